@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 _PENCE_CODES = {"GBX", "GBXP", "GBPX"}  # covers uppercased feed codes (e.g. "GBpx" -> "GBPX")
 
+# Currencies the FX matrix covers by default.
+MATRIX_CURRENCIES: tuple[str, ...] = ("GBX", "USD", "EUR", "CHF", "JPY", "CAD")
+
 
 @dataclass(frozen=True)
 class CurrencyNormaliser:
@@ -90,6 +95,108 @@ class CurrencyNormaliser:
         return value * rate
 
 
+@dataclass(frozen=True)
+class FxMatrix:
+    """Date x currency table of ``base_currency`` per unit of each currency.
+
+    Built once per pricing window and applied as a broadcast multiply, so a
+    whole price panel converts in one array operation instead of a merge or a
+    scalar lookup per instrument. ``GBX`` is derived from ``GBP`` and
+    currencies without any rates are left out.
+    """
+
+    base_currency: str
+    rates: pd.DataFrame
+
+    @classmethod
+    def build(
+        cls,
+        start: date,
+        end: date,
+        currencies: Iterable[object] = MATRIX_CURRENCIES,
+        base_currency: str = "GBP",
+        loader: Optional[Callable[[str], pd.DataFrame]] = None,
+    ) -> "FxMatrix":
+        """Build the matrix for ``start``..``end``.
+
+        ``loader(code)`` returns a ``Date``/``Rate`` frame of GBP per unit of
+        ``code``; it defaults to :func:`backend.utils.fx_rates.fetch_fx_rate_range`.
+        """
+        if loader is None:
+            from backend.utils.fx_rates import fetch_fx_rate_range
+
+            def loader(code: str) -> pd.DataFrame:
+                return fetch_fx_rate_range(code, "GBP", start, end)
+
+        base_currency = CurrencyNormaliser.from_raw(base_currency).canonical
+        codes = {CurrencyNormaliser.from_raw(c).canonical for c in currencies} | {base_currency}
+
+        series: dict[str, pd.Series] = {}
+        for code in sorted(codes - {"GBP", "GBX"}):
+            frame = loader(code)
+            if frame is None or frame.empty:
+                continue
+            rates = pd.Series(
+                pd.to_numeric(frame["Rate"], errors="coerce").to_numpy(dtype=float),
+                index=pd.DatetimeIndex(pd.to_datetime(frame["Date"])),
+            )
+            series[code] = rates[~rates.index.duplicated(keep="last")].sort_index()
+
+        index = pd.bdate_range(start, end)
+        for rates in series.values():
+            index = index.union(rates.index)
+        table = pd.DataFrame({code: rates.reindex(index) for code, rates in series.items()}, index=index)
+        table = table.ffill().bfill()
+        table["GBP"] = 1.0
+        table["GBX"] = 0.01
+
+        if base_currency not in table.columns:
+            return cls(base_currency=base_currency, rates=table.iloc[:, :0])
+        table = table.div(table[base_currency], axis=0)
+        return cls(base_currency=base_currency, rates=table[[c for c in table.columns if c in codes]])
+
+    @classmethod
+    def spot(cls, rates: Mapping[str, float], base_currency: str = "GBP", as_of: Optional[date] = None) -> "FxMatrix":
+        """Single-row matrix from ``{currency: base per unit}`` spot rates."""
+        base_currency = CurrencyNormaliser.from_raw(base_currency).canonical
+        row = {CurrencyNormaliser.from_raw(code).canonical: float(rate) for code, rate in rates.items()}
+        row.setdefault(base_currency, 1.0)
+        if base_currency == "GBP":
+            row.setdefault("GBX", 0.01)
+        index = pd.DatetimeIndex([pd.Timestamp(as_of or date.today())])
+        return cls(base_currency=base_currency, rates=pd.DataFrame([row], index=index, dtype=float))
+
+    def __contains__(self, currency: object) -> bool:
+        return CurrencyNormaliser.from_raw(currency).canonical in self.rates.columns
+
+    def factors(self, dates: Iterable[object], currencies: Sequence[object]) -> np.ndarray:
+        """Return a ``len(dates) x len(currencies)`` array of conversion factors.
+
+        Dates between quotes take the previous rate; unknown currencies are NaN.
+        """
+        idx = pd.DatetimeIndex(pd.to_datetime(list(dates)))
+        codes = [CurrencyNormaliser.from_raw(c).canonical for c in currencies]
+        aligned = self.rates.reindex(self.rates.index.union(idx)).ffill().bfill().reindex(idx)
+        return aligned.reindex(columns=codes).to_numpy(dtype=float)
+
+    def latest(self, currencies: Sequence[object]) -> np.ndarray:
+        """Return the most recent factor for each of ``currencies``."""
+        codes = [CurrencyNormaliser.from_raw(c).canonical for c in currencies]
+        if self.rates.empty:
+            return np.full(len(codes), np.nan)
+        return self.rates.iloc[-1].reindex(codes).to_numpy(dtype=float)
+
+    def convert(self, panel: pd.DataFrame, currencies: Mapping[str, object]) -> pd.DataFrame:
+        """Convert a date-indexed ``panel`` with one column per instrument.
+
+        ``currencies`` maps each column to its raw currency code; columns
+        without an entry are treated as GBP.
+        """
+        factors = self.factors(panel.index, [currencies.get(col) for col in panel.columns])
+        values = panel.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        return pd.DataFrame(values * factors, index=panel.index, columns=panel.columns)
+
+
 def extract_currency(meta: Optional[dict[str, Any]]) -> Optional[CurrencyNormaliser]:
     """Extract normalised currency from metadata payloads."""
     if not isinstance(meta, dict):
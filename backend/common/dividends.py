@@ -15,10 +15,10 @@ Design notes / known v1 limitations
 * Amount calculation: yfinance's ``Ticker.dividends`` returns a per-share
   amount, not the total cash received. This module multiplies the per-share
   amount by the unit count held as of the dividend's ex-date, reconstructed
-  from the transaction log via
-  :func:`backend.common.portfolio_loader.get_units_as_of` (#4947), so a buy or
-  sell between the ex-date and when this job runs does not skew the recorded
-  amount.
+  from the transaction log (#4947) via a
+  :class:`backend.common.position_timeline.PositionTimeline` built once per
+  account, so a buy or sell between the ex-date and when this job runs does
+  not skew the recorded amount.
 * Idempotency: the transaction store has no uniqueness constraint, so this
   module de-duplicates by scanning existing ``DIVIDEND`` transactions for a
   matching ``(ticker, ex_date)`` pair before writing.
@@ -47,7 +47,7 @@ from backend.common.accounts_store import LocalAccountsStore, S3AccountsStore
 from backend.common.currency import CurrencyNormaliser
 from backend.common.data_loader import DATA_BUCKET_ENV
 from backend.common.instruments import get_instrument_meta
-from backend.common.portfolio_loader import get_units_as_of
+from backend.common.position_timeline import PositionTimeline
 from backend.config import config
 from backend.logging_setup import sanitise_log_value
 
@@ -216,6 +216,7 @@ def refresh_dividends() -> Dict[str, Any]:
                 if (t.get("type") or "").upper() == DIVIDEND_TRANSACTION_TYPE
             }
             last_dates = _last_dividend_dates(transactions)
+            timeline = PositionTimeline.from_transactions(data)
 
             for ticker in tickers:
                 summary["tickers_processed"] += 1
@@ -232,7 +233,7 @@ def refresh_dividends() -> Dict[str, Any]:
                     key = _dividend_key(ticker, decl["ex_date"])
                     if key in existing_keys:
                         continue
-                    units_as_of_ex_date = get_units_as_of(data, ticker, decl["ex_date"])
+                    units_as_of_ex_date = timeline.units_on(ticker, decl["ex_date"])
                     if units_as_of_ex_date == 0:
                         continue
                     amount_minor = _amount_minor_gbp(ticker, decl["amount_per_share"], units_as_of_ex_date)
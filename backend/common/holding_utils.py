@@ -6,6 +6,7 @@ import logging
 from datetime import timedelta
 from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -17,13 +18,14 @@ from backend.common.constants import (
     TICKER,
     UNITS,
 )
-from backend.common.currency import CurrencyNormaliser
+from backend.common.currency import CurrencyNormaliser, FxMatrix
 from backend.common.instruments import get_instrument_meta
 from backend.common.numeric_utils import is_nan
 from backend.common.user_config import UserConfig
 from backend.config import config
 from backend.logging_setup import sanitise_log_value
 from backend.timeseries.cache import load_meta_timeseries_range
+from backend.timeseries.panel import load_panel_ranges
 from backend.utils.pricing_dates import PricingDateCalculator
 from backend.utils.timeseries_helpers import (
     _nearest_weekday,
@@ -59,6 +61,50 @@ def _lower_name_map(df: pd.DataFrame) -> Dict[str, str]:
     return {c.lower(): c for c in df.columns}
 
 
+def _spot_fx_matrix(codes: set[str], fx_cache: Dict[str, float]) -> FxMatrix:
+    """Resolve each non-GBP currency in ``codes`` once into a spot ``FxMatrix``.
+
+    Currencies whose rate cannot be resolved, or resolves to a non-positive
+    value, are left out so prices quoted in them convert to NaN and are skipped.
+    """
+    rates: Dict[str, float] = {}
+    for code in sorted(codes - {"GBP", "GBX"}):
+        try:
+            rate = float(_fx_to_base(code, "GBP", fx_cache))
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as exc:
+            logger.warning("FX rate lookup failed for %s: %s", sanitise_log_value(code), sanitise_log_value(exc))
+            continue
+        if pd.notna(rate) and rate > 0:
+            rates[code] = rate
+    return FxMatrix.spot(rates)
+
+
+def _convert_pending(
+    values: Dict[str, Any],
+    pending: Dict[str, tuple[float, str]],
+    fx_cache: Dict[str, float],
+    field: Optional[str] = None,
+) -> None:
+    """Convert ``pending`` native prices to GBP in place within ``values``.
+
+    When ``field`` is given, ``values`` holds dict entries and the price lives
+    under that key. Entries whose converted price is not positive are dropped.
+    """
+    keys = [key for key in pending if key in values]
+    if not keys:
+        return
+    native = np.array([pending[k][0] for k in keys], dtype=float)
+    codes = [pending[k][1] for k in keys]
+    converted = native * _spot_fx_matrix(set(codes), fx_cache).latest(codes)
+    for key, price in zip(keys, converted):
+        if not pd.notna(price) or price <= 0:
+            values.pop(key, None)
+        elif field is None:
+            values[key] = float(price)
+        else:
+            values[key][field] = float(price)
+
+
 def _is_pence_currency(raw: str) -> bool:
     """Backwards-compatible wrapper for pence currency checks."""
     return CurrencyNormaliser.from_raw(raw).is_pence
@@ -76,7 +122,8 @@ def load_latest_prices(full_tickers: list[str]) -> dict[str, float]:
         DataFrame/quote (scale == 0.01, the pence_factor), no additional
         pence conversion is applied.
       - Otherwise, native values are converted through ``CurrencyNormaliser``
-        (pence-to-GBP and non-GBP FX paths).
+        (pence-to-GBP and non-GBP FX paths), resolving each currency once and
+        converting all prices with a single spot ``FxMatrix`` multiply.
 
     Additional behaviour:
     - Uses end_date = yesterday via PricingDateCalculator
@@ -93,6 +140,11 @@ def load_latest_prices(full_tickers: list[str]) -> dict[str, float]:
     from backend.common import instrument_api
 
     fx_cache: Dict[str, float] = {}
+    # key -> (native value, currency code) awaiting the batched FX conversion
+    pending: Dict[str, tuple[float, str]] = {}
+    # One price-panel scan covers every ticker it holds current rows for.
+    resolvable = (instrument_api._resolve_full_ticker(full, {}) for full in full_tickers)
+    panel_frames = load_panel_ranges([pair for pair in resolvable if pair], start_date, end_date)
 
     for full in full_tickers:
         resolved = instrument_api._resolve_full_ticker(full, result)
@@ -104,12 +156,14 @@ def load_latest_prices(full_tickers: list[str]) -> dict[str, float]:
             logger.debug("Could not resolve exchange for %s; defaulting to L", full)
 
         try:
-            df = load_meta_timeseries_range(
-                ticker=ticker,
-                exchange=exchange,
-                start_date=start_date,
-                end_date=end_date,
-            )
+            df = panel_frames.get((ticker, exchange))
+            if df is None:
+                df = load_meta_timeseries_range(
+                    ticker=ticker,
+                    exchange=exchange,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
             if df is None or df.empty:
                 continue
 
@@ -147,11 +201,8 @@ def load_latest_prices(full_tickers: list[str]) -> dict[str, float]:
                 # pence factor (scale == 0.01). A non-zero, non-pence-factor scale (e.g.
                 # 0.5 for a data-provider quirk) does NOT imply pence conversion happened.
                 pence_scaled_in_dataframe = normaliser.is_pence and scale == normaliser.pence_factor
-                if not pence_scaled_in_dataframe:
-                    try:
-                        val = normaliser.to_gbp(val, fx_cache, _fx_to_base)
-                    except ValueError:
-                        continue
+                if not pence_scaled_in_dataframe and normaliser.canonical != "GBP":
+                    pending[f"{ticker}.{exchange}"] = (val, normaliser.canonical)
 
             if not pd.notna(val) or val <= 0:
                 continue
@@ -166,6 +217,7 @@ def load_latest_prices(full_tickers: list[str]) -> dict[str, float]:
                 sanitise_log_value(e),
             )
 
+    _convert_pending(result, pending, fx_cache)
     logger.info("Latest prices fetched: %d/%d", len(result), len(full_tickers))
     return result
 
@@ -187,6 +239,7 @@ def load_live_prices(full_tickers: list[str]) -> dict[str, Dict[str, object]]:
 
     try:
         fx_cache: Dict[str, float] = {}
+        pending: Dict[str, tuple[float, str]] = {}
         resp = requests.get(url, timeout=5)
         raise_for_status = getattr(resp, "raise_for_status", None)
         if callable(raise_for_status):
@@ -216,11 +269,8 @@ def load_live_prices(full_tickers: list[str]) -> dict[str, Dict[str, object]]:
             # pence factor (scale == 0.01). A non-zero, non-pence-factor scale (e.g.
             # 0.5 for a data-provider quirk) does NOT imply pence conversion happened.
             pence_scaled_in_quote = normaliser.is_pence and scale == normaliser.pence_factor
-            if not pence_scaled_in_quote:
-                try:
-                    price = normaliser.to_gbp(price, fx_cache, _fx_to_base)
-                except ValueError:
-                    continue
+            if not pence_scaled_in_quote and normaliser.canonical != "GBP":
+                pending[sym.upper()] = (price, normaliser.canonical)
 
             if not pd.notna(price) or price <= 0:
                 continue
@@ -229,6 +279,8 @@ def load_live_prices(full_tickers: list[str]) -> dict[str, Dict[str, object]]:
                 "price": price,
                 "timestamp": dt.datetime.fromtimestamp(ts, tz=dt.timezone.utc),
             }
+
+        _convert_pending(out, pending, fx_cache, field="price")
     except Exception as exc:
         logger.warning(
             "live price fetch failed for %s: %s",
@@ -34,6 +34,7 @@ from backend.timeseries.cache import (
 )
 from backend.timeseries.fetch_meta_timeseries import run_all_tickers
 from backend.timeseries.fetch_yahoo_timeseries import fetch_yahoo_timeseries_period
+from backend.timeseries.panel import load_panel_ranges
 from backend.utils.pricing_dates import PricingDateCalculator
 from backend.utils.timeseries_helpers import _nearest_weekday, resolve_date_range
 
@@ -380,6 +381,22 @@ def _close_on(sym: str, ex: str, d: dt.date) -> Optional[float]:
     return None if is_nan(price) else price
 
 
+# Days ``load_meta_timeseries_range`` steps back from a date without a close.
+_CLOSE_LOOKBACK_DAYS = 4
+
+
+def _frame_close_on(df: pd.DataFrame, d: dt.date) -> Optional[float]:
+    """Return the close :func:`_close_on` reports for ``d`` from an already loaded range."""
+    snap = _nearest_weekday(d, forward=False)
+    dates = pd.to_datetime(df["Date"]).dt.date
+    rows = df[(dates <= snap) & (dates >= snap - dt.timedelta(days=_CLOSE_LOOKBACK_DAYS))]
+    col = next((c for c in ("close_gbp", "Close_gbp", "close", "Close") if c in rows.columns), None)
+    if rows.empty or col is None:
+        return None
+    price = float(rows[col].iloc[-1])
+    return None if is_nan(price) else price
+
+
 def price_change_pct(ticker: str, days: int) -> Optional[float]:
     """Return % change from ``days`` ago to yesterday's close for ``ticker``."""
     today = dt.date.today()
@@ -392,6 +409,11 @@ def price_change_pct(ticker: str, days: int) -> Optional[float]:
     sym, ex = resolved
     px_now = _close_on(sym, ex, yday)
     px_then = _close_on(sym, ex, yday - dt.timedelta(days=days))
+    return _change_pct(ticker, px_now, px_then)
+
+
+def _change_pct(ticker: str, px_now: Optional[float], px_then: Optional[float]) -> Optional[float]:
+    """Return the % change between two closes, or ``None`` when it is not credible."""
     if px_now is None or px_then is None or px_then == 0:
         return None
     if px_then < MIN_PRICE_THRESHOLD:
@@ -439,22 +461,42 @@ def top_movers(
 
     calc = PricingDateCalculator(today=dt.date.today(), weekday_func=_nearest_weekday)
     last_price_date = _resolve_last_price_date(calc)
+    yday = dt.date.today() - dt.timedelta(days=1)
     rows: List[Dict[str, Any]] = []
     anomalies: List[str] = []
 
-    for t in tickers:
-        if min_weight and weights and weights.get(t, 0.0) < min_weight:
-            continue
-        change = price_change_pct(t, days)
+    selected = [t for t in tickers if not (min_weight and weights and weights.get(t, 0.0) < min_weight)]
+    pairs = {t: _resolve_full_ticker(t, _LATEST_PRICES) for t in selected}
+    # One price-panel scan covers every ticker it holds current rows for;
+    # the rest go through the per-ticker ``price_change_pct``/``_close_on``.
+    window_start = _nearest_weekday(yday - dt.timedelta(days=days), forward=False)
+    panel_frames = load_panel_ranges(
+        [pair for pair in pairs.values() if pair],
+        window_start - dt.timedelta(days=_CLOSE_LOOKBACK_DAYS),
+        max(yday, last_price_date),
+    )
+
+    for t in selected:
+        resolved = pairs[t]
+        frame = panel_frames.get(resolved) if resolved else None
+        closes: List[Optional[float]] = []
+        if frame is not None:
+            closes = [_frame_close_on(frame, d) for d in (yday, yday - dt.timedelta(days=days), last_price_date)]
+        last_px: Optional[float] = None
+        if closes and None not in closes:
+            px_now, px_then, last_px = closes
+            change = _change_pct(t, px_now, px_then)
+        else:
+            change = price_change_pct(t, days)
         if change is None:
             anomalies.append(t)
             continue
-        resolved = _resolve_full_ticker(t, _LATEST_PRICES)
         if not resolved:
             continue
         sym, ex = resolved
         full = f"{sym}.{ex}" if ex else sym
-        last_px = _close_on(sym, ex, last_price_date)
+        if last_px is None:
+            last_px = _close_on(sym, ex, last_price_date)
         meta = get_security_meta(full) or {}
         rows.append(
             {
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from backend.config import config
 from backend.logging_setup import sanitise_log_value
+from backend.timeseries.bundle import active_bundle
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +199,9 @@ def get_instrument_meta(ticker: str) -> Dict[str, Any]:
         # persisting fresh metadata is an explicit, separate operation — see
         # ``_auto_create_instrument_meta`` / the ``/instrument/admin/.../refresh``
         # route — that callers must invoke deliberately, not on every read.
-        return {}
+        bundle = active_bundle()
+        bundled = bundle.instrument(_instrument_key(ticker, "")) if bundle is not None else None
+        return dict(bundled) if bundled else {}
     except json.JSONDecodeError as exc:
         logger.warning("Invalid instrument JSON %s: %s", sanitise_log_value(path), sanitise_log_value(exc))
         return {}
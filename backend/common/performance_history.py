@@ -0,0 +1,206 @@
+"""
+Materialised daily performance history per owner.
+
+:func:`backend.common.portfolio_utils.compute_owner_performance` values the
+owner's holdings from raw closes for every day of the window on every call,
+although after the nightly price refresh only the latest day is new. With
+``performance_history_days`` set, the daily values and the value of each
+day's unit changes are kept in one parquet table per owner under
+``<timeseries cache>/performance/``. The performance endpoint slices that
+table and derives returns and drawdown from the slice; the price-refresh
+job appends the latest closes to it.
+
+Each table records a signature of the inputs it was built from -- the
+modification time, size and name of the owner's account files
+(holdings and transactions) plus the instruments currently flagged in the
+price snapshot -- and a different signature makes it a miss, so edits to
+holdings or transactions rebuild the history on next use. Edits to the
+cached prices (the timeseries editor and the data-quality fixes) call
+:func:`clear` instead, since a revised close may fall anywhere in the
+window. Tables are only kept for a local cache base; any read or write
+error is logged at debug level and callers fall back to a full valuation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from backend.common.data_loader import resolve_paths
+from backend.common.path_utils import safe_join
+from backend.config import config
+from backend.logging_setup import sanitise_log_value
+
+logger = logging.getLogger(__name__)
+
+_FORMAT = 2
+_META_KEY = b"allotmint.performance"
+_SUFFIX = ".parquet"
+
+
+@dataclass
+class StoredHistory:
+    """A materialised history: weekday dates, portfolio values and unit-change flows."""
+
+    dates: np.ndarray
+    values: np.ndarray
+    reporting_date: date
+    data_quality_issues: List[Any] = field(default_factory=list)
+    flows: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        if self.flows is None:
+            self.flows = np.zeros(len(self.values))
+
+
+def history_days() -> int:
+    """Return the number of calendar days kept per owner (0 when disabled)."""
+    return int(getattr(config, "performance_history_days", None) or 0)
+
+
+def history_dir() -> Path | None:
+    """Return the directory holding the tables, or ``None`` when disabled."""
+    if history_days() <= 0:
+        return None
+    base = os.getenv("TIMESERIES_CACHE_BASE") or config.timeseries_cache_base
+    if not base or str(base).startswith("s3://"):
+        return None
+    return Path(base) / "performance"
+
+
+def _table_path(owner: str) -> Path | None:
+    root = history_dir()
+    if root is None:
+        return None
+    try:
+        return safe_join(root, f"{owner}{_SUFFIX}")
+    except ValueError:
+        return None
+
+
+def owner_signature(owner: str, flagged: Iterable[str] = ()) -> str:
+    """Return a digest of ``owner``'s account files and the flagged instruments."""
+    root = resolve_paths(config.repo_root, config.accounts_root).accounts_root
+    entries: list[Any] = []
+    try:
+        paths = sorted(safe_join(root, owner).glob("*.json"))
+    except ValueError:
+        paths = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append([path.name, int(st.st_mtime_ns), st.st_size])
+    entries.append(sorted(t.upper() for t in flagged))
+    return hashlib.sha1(json.dumps(entries).encode("utf-8")).hexdigest()
+
+
+def load(owner: str, signature: str) -> StoredHistory | None:
+    """Return the stored history of ``owner`` if it was built from ``signature``."""
+    path = _table_path(owner)
+    if path is None or not path.exists():
+        return None
+    try:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, columns=["date", "value", "flows"])
+        meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b"{}"))
+        if meta.get("format") != _FORMAT or meta.get("signature") != signature:
+            return None
+        frame = table.to_pandas()
+        return StoredHistory(
+            dates=frame["date"].to_numpy(dtype="datetime64[D]"),
+            values=frame["value"].to_numpy(dtype="float64"),
+            reporting_date=date.fromisoformat(meta["reporting_date"]),
+            data_quality_issues=list(meta.get("data_quality_issues") or []),
+            flows=frame["flows"].to_numpy(dtype="float64"),
+        )
+    except Exception as exc:
+        logger.debug("Performance history read failed (%s): %s", sanitise_log_value(path), sanitise_log_value(exc))
+        return None
+
+
+def save(owner: str, signature: str, history: StoredHistory) -> None:
+    """Write ``history`` as the table of ``owner``, keeping the last :func:`history_days` days."""
+    path = _table_path(owner)
+    if path is None:
+        return
+    keep = history.dates >= np.datetime64(history.reporting_date - timedelta(days=history_days()), "D")
+    frame = pd.DataFrame(
+        {
+            "date": history.dates[keep].astype("datetime64[ms]"),
+            "value": history.values[keep],
+            "flows": history.flows[keep],
+        }
+    )
+    meta = {
+        "format": _FORMAT,
+        "signature": signature,
+        "reporting_date": history.reporting_date.isoformat(),
+        "data_quality_issues": history.data_quality_issues,
+    }
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), _META_KEY: json.dumps(meta, default=str).encode("utf-8")}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table.replace_schema_metadata(metadata), tmp)
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.debug("Performance history write failed (%s): %s", sanitise_log_value(path), sanitise_log_value(exc))
+        tmp.unlink(missing_ok=True)
+
+
+def merge_tail(stored: StoredHistory, tail: StoredHistory) -> StoredHistory:
+    """Return ``stored`` with every row from ``tail``'s first date onwards replaced by ``tail``."""
+    if not len(tail.dates):
+        return StoredHistory(stored.dates, stored.values, tail.reporting_date, stored.data_quality_issues, stored.flows)
+    keep = stored.dates < tail.dates[0]
+    return StoredHistory(
+        dates=np.concatenate([stored.dates[keep], tail.dates]),
+        values=np.concatenate([stored.values[keep], tail.values]),
+        flows=np.concatenate([stored.flows[keep], tail.flows]),
+        reporting_date=tail.reporting_date,
+        data_quality_issues=[
+            *stored.data_quality_issues,
+            *(issue for issue in tail.data_quality_issues if issue not in stored.data_quality_issues),
+        ],
+    )
+
+
+def clear() -> int:
+    """Remove every stored table; returns how many were deleted."""
+    root = history_dir()
+    if root is None or not root.exists():
+        return 0
+    removed = 0
+    for path in root.glob(f"*{_SUFFIX}"):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+__all__ = [
+    "StoredHistory",
+    "clear",
+    "history_days",
+    "history_dir",
+    "load",
+    "merge_tail",
+    "owner_signature",
+    "save",
+]
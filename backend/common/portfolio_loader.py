@@ -14,7 +14,7 @@ import re
 from collections import defaultdict
 from datetime import date
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Iterator, cast
 
 _ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
@@ -282,48 +282,31 @@ def compute_holdings_from_transactions(
     }
 
 
-def get_units_as_of(tx_data: dict[str, Any], ticker: str, as_of: str) -> float:
-    """Return units of ``ticker`` held as of ``as_of`` (ISO date, inclusive).
+_UNIT_TYPE_SIGN = {
+    "BUY": 1,
+    "PURCHASE": 1,
+    "SELL": -1,
+    "TRANSFER_IN": 1,
+    "TRANSFER_OUT": -1,
+    "REMOVAL": -1,
+}
+_SHARE_SCALE = 10**8
 
-    Replays ``BUY``/``PURCHASE``/``SELL``/``TRANSFER_IN``/``TRANSFER_OUT``/
-    ``REMOVAL`` transactions dated on or before ``as_of``, using the same sign
-    convention and PP 1e8-scaling heuristic as
-    :func:`compute_holdings_from_transactions`, but ignores any transaction
-    dated after ``as_of``.
 
-    Used by :mod:`backend.common.dividends` to size a dividend by the units
-    actually held on its ex-date rather than the (possibly since-changed)
-    current holding (#4947).
+def iter_unit_changes(tx_data: dict[str, Any]) -> Iterator[tuple[str, str, float]]:
+    """Yield ``(TICKER, iso_date, signed_units)`` for each unit-changing transaction.
 
-    Performs a single O(n) scan of ``tx_data["transactions"]`` per call, with
-    no memoization across tickers/dates -- callers iterating many tickers or
-    dividend declarations against the same ``tx_data`` re-scan the full
-    transaction log each time. Fine at typical per-account transaction
-    volumes; worth revisiting (e.g. pre-sorting by ticker, or an incremental
-    running-total index) if that stops being true for accounts with very
-    large transaction histories.
+    Only ``BUY``/``PURCHASE``/``SELL``/``TRANSFER_IN``/``TRANSFER_OUT``/
+    ``REMOVAL`` transactions with an ISO date are included, using the same
+    sign convention and PP 1e8-scaling heuristic as
+    :func:`compute_holdings_from_transactions`.
     """
-    TYPE_SIGN = {
-        "BUY": 1,
-        "PURCHASE": 1,
-        "SELL": -1,
-        "TRANSFER_IN": 1,
-        "TRANSFER_OUT": -1,
-        "REMOVAL": -1,
-    }
-    SHARE_SCALE = 10**8
-    ticker = ticker.upper()
-    as_of_str = str(as_of)[:10]
-
-    total = 0.0
     for t in cast("list[dict[str, Any]]", tx_data.get("transactions", [])):
         ttype = (t.get("type") or "").upper()
-        if ttype not in TYPE_SIGN:
-            continue
-        if (t.get("ticker") or "").upper() != ticker:
+        if ttype not in _UNIT_TYPE_SIGN:
             continue
         tx_date = str(t.get("date") or "")[:10]
-        if not _ISO_DATE_RE.match(tx_date) or tx_date > as_of_str:
+        if not _ISO_DATE_RE.match(tx_date):
             continue
         raw = next(
             (t[k] for k in ("shares", "quantity", "units") if k in t and t[k] is not None),
@@ -334,6 +317,24 @@ def get_units_as_of(tx_data: dict[str, Any], ticker: str, as_of: str) -> float:
         except (TypeError, ValueError):
             continue
         if abs(qty) > 1_000_000:  # detect PP's 1e8 scaling
-            qty /= SHARE_SCALE
-        total += qty * TYPE_SIGN[ttype]
-    return total
+            qty /= _SHARE_SCALE
+        yield (t.get("ticker") or "").upper(), tx_date, qty * _UNIT_TYPE_SIGN[ttype]
+
+
+def get_units_as_of(tx_data: dict[str, Any], ticker: str, as_of: str) -> float:
+    """Return units of ``ticker`` held as of ``as_of`` (ISO date, inclusive).
+
+    Replays the unit-changing transactions from :func:`iter_unit_changes`
+    dated on or before ``as_of`` and ignores any transaction dated after it.
+
+    Performs a single O(n) scan of ``tx_data["transactions"]`` per call, with
+    no memoization across tickers/dates. Callers looking up many tickers or
+    dates against the same document should build a
+    :class:`backend.common.position_timeline.PositionTimeline` once instead.
+    """
+    ticker = ticker.upper()
+    as_of_str = str(as_of)[:10]
+    return sum(
+        (qty for tkr, tx_date, qty in iter_unit_changes(tx_data) if tkr == ticker and tx_date <= as_of_str),
+        0.0,
+    )
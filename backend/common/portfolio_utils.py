@@ -14,7 +14,9 @@ import logging
 import math
 import os
 import threading
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List
@@ -22,27 +24,34 @@ from typing import Any, Dict, List
 import numpy as np
 import pandas as pd
 
-from backend.common import group_portfolio
+from backend.common import group_portfolio, performance_history
 from backend.common import portfolio as portfolio_mod
 from backend.common.account_scaffold import load_transactions
-from backend.common.data_loader import DATA_BUCKET_ENV
+from backend.common.data_loader import DATA_BUCKET_ENV, resolve_paths
 from backend.common.holding_utils import _get_price_for_date_scaled
 from backend.common.instruments import (
     get_instrument_meta,
     instrument_meta_path,
     resolve_instrument_ticker,
 )
+from backend.common.path_utils import safe_join
 from backend.common.portfolio_loader import list_portfolios  # existing helper
+from backend.common.position_timeline import owner_timelines
+from backend.common.rolling_risk import rolling_risk
+from backend.common.valuation import PriceMatrix, close_column, dedupe_sorted, history_records, performance_arrays
 from backend.common.virtual_portfolio import (
     VirtualPortfolio,
     list_virtual_portfolios,
 )
+from backend.common.xirr import xirr, xirr_many
 from backend.config import config
 from backend.logging_setup import sanitise_log_value
+from backend.timeseries.bundle import active_bundle
 from backend.timeseries.cache import load_meta_timeseries, load_meta_timeseries_range
+from backend.timeseries.panel import load_panel_ranges
 from backend.utils.fx_rates import fetch_fx_rate_range
 from backend.utils.pricing_dates import PricingDateCalculator
-from backend.utils.timeseries_helpers import apply_scaling, get_scaling_override
+from backend.utils.timeseries_helpers import _nearest_weekday, apply_scaling, get_scaling_override
 
 try:
     from backend.common.anomaly_repair import _detect_single_day_flash_crash
@@ -282,6 +291,13 @@ def _load_snapshot() -> tuple[Dict[str, Dict], datetime | None]:
                 )
                 s3_failed = True
 
+    if config.prices_json is None or not _PRICES_PATH or not _PRICES_PATH.exists():
+        bundle = active_bundle()
+        bundled = bundle.latest_prices() if bundle is not None else None
+        if bundled is not None:
+            logger.info("Serving price snapshot from cache bundle %s", sanitise_log_value(bundle.path))
+            return bundled
+
     if config.prices_json is None:
         if s3_not_found:
             logger.warning("Price snapshot not yet seeded; portfolio prices unavailable until first refresh")
@@ -337,6 +353,7 @@ def refresh_snapshot_in_memory(
         timestamp = datetime.now(UTC)
     _PRICE_SNAPSHOT = new_snapshot
     _PRICE_SNAPSHOT_TS = timestamp
+    clear_benchmark_returns()
     logger.debug("In-memory price snapshot refreshed, %d tickers", len(_PRICE_SNAPSHOT))
 
 
@@ -989,6 +1006,37 @@ def _effective_days(
     return days + max(0, delta)
 
 
+def _units_on_dates(
+    owner: str,
+    dates: np.ndarray,
+    positions: List[tuple[float, str, str]],
+    as_of: date,
+) -> np.ndarray:
+    """Return a date x position matrix of the units held on each of ``dates``.
+
+    ``positions`` are ``(current units, account, ticker)`` per holding row.
+    Where the account's transaction timeline ends at the units the holdings
+    file reports for that ticker on ``as_of``, past dates use the units the
+    timeline says were held then (split across the ticker's holding rows in
+    proportion to their current units). Otherwise -- no transactions, a log
+    that does not reconcile with the holdings, or rows for the ticker that
+    net to zero -- the current units are used for every date.
+    """
+    timelines = owner_timelines(owner)
+    held: Dict[tuple[str, str], float] = defaultdict(float)
+    for units, account, tkr in positions:
+        held[(account, tkr)] += units
+    out = np.empty((len(dates), len(positions)))
+    for j, (units, account, tkr) in enumerate(positions):
+        timeline = timelines.get(account)
+        total = held[(account, tkr)]
+        if total and timeline is not None and tkr in timeline and timeline.reconciles(tkr, total, as_of):
+            out[:, j] = timeline.units_over(tkr, dates) * (units / total)
+        else:
+            out[:, j] = units
+    return out
+
+
 def compute_owner_performance(
     owner: str,
     days: int = 365,
@@ -1000,8 +1048,12 @@ def compute_owner_performance(
     """Return daily portfolio values and returns for an ``owner``.
 
     The calculation uses current holdings and fetches closing prices from the
-    meta timeseries cache for the requested rolling window. Instruments flagged
+    meta timeseries cache for the requested rolling window: the weekdays
+    within ``days`` calendar days of the reporting date. Instruments flagged
     in the price snapshot are skipped unless ``include_flagged`` is ``True``.
+    Each day is valued at the units held that day (see :func:`_units_on_dates`)
+    while the returns and drawdown are net of unit changes, so buys and sells
+    do not show up as gains or losses.
     The result is returned as ``{"history": [...], "max_drawdown": float}`` where
     ``history`` is a list of records::
 
@@ -1017,20 +1069,81 @@ def compute_owner_performance(
 
     Returns ``{"history": [], "max_drawdown": None}`` if the owner or
     timeseries data is missing.
+
+    With ``performance_history_days`` configured, the default variant (no
+    flagged instruments, cash included) is served from the owner's
+    materialised history (see :mod:`backend.common.performance_history`)
+    when it covers the request, and the history is rebuilt after a miss.
     """
 
     calc = PricingDateCalculator(reporting_date=pricing_date)
-    try:
-        pf = portfolio_mod.build_owner_portfolio(owner, pricing_date=calc.reporting_date)
-    except FileNotFoundError:
-        raise
+    if include_flagged or not include_cash or not 0 < days <= performance_history.history_days():
+        dates, total, flows, issues = _owner_value_history(
+            owner,
+            days,
+            include_flagged=include_flagged,
+            include_cash=include_cash,
+            pricing_date=pricing_date,
+            calc=calc,
+        )
+        return _performance_result(dates, total, flows, issues, calc)
+
+    signature = performance_history.owner_signature(owner, _flagged_tickers())
+    stored = performance_history.load(owner, signature)
+    start = np.datetime64(calc.reporting_date - timedelta(days=days), "D")
+    # A table spans ``history_days`` calendar days up to its own reporting date.
+    if (
+        stored is not None
+        and stored.reporting_date >= calc.reporting_date
+        and (stored.reporting_date - calc.reporting_date).days <= performance_history.history_days() - days
+    ):
+        keep = (stored.dates >= start) & (stored.dates <= np.datetime64(calc.reporting_date, "D"))
+        return _performance_result(
+            stored.dates[keep], stored.values[keep], stored.flows[keep], stored.data_quality_issues, calc
+        )
+    if pricing_date is not None:
+        dates, total, flows, issues = _owner_value_history(owner, days, pricing_date=pricing_date, calc=calc)
+        return _performance_result(dates, total, flows, issues, calc)
+
+    dates, total, flows, issues = _owner_value_history(owner, performance_history.history_days(), calc=calc)
+    performance_history.save(
+        owner,
+        signature,
+        performance_history.StoredHistory(dates, total, calc.reporting_date, issues, flows),
+    )
+    keep = dates >= start
+    return _performance_result(dates[keep], total[keep], flows[keep], issues, calc)
+
+
+def _flagged_tickers() -> set[str]:
+    return {k.upper() for k, v in _PRICE_SNAPSHOT.items() if v.get("flagged")}
+
+
+def _owner_value_history(
+    owner: str,
+    days: int,
+    *,
+    include_flagged: bool = False,
+    include_cash: bool = True,
+    pricing_date: date | None = None,
+    calc: PricingDateCalculator,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, list]:
+    """Return ``(dates, values, flows, data_quality_issues)`` for ``owner``'s weekday history.
+
+    ``flows`` is the value of each day's unit changes (see
+    :meth:`PriceMatrix.flows`), with weekend changes carried to the next
+    weekday.
+    """
+
+    pf = portfolio_mod.build_owner_portfolio(owner, pricing_date=calc.reporting_date)
 
     from backend.common import instrument_api
 
-    flagged = {k.upper() for k, v in _PRICE_SNAPSHOT.items() if v.get("flagged")}
+    flagged = _flagged_tickers()
 
-    holdings: List[tuple[str, str, float]] = []
+    holdings: List[tuple[str, str, float, str, str]] = []
     for acct in pf.get("accounts", []):
+        account = str(acct.get("account_type") or "").lower()
         for h in acct.get("holdings", []):
             tkr = (h.get("ticker") or "").upper()
             if not tkr:
@@ -1053,94 +1166,88 @@ def compute_owner_performance(
             if not include_flagged and full in flagged:
                 logger.debug("Skipping flagged instrument %s", sanitise_log_value(full))
                 continue
-            holdings.append((sym, exch, units))
+            holdings.append((sym, exch, units, account, tkr))
 
     if not holdings:
-        return {
-            "history": [],
-            "max_drawdown": None,
-            "reporting_date": calc.reporting_date.isoformat(),
-            "previous_date": calc.previous_pricing_date.isoformat(),
-            "data_quality_issues": [],
-        }
+        return np.array([], dtype="datetime64[D]"), np.array([]), np.array([]), []
 
     effective_days = _effective_days(
         days,
         requested_pricing_date=pricing_date,
         reporting_date=calc.reporting_date,
     )
-    # Collect each holding's per-ticker value series *before* summing them.
-    # Each ticker's series is only indexed by the dates that ticker actually
-    # has a close price for -- e.g. an LSE-listed holding has no row on a UK
-    # bank holiday, even though a NYSE-listed holding in the same portfolio
-    # keeps trading that day. Summing directly with ``fill_value=0`` (the
-    # old behaviour) would treat that missing date as the LSE holding being
-    # worth £0 that day, producing a fake single-day crash that fully
-    # reverses the next trading day. Instead, build the union of dates
-    # across all holdings and forward-fill each series onto it so a missing
-    # date carries forward that ticker's last known price. A ticker with no
-    # price history yet at the start of the window still contributes 0
-    # (via ``fillna(0)`` after the forward-fill) rather than NaN.
-    value_series: List[pd.Series] = []
-    for ticker, exchange, units in holdings:
-        df = load_meta_timeseries(ticker, exchange, effective_days)
+    # Place each holding's closes in one date x holding matrix on the union
+    # of their calendars and forward-fill each column before summing. Each
+    # ticker only has rows for the dates it actually has a close price for --
+    # e.g. an LSE-listed holding has no row on a UK bank holiday, even though
+    # a NYSE-listed holding in the same portfolio keeps trading that day.
+    # Treating that missing date as the LSE holding being worth £0 would
+    # produce a fake single-day crash that fully reverses the next trading
+    # day, so a missing date carries forward that ticker's last known price.
+    # A ticker with no price history yet at the start of the window still
+    # contributes 0 rather than NaN.
+    # Closes come from one price-panel scan where the panel is current, over
+    # the window ``load_meta_timeseries`` would return for the rest.
+    window_end = _nearest_weekday(date.today() - timedelta(days=1), forward=False)
+    window_start = _nearest_weekday(window_end - timedelta(days=effective_days), forward=True)
+    panel_frames = load_panel_ranges(
+        [(ticker, exchange) for ticker, exchange, *_rest in holdings], window_start, window_end, base_currency=None
+    )
+    columns: List[tuple[np.ndarray, np.ndarray]] = []
+    positions: List[tuple[float, str, str]] = []
+    for ticker, exchange, units, account, tkr in holdings:
+        df = panel_frames.get((ticker, exchange))
+        if df is None:
+            df = load_meta_timeseries(ticker, exchange, effective_days, readonly=True)
         if df.empty or "Date" not in df.columns or "Close" not in df.columns:
             continue
-        df = df[["Date", "Close"]].copy()
-        df["Date"] = pd.to_datetime(df["Date"]).dt.date
-        scale = get_scaling_override(ticker, exchange, requested_scaling=None)
-        df = apply_scaling(df, scale)
-        # ``apply_scaling`` currently preserves row order, but enforce date
-        # ordering here to keep value reconstruction deterministic even if
-        # upstream transforms change.
-        df = df.sort_values("Date").reset_index(drop=True)
-        closes = pd.to_numeric(df["Close"], errors="coerce")
-
-        full_ticker = f"{ticker}.{exchange}".upper()
-        if full_ticker == "CASH.GBP":
-            closes = pd.Series(1.0, index=df["Date"])
+        if f"{ticker}.{exchange}".upper() == "CASH.GBP":
+            cash_dates = pd.to_datetime(df["Date"]).to_numpy(dtype="datetime64[D]")
+            dates, closes = dedupe_sorted(cash_dates, np.ones(len(cash_dates)))
         else:
-            closes.index = df["Date"]
-
-        closes = closes.dropna()
-        if closes.empty:
+            scale = get_scaling_override(ticker, exchange, requested_scaling=None)
+            dates, closes = close_column(apply_scaling(df[["Date", "Close"]], scale))
+        if not len(closes):
             continue
-        values = closes * units
-        # Guard against duplicate dates (shouldn't happen, but a duplicated
-        # index breaks ``reindex`` below).
-        values = values[~values.index.duplicated(keep="last")]
-        value_series.append(values)
-
-    if value_series:
-        all_dates = pd.Index(sorted(set().union(*(s.index for s in value_series))), name="Date")
-        total = pd.Series(0.0, index=all_dates)
-        for values in value_series:
-            aligned = values.sort_index().reindex(all_dates).ffill().fillna(0.0)
-            total = total.add(aligned, fill_value=0)
-    else:
-        total = pd.Series(dtype=float)
+        columns.append((dates, closes))
+        positions.append((units, account, tkr))
 
-    if total.empty:
-        return {
-            "history": [],
-            "max_drawdown": None,
-            "reporting_date": calc.reporting_date.isoformat(),
-            "previous_date": calc.previous_pricing_date.isoformat(),
-            "data_quality_issues": [],
-        }
+    matrix = PriceMatrix.from_columns(columns)
+    dates = matrix.dates
+    units = _units_on_dates(owner, dates, positions, calc.reporting_date)
+    total, flows = matrix.values(units), matrix.flows(units)
+    in_window = dates <= np.datetime64(calc.reporting_date, "D")
+    dates, total, flows = dates[in_window], total[in_window], flows[in_window]
+
+    if not len(total):
+        return dates, total, flows, []
 
-    total = total.sort_index()
-    total = total[total.index <= calc.reporting_date]
-    if days:
-        total = total.tail(days)
     if _detect_single_day_flash_crash is not None:
-        total, data_quality_issues = _detect_single_day_flash_crash(total)
+        repaired, data_quality_issues = _detect_single_day_flash_crash(pd.Series(total, index=dates.astype(object)))
+        repaired = repaired.sort_index()
+        dates = np.array(list(repaired.index), dtype="datetime64[D]")
+        total = repaired.to_numpy(dtype="float64")
     else:
         data_quality_issues = []
-    perf = total.sort_index().to_frame(name="value")
-    perf = perf.loc[[idx.weekday() < 5 for idx in perf.index]]
+    weekdays = np.is_busday(dates)
+    flows = np.diff(np.cumsum(flows)[weekdays], prepend=0.0)
+    dates, total = dates[weekdays], total[weekdays]
+    # ``days`` is a calendar window ending at the reporting date, as when
+    # slicing a materialised history.
+    if days:
+        keep = dates >= np.datetime64(calc.reporting_date - timedelta(days=days), "D")
+        dates, total, flows = dates[keep], total[keep], flows[keep]
+    return dates, total, flows, data_quality_issues
 
-    if perf.empty:
+
+def _performance_result(
+    dates: np.ndarray,
+    total: np.ndarray,
+    flows: np.ndarray,
+    data_quality_issues: list,
+    calc: PricingDateCalculator,
+) -> Dict[str, Any]:
+    if not len(total):
         return {
             "history": [],
             "max_drawdown": None,
@@ -1149,32 +1256,9 @@ def compute_owner_performance(
             "data_quality_issues": data_quality_issues,
         }
 
-    perf["daily_return"] = perf["value"].pct_change()
-    perf["weekly_return"] = perf["value"].pct_change(5)
-    start_val = perf["value"].iloc[0]
-    perf["cumulative_return"] = perf["value"] / start_val - 1
-    perf["running_max"] = perf["value"].cummax()
-    perf["drawdown"] = perf["value"] / perf["running_max"] - 1
-    max_drawdown = float(perf["drawdown"].min())
-
-    perf = perf.reset_index().rename(columns={"index": "date"})
-
-    out: List[Dict] = []
-    for row in perf.itertuples(index=False):
-        raw_date = row.Date
-        if isinstance(raw_date, datetime):
-            raw_date = raw_date.date()
-        out.append(
-            {
-                "date": raw_date.isoformat(),
-                "value": round(float(row.value), 2),
-                "daily_return": (float(row.daily_return) if pd.notna(row.daily_return) else None),
-                "weekly_return": (float(row.weekly_return) if pd.notna(row.weekly_return) else None),
-                "cumulative_return": (float(row.cumulative_return) if pd.notna(row.cumulative_return) else None),
-                "running_max": round(float(row.running_max), 2),
-                "drawdown": (float(row.drawdown) if pd.notna(row.drawdown) else None),
-            }
-        )
+    perf = performance_arrays(total, flows)
+    max_drawdown = float(pd.Series(perf["drawdown"]).min())
+    out = history_records(dates, perf)
 
     reporting_date_iso = out[-1]["date"] if out else calc.reporting_date.isoformat()
     previous_date_iso = out[-2]["date"] if len(out) >= 2 else calc.previous_pricing_date.isoformat()
@@ -1188,8 +1272,76 @@ def compute_owner_performance(
     }
 
 
+# Days re-valued before the last stored date when appending to a
+# materialised history; they must match the stored values for the append to
+# be trusted (a holdings change, or a close older than this window that the
+# full valuation carried forward, forces a rebuild instead).
+_PERFORMANCE_APPEND_LOOKBACK_DAYS = 30
+
+
+def append_owner_performance(owner: str) -> bool:
+    """Bring ``owner``'s materialised performance history up to the latest close.
+
+    Only the days since the last stored date, plus a short lookback, are
+    valued; the last stored day is replaced too, so a revised close wins.
+    A missing, outdated or inconsistent table is rebuilt in full. Returns
+    ``False`` when materialised histories are disabled.
+    """
+
+    if performance_history.history_dir() is None:
+        return False
+    calc = PricingDateCalculator()
+    signature = performance_history.owner_signature(owner, _flagged_tickers())
+    stored = performance_history.load(owner, signature)
+    history = None
+    if stored is not None and len(stored.dates):
+        gap = max(0, (calc.reporting_date - stored.dates[-1].astype(object)).days)
+        dates, total, flows, issues = _owner_value_history(owner, gap + _PERFORMANCE_APPEND_LOOKBACK_DAYS, calc=calc)
+        overlap = np.isin(dates, stored.dates) & (dates < stored.dates[-1])
+        prior = np.searchsorted(stored.dates, dates[overlap])
+        if overlap.any() and np.allclose(total[overlap], stored.values[prior], rtol=1e-6, equal_nan=True):
+            tail = dates >= stored.dates[-1]
+            history = performance_history.merge_tail(
+                stored,
+                performance_history.StoredHistory(dates[tail], total[tail], calc.reporting_date, issues, flows[tail]),
+            )
+    if history is None:
+        dates, total, flows, issues = _owner_value_history(owner, performance_history.history_days(), calc=calc)
+        history = performance_history.StoredHistory(dates, total, calc.reporting_date, issues, flows)
+    performance_history.save(owner, signature, history)
+    return True
+
+
+def refresh_performance_histories() -> int:
+    """Append the latest closes to every owner's materialised history.
+
+    Run after a price refresh has written its snapshot (as a background task
+    of the refresh route, or by the scheduled refresh job); returns how many
+    owners were refreshed.
+    """
+
+    if performance_history.history_dir() is None:
+        return 0
+    refreshed = 0
+    for owner in portfolio_mod.list_owners():
+        try:
+            refreshed += append_owner_performance(owner)
+        except Exception as exc:
+            logger.warning(
+                "Failed to refresh performance history for %s: %s",
+                sanitise_log_value(owner),
+                sanitise_log_value(exc),
+            )
+    return refreshed
+
+
 def portfolio_value_breakdown(owner: str, date: str) -> List[Dict[str, Any]]:
-    """Return each holding's units, price and value for ``date``."""
+    """Return each holding's units, price and value for ``date``.
+
+    Units are those held on ``date`` according to the account's transaction
+    timeline when it reconciles with the current holdings, otherwise the
+    current units.
+    """
 
     try:
         target = datetime.fromisoformat(date).date()
@@ -1200,8 +1352,18 @@ def portfolio_value_breakdown(owner: str, date: str) -> List[Dict[str, Any]]:
 
     from backend.common import instrument_api
 
+    timelines = owner_timelines(owner)
+    today = datetime.now(UTC).date()
+    held: Dict[tuple[str, str], float] = defaultdict(float)
+    for acct in pf.get("accounts", []):
+        account = str(acct.get("account_type") or "").lower()
+        for h in acct.get("holdings", []):
+            held[(account, (h.get("ticker") or "").upper())] += _safe_num(h.get("units"))
+
     holdings: Dict[str, Dict[str, Any]] = {}
     for acct in pf.get("accounts", []):
+        account = str(acct.get("account_type") or "").lower()
+        timeline = timelines.get(account)
         for h in acct.get("holdings", []):
             tkr = (h.get("ticker") or "").upper()
             if not tkr:
@@ -1222,6 +1384,9 @@ def portfolio_value_breakdown(owner: str, date: str) -> List[Dict[str, Any]]:
                 key,
                 {"ticker": sym, "exchange": exch, "units": 0.0},
             )
+            total = held[(account, tkr)]
+            if total and timeline is not None and tkr in timeline and timeline.reconciles(tkr, total, today):
+                units = timeline.units_on(tkr, target) * (units / total)
             row["units"] += units
 
     result: List[Dict[str, Any]] = []
@@ -1245,19 +1410,22 @@ def _portfolio_value_series(
     group: bool = False,
     pricing_date: date | None = None,
 ) -> pd.Series:
-    """Helper to compute daily portfolio values for an owner or group."""
+    """Helper to compute daily portfolio values for an owner or group.
+
+    Each day is valued at the units held that day (see :func:`_units_on_dates`).
+    """
 
-    calc = PricingDateCalculator(reporting_date=pricing_date)
     if group:
-        pf = group_portfolio.build_group_portfolio(name, pricing_date=calc.reporting_date)
-    else:
-        pf = portfolio_mod.build_owner_portfolio(name, pricing_date=calc.reporting_date)
+        return _group_value_series(name, days, pricing_date=pricing_date)
+    calc = PricingDateCalculator(reporting_date=pricing_date)
+    pf = portfolio_mod.build_owner_portfolio(name, pricing_date=calc.reporting_date)
 
     from backend.common import instrument_api
 
     flagged = {k.upper() for k, v in _PRICE_SNAPSHOT.items() if v.get("flagged")}
-    holdings: List[tuple[str, str, float]] = []
+    holdings: List[tuple[str, str, float, str, str]] = []
     for acct in pf.get("accounts", []):
+        account = str(acct.get("account_type") or "").lower()
         for h in acct.get("holdings", []):
             tkr = (h.get("ticker") or "").upper()
             if not tkr:
@@ -1277,19 +1445,20 @@ def _portfolio_value_series(
             if full in flagged:
                 logger.debug("Skipping flagged instrument %s", sanitise_log_value(full))
                 continue
-            holdings.append((sym, exch, units))
+            holdings.append((sym, exch, units, account, tkr))
 
     effective_days = _effective_days(
         days,
         requested_pricing_date=pricing_date,
         reporting_date=calc.reporting_date,
     )
-    value_series: list[pd.Series] = []
-    for ticker, exchange, units in holdings:
-        df = load_meta_timeseries(ticker, exchange, effective_days)
+    close_series: list[pd.Series] = []
+    positions: List[tuple[float, str, str]] = []
+    for ticker, exchange, units, account, tkr in holdings:
+        df = load_meta_timeseries(ticker, exchange, effective_days, readonly=True)
         if df.empty or "Date" not in df.columns or "Close" not in df.columns:
             continue
-        df = df[["Date", "Close"]].copy()
+        df = df[["Date", "Close"]]
         df["Date"] = pd.to_datetime(df["Date"]).dt.date
         closes = pd.to_numeric(df.set_index("Date")["Close"], errors="coerce")
         valid_closes = closes.dropna()
@@ -1302,17 +1471,20 @@ def _portfolio_value_series(
                 sanitise_log_value(ticker),
                 sanitise_log_value(exchange),
             )
-        values = (valid_closes * units).sort_index()
-        values = values[values.index <= calc.reporting_date]
-        if values.empty:
+        valid_closes = valid_closes.sort_index()
+        valid_closes = valid_closes[valid_closes.index <= calc.reporting_date]
+        if valid_closes.empty:
             continue
-        value_series.append(values)
+        close_series.append(valid_closes)
+        positions.append((units, account, tkr))
 
-    if not value_series:
+    if not close_series:
         return pd.Series(dtype=float)
 
-    value_frame = pd.concat(value_series, axis=1).sort_index()
-    total = value_frame.ffill(limit=_MAX_PRICE_GAP_FILL_DAYS).sum(axis=1, min_count=1)
+    close_frame = pd.concat(close_series, axis=1).sort_index().ffill(limit=_MAX_PRICE_GAP_FILL_DAYS)
+    dates = np.array(close_frame.index, dtype="datetime64[D]")
+    units = _units_on_dates(name, dates, positions, calc.reporting_date)
+    total = (close_frame * units).sum(axis=1, min_count=1)
 
     total = total.sort_index()
     total = total[total.index <= calc.reporting_date]
@@ -1329,6 +1501,253 @@ def _portfolio_value_series(
     return total
 
 
+def _group_members(slug: str) -> List[str]:
+    groups = {g["slug"]: g for g in group_portfolio.list_groups()}
+    grp = groups.get(slug)
+    if not grp:
+        raise ValueError(f"Unknown group slug: {slug!r}")
+    return list(grp.get("members", []))
+
+
+def _group_value_series(slug: str, days: int = 365, *, pricing_date: date | None = None) -> pd.Series:
+    """Return the daily value of group ``slug`` as the sum of its members' series.
+
+    Member series come from each owner's shared :func:`analytics_context`,
+    so a group costs one alignment and addition over series its members'
+    own requests have usually computed already, rather than a re-valuation
+    of the merged group portfolio. Members are aligned on the union of their
+    dates with gaps carried forward, as holdings are within one owner.
+    """
+    member_series: list[pd.Series] = []
+    for member in _group_members(slug):
+        try:
+            series = analytics_context(member, days, pricing_date=pricing_date).value_series()
+        except FileNotFoundError:
+            logger.debug("Skipping group member without a portfolio: %s", sanitise_log_value(member))
+            continue
+        if not series.empty:
+            member_series.append(series)
+    if not member_series:
+        return pd.Series(dtype=float)
+    total = pd.concat(member_series, axis=1).sort_index()
+    total = total.ffill(limit=_MAX_PRICE_GAP_FILL_DAYS).sum(axis=1, min_count=1)
+    return total.tail(days) if days else total
+
+
+@dataclass(frozen=True)
+class BenchmarkReturns:
+    """Daily and cumulative close-to-close returns of one benchmark, indexed by date."""
+
+    daily: pd.Series
+    cumulative: pd.Series
+
+    def cumulative_over(self, dates: pd.Index) -> np.ndarray:
+        """Return cumulative returns compounded from the first of ``dates``.
+
+        ``dates`` must be a subset of :attr:`daily`'s index in order. When
+        they are a contiguous run of it the stored cumulative returns are
+        rebased; otherwise the daily returns on ``dates`` are compounded.
+        """
+        positions = self.daily.index.get_indexer(dates)
+        if not len(positions):
+            return np.empty(0)
+        if (positions >= 0).all() and (np.diff(positions) == 1).all():
+            growth = self.cumulative.to_numpy(dtype="float64") + 1.0
+            base = growth[positions[0] - 1] if positions[0] > 0 else 1.0
+            return growth[positions] / base - 1.0
+        return np.cumprod(1.0 + self.daily.reindex(dates).to_numpy(dtype="float64")) - 1.0
+
+
+def _load_benchmark_returns(benchmark: str, effective_days: int, reporting_date: date) -> BenchmarkReturns | None:
+    bench_tkr, bench_exch = (benchmark.split(".", 1) + ["L"])[:2]
+    df = load_meta_timeseries(bench_tkr, bench_exch, effective_days, readonly=True)
+    if df.empty or "Close" not in df.columns or "Date" not in df.columns:
+        return None
+    df = df[["Date", "Close"]]
+    df["Date"] = pd.to_datetime(df["Date"]).dt.date
+    df = df[df["Date"] <= reporting_date]
+    daily = df.set_index("Date")["Close"].pct_change().dropna()
+    return BenchmarkReturns(daily=daily, cumulative=(1 + daily).cumprod() - 1)
+
+
+# Benchmark returns are shared by every owner and group compared with the
+# same benchmark over the same window. Entries are keyed on the price
+# snapshot timestamp, so a price refresh starts afresh; the TTL bounds
+# staleness for timeseries refreshed on disk without a new snapshot.
+_BENCHMARK_RETURNS_TTL_SECONDS = 300
+_BENCHMARK_RETURNS_MAX_ENTRIES = 64
+_BENCHMARK_RETURNS: "OrderedDict[tuple, tuple[float, BenchmarkReturns | None]]" = OrderedDict()
+_BENCHMARK_RETURNS_LOCK = threading.Lock()
+
+
+def benchmark_returns(
+    benchmark: str,
+    days: int,
+    *,
+    pricing_date: date | None,
+    reporting_date: date,
+) -> BenchmarkReturns | None:
+    """Return daily and cumulative returns for ``benchmark`` up to ``reporting_date``.
+
+    ``None`` means the benchmark has no usable ``Date``/``Close`` history.
+    """
+    effective_days = _effective_days(
+        days,
+        requested_pricing_date=pricing_date,
+        reporting_date=reporting_date,
+    )
+    key = (benchmark.upper(), effective_days, reporting_date, _PRICE_SNAPSHOT_TS)
+    now = time.monotonic()
+    with _BENCHMARK_RETURNS_LOCK:
+        cached = _BENCHMARK_RETURNS.get(key)
+        if cached is not None and now - cached[0] < _BENCHMARK_RETURNS_TTL_SECONDS:
+            _BENCHMARK_RETURNS.move_to_end(key)
+            return cached[1]
+    returns = _load_benchmark_returns(benchmark, effective_days, reporting_date)
+    with _BENCHMARK_RETURNS_LOCK:
+        _BENCHMARK_RETURNS[key] = (now, returns)
+        _BENCHMARK_RETURNS.move_to_end(key)
+        while len(_BENCHMARK_RETURNS) > _BENCHMARK_RETURNS_MAX_ENTRIES:
+            _BENCHMARK_RETURNS.popitem(last=False)
+    return returns
+
+
+def clear_benchmark_returns() -> None:
+    with _BENCHMARK_RETURNS_LOCK:
+        _BENCHMARK_RETURNS.clear()
+
+
+class AnalyticsContext:
+    """Inputs shared by the performance metrics of one owner or group.
+
+    The portfolio value series and the owner's transactions are loaded on
+    first use and then kept, so alpha, tracking error, drawdown, TWR, XIRR
+    and CAGR computed from one context value the portfolio once; benchmark
+    returns come from the process-wide :func:`benchmark_returns` store.
+    Every metric builds a throwaway context when it is not handed one;
+    :func:`analytics_context` hands out shared ones.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        days: int = 365,
+        *,
+        group: bool = False,
+        pricing_date: date | None = None,
+    ) -> None:
+        self.name = name
+        self.days = days
+        self.group = group
+        self.pricing_date = pricing_date
+        self._lock = threading.RLock()
+        self._reporting_date: date | None = None
+        self._values: pd.Series | None = None
+        self._transactions: List[Dict[str, Any]] | None = None
+
+    @property
+    def reporting_date(self) -> date:
+        with self._lock:
+            if self._reporting_date is None:
+                self._reporting_date = PricingDateCalculator(reporting_date=self.pricing_date).reporting_date
+            return self._reporting_date
+
+    def value_series(self) -> pd.Series:
+        """Return the daily portfolio values (see :func:`_portfolio_value_series`)."""
+        with self._lock:
+            if self._values is None:
+                self._values = _portfolio_value_series(
+                    self.name,
+                    self.days,
+                    group=self.group,
+                    pricing_date=self.pricing_date,
+                )
+            return self._values
+
+    def transactions(self) -> List[Dict[str, Any]]:
+        """Return the owner's transactions (owners only; groups have none)."""
+        with self._lock:
+            if self._transactions is None:
+                self._transactions = load_transactions(self.name)
+            return self._transactions
+
+    def benchmark_returns(self, benchmark: str) -> BenchmarkReturns | None:
+        """Return ``benchmark``'s returns over this context's window (see :func:`benchmark_returns`)."""
+        return benchmark_returns(
+            benchmark,
+            self.days,
+            pricing_date=self.pricing_date,
+            reporting_date=self.reporting_date,
+        )
+
+
+# Shared contexts are keyed on the data they were computed from; the TTL
+# bounds staleness for inputs the key cannot see (timeseries refreshed on
+# disk without a new price snapshot).
+_ANALYTICS_CONTEXT_TTL_SECONDS = 300
+_ANALYTICS_CONTEXT_MAX_ENTRIES = 32
+_ANALYTICS_CONTEXTS: "OrderedDict[tuple, tuple[float, AnalyticsContext]]" = OrderedDict()
+_ANALYTICS_CONTEXTS_LOCK = threading.Lock()
+
+
+def _analytics_data_version(name: str, group: bool) -> tuple:
+    """Return the price snapshot time and a signature of the account files behind ``name``."""
+    root = resolve_paths(config.repo_root, config.accounts_root).accounts_root
+    if group:
+        paths = sorted(root.glob("*/*.json"))
+    else:
+        try:
+            paths = sorted(safe_join(root, name).glob("*.json"))
+        except ValueError:
+            paths = []
+    signature = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        signature.append((str(path.relative_to(root)), int(st.st_mtime_ns), st.st_size))
+    return _PRICE_SNAPSHOT_TS, tuple(signature)
+
+
+def analytics_context(
+    name: str,
+    days: int = 365,
+    *,
+    group: bool = False,
+    pricing_date: date | None = None,
+) -> AnalyticsContext:
+    """Return a shared :class:`AnalyticsContext` for ``name``.
+
+    Contexts are keyed on owner (or group), window, pricing date and data
+    version -- the price snapshot timestamp plus the modification time and
+    size of the owner's account files -- so a refreshed snapshot or edited
+    holdings/transactions start a new context.
+    """
+    key = (name, group, days, pricing_date, _analytics_data_version(name, group))
+    now = time.monotonic()
+    with _ANALYTICS_CONTEXTS_LOCK:
+        cached = _ANALYTICS_CONTEXTS.get(key)
+        if cached is not None and now - cached[0] < _ANALYTICS_CONTEXT_TTL_SECONDS:
+            _ANALYTICS_CONTEXTS.move_to_end(key)
+            return cached[1]
+        ctx = AnalyticsContext(name, days, group=group, pricing_date=pricing_date)
+        _ANALYTICS_CONTEXTS[key] = (now, ctx)
+        _ANALYTICS_CONTEXTS.move_to_end(key)
+        while len(_ANALYTICS_CONTEXTS) > _ANALYTICS_CONTEXT_MAX_ENTRIES:
+            _ANALYTICS_CONTEXTS.popitem(last=False)
+    return ctx
+
+
+def clear_analytics_contexts() -> None:
+    with _ANALYTICS_CONTEXTS_LOCK:
+        _ANALYTICS_CONTEXTS.clear()
+
+
+def _iso_dates(index: pd.Index) -> List[str]:
+    return [d.isoformat() if hasattr(d, "isoformat") else str(d) for d in index]
+
+
 def _alpha_vs_benchmark(
     name: str,
     benchmark: str,
@@ -1337,9 +1756,10 @@ def _alpha_vs_benchmark(
     group: bool = False,
     include_breakdown: bool = False,
     pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
 ) -> tuple[float | None, dict[str, Any]]:
-    calc = PricingDateCalculator(reporting_date=pricing_date)
-    total = _portfolio_value_series(name, days, group=group, pricing_date=pricing_date)
+    ctx = context or AnalyticsContext(name, days, group=group, pricing_date=pricing_date)
+    total = ctx.value_series()
     if total.empty:
         return None, {
             "series": [],
@@ -1348,25 +1768,15 @@ def _alpha_vs_benchmark(
         }
     port_ret = total.pct_change().dropna()
 
-    bench_tkr, bench_exch = (benchmark.split(".", 1) + ["L"])[:2]
-    effective_days = _effective_days(
-        days,
-        requested_pricing_date=pricing_date,
-        reporting_date=calc.reporting_date,
-    )
-    df = load_meta_timeseries(bench_tkr, bench_exch, effective_days)
-    if df.empty or "Close" not in df.columns or "Date" not in df.columns:
+    bench = ctx.benchmark_returns(benchmark)
+    if bench is None:
         return None, {
             "series": [],
             "portfolio_cumulative_return": None,
             "benchmark_cumulative_return": None,
         }
-    df = df[["Date", "Close"]].copy()
-    df["Date"] = pd.to_datetime(df["Date"]).dt.date
-    df = df[df["Date"] <= calc.reporting_date]
-    bench_ret = df.set_index("Date")["Close"].pct_change().dropna()
 
-    port_ret, bench_ret = port_ret.align(bench_ret, join="inner")
+    port_ret, bench_ret = port_ret.align(bench.daily, join="inner")
     if port_ret.empty:
         return None, {
             "series": [],
@@ -1386,28 +1796,28 @@ def _alpha_vs_benchmark(
             "benchmark_cumulative_return": None,
         }
 
-    port_cum_series = (1 + aligned["portfolio"]).cumprod() - 1
-    bench_cum_series = (1 + aligned["benchmark"]).cumprod() - 1
-    value = float(port_cum_series.iloc[-1] - bench_cum_series.iloc[-1])
+    port_cum = np.cumprod(1.0 + aligned["portfolio"].to_numpy(dtype="float64")) - 1.0
+    bench_cum = bench.cumulative_over(aligned.index)
+    excess = port_cum - bench_cum
+    value = float(excess[-1])
 
     if not include_breakdown:
         return value, {}
 
-    breakdown_series: list[dict[str, Any]] = []
-    for idx, _row in aligned.iterrows():
-        breakdown_series.append(
-            {
-                "date": idx.isoformat() if hasattr(idx, "isoformat") else str(idx),
-                "portfolio_cumulative_return": float(port_cum_series.loc[idx]),
-                "benchmark_cumulative_return": float(bench_cum_series.loc[idx]),
-                "excess_cumulative_return": float(port_cum_series.loc[idx] - bench_cum_series.loc[idx]),
-            }
-        )
+    breakdown_series = [
+        {
+            "date": d,
+            "portfolio_cumulative_return": p,
+            "benchmark_cumulative_return": b,
+            "excess_cumulative_return": e,
+        }
+        for d, p, b, e in zip(_iso_dates(aligned.index), port_cum.tolist(), bench_cum.tolist(), excess.tolist())
+    ]
 
     breakdown = {
         "series": breakdown_series,
-        "portfolio_cumulative_return": float(port_cum_series.iloc[-1]),
-        "benchmark_cumulative_return": float(bench_cum_series.iloc[-1]),
+        "portfolio_cumulative_return": float(port_cum[-1]),
+        "benchmark_cumulative_return": float(bench_cum[-1]),
     }
     return value, breakdown
 
@@ -1420,28 +1830,19 @@ def _tracking_error(
     group: bool = False,
     include_breakdown: bool = False,
     pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
 ) -> tuple[float | None, dict[str, Any]]:
-    calc = PricingDateCalculator(reporting_date=pricing_date)
-    total = _portfolio_value_series(name, days, group=group, pricing_date=pricing_date)
+    ctx = context or AnalyticsContext(name, days, group=group, pricing_date=pricing_date)
+    total = ctx.value_series()
     if total.empty:
         return None, {"active_returns": [], "daily_active_standard_deviation": None}
     port_ret = total.pct_change().dropna()
 
-    bench_tkr, bench_exch = (benchmark.split(".", 1) + ["L"])[:2]
-    effective_days = _effective_days(
-        days,
-        requested_pricing_date=pricing_date,
-        reporting_date=calc.reporting_date,
-    )
-    df = load_meta_timeseries(bench_tkr, bench_exch, effective_days)
-    if df.empty or "Close" not in df.columns or "Date" not in df.columns:
+    bench = ctx.benchmark_returns(benchmark)
+    if bench is None:
         return None, {"active_returns": [], "daily_active_standard_deviation": None}
-    df = df[["Date", "Close"]].copy()
-    df["Date"] = pd.to_datetime(df["Date"]).dt.date
-    df = df[df["Date"] <= calc.reporting_date]
-    bench_ret = df.set_index("Date")["Close"].pct_change().dropna()
 
-    port_ret, bench_ret = port_ret.align(bench_ret, join="inner")
+    port_ret, bench_ret = port_ret.align(bench.daily, join="inner")
     if port_ret.empty:
         return None, {"active_returns": [], "daily_active_standard_deviation": None}
     aligned = pd.DataFrame({"portfolio": port_ret, "benchmark": bench_ret})
@@ -1457,16 +1858,20 @@ def _tracking_error(
     if not include_breakdown:
         return annualised, {}
 
-    active_rows: list[dict[str, Any]] = []
-    for idx, row in aligned.iterrows():
-        active_rows.append(
-            {
-                "date": idx.isoformat() if hasattr(idx, "isoformat") else str(idx),
-                "portfolio_return": float(row["portfolio"]),
-                "benchmark_return": float(row["benchmark"]),
-                "active_return": float(row["active"]),
-            }
+    active_rows = [
+        {
+            "date": d,
+            "portfolio_return": p,
+            "benchmark_return": b,
+            "active_return": a,
+        }
+        for d, p, b, a in zip(
+            _iso_dates(aligned.index),
+            aligned["portfolio"].to_numpy(dtype="float64").tolist(),
+            aligned["benchmark"].to_numpy(dtype="float64").tolist(),
+            aligned["active"].to_numpy(dtype="float64").tolist(),
         )
+    ]
 
     breakdown = {
         "active_returns": active_rows,
@@ -1482,8 +1887,10 @@ def _max_drawdown(
     group: bool = False,
     include_breakdown: bool = False,
     pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
 ) -> tuple[float | None, dict[str, Any]]:
-    total = _portfolio_value_series(name, days, group=group, pricing_date=pricing_date)
+    ctx = context or AnalyticsContext(name, days, group=group, pricing_date=pricing_date)
+    total = ctx.value_series()
     if total.empty:
         return None, {"series": [], "peak": None, "trough": None}
     running_max = total.cummax()
@@ -1494,16 +1901,15 @@ def _max_drawdown(
     if not include_breakdown:
         return value, {}
 
-    series: list[dict[str, Any]] = []
-    for idx, val in total.items():
-        series.append(
-            {
-                "date": idx.isoformat() if hasattr(idx, "isoformat") else str(idx),
-                "portfolio_value": float(val),
-                "running_max": float(running_max.loc[idx]),
-                "drawdown": float(drawdown.loc[idx]),
-            }
+    series = [
+        {"date": d, "portfolio_value": v, "running_max": m, "drawdown": dd}
+        for d, v, m, dd in zip(
+            _iso_dates(total.index),
+            total.to_numpy(dtype="float64").tolist(),
+            running_max.to_numpy(dtype="float64").tolist(),
+            drawdown.to_numpy(dtype="float64").tolist(),
         )
+    ]
 
     peak_info: dict[str, Any] | None = None
     trough_info: dict[str, Any] | None = None
@@ -1538,6 +1944,7 @@ def compute_alpha_vs_benchmark(
     *,
     include_breakdown: bool = False,
     pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
 ) -> float | None | tuple[float | None, dict[str, Any]]:
     value, breakdown = _alpha_vs_benchmark(
         owner,
@@ -1545,6 +1952,7 @@ def compute_alpha_vs_benchmark(
         days,
         include_breakdown=include_breakdown,
         pricing_date=pricing_date,
+        context=context,
     )
     if include_breakdown:
         return value, breakdown
@@ -1571,6 +1979,7 @@ def compute_tracking_error(
     *,
     include_breakdown: bool = False,
     pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
 ) -> float | None | tuple[float | None, dict[str, Any]]:
     value, breakdown = _tracking_error(
         owner,
@@ -1578,6 +1987,7 @@ def compute_tracking_error(
         days,
         include_breakdown=include_breakdown,
         pricing_date=pricing_date,
+        context=context,
     )
     if include_breakdown:
         return value, breakdown
@@ -1603,8 +2013,15 @@ def compute_max_drawdown(
     *,
     include_breakdown: bool = False,
     pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
 ) -> float | None | tuple[float | None, dict[str, Any]]:
-    value, breakdown = _max_drawdown(owner, days, include_breakdown=include_breakdown, pricing_date=pricing_date)
+    value, breakdown = _max_drawdown(
+        owner,
+        days,
+        include_breakdown=include_breakdown,
+        pricing_date=pricing_date,
+        context=context,
+    )
     if include_breakdown:
         return value, breakdown
     return value
@@ -1622,6 +2039,72 @@ def compute_group_max_drawdown(
     return value
 
 
+def _rolling_risk(
+    name: str,
+    benchmark: str,
+    window: int,
+    days: int = 365,
+    *,
+    group: bool = False,
+    pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
+) -> dict[str, Any]:
+    ctx = context or AnalyticsContext(name, days, group=group, pricing_date=pricing_date)
+    total = ctx.value_series()
+    port_ret = total.pct_change().replace([np.inf, -np.inf], np.nan).dropna()
+    bench = ctx.benchmark_returns(benchmark)
+    if bench is not None:
+        aligned = pd.DataFrame({"portfolio": port_ret, "benchmark": bench.daily}).dropna()
+    else:
+        aligned = pd.DataFrame({"portfolio": port_ret})
+    if len(aligned) < window:
+        return {"window": window, "series": []}
+
+    metrics = rolling_risk(
+        aligned["portfolio"].to_numpy(dtype="float64"),
+        window,
+        benchmark=aligned["benchmark"].to_numpy(dtype="float64") if bench is not None else None,
+        risk_free_rate=config.risk_free_rate or 0.0,
+    )
+    ends = _iso_dates(aligned.index[window - 1 :])
+    missing = [None] * len(ends)
+    columns = {
+        key: [None if math.isnan(v) else v for v in metrics[key].tolist()] if key in metrics else missing
+        for key in ("volatility", "sharpe_ratio", "sortino_ratio", "beta", "correlation")
+    }
+    series = [{"date": d, **{key: col[i] for key, col in columns.items()}} for i, d in enumerate(ends)]
+    return {"window": window, "series": series}
+
+
+def compute_rolling_risk(
+    owner: str,
+    benchmark: str = "VWRL.L",
+    window: int = 63,
+    days: int = 365,
+    *,
+    pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
+) -> dict[str, Any]:
+    """Return rolling volatility, Sharpe, Sortino, beta and correlation for ``owner``.
+
+    Each point covers the ``window`` daily returns ending on its date (see
+    :func:`backend.common.rolling_risk.rolling_risk`); returns are aligned
+    with the benchmark's, and beta/correlation are ``None`` when the
+    benchmark has no history.
+    """
+    return _rolling_risk(owner, benchmark, window, days, pricing_date=pricing_date, context=context)
+
+
+def compute_group_rolling_risk(
+    slug: str,
+    benchmark: str = "VWRL.L",
+    window: int = 63,
+    days: int = 365,
+) -> dict[str, Any]:
+    """Return :func:`compute_rolling_risk` metrics for group ``slug``."""
+    return _rolling_risk(slug, benchmark, window, days, group=True)
+
+
 # ──────────────────────────────────────────────────────────────
 # Return metrics
 # ──────────────────────────────────────────────────────────────
@@ -1652,17 +2135,19 @@ def compute_time_weighted_return(
     days: int = 365,
     *,
     pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
 ) -> float | None:
     """Compute time-weighted return for ``owner`` over ``days``."""
 
-    total = _portfolio_value_series(owner, days, pricing_date=pricing_date)
+    ctx = context or AnalyticsContext(owner, days, pricing_date=pricing_date)
+    total = ctx.value_series()
     if total.empty or len(total) < 2:
         return None
 
     start = total.index.min()
     end = total.index.max()
 
-    txs = load_transactions(owner)
+    txs = ctx.transactions()
     flows: defaultdict[date, float] = defaultdict(float)
     for t in txs:
         d = _parse_date(t.get("date"))
@@ -1688,18 +2173,16 @@ def compute_time_weighted_return(
     return float(twr - 1.0)
 
 
-def compute_xirr(owner: str, days: int = 365, *, pricing_date: date | None = None) -> float | None:
-    """Compute XIRR for ``owner`` over ``days`` using cash flows."""
-
-    total = _portfolio_value_series(owner, days, pricing_date=pricing_date)
-    if total.empty:
-        return None
+def _xirr_cash_flows(total: pd.Series, txs: List[Dict[str, Any]]) -> tuple[List[date], List[float]]:
+    """Return XIRR cash flows: external flows inside ``total``'s window plus its closing value.
 
+    Deposits count as money paid in (negative); withdrawals, dividends and
+    interest as money received (positive).
+    """
     start = total.index.min()
     end = total.index.max()
-
-    txs = load_transactions(owner)
-    flows: list[tuple[date, float]] = []
+    dates: List[date] = []
+    amounts: List[float] = []
     for t in txs:
         d = _parse_date(t.get("date"))
         if not d or d < start or d > end:
@@ -1711,57 +2194,67 @@ def compute_xirr(owner: str, days: int = 365, *, pricing_date: date | None = Non
             except (TypeError, ValueError):
                 continue
             sign = 1 if _CASH_FLOW_SIGNS[typ] < 0 else -1
-            flows.append((d, amt * sign))
+            dates.append(d)
+            amounts.append(amt * sign)
+    dates.append(end)
+    amounts.append(float(total.iloc[-1]))
+    return dates, amounts
+
+
+def compute_xirr(
+    owner: str,
+    days: int = 365,
+    *,
+    pricing_date: date | None = None,
+    context: AnalyticsContext | None = None,
+) -> float | None:
+    """Compute XIRR for ``owner`` over ``days`` using cash flows."""
 
-    flows.append((end, float(total.iloc[-1])))
-    if len(flows) < 2:
+    ctx = context or AnalyticsContext(owner, days, pricing_date=pricing_date)
+    total = ctx.value_series()
+    if total.empty:
         return None
+    dates, amounts = _xirr_cash_flows(total, ctx.transactions())
+    return xirr(dates, amounts)
 
-    flows.sort(key=lambda x: x[0])
-    start = flows[0][0]
 
-    def xnpv(rate: float) -> float:
-        return sum(amt / (1.0 + rate) ** ((d - start).days / 365.0) for d, amt in flows)
+def compute_xirr_many(
+    owners: List[str],
+    days: int = 365,
+    *,
+    pricing_date: date | None = None,
+) -> Dict[str, float | None]:
+    """Compute XIRR for every owner in ``owners`` with one vectorised solve.
 
-    rate = 0.1
-    converged = False
-    for _ in range(100):
-        try:
-            f = float(xnpv(rate))
-        except (OverflowError, ValueError, TypeError):
-            return None
-        if abs(f) < 1e-6:
-            converged = True
-            break
+    Owners that do not exist or have no value history map to ``None``.
+    """
+
+    flow_sets: list[tuple[List[date], List[float]]] = []
+    solved: list[str] = []
+    for owner in owners:
+        ctx = analytics_context(owner, days, pricing_date=pricing_date)
         try:
-            df = float(
-                sum(
-                    -((d - start).days / 365.0) * amt / (1.0 + rate) ** ((d - start).days / 365.0 + 1)
-                    for d, amt in flows
-                )
-            )
-        except (OverflowError, ValueError, TypeError):
-            return None
-        if df == 0 or not math.isfinite(df):
-            return None
-        rate_new = rate - f / df
-        if not math.isfinite(rate_new) or rate_new <= -1:
-            return None
-        if abs(rate_new - rate) < 1e-7:
-            rate = rate_new
-            converged = True
-            break
-        rate = rate_new
-
-    if not converged or not math.isfinite(rate):
-        return None
-    return float(rate)
+            total = ctx.value_series()
+            if total.empty:
+                continue
+            flow_sets.append(_xirr_cash_flows(total, ctx.transactions()))
+        except FileNotFoundError:
+            continue
+        solved.append(owner)
+    rates = dict(zip(solved, xirr_many(flow_sets)))
+    return {owner: rates.get(owner) for owner in owners}
 
 
-def compute_cagr(owner: str, days: int = 365) -> float | None:
+def compute_group_xirr(slug: str, days: int = 365) -> Dict[str, float | None]:
+    """Return ``{member: XIRR}`` for every member of group ``slug``."""
+
+    return compute_xirr_many(_group_members(slug), days)
+
+
+def compute_cagr(owner: str, days: int = 365, *, context: AnalyticsContext | None = None) -> float | None:
     """Compute the portfolio CAGR for ``owner`` over ``days``."""
 
-    total = _portfolio_value_series(owner, days)
+    total = (context or AnalyticsContext(owner, days)).value_series()
     if total.empty or len(total) < 2:
         return None
 
@@ -1773,6 +2266,33 @@ def compute_cagr(owner: str, days: int = 365) -> float | None:
     return float((end_val / start_val) ** (1 / years) - 1)
 
 
+def compute_performance_summary(
+    owner: str,
+    benchmark: str = "VWRL.L",
+    days: int = 365,
+    *,
+    pricing_date: date | None = None,
+) -> Dict[str, float | None]:
+    """Return alpha, tracking error, max drawdown, TWR, XIRR and CAGR for ``owner``.
+
+    All six metrics share one :func:`analytics_context`, so the portfolio
+    is valued and the benchmark loaded once for the whole summary.
+    """
+
+    ctx = analytics_context(owner, days, pricing_date=pricing_date)
+    alpha, _ = _alpha_vs_benchmark(owner, benchmark, days, pricing_date=pricing_date, context=ctx)
+    tracking_error, _ = _tracking_error(owner, benchmark, days, pricing_date=pricing_date, context=ctx)
+    max_drawdown, _ = _max_drawdown(owner, days, pricing_date=pricing_date, context=ctx)
+    return {
+        "alpha_vs_benchmark": alpha,
+        "tracking_error": tracking_error,
+        "max_drawdown": max_drawdown,
+        "time_weighted_return": compute_time_weighted_return(owner, days, pricing_date=pricing_date, context=ctx),
+        "xirr": compute_xirr(owner, days, pricing_date=pricing_date, context=ctx),
+        "cagr": compute_cagr(owner, days, context=ctx),
+    }
+
+
 def _cash_value_series(owner: str, days: int = 365) -> pd.Series:
     """Helper to compute daily cash values for an owner."""
 
@@ -1798,10 +2318,10 @@ def _cash_value_series(owner: str, days: int = 365) -> pd.Series:
 
     total = pd.Series(dtype=float)
     for ticker, exchange, units in holdings:
-        df = load_meta_timeseries(ticker, exchange, days)
+        df = load_meta_timeseries(ticker, exchange, days, readonly=True)
         if df.empty or "Date" not in df.columns or "Close" not in df.columns:
             continue
-        df = df[["Date", "Close"]].copy()
+        df = df[["Date", "Close"]]
         df["Date"] = pd.to_datetime(df["Date"]).dt.date
         values = df.set_index("Date")["Close"] * units
         total = total.add(values, fill_value=0)
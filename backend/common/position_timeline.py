@@ -0,0 +1,151 @@
+"""
+Units held per ticker over time, built once from transaction documents.
+
+:func:`backend.common.portfolio_loader.get_units_as_of` replays the whole
+transaction log for every ``(ticker, date)`` it is asked about. A
+:class:`PositionTimeline` replays it once: for each ticker it keeps the
+sorted dates on which its units changed and the cumulative units after each
+of those dates, so the units on any date are a binary search and the units
+on every date of a price calendar are one ``searchsorted`` call.
+
+:func:`owner_timelines` builds one timeline per account from the owner's
+``<account>_transactions.json`` files and caches them until any of those
+files changes (by modification time, size and name).
+
+Transaction logs are not always complete -- an account may have been
+imported as a holdings snapshot with no history. :meth:`PositionTimeline.reconciles`
+lets callers check that a timeline ends at the units the holdings file
+reports before trusting it for past dates.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+
+from backend.common.data_loader import resolve_paths
+from backend.common.path_utils import safe_join
+from backend.common.portfolio_loader import iter_unit_changes
+from backend.config import config
+from backend.logging_setup import sanitise_log_value
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_DATES = np.array([], dtype="datetime64[D]")
+_EMPTY_UNITS = np.array([], dtype="float64")
+
+
+class PositionTimeline:
+    """Cumulative units per ticker as step functions over dates."""
+
+    def __init__(self, steps: Dict[str, Tuple[np.ndarray, np.ndarray]] | None = None) -> None:
+        self._steps = steps or {}
+
+    @classmethod
+    def from_transactions(cls, tx_data: Dict[str, Any]) -> "PositionTimeline":
+        """Build the timeline for one transactions document."""
+        changes: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for ticker, tx_date, qty in iter_unit_changes(tx_data):
+            changes[ticker][tx_date] += qty
+        steps = {}
+        for ticker, by_date in changes.items():
+            ordered = sorted(by_date)
+            steps[ticker] = (
+                np.array(ordered, dtype="datetime64[D]"),
+                np.cumsum([by_date[d] for d in ordered], dtype="float64"),
+            )
+        return cls(steps)
+
+    def tickers(self) -> list[str]:
+        return sorted(self._steps)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.upper() in self._steps
+
+    def units_over(self, ticker: str, dates: Iterable[Any]) -> np.ndarray:
+        """Return the units of ``ticker`` held at the end of each of ``dates``."""
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        change_dates, cumulative = self._steps.get(ticker.upper(), (_EMPTY_DATES, _EMPTY_UNITS))
+        if not len(change_dates):
+            return np.zeros(len(dates))
+        pos = np.searchsorted(change_dates, dates, side="right")
+        return np.where(pos > 0, cumulative[np.maximum(pos - 1, 0)], 0.0)
+
+    def units_on(self, ticker: str, as_of: date | str) -> float:
+        """Return the units of ``ticker`` held at the end of ``as_of``."""
+        return float(self.units_over(ticker, [np.datetime64(str(as_of)[:10], "D")])[0])
+
+    def reconciles(self, ticker: str, units: float, as_of: date | str, *, tolerance: float = 1e-6) -> bool:
+        """Return whether the timeline holds ``units`` of ``ticker`` on ``as_of``."""
+        held = self.units_on(ticker, as_of)
+        return abs(held - units) <= tolerance * max(1.0, abs(units))
+
+
+_CACHE: Dict[str, Tuple[Tuple[Tuple[str, int, int], ...], Dict[str, PositionTimeline]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _owner_dir(owner: str, accounts_root: Path | None) -> Path | None:
+    root = Path(accounts_root) if accounts_root else resolve_paths(config.repo_root, config.accounts_root).accounts_root
+    try:
+        owner_dir = safe_join(root, owner)
+    except ValueError:
+        return None
+    return owner_dir if owner_dir.is_dir() else None
+
+
+def _files_signature(paths: list[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    signature = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        signature.append((path.name, int(st.st_mtime_ns), st.st_size))
+    return tuple(signature)
+
+
+def owner_timelines(owner: str, accounts_root: Path | None = None) -> Dict[str, PositionTimeline]:
+    """Return ``{account_type (lower-case): PositionTimeline}`` for ``owner``.
+
+    Owners without a directory or transaction files get an empty mapping.
+    """
+    owner_dir = _owner_dir(owner, accounts_root)
+    if owner_dir is None:
+        return {}
+    paths = sorted(owner_dir.glob("*_transactions.json"))
+    signature = _files_signature(paths)
+    cache_key = str(owner_dir)
+    with _CACHE_LOCK:
+        cached = _CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    timelines: Dict[str, PositionTimeline] = {}
+    for path in paths:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Skipping transactions file %s: %s", sanitise_log_value(path), sanitise_log_value(exc))
+            continue
+        account = str(data.get("account_type") or path.stem.replace("_transactions", "")).lower()
+        timelines[account] = PositionTimeline.from_transactions(data)
+
+    with _CACHE_LOCK:
+        _CACHE[cache_key] = (signature, timelines)
+    return timelines
+
+
+def clear_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+__all__ = ["PositionTimeline", "clear_cache", "owner_timelines"]
@@ -55,9 +55,12 @@ from backend.common.portfolio_utils import (
 # ──────────────────────────────────────────────────────────────
 from backend.config import config
 from backend.logging_setup import sanitise_log_value
-from backend.timeseries.cache import load_meta_timeseries_range
+from backend.timeseries.cache import batched_manifest_updates, load_meta_timeseries_range
+from backend.timeseries.fetch_meta_timeseries import run_all_tickers
+from backend.timeseries.panel import load_panel_ranges
 from backend.utils.pricing_dates import PricingDateCalculator
 from backend.utils.timeseries_helpers import _nearest_weekday
+from backend.utils.trading_calendar import get_trading_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +73,7 @@ def _close_on(sym: str, exch: str, d: date) -> Optional[float]:
     through the same conversion path used elsewhere.
     """
 
-    snap = _nearest_weekday(d, forward=False)
+    snap = get_trading_calendar(exch).previous_trading_day(d)
     df = load_meta_timeseries_range(sym, exch, start_date=snap, end_date=snap)
     if df is None or df.empty:
         return None
@@ -117,16 +120,32 @@ def get_price_snapshot(tickers: List[str]) -> Dict[str, Dict]:
     - Last-close fallback: ``_load_latest_prices`` already converts to GBP
       → "GBP".
     - No-data path: ``None`` (last_price is also None; consumers should skip).
+
+    ``last_price_date`` and the 7/30 day anchors skip the holiday closures of
+    the ticker's exchange when it resolves, and weekends only otherwise.
     """
 
     calc = PricingDateCalculator(today=date.today(), weekday_func=_nearest_weekday)
-    last_trading_day = calc.reporting_date
+    # Holdings on a known exchange take their dates from its trading calendar.
+    exchange_calcs: Dict[str, PricingDateCalculator] = {}
     latest = _load_latest_prices(list(tickers))
     live = load_live_prices(list(tickers))
     now = datetime.now(UTC)
 
     snapshot: Dict[str, Dict] = {}
     for full in tickers:
+        resolved = instrument_api._resolve_full_ticker(full, latest)
+        if resolved:
+            sym, exch = resolved
+            if exch not in exchange_calcs:
+                exchange_calcs[exch] = PricingDateCalculator(today=calc.today, exchange=exch)
+            last_trading_day = exchange_calcs[exch].reporting_date
+        else:
+            sym = full.split(".", 1)[0]
+            exch = "L"
+            logger.debug("Could not resolve exchange for %s; defaulting to L", full)
+            last_trading_day = calc.reporting_date
+
         live_info = live.get(full.upper())
         last_close = latest.get(full)
         price = None
@@ -168,16 +187,8 @@ def get_price_snapshot(tickers: List[str]) -> Dict[str, Dict]:
         }
 
         if price is not None:
-            resolved = instrument_api._resolve_full_ticker(full, latest)
-            if resolved:
-                sym, exch = resolved
-            else:
-                sym = full.split(".", 1)[0]
-                exch = "L"
-                logger.debug("Could not resolve exchange for %s; defaulting to L", full)
-
-            px_7_candidate = calc.reporting_date - timedelta(days=7)
-            px_30_candidate = calc.reporting_date - timedelta(days=30)
+            px_7_candidate = last_trading_day - timedelta(days=7)
+            px_30_candidate = last_trading_day - timedelta(days=30)
 
             px_7 = _close_on(sym, exch, px_7_candidate)
             px_30 = _close_on(sym, exch, px_30_candidate)
@@ -296,7 +307,13 @@ def refresh_prices() -> Dict:
     tickers: List[str] = list_all_unique_tickers()
     logger.info("Updating price snapshot for: %s", [sanitise_log_value(t) for t in tickers])
 
-    snapshot = get_price_snapshot(tickers)
+    # Every series the snapshot extends is recorded in the cache manifest in one write.
+    with batched_manifest_updates():
+        # Warm the meta cache with batched Yahoo downloads first, so the
+        # snapshot reads cached rows instead of fetching ticker by ticker.
+        if not config.offline_mode:
+            run_all_tickers(tickers, batch=True)
+        snapshot = get_price_snapshot(tickers)
 
     # ---- persist to disk --------------------------------------------------
     if not config.prices_json:
@@ -416,11 +433,15 @@ def load_prices_for_tickers(
     """
     Fetch historical daily closes for a list of tickers and return a
     concatenated dataframe; keeps each original suffix (e.g. '.L').
+    Tickers the price panel holds current rows for come from one panel scan.
     """
     calc = PricingDateCalculator(today=date.today(), weekday_func=_nearest_weekday)
     start_date, end_date = calc.lookback_range(days, end=calc.today, forward_end=True)
 
     frames: List[pd.DataFrame] = []
+    tickers = list(tickers)
+    resolvable = (instrument_api._resolve_full_ticker(full, {}) for full in tickers)
+    panel_frames = load_panel_ranges([pair for pair in resolvable if pair], start_date, end_date)
 
     for full in tickers:
         try:
@@ -431,7 +452,9 @@ def load_prices_for_tickers(
                 ticker_only = full.split(".", 1)[0]
                 exchange = "L"
                 logger.debug("Could not resolve exchange for %s; defaulting to L", full)
-            df = load_meta_timeseries_range(ticker_only, exchange, start_date=start_date, end_date=end_date)
+            df = panel_frames.get((ticker_only, exchange))
+            if df is None:
+                df = load_meta_timeseries_range(ticker_only, exchange, start_date=start_date, end_date=end_date)
             if not df.empty:
                 df["Ticker"] = full  # restore suffix for display
                 frames.append(df)
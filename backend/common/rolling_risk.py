@@ -0,0 +1,126 @@
+"""
+Rolling risk metrics over a daily return series.
+
+Charting volatility, Sharpe, Sortino, beta and correlation over a moving
+window used to mean one standard-deviation/covariance computation per
+window position. Every one of those statistics is a function of a few
+window sums -- of the returns, their squares, the squared downside and the
+portfolio x benchmark products -- and each window sum is the difference of
+two entries of a cumulative sum. :func:`rolling_risk` therefore computes
+all the metrics for every window in a handful of array passes, whatever the
+window length.
+
+Cumulative sums of raw squares lose precision when the mean is large
+relative to the spread, so returns are centred on their overall mean first
+(variances and covariances do not depend on the shift).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Optional
+
+import numpy as np
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Return the sum of every run of ``window`` consecutive ``values``.
+
+    The result has ``len(values) - window + 1`` entries (none when there
+    are fewer than ``window`` values); entry ``i`` covers ``values[i : i + window]``.
+    """
+    values = np.asarray(values, dtype="float64")
+    if window < 1 or len(values) < window:
+        return np.empty(0)
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    return cumulative[window:] - cumulative[:-window]
+
+
+def _window_sums_of_squares(values: np.ndarray, window: int) -> np.ndarray:
+    """Return :func:`window_sums` of ``values ** 2`` with cancellation noise cleared.
+
+    A window of zeros can come back as a tiny positive or negative number
+    from the cumulative-sum differences; anything below the rounding error
+    of the running total is set to zero so flat windows give NaN ratios
+    rather than huge ones.
+    """
+    squares = values * values
+    sums = window_sums(squares, window)
+    sums[sums <= 8 * np.finfo("float64").eps * squares.sum()] = 0.0
+    return sums
+
+
+def _window_variance(centred: np.ndarray, sums: np.ndarray, window: int) -> np.ndarray:
+    """Return the sample variance of each window from its sums and sums of squares."""
+    deviations = _window_sums_of_squares(centred, window) - sums * sums / window
+    scale = 8 * np.finfo("float64").eps * float((centred * centred).sum())
+    return np.where(deviations > scale, deviations, 0.0) / (window - 1)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = numerator / denominator
+    out[~(denominator > 0)] = np.nan
+    return out
+
+
+def rolling_risk(
+    returns: np.ndarray,
+    window: int,
+    *,
+    benchmark: Optional[np.ndarray] = None,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = TRADING_DAYS_PER_YEAR,
+) -> Dict[str, np.ndarray]:
+    """Return annualised rolling volatility, Sharpe and Sortino, plus beta and correlation.
+
+    ``returns`` (and ``benchmark``, aligned with it) are per-period simple
+    returns without gaps; every output array has one entry per window,
+    ending at ``returns[window - 1:]``. Volatility is the sample standard
+    deviation, Sortino uses the downside deviation below the per-period
+    risk-free rate (``risk_free_rate / periods_per_year``, as in the trading
+    agent), and undefined ratios (zero variance) are NaN. ``beta`` and
+    ``correlation`` are only returned with a ``benchmark``.
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    r = np.asarray(returns, dtype="float64")
+    n_windows = max(len(r) - window + 1, 0)
+    if benchmark is not None:
+        b = np.asarray(benchmark, dtype="float64")
+        if b.shape != r.shape:
+            raise ValueError("benchmark must be aligned with returns")
+    if not n_windows:
+        empty = {key: np.empty(0) for key in ("volatility", "sharpe_ratio", "sortino_ratio")}
+        if benchmark is not None:
+            empty.update(beta=np.empty(0), correlation=np.empty(0))
+        return empty
+
+    annualise = math.sqrt(periods_per_year)
+    rf = risk_free_rate / periods_per_year
+
+    x = r - r.mean()
+    sum_x = window_sums(x, window)
+    var_r = _window_variance(x, sum_x, window)
+    std_r = np.sqrt(var_r)
+    excess = sum_x / window + r.mean() - rf
+    downside_dev = np.sqrt(_window_sums_of_squares(np.minimum(r - rf, 0.0), window) / window)
+
+    out = {
+        "volatility": std_r * annualise,
+        "sharpe_ratio": _ratio(excess, std_r) * annualise,
+        "sortino_ratio": _ratio(excess, downside_dev) * annualise,
+    }
+    if benchmark is not None:
+        y = b - b.mean()
+        sum_y = window_sums(y, window)
+        var_b = _window_variance(y, sum_y, window)
+        cov = (window_sums(x * y, window) - sum_x * sum_y / window) / (window - 1)
+        out["beta"] = _ratio(cov, var_b)
+        out["correlation"] = np.clip(_ratio(cov, np.sqrt(var_r * var_b)), -1.0, 1.0)
+    return out
+
+
+__all__ = ["TRADING_DAYS_PER_YEAR", "rolling_risk", "window_sums"]
@@ -0,0 +1,145 @@
+"""
+Vectorised XIRR.
+
+The rate ``r`` solving ``sum(amount_i * (1 + r) ** -t_i) = 0``, where
+``t_i`` is the year fraction (actual days / 365) of each cash flow after the
+first, is found for many cash-flow sets at once: the sets are padded into
+``(sets, flows)`` arrays and every iteration evaluates all of their NPVs and
+derivatives in one pass.
+
+Plain Newton from a fixed guess diverges on awkward flows (large early
+withdrawals, rates near -100%). Each set is first bracketed by scanning a
+fixed grid of rates for a sign change -- the bracket nearest the guess wins
+when there are several roots -- and Newton steps that leave the bracket, or
+are not finite, are replaced by bisection, which keeps the bracket and
+therefore always converges.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DAYS_PER_YEAR = 365.0
+
+_RATE_GRID = np.array(
+    [-0.999999, -0.99, -0.9, -0.75, -0.5, -0.25, -0.1, 0.0, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 100.0, 1e3, 1e6, 1e9]
+)
+
+CashFlows = Tuple[Sequence[date], Sequence[float]]
+
+
+def year_fractions(dates: Sequence[date] | np.ndarray) -> np.ndarray:
+    """Return the years (actual days / 365) from the earliest date to each date."""
+    days = np.asarray(dates, dtype="datetime64[D]")
+    if not len(days):
+        return np.zeros(0)
+    return (days - days.min()).astype("float64") / DAYS_PER_YEAR
+
+
+def _npv(rates: np.ndarray, fractions: np.ndarray, amounts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the NPV and its derivative for each row at ``rates`` (one per row)."""
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        discount = np.exp(-fractions * np.log1p(rates)[:, None])
+        discounted = amounts * discount
+        npv = discounted.sum(axis=1)
+        slope = -(fractions * discounted).sum(axis=1) / (1.0 + rates)
+    return npv, slope
+
+
+def _pad(flow_sets: Sequence[CashFlows]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return padded ``(fractions, amounts)`` arrays and a mask of solvable sets.
+
+    A set is solvable when it has at least one strictly positive and one
+    strictly negative flow; zero flows are dropped.
+    """
+    width = max((len(amounts) for _dates, amounts in flow_sets), default=0)
+    fractions = np.zeros((len(flow_sets), width))
+    amounts = np.zeros((len(flow_sets), width))
+    solvable = np.zeros(len(flow_sets), dtype=bool)
+    for i, (dates, values) in enumerate(flow_sets):
+        values = np.asarray(values, dtype="float64")
+        keep = np.isfinite(values) & (values != 0)
+        if not keep.any():
+            continue
+        row = values[keep]
+        fractions[i, : len(row)] = year_fractions(np.asarray(dates, dtype="datetime64[D]")[keep])
+        amounts[i, : len(row)] = row
+        solvable[i] = (row > 0).any() and (row < 0).any()
+    return fractions, amounts, solvable
+
+
+def xirr_many(
+    flow_sets: Sequence[CashFlows],
+    *,
+    guess: float = 0.1,
+    tolerance: float = 1e-7,
+    max_iterations: int = 100,
+) -> List[Optional[float]]:
+    """Return the XIRR of each ``(dates, amounts)`` set, or ``None`` where there is none.
+
+    Money paid in is negative and money received (including the closing
+    value) positive. ``None`` is returned for sets without both signs, with
+    no sign change between rates of -100% and 1e9, or that do not converge.
+    """
+    if not flow_sets:
+        return []
+    fractions, amounts, solvable = _pad(flow_sets)
+    n = len(flow_sets)
+
+    grid = np.broadcast_to(_RATE_GRID, (n, len(_RATE_GRID)))
+    grid_npv = np.stack([_npv(grid[:, j], fractions, amounts)[0] for j in range(len(_RATE_GRID))], axis=1)
+    sign = np.sign(grid_npv)
+    crossing = np.isfinite(grid_npv[:, :-1]) & np.isfinite(grid_npv[:, 1:]) & (sign[:, :-1] * sign[:, 1:] <= 0)
+    # Prefer the bracket whose interval is nearest the guess.
+    guess_index = int(np.searchsorted(_RATE_GRID, guess, side="right")) - 1
+    distance = np.abs(np.arange(len(_RATE_GRID) - 1) - guess_index).astype("float64")
+    chosen = np.argmin(np.where(crossing, distance, np.inf), axis=1)
+    active = solvable & crossing.any(axis=1)
+
+    rows = np.arange(n)
+    lo, hi = _RATE_GRID[chosen], _RATE_GRID[chosen + 1]
+    sign_lo = sign[rows, chosen]
+    rate = np.where((lo < guess) & (guess < hi), guess, 0.5 * (lo + hi))
+    result = np.full(n, np.nan)
+    # A grid point that is itself a root needs no iteration.
+    exact_lo, exact_hi = sign_lo == 0, sign[rows, chosen + 1] == 0
+    result[active & exact_lo] = lo[active & exact_lo]
+    result[active & ~exact_lo & exact_hi] = hi[active & ~exact_lo & exact_hi]
+    active &= ~(exact_lo | exact_hi)
+
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        npv, slope = _npv(rate, fractions, amounts)
+        same_side = np.sign(npv) == sign_lo
+        lo = np.where(active & same_side, rate, lo)
+        hi = np.where(active & ~same_side, rate, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = rate - npv / slope
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        stepped = np.where(inside, newton, 0.5 * (lo + hi))
+        step_tolerance = tolerance * np.maximum(1.0, np.abs(rate))
+        done = active & ((npv == 0) | (np.abs(stepped - rate) < step_tolerance) | (hi - lo < step_tolerance))
+        result[done] = np.where(npv == 0, rate, stepped)[done]
+        active &= ~done
+        rate = np.where(active, stepped, rate)
+
+    return [float(r) if np.isfinite(r) else None for r in result]
+
+
+def xirr(
+    dates: Sequence[date],
+    amounts: Sequence[float],
+    *,
+    guess: float = 0.1,
+    tolerance: float = 1e-7,
+    max_iterations: int = 100,
+) -> Optional[float]:
+    """Return the XIRR of one set of cash flows (see :func:`xirr_many`)."""
+    return xirr_many([(dates, amounts)], guess=guess, tolerance=tolerance, max_iterations=max_iterations)[0]
+
+
+__all__ = ["DAYS_PER_YEAR", "xirr", "xirr_many", "year_fractions"]
@@ -159,6 +159,17 @@ class Config:
     alpha_vantage_key: Optional[str] = None
     fundamentals_cache_ttl_seconds: Optional[int] = None
     stooq_timeout: Optional[int] = None
+    stooq_requests_per_minute: Optional[float] = None
+    yahoo_requests_per_minute: Optional[float] = None
+    alpha_vantage_requests_per_minute: Optional[float] = None
+    rate_limit_db_path: Optional[str] = None
+    timeseries_memory_cache_mb: Optional[int] = None
+    timeseries_hedge_delay_seconds: Optional[float] = None
+    timeseries_compact_dtypes: bool = False
+    timeseries_hot_tier_dir: Optional[str] = None
+    timeseries_hot_tier_mb: Optional[int] = None
+    cache_bundle_path: Optional[str] = None
+    performance_history_days: Optional[int] = None
     news_requests_per_day: int = 25
     yahoo_news_endpoint: Optional[str] = None
     yahoo_news_key: Optional[str] = None
@@ -522,6 +533,21 @@ def load_config() -> Config:
         alpha_vantage_key=data.get("alpha_vantage_key"),
         fundamentals_cache_ttl_seconds=data.get("fundamentals_cache_ttl_seconds"),
         stooq_timeout=data.get("stooq_timeout"),
+        stooq_requests_per_minute=data.get("stooq_requests_per_minute"),
+        yahoo_requests_per_minute=data.get("yahoo_requests_per_minute"),
+        alpha_vantage_requests_per_minute=data.get("alpha_vantage_requests_per_minute"),
+        rate_limit_db_path=data.get("rate_limit_db_path"),
+        timeseries_memory_cache_mb=data.get("timeseries_memory_cache_mb"),
+        timeseries_hedge_delay_seconds=data.get("timeseries_hedge_delay_seconds"),
+        timeseries_compact_dtypes=_coerce_bool_with_default(
+            data.get("timeseries_compact_dtypes"),
+            key="timeseries_compact_dtypes",
+            default=False,
+        ),
+        timeseries_hot_tier_dir=data.get("timeseries_hot_tier_dir"),
+        timeseries_hot_tier_mb=data.get("timeseries_hot_tier_mb"),
+        cache_bundle_path=data.get("cache_bundle_path"),
+        performance_history_days=data.get("performance_history_days"),
         news_requests_per_day=data.get("news_requests_per_day", 25),
         max_trades_per_month=data.get("max_trades_per_month"),
         hold_days_min=data.get("hold_days_min"),
@@ -22,10 +22,11 @@ import logging
 import os
 from datetime import UTC, datetime
 
-from backend.common.portfolio_utils import DATA_BUCKET_ENV, PRICES_S3_KEY
+from backend.common.portfolio_utils import DATA_BUCKET_ENV, PRICES_S3_KEY, refresh_performance_histories
 from backend.common.prices import refresh_prices
 from backend.config import config
 from backend.logging_setup import sanitise_exception_traceback, sanitise_log_value
+from backend.timeseries import panel as price_panel
 
 try:  # trading agent is optional; skip if missing
     import trading_agent  # type: ignore
@@ -64,6 +65,31 @@ def _seed_empty_snapshot() -> None:
         logger.warning("Failed to seed empty price snapshot to S3: %s", sanitise_log_value(exc))
 
 
+def _rebuild_price_panel() -> None:
+    """Refresh the columnar price panel from the freshly warmed meta cache.
+
+    The panel is derived data (see :mod:`backend.timeseries.panel`); readers
+    fall back to the per-ticker cache for anything it lacks, so a failed
+    rebuild is logged and otherwise ignored.
+    """
+    try:
+        price_panel.build_meta_panel()
+    except Exception as exc:
+        logger.warning("Price panel rebuild failed: %s", sanitise_log_value(exc))
+
+
+def _refresh_performance_histories() -> None:
+    """Append the new closes to the materialised performance histories.
+
+    Like the panel they are derived data: a failed refresh only means the
+    next performance request values the owner's history in full.
+    """
+    try:
+        refresh_performance_histories()
+    except Exception as exc:
+        logger.warning("Performance history refresh failed: %s", sanitise_log_value(exc))
+
+
 def lambda_handler(event, context):
     """Lambda handler invoked by the scheduler and CDK deploy Trigger.
 
@@ -89,6 +115,10 @@ def lambda_handler(event, context):
         result = {"error": str(exc), "tickers": [], "snapshot": {}, "timestamp": ts}
         _refresh_failed = True
 
+    if not _refresh_failed:
+        _rebuild_price_panel()
+        _refresh_performance_histories()
+
     # Skip the trading agent when prices are unavailable — running it against an
     # empty or stale snapshot could produce incorrect trade signals.
     if (
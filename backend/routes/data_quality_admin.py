@@ -27,6 +27,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
 
 import backend.data_quality.issues as dq_issues
+from backend.common import performance_history
 from backend.common.accounts_store import LocalAccountsStore
 from backend.common.authz import ensure_owner_access
 from backend.common.errors import AppError
@@ -44,6 +45,7 @@ from backend.routes import get_active_user
 from backend.routes._accounts import resolve_accounts_root
 from backend.routes.transactions import resolve_writable_store
 from backend.timeseries.cache import (
+    compact_meta_timeseries,
     load_cached_meta_timeseries_full,
     load_meta_timeseries,
     meta_timeseries_cache_path,
@@ -429,6 +431,9 @@ def _fix_refetch(payload: dict[str, Any], actor: str | None) -> dict[str, Any]:
             detail="Refetch currently supports the local cache only.",
         )
     path = Path(cache)
+    # Backups, snapshots and rollback work on the base file's bytes, so fold
+    # any delta segments into it first (and again after the fetch below).
+    compact_meta_timeseries(ticker, exchange)
     existed = path.exists()
     before_rows = 0
     before_bounds: tuple[Any, Any] | None = None
@@ -445,6 +450,7 @@ def _fix_refetch(payload: dict[str, Any], actor: str | None) -> dict[str, Any]:
             status_code=502,
             detail=f"Upstream returned no valid data for {ticker}.{exchange}; cache left unchanged.",
         )
+    compact_meta_timeseries(ticker, exchange)
     after_bytes = path.read_bytes() if path.exists() else None
     # A refetch that already existed and came back with the same row count
     # *and* date range covered the gap with nothing new (e.g. upstream had
@@ -471,6 +477,7 @@ def _fix_refetch(payload: dict[str, Any], actor: str | None) -> dict[str, Any]:
     except Exception:
         _rollback_after_audit_failure(path, existed=existed, expected_bytes=after_bytes)
         raise
+    performance_history.clear()
     return {
         "status": "no_change" if no_change else "fixed",
         "rows": len(df),
@@ -497,6 +504,7 @@ def _fix_unresolved_ticker(payload: dict[str, Any], actor: str | None) -> dict[s
             detail="Unresolved-ticker fixes currently support the local cache only.",
         )
     path = Path(cache)
+    compact_meta_timeseries(resolved_symbol, resolved_exchange or exchange)
     existed = path.exists()
     before_rows = 0
     if existed:
@@ -550,6 +558,7 @@ def _fix_unresolved_ticker(payload: dict[str, Any], actor: str | None) -> dict[s
                     "was not recorded as a fix."
                 ),
             )
+    compact_meta_timeseries(resolved_symbol, resolved_exchange or exchange)
     after_bytes = path.read_bytes() if path.exists() else None
     try:
         entry = append_audit(
@@ -564,6 +573,7 @@ def _fix_unresolved_ticker(payload: dict[str, Any], actor: str | None) -> dict[s
     except Exception:
         _rollback_after_audit_failure(path, existed=existed, expected_bytes=after_bytes)
         raise
+    performance_history.clear()
     return {"status": "fixed", "ticker": resolved, "rows": len(df), "audit_id": entry["id"]}
 
 
@@ -577,6 +587,7 @@ def _fix_dedupe(payload: dict[str, Any], actor: str | None) -> dict[str, Any]:
             detail="Dedupe currently supports the local cache only.",
         )
     path = Path(cache)
+    compact_meta_timeseries(ticker, exchange)
     if not path.exists():
         raise HTTPException(status_code=404, detail="Cached series not found.")
     before_bytes = path.read_bytes()
@@ -621,6 +632,7 @@ def _fix_dedupe(payload: dict[str, Any], actor: str | None) -> dict[str, Any]:
         _rollback_after_audit_failure(path, existed=True, expected_bytes=after_bytes)
         raise
     _write_fix_snapshot(path, entry["id"], before_bytes)
+    performance_history.clear()
     return {
         "status": "fixed",
         "removed": before_rows - len(deduped),
@@ -660,6 +672,7 @@ def _fix_ticker_mismatch(payload: dict[str, Any], actor: str | None) -> dict[str
             detail="Ticker normalization currently supports the local cache only.",
         )
     path = Path(cache)
+    compact_meta_timeseries(ticker, exchange)
     if not path.exists():
         raise HTTPException(status_code=404, detail="Cached series not found.")
     before_bytes = path.read_bytes()
@@ -687,6 +700,7 @@ def _fix_ticker_mismatch(payload: dict[str, Any], actor: str | None) -> dict[str
         _rollback_after_audit_failure(path, existed=True, expected_bytes=after_bytes)
         raise
     _write_fix_snapshot(path, entry["id"], before_bytes)
+    performance_history.clear()
     return {"status": "fixed", "tickers": [ticker], "audit_id": entry["id"]}
 
 
@@ -1063,6 +1077,7 @@ async def undo_audit(
         _atomic_write_bytes(path, restore_from.read_bytes())
         if snapshot.exists():
             snapshot.unlink(missing_ok=True)
+        performance_history.clear()
         append_audit(
             action="undo",
             issue_id=str(entry.get("issue_id") or ""),
@@ -151,6 +151,61 @@ async def owner_xirr(owner: str, days: int = 365, as_of: str | None = None):
         raise_owner_not_found(owner)
 
 
+@router.get("/performance/{owner}/summary")
+@handle_owner_not_found
+async def owner_summary(
+    owner: str,
+    benchmark: str = "VWRL.L",
+    days: int = 365,
+    as_of: str | None = None,
+):
+    """Return alpha, tracking error, drawdown, TWR, XIRR and CAGR for ``owner`` in one pass."""
+    owner = _validate_owner_slug(owner, "owner")
+    benchmark = _validate_benchmark(benchmark)
+    try:
+        summary = portfolio_utils.compute_performance_summary(
+            owner,
+            benchmark,
+            days,
+            pricing_date=_resolve_as_of(as_of),
+        )
+        return {"owner": owner, "benchmark": benchmark, **summary}
+    except FileNotFoundError:
+        raise_owner_not_found(owner, benchmark=benchmark)
+
+
+def _validate_window(window: int) -> int:
+    if window < 2:
+        raise HTTPException(status_code=400, detail="Window must be at least 2 days")
+    return window
+
+
+@router.get("/performance/{owner}/rolling-risk")
+@handle_owner_not_found
+async def owner_rolling_risk(
+    owner: str,
+    benchmark: str = "VWRL.L",
+    window: int = 63,
+    days: int = 365,
+    as_of: str | None = None,
+):
+    """Return rolling volatility, Sharpe, Sortino, beta and correlation for ``owner``."""
+    owner = _validate_owner_slug(owner, "owner")
+    benchmark = _validate_benchmark(benchmark)
+    window = _validate_window(window)
+    try:
+        result = portfolio_utils.compute_rolling_risk(
+            owner,
+            benchmark,
+            window,
+            days,
+            pricing_date=_resolve_as_of(as_of),
+        )
+        return {"owner": owner, "benchmark": benchmark, **result}
+    except FileNotFoundError:
+        raise_owner_not_found(owner, benchmark=benchmark)
+
+
 @router.get("/performance/{owner}/holdings")
 @handle_owner_not_found
 async def owner_holdings(owner: str, date: str):
@@ -218,6 +273,29 @@ async def group_max_drawdown(slug: str, days: int = 365):
         raise HTTPException(status_code=404, detail="Group not found") from exc
 
 
+@router.get("/performance-group/{slug}/rolling-risk")
+async def group_rolling_risk(slug: str, benchmark: str = "VWRL.L", window: int = 63, days: int = 365):
+    """Return rolling volatility, Sharpe, Sortino, beta and correlation for a group portfolio."""
+    slug = _validate_owner_slug(slug, "slug")
+    benchmark = _validate_benchmark(benchmark)
+    window = _validate_window(window)
+    try:
+        result = portfolio_utils.compute_group_rolling_risk(slug, benchmark, window, days)
+        return {"group": slug, "benchmark": benchmark, **result}
+    except (FileNotFoundError, ValueError) as exc:
+        raise HTTPException(status_code=404, detail="Group not found") from exc
+
+
+@router.get("/performance-group/{slug}/xirr")
+async def group_xirr(slug: str, days: int = 365):
+    """Return XIRR for every member of a group portfolio."""
+    slug = _validate_owner_slug(slug, "slug")
+    try:
+        return {"group": slug, "xirr": portfolio_utils.compute_group_xirr(slug, days)}
+    except (FileNotFoundError, ValueError) as exc:
+        raise HTTPException(status_code=404, detail="Group not found") from exc
+
+
 @router.get("/performance/{owner}")
 @handle_owner_not_found
 async def performance(
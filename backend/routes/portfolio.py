@@ -17,7 +17,7 @@ import logging
 from pathlib import Path
 from typing import Annotated, Any, Dict, List, Optional, Sequence, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel, Field
 
@@ -980,20 +980,24 @@ async def instrument_detail(
     return {"prices": prices_list, "mini": series.get("mini", {}), "positions": positions_list}
 
 
-async def _do_refresh_prices() -> dict:
+async def _do_refresh_prices(background_tasks: BackgroundTasks | None = None) -> dict:
     logger.info("Refreshing prices via /prices/refresh")
     result = await asyncio.to_thread(prices.refresh_prices)
+    if background_tasks is not None:
+        # Appending the new closes to the materialised performance histories
+        # values every owner, so it runs after the response is sent.
+        background_tasks.add_task(portfolio_utils.refresh_performance_histories)
     return {"status": "ok", **result}
 
 
 @router.get("/prices/refresh", operation_id="refresh_prices_get")
-async def refresh_prices_get():
-    return await _do_refresh_prices()
+async def refresh_prices_get(background_tasks: BackgroundTasks):
+    return await _do_refresh_prices(background_tasks)
 
 
 @router.post("/prices/refresh", operation_id="refresh_prices_post")
-async def refresh_prices_post():
-    return await _do_refresh_prices()
+async def refresh_prices_post(background_tasks: BackgroundTasks):
+    return await _do_refresh_prices(background_tasks)
 
 
 @router.get("/prices/live", operation_id="prices_live_get")
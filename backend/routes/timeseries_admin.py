@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, Depends
 
@@ -13,9 +14,15 @@ from backend.config import config
 from backend.logging_setup import sanitise_log_value
 from backend.timeseries.cache import (
     _ensure_schema,
+    compact_cached_meta_timeseries,
     load_meta_timeseries,
+    meta_cache_stats,
+    meta_memory_report,
     meta_timeseries_cache_path,
+    rebuild_meta_cache_manifest,
 )
+from backend.timeseries.provider_health import provider_health_stats
+from backend.utils.trading_calendar import get_trading_calendar
 
 router = APIRouter(prefix="/timeseries", tags=["timeseries"], dependencies=[Depends(get_current_user)])
 logger = logging.getLogger(__name__)
@@ -26,8 +33,12 @@ def _summarize(df: pd.DataFrame, ticker: str, exchange: str) -> dict[str, Any]:
     df = df.sort_values("Date")
     earliest = df["Date"].min()
     latest = df["Date"].max()
-    bdays = len(pd.bdate_range(earliest, latest)) or 1
-    completeness = len(df) / bdays * 100
+    # Share of the exchange's trading days present; rows on holidays don't count.
+    expected = get_trading_calendar(exchange).trading_days_between(
+        pd.to_datetime(earliest).date(), pd.to_datetime(latest).date()
+    )
+    present = pd.to_datetime(df["Date"]).to_numpy(dtype="datetime64[D]")
+    completeness = float(np.isin(expected, present).sum()) / (len(expected) or 1) * 100
     latest_source = df.iloc[-1]["Source"] if "Source" in df.columns else None
     main_source = (
         df["Source"].value_counts().idxmax() if "Source" in df.columns and not df["Source"].dropna().empty else None
@@ -112,6 +123,36 @@ async def timeseries_admin() -> list[dict[str, Any]]:
     return summaries
 
 
+@router.get("/admin/cache-stats")
+async def timeseries_cache_stats() -> dict[str, Any]:
+    """Report hit/miss/eviction/byte counters for the in-process meta cache."""
+    return meta_cache_stats()
+
+
+@router.get("/admin/providers")
+async def timeseries_provider_stats() -> dict[str, Any]:
+    """Report per-provider latency, coverage and circuit-breaker state."""
+    return provider_health_stats()
+
+
+@router.get("/admin/{ticker}/{exchange}/memory")
+async def timeseries_memory_report(ticker: str, exchange: str) -> dict[str, Any]:
+    """Compare a cached series' footprint under the standard and compact dtypes."""
+    return meta_memory_report(ticker.upper(), exchange.upper())
+
+
+@router.post("/admin/compact")
+async def compact_timeseries_cache() -> dict[str, Any]:
+    """Fold accumulated delta segments into their base cache files."""
+    return {"status": "ok", **compact_cached_meta_timeseries()}
+
+
+@router.post("/admin/manifest/rebuild")
+async def rebuild_timeseries_manifest() -> dict[str, Any]:
+    """Rewrite the S3 cache manifest from a full listing of cached series."""
+    return {"status": "ok", "series": rebuild_meta_cache_manifest()}
+
+
 @router.post("/admin/{ticker}/{exchange}/refetch")
 async def refetch_timeseries(ticker: str, exchange: str) -> dict[str, Any]:
     """Fetch latest timeseries data for a ticker/exchange pair."""
@@ -12,7 +12,7 @@ from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 
-from backend.common import instrument_api
+from backend.common import instrument_api, performance_history
 from backend.common.errors import InternalServiceError, ValidationFailure
 from backend.logging_setup import sanitise_log_value
 from backend.timeseries.cache import (
@@ -21,9 +21,13 @@ from backend.timeseries.cache import (
     _s3_client,
     _s3_object_recently_confirmed_missing,
     _split_s3_cache_uri,
+    compact_delta_segments,
+    discard_delta_segments,
     has_cached_meta_timeseries,
     invalidate_s3_cache_metadata,
     meta_timeseries_cache_path,
+    record_meta_cache_delete,
+    record_meta_cache_write,
 )
 
 router = APIRouter(prefix="/timeseries", tags=["timeseries"])
@@ -86,6 +90,9 @@ def _load_timeseries(ticker: str, exchange: str) -> pd.DataFrame:
     exists = _s3_object_exists(cache, ticker, exchange) if cache.startswith("s3://") else Path(cache).exists()
     if exists:
         try:
+            # Fold pending delta segments so the base file holds the whole
+            # series before it is returned, edited or moved.
+            compact_delta_segments(cache)
             return _ensure_schema(pd.read_parquet(cache))
         except Exception as exc:  # pragma: no cover - defensive
             raise InternalServiceError(
@@ -145,6 +152,7 @@ def _create_s3_destination(df: pd.DataFrame, destination: str) -> tuple[str, str
             raise HTTPException(status_code=409, detail="Destination time series already exists") from exc
         raise InternalServiceError("Failed to create destination time series") from exc
     invalidate_s3_cache_metadata(destination)
+    record_meta_cache_write(destination, df)
     return bucket, key
 
 
@@ -164,8 +172,10 @@ def _move_s3_timeseries(df: pd.DataFrame, source: str, destination: str) -> None
                 "Failed to remove source and roll back destination time series"
             ) from rollback_exc
         invalidate_s3_cache_metadata(destination)
+        record_meta_cache_delete(destination)
         raise InternalServiceError("Failed to remove source time series; destination was rolled back") from exc
     invalidate_s3_cache_metadata(source)
+    record_meta_cache_delete(source)
 
 
 def _move_local_timeseries(source: str, destination: str) -> None:
@@ -271,8 +281,11 @@ async def post_timeseries_edit(
     if not cache.startswith("s3://"):
         Path(cache).parent.mkdir(parents=True, exist_ok=True)
     df.to_parquet(cache, index=False)
+    discard_delta_segments(cache)
     if cache.startswith("s3://"):
         invalidate_s3_cache_metadata(cache)
+        record_meta_cache_write(cache, df)
+    performance_history.clear()
     return JSONResponse({"status": "ok", "rows": len(df)})
 
 
@@ -288,6 +301,7 @@ async def move_timeseries_edit(
     if destination_ticker != ticker:
         raise ValidationFailure("Source and destination resolve to different tickers")
     rows = _move_timeseries(ticker, source_exchange, destination_exchange)
+    performance_history.clear()
     return JSONResponse(
         {
             "status": "ok",
@@ -0,0 +1,270 @@
+"""
+Single-file, memory-mappable bundle of the offline price store.
+
+A bundle packs every cached meta series, the FX history files, the
+instrument metadata JSON and ``latest_prices.json`` into one Arrow IPC file.
+All price rows live in a single table (one contiguous run of rows per
+series) and the schema metadata carries a JSON header with the format
+version, an index of ``key -> (offset, rows, kind)`` and the JSON documents.
+Opening the bundle memory-maps the file, so a cold Lambda or container
+pays for one open instead of hundreds of parquet reads from EFS/S3, and
+only the pages of the series it actually serves are touched.
+
+Keys are cache-relative paths (``meta/VOD_L.parquet``, ``fx/USD.parquet``)
+and instrument paths relative to the instruments directory
+(``L/VOD.json``), so readers map their usual file path to a key with
+:func:`bundle_key` and fall back to the bundle when the file is missing.
+
+Build one with ``python scripts/build_cache_bundle.py --output <path>`` and
+point ``cache_bundle_path`` (or ``CACHE_BUNDLE_PATH``) at it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from backend.config import config
+from backend.logging_setup import sanitise_log_value
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 1
+_META_KEY = b"allotmint.bundle"
+_PRICE_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume", "Ticker", "Source"]
+
+
+def bundle_key(path: str | Path) -> str:
+    """Return the bundle key for a cache file path (its last two components)."""
+    parts = PurePosixPath(str(path).replace("\\", "/")).parts
+    return "/".join(parts[-2:])
+
+
+def _price_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("Date", pa.timestamp("ms")),
+            ("Open", pa.float64()),
+            ("High", pa.float64()),
+            ("Low", pa.float64()),
+            ("Close", pa.float64()),
+            ("Volume", pa.float64()),
+            ("Ticker", pa.string()),
+            ("Source", pa.string()),
+        ]
+    )
+
+
+def _normalise_rows(df: pd.DataFrame) -> pd.DataFrame:
+    out = pd.DataFrame(index=range(len(df)))
+    out["Date"] = pd.to_datetime(df["Date"].to_numpy(), errors="coerce").astype("datetime64[ms]")
+    for col in ("Open", "High", "Low", "Close", "Volume"):
+        values = df[col] if col in df.columns else pd.Series(float("nan"), index=df.index)
+        out[col] = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=float("nan"))
+    for col in ("Ticker", "Source"):
+        values = df[col] if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        out[col] = values.astype(object).where(values.notna(), None).to_numpy()
+    return out.dropna(subset=["Date"]).sort_values("Date", kind="stable").reset_index(drop=True)
+
+
+def _fx_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Store an FX ``Date``/``Rate`` frame as price rows with ``Close`` = rate."""
+    return _normalise_rows(pd.DataFrame({"Date": df["Date"], "Close": df["Rate"], "Source": "fx"}))
+
+
+def write_cache_bundle(
+    output: str | Path,
+    *,
+    meta: Dict[str, pd.DataFrame],
+    fx: Dict[str, pd.DataFrame],
+    instruments: Dict[str, Any],
+    latest_prices: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Write a bundle from already-loaded frames and documents.
+
+    ``meta`` and ``fx`` map bundle keys to frames. The file is written next
+    to ``output`` and moved into place, so readers never see a partial
+    bundle. Returns a summary of what was packed.
+    """
+    import pyarrow as pa
+
+    index: Dict[str, Tuple[int, int, str]] = {}
+    parts: list[pd.DataFrame] = []
+    offset = 0
+    for kind, frames, convert in (("meta", meta, _normalise_rows), ("fx", fx, _fx_rows)):
+        for key in sorted(frames):
+            rows = convert(frames[key])
+            if rows.empty:
+                continue
+            index[key] = (offset, len(rows), kind)
+            parts.append(rows)
+            offset += len(rows)
+    table_df = pd.concat(parts, ignore_index=True) if parts else _normalise_rows(pd.DataFrame(columns=_PRICE_COLUMNS))
+    header = {
+        "format": BUNDLE_FORMAT,
+        "created": datetime.now(UTC).isoformat(),
+        "index": index,
+        "instruments": instruments,
+        "latest_prices": latest_prices,
+    }
+    schema = _price_schema().with_metadata({_META_KEY: json.dumps(header).encode("utf-8")})
+    table = pa.Table.from_pandas(table_df, schema=schema, preserve_index=False)
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.tmp")
+    # Uncompressed IPC so the columns can be memory-mapped in place.
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, output)
+    return {
+        "path": str(output),
+        "format": BUNDLE_FORMAT,
+        "meta_series": sum(1 for _o, _n, kind in index.values() if kind == "meta"),
+        "fx_series": sum(1 for _o, _n, kind in index.values() if kind == "fx"),
+        "rows": offset,
+        "instruments": len(instruments),
+        "latest_prices": latest_prices is not None,
+        "bytes": output.stat().st_size,
+    }
+
+
+def build_cache_bundle(output: str | Path) -> Dict[str, Any]:
+    """Pack the configured meta/FX caches, instruments and latest prices.
+
+    Works against a local or S3 cache base; raises ``RuntimeError`` when an
+    FX history file cannot be read.
+    """
+    from backend.common.instruments import _active_instruments_dir
+    from backend.timeseries import cache
+
+    meta = {}
+    for ticker, exchange in cache.list_cached_meta_tickers():
+        df = cache.load_cached_meta_timeseries_full(ticker, exchange)
+        if not df.empty:
+            meta[bundle_key(cache.meta_timeseries_cache_path(ticker, exchange))] = df
+
+    # A bundle missing an FX series would convert offline prices wrongly,
+    # so unreadable FX files fail the build rather than being skipped.
+    fx = {}
+    for path in cache.list_cached_fx_paths():
+        try:
+            frame = pd.read_parquet(path)
+        except Exception as exc:
+            raise RuntimeError(f"Unable to read FX cache {path}") from exc
+        if {"Date", "Rate"} <= set(frame.columns) and not frame.empty:
+            fx[bundle_key(path)] = frame
+
+    instruments: Dict[str, Any] = {}
+    instruments_dir = _active_instruments_dir()
+    for path in sorted(instruments_dir.rglob("*.json")):
+        try:
+            instruments[path.relative_to(instruments_dir).as_posix()] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Skipping instrument file %s: %s", sanitise_log_value(path), sanitise_log_value(exc))
+
+    latest_prices = None
+    prices_path = Path(config.prices_json) if config.prices_json else None
+    if prices_path is not None and prices_path.exists():
+        latest_prices = json.loads(prices_path.read_text())
+
+    return write_cache_bundle(output, meta=meta, fx=fx, instruments=instruments, latest_prices=latest_prices)
+
+
+class CacheBundle:
+    """Read-only view of a bundle file, memory-mapped on open."""
+
+    def __init__(self, path: str | Path) -> None:
+        import pyarrow as pa
+
+        self.path = Path(path)
+        reader = pa.ipc.open_file(pa.memory_map(str(self.path), "r"))
+        header = json.loads((reader.schema.metadata or {}).get(_META_KEY, b"{}"))
+        if header.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported cache bundle format {header.get('format')!r} in {self.path}")
+        self.created = datetime.fromisoformat(header["created"])
+        self._index: Dict[str, Tuple[int, int, str]] = {k: tuple(v) for k, v in header["index"].items()}
+        self._instruments: Dict[str, Any] = header.get("instruments") or {}
+        self._latest_prices: Optional[Dict[str, Any]] = header.get("latest_prices")
+        self._table = reader.read_all()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def keys(self) -> list[str]:
+        return list(self._index)
+
+    def frame(self, key: str) -> pd.DataFrame | None:
+        """Return the rows stored under ``key`` (``Date``/``Rate`` for FX), or ``None``."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, rows, kind = entry
+        df = self._table.slice(offset, rows).to_pandas()
+        if kind == "fx":
+            return df[["Date", "Close"]].rename(columns={"Close": "Rate"})
+        return df
+
+    def instrument(self, rel_path: str) -> Dict[str, Any] | None:
+        return self._instruments.get(rel_path)
+
+    def latest_prices(self) -> Tuple[Dict[str, Any], datetime] | None:
+        if self._latest_prices is None:
+            return None
+        # Naive local time, like the mtime of a local latest_prices.json.
+        return self._latest_prices, datetime.fromtimestamp(self.created.timestamp())
+
+
+_ACTIVE: Tuple[Tuple[str, float] | None, CacheBundle | None] = (None, None)
+_ACTIVE_LOCK = threading.Lock()
+
+
+def cache_bundle_path() -> Path | None:
+    configured = os.getenv("CACHE_BUNDLE_PATH") or getattr(config, "cache_bundle_path", None)
+    return Path(configured).expanduser() if configured else None
+
+
+def active_bundle() -> CacheBundle | None:
+    """Return the configured bundle, reopening it if the file was replaced."""
+    global _ACTIVE
+    path = cache_bundle_path()
+    if path is None:
+        return None
+    try:
+        stamp = (str(path), path.stat().st_mtime)
+    except OSError:
+        return None
+    with _ACTIVE_LOCK:
+        if _ACTIVE[0] != stamp:
+            try:
+                _ACTIVE = (stamp, CacheBundle(path))
+            except Exception as exc:
+                logger.warning("Ignoring cache bundle %s: %s", sanitise_log_value(path), sanitise_log_value(exc))
+                _ACTIVE = (stamp, None)
+        return _ACTIVE[1]
+
+
+def bundled_frame(path: str | Path) -> pd.DataFrame | None:
+    """Return the bundled copy of the cache file at ``path``, if any."""
+    bundle = active_bundle()
+    return bundle.frame(bundle_key(path)) if bundle is not None else None
+
+
+__all__ = [
+    "BUNDLE_FORMAT",
+    "CacheBundle",
+    "active_bundle",
+    "build_cache_bundle",
+    "bundle_key",
+    "bundled_frame",
+    "write_cache_bundle",
+]
@@ -11,26 +11,32 @@ where the parquet files live, e.g.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
 import threading
 import time
-from datetime import date, datetime, timedelta
+from contextlib import contextmanager
+from datetime import UTC, date, datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict
+from typing import Any, Callable, Dict, Iterator
 from urllib.parse import quote
 
 import boto3
+import numpy as np
 import pandas as pd
 import requests
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+from backend.common.currency import FxMatrix
 from backend.common.instruments import get_instrument_meta
 from backend.config import config
 from backend.logging_setup import sanitise_log_value
+from backend.timeseries import hot_tier
+from backend.timeseries.bundle import active_bundle, bundle_key, bundled_frame
 
 # ──────────────────────────────────────────────────────────────
 # Remote fetchers
@@ -39,6 +45,7 @@ from backend.timeseries.fetch_ft_timeseries import fetch_ft_timeseries
 from backend.timeseries.fetch_meta_timeseries import fetch_meta_timeseries
 from backend.timeseries.fetch_stooq_timeseries import fetch_stooq_timeseries_range
 from backend.timeseries.fetch_yahoo_timeseries import fetch_yahoo_timeseries_range
+from backend.timeseries.frame_cache import FrameCache, KeyedLocks, SingleFlight, frame_nbytes, frame_view
 from backend.utils.fx_rates import fetch_fx_rate_range
 from backend.utils.timeseries_helpers import (
     _nearest_weekday,
@@ -46,6 +53,7 @@ from backend.utils.timeseries_helpers import (
     apply_scaling,
     get_scaling_override,
 )
+from backend.utils.trading_calendar import get_trading_calendar
 
 OFFLINE_MODE = config.offline_mode
 
@@ -56,6 +64,13 @@ _FAILED_FETCH_COUNT = 0
 
 # Expected schema for any timeseries DF we return
 EXPECTED_COLS = ["Date", "Open", "High", "Low", "Close", "Volume", "Ticker", "Source"]
+PRICE_COLS = ["Open", "High", "Low", "Close"]
+LABEL_COLS = ["Ticker", "Source"]
+# Prices are only narrowed to float32 when every value still agrees with the
+# float64 original to this many decimal places. (A relative tolerance would
+# not do: float32 rounding is always within 6e-8, however many digits a
+# large price loses.)
+_FLOAT32_DECIMALS = 4
 
 EXCHANGE_TO_CCY = {
     "L": "GBP",
@@ -93,6 +108,9 @@ def _ensure_schema(df: pd.DataFrame) -> pd.DataFrame:
     matches the resolution pyarrow writes to parquet by default and keeps
     assert_frame_equal comparisons stable regardless of the code path that
     produced the Date values.
+
+    Rows are returned sorted by Date so range lookups on cached frames can
+    binary-search the column (see :func:`apply_date_range`).
     """
     if df is None or df.empty:
         return _empty_ts()
@@ -120,8 +138,48 @@ def _ensure_schema(df: pd.DataFrame) -> pd.DataFrame:
         dates = dates.dt.tz_convert(None)
     df["Date"] = dates.astype("datetime64[ms]")
     df = df.dropna(subset=["Date"])
+    if not df["Date"].is_monotonic_increasing:
+        df = df.sort_values("Date", kind="stable").reset_index(drop=True)
     # Return only expected columns in expected order (stable)
-    return df[EXPECTED_COLS]
+    df = df[EXPECTED_COLS]
+    return _compact_dtypes(df) if _compact_dtypes_enabled() else _standard_dtypes(df)
+
+
+def _compact_dtypes_enabled() -> bool:
+    return bool(getattr(config, "timeseries_compact_dtypes", False))
+
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Narrow a schema-conformant frame to the compact cache dtypes.
+
+    Prices become float32 where every value round-trips to
+    ``_FLOAT32_DECIMALS`` decimal places, Volume becomes int64 when it holds only whole numbers,
+    and Ticker/Source become categoricals (dictionary-encoded in parquet).
+    """
+    df = df.copy(deep=False)
+    for col in PRICE_COLS:
+        values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        narrow = values.astype("float32")
+        exact = np.array_equal(
+            np.round(narrow.astype("float64"), _FLOAT32_DECIMALS),
+            np.round(values, _FLOAT32_DECIMALS),
+            equal_nan=True,
+        )
+        df[col] = narrow if exact else values
+    volume = pd.to_numeric(df["Volume"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    if not np.isnan(volume).any() and np.array_equal(volume, np.trunc(volume)):
+        df["Volume"] = volume.astype("int64")
+    for col in LABEL_COLS:
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _standard_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Undo :func:`_compact_dtypes` for frames read back from compact parquet."""
+    widen = {col: "float64" for col in PRICE_COLS if df[col].dtype == np.float32}
+    widen.update({col: object for col in LABEL_COLS if isinstance(df[col].dtype, pd.CategoricalDtype)})
+    return df.astype(widen) if widen else df
 
 
 # ──────────────────────────────────────────────────────────────
@@ -161,16 +219,23 @@ def _ensure_local_dir(path: str) -> None:
 # ──────────────────────────────────────────────────────────────
 # Weekend-safe window helper
 # ──────────────────────────────────────────────────────────────
-def _weekday_range(today: date, days: int) -> tuple[date, date]:
-    today = _nearest_weekday(today, forward=False)  # Fri if Sat/Sun
-    cutoff = _nearest_weekday(today - timedelta(days=days), forward=True)
+def _weekday_range(today: date, days: int, exchange: str | None = None) -> tuple[date, date]:
+    """Return ``(cutoff, today)`` rolled onto trading days.
+
+    Without ``exchange`` only weekends are skipped; with it, that exchange's
+    holidays are skipped too, so the day after a bank holiday does not look
+    like a missing close.
+    """
+    roll = get_trading_calendar(exchange).roll if exchange else _nearest_weekday
+    today = roll(today, False)  # Fri if Sat/Sun
+    cutoff = roll(today - timedelta(days=days), True)
     return cutoff, today
 
 
 # ──────────────────────────────────────────────────────────────
 # Parquet I/O helpers
 # ──────────────────────────────────────────────────────────────
-def _load_parquet(path: str) -> pd.DataFrame:
+def _read_parquet_file(path: str) -> pd.DataFrame:
     try:
         df = pd.read_parquet(path)
         df = _ensure_schema(df)
@@ -181,13 +246,277 @@ def _load_parquet(path: str) -> pd.DataFrame:
         return _empty_ts()
 
 
-def _save_parquet(df: pd.DataFrame, path: str) -> None:
+def _hot_tier_key(path: str) -> str:
+    """Return ``path`` relative to the cache base, without its suffix."""
+    if _CACHE_BASE and path.startswith(_CACHE_BASE):
+        rel = path[len(_CACHE_BASE) :]
+    else:
+        rel = bundle_key(path)
+    return rel.replace("\\", "/").strip("/").removesuffix(".parquet")
+
+
+def _hot_tier_signature(path: str) -> str | None:
+    """Return the version stamp of the base file at ``path`` (``None`` if missing)."""
+    if path.startswith("s3://"):
+        mtime = _s3_object_mtime(path)
+        return None if mtime is None else f"s3:{mtime}"
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _bundle_supersedes_local(path: str) -> bool:
+    """Return whether the bundle is at least as new as the local cache for ``path``.
+
+    A local base file written after the bundle was built, or any local
+    delta segments, mean the cache directory has rows the bundle lacks.
+    S3 paths are not checked, so offline reads stay off the network.
+    """
+    bundle = active_bundle()
+    if bundle is None or path.startswith("s3://"):
+        return True
+    if _list_delta_segments(path):
+        return False
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return True
+    return mtime <= bundle.created.timestamp()
+
+
+def _load_parquet(path: str) -> pd.DataFrame:
+    """Load a cached series: the base file merged with any delta segments.
+
+    When a cache bundle is configured it backs the base file: offline reads
+    serve the bundled copy without touching the cache directory unless the
+    local base file is newer than the bundle or has delta segments, and
+    online reads fall back to it when the base file is missing. When a hot
+    tier is configured, a merged frame built from an unchanged base file is
+    served from its memory-mapped Arrow copy instead of being re-read.
+    """
+    if OFFLINE_MODE and _bundle_supersedes_local(path):
+        bundled = bundled_frame(path)
+        if bundled is not None:
+            return _ensure_schema(bundled)
+    hot_key = signature = None
+    if hot_tier.hot_tier_dir() is not None:
+        signature = _hot_tier_signature(path)
+        if signature is not None:
+            hot_key = _hot_tier_key(path)
+            hot = hot_tier.read(hot_key, signature)
+            if hot is not None:
+                return _ensure_schema(hot)
+    base = _read_parquet_file(path)
+    if base.empty:
+        bundled = bundled_frame(path)
+        if bundled is not None:
+            base = _ensure_schema(bundled)
+    segments = [] if _known_delta_count(path) == 0 else _list_delta_segments(path)
+    if not segments:
+        result = base
+    else:
+        frames = [df for df in (base, *(_read_parquet_file(s) for s in segments)) if not df.empty]
+        if not frames:
+            return _empty_ts()
+        merged = pd.concat(frames, ignore_index=True).drop_duplicates(subset="Date", keep="last")
+        result = _ensure_schema(merged.sort_values("Date").reset_index(drop=True))
+    if hot_key is not None:
+        hot_tier.write(hot_key, signature, result)
+    return result
+
+
+def _write_parquet_file(df: pd.DataFrame, path: str) -> None:
     df = _ensure_schema(df)
     _ensure_local_dir(path)
     df.to_parquet(path, index=False)
     logger.debug("Saved cache to %s (%s rows)", path, len(df))
 
 
+def _save_parquet(df: pd.DataFrame, path: str) -> None:
+    """Rewrite the base file with ``df``, superseding any delta segments."""
+    _write_parquet_file(df, path)
+    discard_delta_segments(path)
+
+
+# ──────────────────────────────────────────────────────────────
+# Delta segments
+# ──────────────────────────────────────────────────────────────
+# Extending a series by a day used to mean reading the whole parquet,
+# appending one row and writing the whole file back -- on S3 a full GET+PUT
+# of up to ten years of history per ticker per refresh. Forward-only
+# extensions are instead written as small segment files next to the base::
+#
+#     meta/VOD_L.parquet
+#     meta/VOD_L.delta/20240102T223001123456.parquet
+#
+# ``_load_parquet`` merges the base with its segments (later segments win on
+# duplicate dates) and ``compact_delta_segments`` folds them back into the
+# base. Appending a segment also bumps the base file's modification time so
+# the mtime-based staleness checks keep seeing every update. On S3 the
+# manifest entry records how many segments a series has, so loads of a
+# series without any skip the segment listing.
+_DELTA_SUFFIX = ".delta"
+# Fold segments into the base once this many have accumulated (about a
+# month of daily refreshes), bounding the number of reads per cache load.
+_DELTA_COMPACT_THRESHOLD = 20
+
+
+def _delta_dir(path: str) -> str:
+    stem = path[: -len(".parquet")] if path.endswith(".parquet") else path
+    return stem + _DELTA_SUFFIX
+
+
+def _list_delta_segments(path: str) -> list[str]:
+    """Return the delta segment paths for ``path`` in write order."""
+    delta_dir = _delta_dir(path)
+    if not delta_dir.startswith("s3://"):
+        p = Path(delta_dir)
+        if not p.is_dir():
+            return []
+        return sorted(str(s) for s in p.glob("*.parquet"))
+
+    parsed = _split_s3_cache_uri(delta_dir)
+    if parsed is None:
+        return []
+    bucket, prefix = parsed
+    keys: list[str] = []
+    try:
+        paginator = _s3_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=f"{prefix}/"):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []) if obj["Key"].endswith(".parquet"))
+    except (BotoCoreError, ClientError) as exc:  # pragma: no cover - defensive AWS path
+        logger.warning(
+            "Unable to list delta segments for %s: %s",
+            sanitise_log_value(path),
+            sanitise_log_value(exc),
+        )
+        return []
+    return [f"s3://{bucket}/{key}" for key in sorted(keys)]
+
+
+def _known_delta_count(path: str) -> int | None:
+    """Return the manifest's segment count for ``path``, or ``None`` if unknown."""
+    entry, _complete = _manifest_entry(path)
+    deltas = entry.get("deltas") if entry is not None else None
+    return deltas if isinstance(deltas, int) else None
+
+
+def _delete_cache_objects(paths: list[str]) -> None:
+    """Best-effort delete of cache files/objects (used for delta segments)."""
+    s3_keys: Dict[str, list[str]] = {}
+    for path in paths:
+        if path.startswith("s3://"):
+            parsed = _split_s3_cache_uri(path)
+            if parsed is not None:
+                s3_keys.setdefault(parsed[0], []).append(parsed[1])
+            continue
+        Path(path).unlink(missing_ok=True)
+        try:
+            Path(path).parent.rmdir()
+        except OSError:
+            pass  # other segments still present
+    for bucket, keys in s3_keys.items():
+        try:
+            for i in range(0, len(keys), 1000):
+                _s3_client().delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": k} for k in keys[i : i + 1000]], "Quiet": True},
+                )
+        except (BotoCoreError, ClientError) as exc:  # pragma: no cover - defensive AWS path
+            logger.warning("Unable to delete delta segments: %s", sanitise_log_value(exc))
+
+
+def discard_delta_segments(path: str) -> int:
+    """Delete the delta segments of ``path`` ahead of a full replacement."""
+    segments = _list_delta_segments(path)
+    _delete_cache_objects(segments)
+    return len(segments)
+
+
+# System metadata a REPLACE self-copy would otherwise reset.
+_PRESERVED_OBJECT_HEADERS = ("ContentType", "ContentEncoding", "ContentDisposition", "ContentLanguage", "CacheControl")
+
+
+def _touch_cache_file(path: str) -> None:
+    """Bump ``path``'s modification time without rewriting its contents."""
+    if not path.startswith("s3://"):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return
+    parsed = _split_s3_cache_uri(path)
+    if parsed is None:
+        return
+    bucket, key = parsed
+    try:
+        # Server-side self-copy: refreshes LastModified without moving the
+        # object's bytes through this process. S3 only allows a self-copy
+        # that replaces the metadata, so the current metadata is copied over.
+        head = _s3_client().head_object(Bucket=bucket, Key=key)
+        headers = {name: head[name] for name in _PRESERVED_OBJECT_HEADERS if head.get(name)}
+        _s3_client().copy_object(
+            Bucket=bucket,
+            Key=key,
+            CopySource={"Bucket": bucket, "Key": key},
+            MetadataDirective="REPLACE",
+            Metadata=head.get("Metadata") or {},
+            **headers,
+        )
+    except (BotoCoreError, ClientError) as exc:  # pragma: no cover - defensive AWS path
+        logger.warning("Unable to touch %s: %s", sanitise_log_value(path), sanitise_log_value(exc))
+    invalidate_s3_cache_metadata(path)
+
+
+def _append_delta(df: pd.DataFrame, path: str) -> int:
+    """Persist ``df`` as a new delta segment of the series stored at ``path``.
+
+    Returns how many segments the series has afterwards (0 once they have
+    been compacted).
+    """
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+    delta_dir = _delta_dir(path)
+    segment = (
+        f"{delta_dir}/{stamp}.parquet" if delta_dir.startswith("s3://") else str(Path(delta_dir, f"{stamp}.parquet"))
+    )
+    known = _known_delta_count(path)
+    _write_parquet_file(df, segment)
+    _touch_cache_file(path)
+    count = known + 1 if known is not None else len(_list_delta_segments(path))
+    if count >= _DELTA_COMPACT_THRESHOLD:
+        compact_delta_segments(path)
+        return 0
+    return count
+
+
+def compact_delta_segments(path: str) -> int:
+    """Fold the delta segments of the series at ``path`` into its base file.
+
+    Returns the number of segments folded. The base is rewritten before the
+    segments are removed, so an interrupted compaction only leaves segments
+    whose rows the base already holds; a segment appended concurrently is
+    not in the folded set and survives.
+    """
+    segments = _list_delta_segments(path)
+    if not segments:
+        return 0
+    merged = _load_parquet(path)
+    if not merged.empty:
+        _write_parquet_file(merged, path)
+        record_meta_cache_write(path, merged)
+    _delete_cache_objects(segments)
+    if path.startswith("s3://"):
+        invalidate_s3_cache_metadata(path)
+    logger.debug(
+        "Compacted %s delta segments into %s",
+        sanitise_log_value(len(segments)),
+        sanitise_log_value(path),
+    )
+    return len(segments)
+
+
 # ──────────────────────────────────────────────────────────────
 # Rolling parquet cache (disk/S3)
 # ──────────────────────────────────────────────────────────────
@@ -203,31 +532,32 @@ def _rolling_cache(
 
     logger.debug("Rolling cache: %s", cache_path)
     # Only look up to yesterday (we have close prices only)
-    cutoff, today = _weekday_range(datetime.today().date() - timedelta(days=1), days)
+    cutoff, today = _weekday_range(datetime.today().date() - timedelta(days=1), days, exchange)
+    # Coverage is judged against the trading-calendar cutoff, but the window
+    # itself starts on the weekday cutoff so rows a provider does report on
+    # an exchange holiday are not sliced away.
+    start = _nearest_weekday(today - timedelta(days=days), forward=True)
 
     existing = _load_parquet(cache_path)
 
     if OFFLINE_MODE:
         if existing.empty:
             raise ValueError(f"Offline mode: no cache available at {cache_path}")
-        ex = existing.copy()
-        ex["Date"] = ex["Date"].dt.date
-        mask = (ex["Date"] >= cutoff) & (ex["Date"] <= today)
-        return _ensure_schema(ex.loc[mask].reset_index(drop=True))
+        return _ensure_schema(apply_date_range(existing, start, today))
 
     # live mode: update cache if needed
+    append_only = False
     if not existing.empty:
-        ex = existing.copy()
-        ex["Date"] = ex["Date"].dt.date
-        have_min, have_max = ex["Date"].min(), ex["Date"].max()
+        have_min, have_max = existing["Date"].min().date(), existing["Date"].max().date()
 
         # Already fully covered
         if have_min <= cutoff and have_max >= today:
-            return _ensure_schema(existing[existing["Date"].dt.date >= cutoff].reset_index(drop=True))
+            return _ensure_schema(apply_date_range(existing, start))
 
         # Need to extend forward only
         if have_min <= cutoff <= have_max < today:
             fetch_args.update(start_date=have_max + timedelta(days=1), end_date=today)
+            append_only = True
         # Need to fetch earlier window chunk
         elif cutoff < have_min:
             fetch_args.update(start_date=cutoff, end_date=have_min - timedelta(days=1))
@@ -250,9 +580,7 @@ def _rolling_cache(
         logger.debug("Timeseries fetch failure details", exc_info=True)
         if existing.empty:
             return _empty_ts()
-        ex = existing.copy()
-        ex["Date"] = ex["Date"].dt.date
-        return _ensure_schema(ex[ex["Date"] >= cutoff].reset_index(drop=True))
+        return _ensure_schema(apply_date_range(existing, start))
     new = _ensure_schema(new)
 
     if new.empty:
@@ -260,9 +588,7 @@ def _rolling_cache(
         if existing.empty:
             return _empty_ts()
         # Return best-effort slice of existing
-        ex = existing.copy()
-        ex["Date"] = ex["Date"].dt.date
-        return _ensure_schema(ex[ex["Date"] >= cutoff].reset_index(drop=True))
+        return _ensure_schema(apply_date_range(existing, start))
 
     # Merge and dedupe by Date, skipping empty/all-NA frames to avoid
     # pandas concat dtype warnings and object coercion
@@ -273,8 +599,16 @@ def _rolling_cache(
     combined = (
         pd.concat(frames, ignore_index=True).drop_duplicates(subset="Date").sort_values("Date").reset_index(drop=True)
     )
-    _save_parquet(combined, cache_path)
-    return _ensure_schema(combined[combined["Date"].dt.date >= cutoff].reset_index(drop=True))
+    if append_only:
+        # Only rows past the cached range are new; persist just those as a
+        # delta segment instead of rewriting the whole file.
+        fresh = new[new["Date"] > existing["Date"].max()]
+        if not fresh.empty:
+            record_meta_cache_write(cache_path, combined, deltas=_append_delta(fresh, cache_path))
+    else:
+        _save_parquet(combined, cache_path)
+        record_meta_cache_write(cache_path, combined)
+    return _ensure_schema(apply_date_range(combined, start))
 
 
 # ──────────────────────────────────────────────────────────────
@@ -503,14 +837,287 @@ def _s3_object_mtime(cache: str) -> float | None:
     return mtime
 
 
+# ──────────────────────────────────────────────────────────────
+# Meta cache manifest (S3)
+# ──────────────────────────────────────────────────────────────
+# The TTL dicts above only soften the per-ticker HeadObject cost: a cold
+# Movers/Instrument request still pays one round trip per holding, and
+# listing the cache walks every object under ``meta/``. Writers therefore
+# also maintain a single manifest object next to the series::
+#
+#     meta/_manifest.json
+#     {"version": 1, "complete": true,
+#      "series": {"VOD_L": {"mtime": ..., "rows": ..., "min_date": "...",
+#                           "max_date": "...", "size": ...}}}
+#
+# Readers fetch it at most once per ``_MANIFEST_TTL_SECONDS`` and answer
+# staleness and existence checks from it. A series missing from the manifest
+# falls back to the per-object HeadObject checks, so a manifest that lags a
+# write only costs the old round trip. ``complete`` is set by
+# :func:`rebuild_meta_cache_manifest` once every cached file is recorded;
+# only then is absence from the manifest treated as "not cached" and the
+# manifest used in place of a listing. Updates are conditional puts
+# (``IfMatch``/``IfNoneMatch``) retried on conflict, so concurrent writers
+# do not drop each other's entries. An update that still fails deletes the
+# shared manifest: every reader then falls back to HeadObject/listing until
+# the next rebuild, rather than trusting an entry that missed a write.
+# Refresh runs wrap their writes in :func:`batched_manifest_updates`, which
+# applies every update of the run with a single conditional put.
+_MANIFEST_NAME = "_manifest.json"
+_MANIFEST_VERSION = 1
+_MANIFEST_TTL_SECONDS = 30.0
+_MANIFEST_WRITE_ATTEMPTS = 3
+_MANIFEST_LOCK = threading.Lock()
+# (fetched_at, etag, manifest) for the last manifest read; ``manifest`` is
+# ``None`` when there was none (or it was unreadable), ``etag`` is ``None``
+# when the object does not exist.
+_MANIFEST_STATE: tuple[float, str | None, dict | None] | None = None
+# Updates queued by the open ``batched_manifest_updates`` blocks (``None``
+# outside one) and how many blocks are open.
+_MANIFEST_BATCH: list[Callable[[dict], None]] | None = None
+_MANIFEST_BATCH_DEPTH = 0
+
+
+def _manifest_path() -> str:
+    return _cache_path("meta", _MANIFEST_NAME)
+
+
+def _manifest_key(cache: str) -> str | None:
+    """Return the manifest entry name for a meta series path, else ``None``."""
+    prefix = _cache_path("meta", "")
+    if not cache.startswith("s3://") or not cache.startswith(prefix) or not cache.endswith(".parquet"):
+        return None
+    name = cache[len(prefix) :]
+    return None if "/" in name else name[: -len(".parquet")]
+
+
+def _fetch_manifest() -> tuple[str | None, dict | None]:
+    parsed = _split_s3_cache_uri(_manifest_path())
+    if parsed is None:
+        return None, None
+    bucket, key = parsed
+    try:
+        resp = _s3_client().get_object(Bucket=bucket, Key=key)
+        manifest = json.loads(resp["Body"].read())
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") not in {"404", "NoSuchKey", "NotFound"}:
+            logger.warning("Unable to read the timeseries cache manifest: %s", sanitise_log_value(exc))
+        return None, None
+    except Exception as exc:  # advisory: callers fall back to per-object checks
+        logger.warning("Unable to read the timeseries cache manifest: %s", sanitise_log_value(exc))
+        return None, None
+    if not isinstance(manifest, dict) or manifest.get("version") != _MANIFEST_VERSION:
+        return resp.get("ETag"), None
+    manifest.setdefault("series", {})
+    return resp.get("ETag"), manifest
+
+
+def _manifest_snapshot(*, refresh: bool = False) -> tuple[str | None, dict | None]:
+    """Return ``(etag, manifest)``, fetching at most once per TTL."""
+    global _MANIFEST_STATE
+    with _MANIFEST_LOCK:
+        state = _MANIFEST_STATE
+    if not refresh and state is not None and time.monotonic() - state[0] < _MANIFEST_TTL_SECONDS:
+        return state[1], state[2]
+    etag, manifest = _fetch_manifest()
+    with _MANIFEST_LOCK:
+        if manifest is not None:
+            # Keep this process's queued updates visible across refetches.
+            for apply in _MANIFEST_BATCH or ():
+                apply(manifest)
+        _MANIFEST_STATE = (time.monotonic(), etag, manifest)
+    return etag, manifest
+
+
+def _manifest_entry(cache: str) -> tuple[dict | None, bool]:
+    """Return ``(entry, complete)`` for ``cache`` from the current manifest."""
+    name = _manifest_key(cache)
+    if name is None:
+        return None, False
+    _etag, manifest = _manifest_snapshot()
+    if manifest is None:
+        return None, False
+    return manifest["series"].get(name), bool(manifest.get("complete"))
+
+
+def _put_manifest(manifest: dict, etag: str | None) -> str | None:
+    """Conditionally write ``manifest``; return the new ETag, or ``None`` on conflict."""
+    parsed = _split_s3_cache_uri(_manifest_path())
+    if parsed is None:
+        return None
+    bucket, key = parsed
+    condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+    try:
+        resp = _s3_client().put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=json.dumps(manifest, sort_keys=True).encode("utf-8"),
+            ContentType="application/json",
+            **condition,
+        )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"412", "PreconditionFailed", "ConditionalRequestConflict"}:
+            return None
+        raise
+    return resp.get("ETag") or ""
+
+
+def _discard_manifest() -> None:
+    """Delete the shared manifest so no reader trusts its entries."""
+    global _MANIFEST_STATE
+    parsed = _split_s3_cache_uri(_manifest_path())
+    if parsed is not None:
+        try:
+            _s3_client().delete_object(Bucket=parsed[0], Key=parsed[1])
+        except Exception as exc:
+            logger.warning("Unable to discard the timeseries cache manifest: %s", sanitise_log_value(exc))
+    with _MANIFEST_LOCK:
+        _MANIFEST_STATE = None
+
+
+@contextmanager
+def batched_manifest_updates() -> Iterator[None]:
+    """Queue manifest updates made inside the block and write them once at the end.
+
+    Blocks may nest (and span threads); the queued updates are written
+    when the outermost block exits. Until then they are applied to this
+    process's copy of the manifest only.
+    """
+    global _MANIFEST_BATCH, _MANIFEST_BATCH_DEPTH
+    with _MANIFEST_LOCK:
+        _MANIFEST_BATCH_DEPTH += 1
+        if _MANIFEST_BATCH is None:
+            _MANIFEST_BATCH = []
+    try:
+        yield
+    finally:
+        with _MANIFEST_LOCK:
+            _MANIFEST_BATCH_DEPTH -= 1
+            pending = _MANIFEST_BATCH if _MANIFEST_BATCH_DEPTH == 0 else None
+            if pending is not None:
+                _MANIFEST_BATCH = None
+        if pending:
+
+            def apply_all(manifest: dict) -> None:
+                for apply in pending:
+                    apply(manifest)
+
+            _update_manifest(apply_all)
+
+
+def _update_manifest(apply: Callable[[dict], None]) -> None:
+    """Apply ``apply`` to the manifest and write it back, retrying on conflict."""
+    global _MANIFEST_STATE
+    with _MANIFEST_LOCK:
+        if _MANIFEST_BATCH is not None:
+            _MANIFEST_BATCH.append(apply)
+            if _MANIFEST_STATE is not None and _MANIFEST_STATE[2] is not None:
+                fetched_at, etag, manifest = _MANIFEST_STATE
+                local = {**manifest, "series": dict(manifest["series"])}
+                apply(local)
+                _MANIFEST_STATE = (fetched_at, etag, local)
+            return
+    etag, manifest = _manifest_snapshot()
+    try:
+        for _attempt in range(_MANIFEST_WRITE_ATTEMPTS):
+            updated = {"version": _MANIFEST_VERSION, "complete": False, "series": {}}
+            if manifest is not None:
+                updated.update(manifest)
+                updated["series"] = dict(manifest["series"])
+            apply(updated)
+            new_etag = _put_manifest(updated, etag)
+            if new_etag is not None:
+                with _MANIFEST_LOCK:
+                    _MANIFEST_STATE = (time.monotonic(), new_etag, updated)
+                return
+            etag, manifest = _manifest_snapshot(refresh=True)
+    except Exception as exc:  # advisory: readers fall back to per-object checks
+        logger.warning("Unable to update the timeseries cache manifest: %s", sanitise_log_value(exc))
+    else:
+        logger.warning("Gave up updating the timeseries cache manifest after repeated write conflicts")
+    # No reader (in any process) may trust an entry this update failed to change.
+    _discard_manifest()
+
+
+def _manifest_record(df: pd.DataFrame, *, mtime: float, size: int | None = None, deltas: int | None = 0) -> dict:
+    dates = pd.to_datetime(df["Date"]) if "Date" in df.columns else pd.Series(dtype="datetime64[ns]")
+    return {
+        "mtime": mtime,
+        "rows": int(len(df)),
+        "min_date": dates.min().date().isoformat() if not dates.empty else None,
+        "max_date": dates.max().date().isoformat() if not dates.empty else None,
+        "size": size,
+        "deltas": deltas,
+    }
+
+
+def record_meta_cache_write(cache: str, df: pd.DataFrame, *, deltas: int = 0) -> None:
+    """Record that the full series ``df`` was just written to ``cache``.
+
+    ``deltas`` is how many delta segments the series now has on top of its
+    base file. No-op for local caches and non-meta paths. ``size`` is left
+    unset because s3fs does not report the written object's size; a
+    rebuild fills it in from the listing.
+    """
+    name = _manifest_key(cache)
+    if name is None:
+        return
+    entry = _manifest_record(df, mtime=time.time(), deltas=deltas)
+    _update_manifest(lambda manifest: manifest["series"].__setitem__(name, entry))
+
+
+def record_meta_cache_delete(cache: str) -> None:
+    """Drop ``cache`` from the manifest after its series was deleted."""
+    name = _manifest_key(cache)
+    if name is None:
+        return
+    _update_manifest(lambda manifest: manifest["series"].pop(name, None))
+
+
+def meta_cache_manifest() -> dict | None:
+    """Return the current meta cache manifest (S3 caches only)."""
+    if _CACHE_BASE is None or not _CACHE_BASE.startswith("s3://"):
+        return None
+    return _manifest_snapshot()[1]
+
+
+def rebuild_meta_cache_manifest() -> int:
+    """Rewrite the manifest from a full listing of the S3 meta cache.
+
+    Reads every cached series once, so this is an admin/maintenance
+    operation rather than something to run per request. Returns the number
+    of series recorded.
+    """
+    if _CACHE_BASE is None or not _CACHE_BASE.startswith("s3://"):
+        return 0
+    started = time.time()
+    series: dict[str, dict] = {}
+    for name, (mtime, size) in _s3_cached_meta_objects(_CACHE_BASE).items():
+        stem = name[: -len(".parquet")]
+        df = _load_parquet(_cache_path("meta", name))
+        # The segment count is left unknown (loads keep listing) until the next write.
+        series[stem] = _manifest_record(df, mtime=mtime, size=size, deltas=None)
+
+    def replace(manifest: dict) -> None:
+        # Keep entries written while the listing was being read.
+        newer = {k: v for k, v in manifest["series"].items() if (v.get("mtime") or 0) >= started}
+        manifest["series"] = {**series, **newer}
+        manifest["complete"] = True
+
+    _update_manifest(replace)
+    logger.info("Rebuilt the timeseries cache manifest with %s series", sanitise_log_value(len(series)))
+    return len(series)
+
+
 def _invalidate_meta_caches_if_stale(ticker: str, exchange: str) -> None:
-    """Clear both meta LRUs when the backing file's mtime has changed."""
+    """Drop the in-process entries for one series when its file's mtime changed."""
     cache = meta_timeseries_cache_path(ticker, exchange)
     if cache.startswith("s3://"):
-        mtime = _s3_object_mtime(cache)
+        entry, _complete = _manifest_entry(cache)
+        mtime = entry["mtime"] if entry is not None else _s3_object_mtime(cache)
         if mtime is None:
             # Confirmed-missing within the negative-cache TTL: the previous
-            # miss already cleared the LRUs once, so there is nothing new
+            # miss already invalidated the series once, so there is nothing new
             # to invalidate and no reason to touch _CACHE_FILE_MTIMES.
             return
     else:
@@ -518,49 +1125,172 @@ def _invalidate_meta_caches_if_stale(ticker: str, exchange: str) -> None:
         mtime = p.stat().st_mtime if p.exists() else 0.0
     prev = _CACHE_FILE_MTIMES.get(cache)
     if prev is not None and prev != mtime:
-        _load_meta_timeseries_cached.cache_clear()
-        _memoized_range_cached.cache_clear()
+        _FRAME_CACHE.invalidate(ticker, exchange)
     _CACHE_FILE_MTIMES[cache] = mtime
 
 
-@lru_cache(maxsize=512)
+# ──────────────────────────────────────────────────────────────
+# In-process frame cache (loads and ranges)
+# ──────────────────────────────────────────────────────────────
+_DEFAULT_MEMORY_CACHE_MB = 128
+
+
+def _memory_cache_budget_bytes() -> int:
+    mb = getattr(config, "timeseries_memory_cache_mb", None)
+    if mb is None:
+        mb = _DEFAULT_MEMORY_CACHE_MB
+    return int(float(mb) * 1024 * 1024)
+
+
+_FRAME_CACHE = FrameCache(_memory_cache_budget_bytes())
+# Concurrent misses for the same key share one load, and loads of the same
+# series are serialised, so a burst of page requests for one ticker triggers
+# a single provider fetch and a single parquet write.
+_IN_FLIGHT = SingleFlight()
+_SERIES_LOCKS = KeyedLocks()
+
+
+def clear_meta_caches() -> None:
+    """Drop every in-process meta load/range entry."""
+    _FRAME_CACHE.clear()
+
+
+def meta_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss/eviction/byte counters for the in-process meta cache and hot tier."""
+    return {
+        **_FRAME_CACHE.stats(),
+        "coalesced": _IN_FLIGHT.shared,
+        "compact_dtypes": _compact_dtypes_enabled(),
+        "hot_tier": hot_tier.stats(),
+    }
+
+
+def meta_memory_report(ticker: str, exchange: str) -> Dict[str, Any]:
+    """Measure one cached series under the standard and compact schemas.
+
+    Sizes are in-memory bytes as counted by the frame cache budget, so the
+    ratio is how many more copies of this series fit when
+    ``timeseries_compact_dtypes`` is enabled.
+    """
+    df = load_cached_meta_timeseries_full(ticker, exchange)
+    compact = _compact_dtypes(df) if not df.empty else df
+    standard_bytes = frame_nbytes(_standard_dtypes(df))
+    compact_bytes = frame_nbytes(compact)
+    return {
+        "ticker": ticker,
+        "exchange": exchange,
+        "rows": len(df),
+        "standard_bytes": standard_bytes,
+        "compact_bytes": compact_bytes,
+        "ratio": round(standard_bytes / compact_bytes, 2) if compact_bytes else None,
+        "compact_dtypes": _compact_dtypes_enabled(),
+        "dtypes": {col: str(dtype) for col, dtype in compact.dtypes.items()},
+    }
+
+
 def _load_meta_timeseries_cached(ticker: str, exchange: str, days: int) -> pd.DataFrame:
-    """LRU-backed loader for Meta timeseries."""
-    cache = str(meta_timeseries_cache_path(ticker, exchange))
-    return _rolling_cache(
-        fetch_meta_timeseries,
-        cache,
-        {"ticker": ticker, "exchange": exchange},
-        days,
-        ticker=ticker,
-        exchange=exchange,
-    )
+    """Frame-cache-backed loader for Meta timeseries."""
+    key = ("load", ticker, exchange, days)
+    cached = _FRAME_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    def load() -> pd.DataFrame:
+        with _SERIES_LOCKS.get((ticker.upper(), exchange.upper())):
+            # Another load of this key may have finished while we waited.
+            cached = _FRAME_CACHE.peek(key)
+            if cached is not None:
+                return cached
+            cache = str(meta_timeseries_cache_path(ticker, exchange))
+            df = _rolling_cache(
+                fetch_meta_timeseries,
+                cache,
+                {"ticker": ticker, "exchange": exchange},
+                days,
+                ticker=ticker,
+                exchange=exchange,
+            )
+            _FRAME_CACHE.put(key, df, ticker=ticker, exchange=exchange)
+            return df
 
+    return _IN_FLIGHT.do(key, load)
 
-def load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
-    """Load Meta timeseries with in-process caching and mutation safety."""
+
+def load_meta_timeseries(ticker: str, exchange: str, days: int, *, readonly: bool = False) -> pd.DataFrame:
+    """Load Meta timeseries with in-process caching and mutation safety.
+
+    By default callers get a private deep copy. ``readonly=True`` returns a
+    zero-copy :func:`frame_view` of the cached frame instead, for hot paths
+    that only read the series.
+    """
     global OFFLINE_MODE
 
     # If offline mode toggles, clear in-memory cache
     if OFFLINE_MODE != config.offline_mode:
         OFFLINE_MODE = config.offline_mode
-        _load_meta_timeseries_cached.cache_clear()
-        _memoized_range_cached.cache_clear()
+        clear_meta_caches()
         _CACHE_FILE_MTIMES.clear()
 
     _invalidate_meta_caches_if_stale(ticker, exchange)
-    return _load_meta_timeseries_cached(ticker, exchange, days).copy()
+    df = _load_meta_timeseries_cached(ticker, exchange, days)
+    return frame_view(df) if readonly else df.copy()
+
+
+def warm_meta_timeseries(ticker: str, exchange: str, days: int, prefetched: pd.DataFrame) -> pd.DataFrame:
+    """Bring the cached series up to date from rows that were already fetched.
+
+    Batch warm-ups download many symbols in one provider call; this runs the
+    usual rolling-cache update for one of them with ``prefetched`` standing
+    in for the Yahoo fetch, so the cache file is written exactly as a
+    regular load would write it. The rows go through the same coverage
+    check as a regular fetch: windows they leave short are gap-filled from
+    the other providers by :func:`fetch_meta_timeseries`.
+    """
+    prefetched = prefetched.assign(Date=pd.to_datetime(prefetched["Date"])).sort_values("Date", kind="stable")
+
+    def fetch(*, ticker: str, exchange: str, start_date: date, end_date: date) -> pd.DataFrame:
+        return fetch_meta_timeseries(ticker, exchange, start_date, end_date, prefetched=prefetched)
+
+    with _SERIES_LOCKS.get((ticker.upper(), exchange.upper())):
+        df = _rolling_cache(
+            fetch,
+            str(meta_timeseries_cache_path(ticker, exchange)),
+            {"ticker": ticker, "exchange": exchange},
+            days,
+            ticker=ticker,
+            exchange=exchange,
+        )
+    _FRAME_CACHE.invalidate(ticker, exchange)
+    return df
 
 
 # ──────────────────────────────────────────────────────────────
-# In-process LRU for *ranges* (no duplicate IO per request)
+# In-process cache for *ranges* (no duplicate IO per request)
 # ──────────────────────────────────────────────────────────────
-@lru_cache(maxsize=512)
 def _memoized_range_cached(
     ticker: str,
     exchange: str,
     start_iso: str,
     end_iso: str,
+) -> pd.DataFrame:
+    key = ("range", ticker, exchange, start_iso, end_iso)
+    cached = _FRAME_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    def load() -> pd.DataFrame:
+        df = _load_meta_range(ticker, exchange, start_iso, end_iso)
+        _FRAME_CACHE.put(key, df, ticker=ticker, exchange=exchange)
+        return df
+
+    return _IN_FLIGHT.do(key, load)
+
+
+def _load_meta_range(
+    ticker: str,
+    exchange: str,
+    start_iso: str,
+    end_iso: str,
 ) -> pd.DataFrame:
     global OFFLINE_MODE
 
@@ -611,10 +1341,77 @@ def _memoized_range(
     start_iso: str,
     end_iso: str,
 ) -> pd.DataFrame:
-    """LRU-cached range fetch that returns a copy to prevent mutation."""
+    """Cached range fetch that returns a copy to prevent mutation."""
     return _memoized_range_cached(ticker, exchange, start_iso, end_iso).copy()
 
 
+def _instrument_currency(ticker: str, exchange: str) -> str:
+    """Return the quote currency of ``ticker.exchange`` from metadata or its exchange."""
+    meta = get_instrument_meta(f"{ticker}.{exchange}")
+    return meta.get("currency") or EXCHANGE_TO_CCY.get((exchange or "").upper(), "GBP")
+
+
+def _load_fx_rates(curr: str, start: date, end: date) -> pd.DataFrame:
+    """Return ``Date``/``Rate`` GBP per unit of ``curr`` for ``start``..``end``.
+
+    Offline, the FX cache, the bundled snapshot and the optional proxy are
+    tried before a live fetch; a ``ValueError`` means none of them had the
+    range.
+    """
+    curr = (curr or "").strip().upper()
+    if not re.fullmatch(r"[A-Z]{3}", curr):
+        logger.warning("Invalid/unsupported FX currency code: %s", _sanitize_for_log(curr))
+        return pd.DataFrame(columns=["Date", "Rate"])
+
+    if OFFLINE_MODE:
+        path = _cache_path("fx", f"{curr}.parquet")
+        try:
+            fx = pd.read_parquet(path)
+            fx["Date"] = pd.to_datetime(fx["Date"])
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.debug("FX cache read miss (%s): %s", path, exc)
+            fx = pd.DataFrame(columns=["Date", "Rate"])
+
+        if fx.empty:
+            bundled = bundled_frame(path)
+            if bundled is not None:
+                fx = bundled
+
+        if fx.empty and getattr(config, "fx_proxy_url", None):
+            try:
+                safe_curr = quote(curr, safe="")
+                url = f"{config.fx_proxy_url.rstrip('/')}/{safe_curr}"
+                params = {"start": start.isoformat(), "end": end.isoformat()}
+                resp = requests.get(url, params=params, timeout=5)
+                if resp.ok:
+                    fx = pd.DataFrame(resp.json())
+                    fx["Date"] = pd.to_datetime(fx["Date"])
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("FX proxy fetch failed for %s: %s", _sanitize_for_log(curr), sanitise_log_value(exc))
+
+        if fx.empty:
+            try:
+                fx = fetch_fx_rate_range(curr, "GBP", start, end).copy()
+                if fx.empty:
+                    raise ValueError(f"Offline mode: no FX rates for {curr}")
+
+                fx["Date"] = pd.to_datetime(fx["Date"])
+            except Exception as exc:
+                raise ValueError(f"Offline mode: no FX rates for {curr}") from exc
+
+        fx = apply_date_range(fx, start, end)
+        if fx.empty:
+            raise ValueError(f"Offline mode: FX cache lacks range for {curr}")
+    else:
+        fx = fetch_fx_rate_range(curr, "GBP", start, end).copy()
+        if fx.empty:
+            return pd.DataFrame()
+        fx["Date"] = pd.to_datetime(fx["Date"])
+
+    fx["Rate"] = pd.to_numeric(fx["Rate"], errors="coerce")
+    return fx
+
+
 def _convert_to_base_currency(
     df: pd.DataFrame,
     ticker: str,
@@ -625,84 +1422,26 @@ def _convert_to_base_currency(
 ) -> pd.DataFrame:
     """Convert OHLC prices to ``base_currency`` if needed."""
 
-    meta = get_instrument_meta(f"{ticker}.{exchange}")
-    currency = meta.get("currency") or EXCHANGE_TO_CCY.get((exchange or "").upper(), "GBP")
+    currency = _instrument_currency(ticker, exchange)
     base_currency = (base_currency or "GBP").upper()
 
     if currency in (base_currency, "GBX") or df.empty:
         return df
 
-    def _load_rates(curr: str) -> pd.DataFrame:
-        curr = (curr or "").strip().upper()
-        if not re.fullmatch(r"[A-Z]{3}", curr):
-            logger.warning("Invalid/unsupported FX currency code: %s", _sanitize_for_log(curr))
-            return pd.DataFrame(columns=["Date", "Rate"])
-
-        if OFFLINE_MODE:
-            path = _cache_path("fx", f"{curr}.parquet")
-            try:
-                fx = pd.read_parquet(path)
-                fx["Date"] = pd.to_datetime(fx["Date"])
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug("FX cache read miss (%s): %s", path, exc)
-                fx = pd.DataFrame(columns=["Date", "Rate"])
-
-            if fx.empty and getattr(config, "fx_proxy_url", None):
-                try:
-                    safe_curr = quote(curr, safe="")
-                    url = f"{config.fx_proxy_url.rstrip('/')}/{safe_curr}"
-                    params = {"start": start.isoformat(), "end": end.isoformat()}
-                    resp = requests.get(url, params=params, timeout=5)
-                    if resp.ok:
-                        fx = pd.DataFrame(resp.json())
-                        fx["Date"] = pd.to_datetime(fx["Date"])
-                except Exception as exc:  # pragma: no cover - defensive
-                    logger.warning("FX proxy fetch failed for %s: %s", _sanitize_for_log(curr), sanitise_log_value(exc))
-
-            if fx.empty:
-                try:
-                    fx = fetch_fx_rate_range(curr, "GBP", start, end).copy()
-                    if fx.empty:
-                        raise ValueError(f"Offline mode: no FX rates for {curr}")
-
-                    fx["Date"] = pd.to_datetime(fx["Date"])
-                except Exception as exc:
-                    raise ValueError(f"Offline mode: no FX rates for {curr}") from exc
-
-            fx = apply_date_range(fx, start, end)
-            if fx.empty:
-                raise ValueError(f"Offline mode: FX cache lacks range for {curr}")
-        else:
-            fx = fetch_fx_rate_range(curr, "GBP", start, end).copy()
-            if fx.empty:
-                return pd.DataFrame()
-            fx["Date"] = pd.to_datetime(fx["Date"])
-
-        fx["Rate"] = pd.to_numeric(fx["Rate"], errors="coerce")
-        return fx
-
-    fx_from_instr = _load_rates(currency)
-    if fx_from_instr.empty:
+    matrix = FxMatrix.build(start, end, (currency,), base_currency, loader=lambda c: _load_fx_rates(c, start, end))
+    if currency not in matrix:
         return df
 
-    if base_currency == "GBP":
-        fx = fx_from_instr[["Date", "Rate"]]
-    else:
-        fx_base = _load_rates(base_currency)
-        if fx_base.empty:
-            return df
-        fx = fx_from_instr.merge(fx_base, on="Date", how="left", suffixes=("_inst", "_base"))
-        fx["Rate"] = fx["Rate_inst"] / fx["Rate_base"]
-        fx = fx[["Date", "Rate"]]
-
-    merged = df.merge(fx, on="Date", how="left")
-    merged["Rate"] = merged["Rate"].ffill().bfill()
+    out = df.copy()
+    rate = matrix.factors(out["Date"], (currency,))[:, 0]
+    cols = [col for col in ["Open", "High", "Low", "Close"] if col in out.columns]
+    for col in cols:
+        out[col] = pd.to_numeric(out[col], errors="coerce")
+    converted = out[cols].to_numpy(dtype=float) * rate[:, None]
     base_lower = base_currency.lower()
-    for col in ["Open", "High", "Low", "Close"]:
-        if col in merged.columns:
-            merged[col] = pd.to_numeric(merged[col], errors="coerce")
-            merged[f"{col}_{base_lower}"] = merged[col] * merged["Rate"]
-    return merged.drop(columns=["Rate"])
+    for i, col in enumerate(cols):
+        out[f"{col}_{base_lower}"] = converted[:, i]
+    return out
 
 
 # ──────────────────────────────────────────────────────────────
@@ -715,13 +1454,23 @@ def load_meta_timeseries_range(
     end_date: date,
     _allow_fallback: bool = True,
     base_currency: str = "GBP",
+    *,
+    readonly: bool = False,
 ) -> pd.DataFrame:
+    """Return cached Meta prices for ``start_date``..``end_date`` in ``base_currency``.
+
+    ``readonly=True`` skips the defensive copy of the cached range, as for
+    :func:`load_meta_timeseries`.
+    """
     global OFFLINE_MODE
     _invalidate_meta_caches_if_stale(ticker, exchange)
     for offset in range(0, 5):  # try same day, 1-day back, 2-day back...
         s = start_date - timedelta(days=offset)
         e = end_date - timedelta(days=offset)
-        df = _memoized_range(ticker, exchange, s.isoformat(), e.isoformat())
+        if readonly:
+            df = frame_view(_memoized_range_cached(ticker, exchange, s.isoformat(), e.isoformat()))
+        else:
+            df = _memoized_range(ticker, exchange, s.isoformat(), e.isoformat())
         if not df.empty:
             try:
                 df = _convert_to_base_currency(df, ticker, exchange, s, e, base_currency)
@@ -741,7 +1490,8 @@ def load_meta_timeseries_range(
         try:
             config.offline_mode = False
             OFFLINE_MODE = False
-            _memoized_range_cached.cache_clear()
+            # Drop the empty offline range results cached for this series above.
+            _FRAME_CACHE.invalidate(ticker, exchange, namespace="range")
             return load_meta_timeseries_range(
                 ticker,
                 exchange,
@@ -749,6 +1499,7 @@ def load_meta_timeseries_range(
                 end_date,
                 _allow_fallback=False,
                 base_currency=base_currency,
+                readonly=readonly,
             )
         finally:
             config.offline_mode = prev_offline_mode
@@ -778,6 +1529,11 @@ def _s3_cache_object_exists(cache: str) -> bool:
 def has_cached_meta_timeseries(ticker: str, exchange: str) -> bool:
     cache = meta_timeseries_cache_path(ticker, exchange)
     if cache.startswith("s3://"):
+        entry, complete = _manifest_entry(cache)
+        if entry is not None:
+            return bool(entry.get("rows"))
+        if complete:
+            return False
         return _s3_cache_object_exists(cache)
     p = Path(cache)
     return p.exists() and p.stat().st_size > 0
@@ -787,13 +1543,29 @@ def meta_timeseries_cache_path(ticker: str, exchange: str) -> str:
     return _cache_path("meta", f"{ticker.upper()}_{exchange.upper()}.parquet")
 
 
+def meta_series_signature(ticker: str, exchange: str) -> str | None:
+    """Return a stamp that changes whenever the cached series is written.
+
+    Appending a delta segment touches the base file, so its modification
+    time covers every write. S3 caches answer from the manifest when it has
+    the series, saving the HeadObject. ``None`` means the series is not cached.
+    """
+    cache = meta_timeseries_cache_path(ticker, exchange)
+    if cache.startswith("s3://"):
+        entry, _complete = _manifest_entry(cache)
+        if entry is not None and entry.get("mtime") is not None:
+            return f"manifest:{entry['mtime']}"
+    return _hot_tier_signature(cache)
+
+
 def load_cached_meta_timeseries_full(ticker: str, exchange: str) -> pd.DataFrame:
     """Read the full cached meta timeseries as-is, with no fetch or date filter.
 
     Unlike :func:`load_meta_timeseries_range`, this never triggers a live
     fetch and never dedupes/trims rows — it is intended for read-only
     diagnostics (e.g. data-quality checks) that need to see the raw cache
-    contents, duplicates included.
+    contents, duplicates included. Pending delta segments are merged in
+    (they only ever hold dates past the base file's last row).
     """
     return _load_parquet(meta_timeseries_cache_path(ticker, exchange))
 
@@ -806,28 +1578,36 @@ def _local_cached_meta_filenames(base: str) -> list[str]:
 
 
 def _s3_cached_meta_filenames(base: str) -> list[str]:
+    return list(_s3_cached_meta_objects(base))
+
+
+def _s3_cached_meta_objects(base: str) -> dict[str, tuple[float, int]]:
+    """Return ``{filename: (mtime, size)}`` for the S3 meta cache objects."""
     without_scheme = base[len("s3://") :]
     bucket, _, prefix = without_scheme.partition("/")
     if not bucket:
         logger.warning("Invalid S3 timeseries cache base: %s", _sanitize_for_log(base))
-        return []
+        return {}
     meta_prefix = f"{prefix.rstrip('/')}/meta/" if prefix else "meta/"
-    names: list[str] = []
+    objects: dict[str, tuple[float, int]] = {}
     try:
         paginator = _s3_client().get_paginator("list_objects_v2")
         for page in paginator.paginate(Bucket=bucket, Prefix=meta_prefix):
             for obj in page.get("Contents", []):
                 key = obj["Key"]
-                if key.endswith(".parquet"):
-                    names.append(key.rsplit("/", 1)[-1])
+                # Skip delta segments (``meta/<T>_<E>.delta/<stamp>.parquet``).
+                if key.endswith(".parquet") and "/" not in key[len(meta_prefix) :]:
+                    modified = obj.get("LastModified")
+                    mtime = float(modified.timestamp()) if hasattr(modified, "timestamp") else 0.0
+                    objects[key.rsplit("/", 1)[-1]] = (mtime, int(obj.get("Size", 0)))
     except (BotoCoreError, ClientError) as exc:  # pragma: no cover - defensive AWS path
         logger.error(
             "Unable to list S3 timeseries cache objects under %s: %s",
             _sanitize_for_log(meta_prefix),
             sanitise_log_value(exc),
         )
-        return []
-    return names
+        return {}
+    return objects
 
 
 def list_cached_meta_tickers() -> list[tuple[str, str]]:
@@ -835,7 +1615,11 @@ def list_cached_meta_tickers() -> list[tuple[str, str]]:
     if _CACHE_BASE is None:
         return []
     if _CACHE_BASE.startswith("s3://"):
-        filenames = _s3_cached_meta_filenames(_CACHE_BASE)
+        manifest = meta_cache_manifest()
+        if manifest is not None and manifest.get("complete"):
+            filenames = [f"{name}.parquet" for name in manifest["series"]]
+        else:
+            filenames = _s3_cached_meta_filenames(_CACHE_BASE)
     else:
         filenames = _local_cached_meta_filenames(_CACHE_BASE)
 
@@ -850,6 +1634,55 @@ def list_cached_meta_tickers() -> list[tuple[str, str]]:
     return sorted(pairs)
 
 
+def list_cached_fx_paths() -> list[str]:
+    """Return the sorted paths (``s3://`` URIs on S3) of the cached FX history files.
+
+    S3 listing errors propagate, so callers packing the FX cache (the
+    offline bundle build) fail instead of silently leaving it out.
+    """
+    if _CACHE_BASE is None:
+        return []
+    if not _CACHE_BASE.startswith("s3://"):
+        return [str(p) for p in sorted(Path(_CACHE_BASE, "fx").glob("*.parquet"))]
+    parsed = _split_s3_cache_uri(_cache_path("fx"))
+    if parsed is None:
+        return []
+    bucket, prefix = parsed
+    paths: list[str] = []
+    paginator = _s3_client().get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=f"{prefix}/"):
+        for obj in page.get("Contents", []):
+            key = obj["Key"]
+            if key.endswith(".parquet") and "/" not in key[len(prefix) + 1 :]:
+                paths.append(f"s3://{bucket}/{key}")
+    return sorted(paths)
+
+
+def compact_meta_timeseries(ticker: str, exchange: str) -> int:
+    """Fold any delta segments for ``ticker``/``exchange`` into the base file.
+
+    Callers that read or replace the base parquet directly (manual edits,
+    data-quality fixes) compact first so the file holds the whole series.
+    """
+    return compact_delta_segments(meta_timeseries_cache_path(ticker, exchange))
+
+
+def compact_cached_meta_timeseries() -> dict[str, int]:
+    """Compact every cached meta series; returns ticker/segment counts."""
+    tickers = segments = 0
+    for ticker, exchange in list_cached_meta_tickers():
+        folded = compact_meta_timeseries(ticker, exchange)
+        if folded:
+            tickers += 1
+            segments += folded
+    logger.info(
+        "Compacted %s delta segments across %s cached series",
+        sanitise_log_value(segments),
+        sanitise_log_value(tickers),
+    )
+    return {"tickers": tickers, "segments": segments}
+
+
 # NOTE: keep arg order to avoid breaking existing callers
 def get_price_for_date(exchange, ticker, date, field="Close", base_currency: str = "GBP"):
     """
@@ -15,11 +15,13 @@ import logging
 import os
 import re
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import date, datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backend import config
@@ -45,13 +47,19 @@ from backend.timeseries.fetch_stooq_timeseries import (
     StooqRateLimitError,
     fetch_stooq_timeseries_range,
 )
-from backend.timeseries.fetch_yahoo_timeseries import fetch_yahoo_timeseries_range
+from backend.timeseries.fetch_yahoo_timeseries import (
+    fetch_yahoo_timeseries_batch,
+    fetch_yahoo_timeseries_range,
+)
+from backend.timeseries.provider_health import PROVIDER_HEALTH, is_provider_failure
 from backend.timeseries.ticker_validator import is_valid_ticker, record_skipped_ticker
+from backend.utils.rate_limiter import get_rate_limiter
 from backend.utils.timeseries_helpers import (
     STANDARD_COLUMNS,
     _is_isin,
     _nearest_weekday,
 )
+from backend.utils.trading_calendar import get_trading_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -377,11 +385,178 @@ def _merge(sources: List[pd.DataFrame]) -> pd.DataFrame:
     return df.sort_values("Date").reset_index(drop=True)
 
 
-def _coverage_ratio(df: pd.DataFrame, expected: set[date]) -> float:
-    if df.empty or not expected:
+def _coverage_ratio(df: pd.DataFrame, expected: Iterable[date] | np.ndarray) -> float:
+    """Return the share of ``expected`` trading days present in ``df``."""
+    if not isinstance(expected, np.ndarray):
+        expected = np.array(sorted(expected), dtype="datetime64[D]")
+    if df.empty or not len(expected):
         return 0.0
-    present = set(pd.to_datetime(df["Date"]).dt.date)
-    return len(present & expected) / len(expected)
+    present = pd.to_datetime(df["Date"]).to_numpy(dtype="datetime64[D]")
+    return float(np.isin(expected, present).sum()) / len(expected)
+
+
+def _provider_steps(
+    ticker: str, exchange: str, start_date: date, end_date: date
+) -> list[tuple[str, Callable[[], pd.DataFrame]]]:
+    """Return the primary providers as zero-argument fetches, best first.
+
+    Each fetch logs and swallows its own provider errors, returning an empty
+    frame on a miss, so callers only need to merge and check coverage. A
+    provider whose circuit breaker is open or whose shared rate limit is
+    exhausted is skipped straight away (an empty frame) rather than waited
+    for. Every call is recorded in :data:`PROVIDER_HEALTH`, whose ranking
+    decides the order of the returned steps.
+    """
+    expected_dates = get_trading_calendar(exchange).trading_days_between(start_date, end_date)
+
+    def empty() -> pd.DataFrame:
+        return pd.DataFrame(columns=STANDARD_COLUMNS)
+
+    def tracked(name: str, limiter: str, call: Callable[[], pd.DataFrame | None]) -> Callable[[], pd.DataFrame]:
+        def fetch() -> pd.DataFrame:
+            if not PROVIDER_HEALTH.allow(name):
+                logger.debug(
+                    "%s circuit open; skipping for %s.%s",
+                    sanitise_log_value(name),
+                    sanitise_log_value(ticker),
+                    sanitise_log_value(exchange),
+                )
+                return empty()
+            if not get_rate_limiter(limiter).try_acquire():
+                PROVIDER_HEALTH.skip(name)
+                logger.debug(
+                    "%s rate limit reached; skipping for %s.%s",
+                    sanitise_log_value(name),
+                    sanitise_log_value(ticker),
+                    sanitise_log_value(exchange),
+                )
+                return empty()
+            started = time.monotonic()
+            try:
+                frame = call()
+            except Exception as exc:
+                failed = is_provider_failure(exc)
+                PROVIDER_HEALTH.record(
+                    name, ok=not failed, latency=time.monotonic() - started, instrument=f"{ticker}.{exchange}"
+                )
+                logger.debug(
+                    "%s %s for %s.%s: %s",
+                    sanitise_log_value(name),
+                    sanitise_log_value("failure" if failed else "miss"),
+                    sanitise_log_value(ticker),
+                    sanitise_log_value(exchange),
+                    sanitise_log_value(exc),
+                )
+                return empty()
+            if frame is None:
+                # The provider reported its own rate limit: no health signal.
+                PROVIDER_HEALTH.skip(name)
+                return empty()
+            PROVIDER_HEALTH.record(
+                name,
+                ok=True,
+                latency=time.monotonic() - started,
+                coverage=_coverage_ratio(frame, expected_dates),
+                instrument=f"{ticker}.{exchange}",
+            )
+            return frame
+
+        return fetch
+
+    def yahoo() -> pd.DataFrame:
+        return fetch_yahoo_timeseries_range(ticker, exchange, start_date, end_date)
+
+    def stooq() -> pd.DataFrame | None:
+        try:
+            return fetch_stooq_timeseries_range(ticker, exchange, start_date, end_date)
+        except StooqRateLimitError as exc:
+            logger.debug(
+                "Stooq rate limit for %s.%s: %s",
+                sanitise_log_value(ticker),
+                sanitise_log_value(exchange),
+                sanitise_log_value(exc),
+            )
+            # The daily hit cap resets tomorrow; tell the other workers too.
+            tomorrow = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+            get_rate_limiter("stooq").block_for((tomorrow - datetime.now()).total_seconds())
+            return None
+
+    def alphavantage() -> pd.DataFrame | None:
+        try:
+            return fetch_alphavantage_timeseries_range(ticker, exchange, start_date, end_date)
+        except AlphaVantageRateLimitError as exc:
+            logger.debug(
+                "Alpha Vantage rate limit for %s.%s: %s",
+                sanitise_log_value(ticker),
+                sanitise_log_value(exchange),
+                sanitise_log_value(exc),
+            )
+            if exc.retry_after:
+                get_rate_limiter("alpha_vantage").block_for(exc.retry_after)
+            return None
+
+    steps: dict[str, Callable[[], pd.DataFrame]] = {
+        "yahoo": tracked("yahoo", "yahoo", yahoo),
+        "stooq": tracked("stooq", "stooq", stooq),
+    }
+    if getattr(config, "alpha_vantage_enabled", None):
+        steps["alphavantage"] = tracked("alphavantage", "alpha_vantage", alphavantage)
+    else:
+        logger.debug(
+            "Alpha Vantage disabled; skipping for %s.%s",
+            sanitise_log_value(ticker),
+            sanitise_log_value(exchange),
+        )
+    return [(name, steps[name]) for name in PROVIDER_HEALTH.order(list(steps))]
+
+
+def _fetch_hedged(
+    steps: list[tuple[str, Callable[[], pd.DataFrame]]],
+    expected_dates: np.ndarray,
+    min_coverage: float,
+    hedge_delay: float,
+) -> tuple[pd.DataFrame | None, list[pd.DataFrame]]:
+    """Run ``steps`` as hedged requests rather than strictly one after another.
+
+    The first provider starts immediately; each further provider starts once
+    the previous one has been running for ``hedge_delay`` seconds or has
+    returned without covering the window. Frames are merged in provider
+    priority order as they arrive. Returns ``(merged, frames)`` as soon as
+    coverage reaches ``min_coverage`` (providers not yet started are
+    cancelled; in-flight ones finish in the background and are discarded),
+    otherwise ``(None, frames)`` with every non-empty result for the caller's
+    fallback.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="meta-hedge")
+    pending: dict[Future, int] = {}
+    results: dict[int, pd.DataFrame] = {}
+    launched = 0
+    try:
+        while launched < len(steps) or pending:
+            if launched < len(steps):
+                pending[executor.submit(steps[launched][1])] = launched
+                launched += 1
+            done, _ = wait(
+                pending,
+                timeout=hedge_delay if launched < len(steps) else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                idx = pending.pop(future)
+                frame = future.result()
+                if not frame.empty:
+                    results[idx] = frame
+            if done and results:
+                combined = _merge([results[i] for i in sorted(results)])
+                if _coverage_ratio(combined, expected_dates) >= min_coverage:
+                    logger.debug(
+                        "Hedged fetch covered by %s",
+                        sanitise_log_value(",".join(steps[i][0] for i in sorted(results))),
+                    )
+                    return combined, []
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return None, [results[i] for i in sorted(results)]
 
 
 # ──────────────────────────────────────────────────────────────
@@ -394,10 +569,19 @@ def fetch_meta_timeseries(
     end_date: Optional[date] = None,
     *,
     min_coverage: float = 0.95,  # 95 % of trading days
+    prefetched: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """
     Fetch price history from Yahoo, Stooq, FT - only as much as needed.
 
+    Providers are tried in order; with ``timeseries_hedge_delay_seconds``
+    configured, the next provider is started in parallel once the previous
+    one has taken that long (see :func:`_fetch_hedged`).
+
+    ``prefetched`` holds Yahoo rows already downloaded elsewhere (a batch
+    warm-up); they take the place of the Yahoo call, and the other
+    providers only run when those rows miss the coverage threshold.
+
     Returns DF[Date, Open, High, Low, Close, Volume, Ticker, Source].
     """
     # ── Guard rails & resolution ───────────────────────────────
@@ -448,8 +632,8 @@ def fetch_meta_timeseries(
         record_skipped_ticker(ticker, exchange, reason="unknown")
         return pd.DataFrame(columns=STANDARD_COLUMNS)
 
-    # Weekday grid we want to fill
-    expected_dates = set(pd.bdate_range(start_date, end_date).date)
+    # Trading-day grid we want to fill; exchange holidays are not expected
+    expected_dates = get_trading_calendar(exchange).trading_days_between(start_date, end_date)
 
     data: list[pd.DataFrame] = []
 
@@ -459,75 +643,26 @@ def fetch_meta_timeseries(
         if not ft_df.empty:
             return ft_df
 
-    # ── 1 · Yahoo ─────────────────────────────────────────────
-    try:
-        yahoo = fetch_yahoo_timeseries_range(ticker, exchange, start_date, end_date)
-        if not yahoo.empty:
-            data.append(yahoo)
-            if _coverage_ratio(yahoo, expected_dates) >= min_coverage:
-                return yahoo
-    except Exception as exc:
-        logger.debug(
-            "Yahoo miss for %s.%s: %s",
-            sanitise_log_value(ticker),
-            sanitise_log_value(exchange),
-            sanitise_log_value(exc),
-        )
-
-    # ── 2 · Stooq (fill gaps only if needed) ──────────────────
-    try:
-        stooq = fetch_stooq_timeseries_range(ticker, exchange, start_date, end_date)
-        if not stooq.empty:
-            combined = _merge([*data, stooq])
+    # ── 1-3 · Yahoo, Stooq, Alpha Vantage ─────────────────────
+    steps = _provider_steps(ticker, exchange, start_date, end_date)
+    if prefetched is not None:
+        dates = pd.to_datetime(prefetched["Date"])
+        window = prefetched[(dates >= pd.Timestamp(start_date)) & (dates <= pd.Timestamp(end_date))]
+        steps = [("yahoo", lambda: window), *((name, fetch) for name, fetch in steps if name != "yahoo")]
+    hedge_delay = getattr(config, "timeseries_hedge_delay_seconds", None)
+    if hedge_delay is not None and len(steps) > 1:
+        covered, data = _fetch_hedged(steps, expected_dates, min_coverage, float(hedge_delay))
+        if covered is not None:
+            return covered
+    else:
+        for _name, fetch in steps:
+            frame = fetch()
+            if frame.empty:
+                continue
+            combined = _merge([*data, frame]) if data else frame
             if _coverage_ratio(combined, expected_dates) >= min_coverage:
                 return combined
-            data.append(stooq)
-    except StooqRateLimitError as exc:
-        logger.debug(
-            "Stooq rate limit for %s.%s: %s",
-            sanitise_log_value(ticker),
-            sanitise_log_value(exchange),
-            sanitise_log_value(exc),
-        )
-    except Exception as exc:
-        logger.debug(
-            "Stooq miss for %s.%s: %s",
-            sanitise_log_value(ticker),
-            sanitise_log_value(exchange),
-            sanitise_log_value(exc),
-        )
-
-    # ── 3 · Alpha Vantage (fill gaps if still needed) ─────────
-    if config.alpha_vantage_enabled:
-        try:
-            av = fetch_alphavantage_timeseries_range(ticker, exchange, start_date, end_date)
-            if not av.empty:
-                combined = _merge([*data, av])
-                if _coverage_ratio(combined, expected_dates) >= min_coverage:
-                    return combined
-                data.append(av)
-        except AlphaVantageRateLimitError as exc:
-            logger.debug(
-                "Alpha Vantage rate limit for %s.%s: %s",
-                sanitise_log_value(ticker),
-                sanitise_log_value(exchange),
-                sanitise_log_value(exc),
-            )
-            if exc.retry_after:
-                time.sleep(exc.retry_after)
-        except Exception as exc:
-            logger.debug(
-                "Alpha Vantage miss for %s.%s: %s",
-                sanitise_log_value(ticker),
-                sanitise_log_value(exchange),
-                sanitise_log_value(exc),
-            )
-    else:
-        logger.debug(
-            "Alpha Vantage disabled; skipping for %s.%s",
-            sanitise_log_value(ticker),
-            sanitise_log_value(exchange),
-        )
+            data.append(frame)
 
     # ── 4 · FT fallback – last resort ─────────────────────────
     ft_df = fetch_ft_df(ticker, end_date, start_date)
@@ -561,45 +696,112 @@ def fetch_ft_df(ticker, end_date, start_date):
 
 # ──────────────────────────────────────────────────────────────
 # Cache-aware batch helpers (local import) ─────────────────────
-def run_all_tickers(tickers: List[str], exchange: str = "", days: int = 365) -> List[str]:
+# Symbols per multi-symbol Yahoo download in batch warm-ups.
+_YAHOO_BATCH_SIZE = 50
+_WARM_UP_WORKERS = 4
+
+
+def run_all_tickers(
+    tickers: List[str],
+    exchange: str = "",
+    days: int = 365,
+    *,
+    batch: bool = False,
+    max_workers: int = _WARM_UP_WORKERS,
+) -> List[str]:
     """Warm-up helper - returns tickers that produced data.
 
     ``tickers`` may contain base symbols ("VOD") or full tickers ("VOD.L").
     When a ticker includes an exchange suffix, it takes precedence over the
     ``exchange`` argument. If neither provides an exchange, resolve via
     instrument metadata.
+
+    With ``batch=True`` the tickers are grouped by exchange and downloaded
+    from Yahoo in chunks of ``_YAHOO_BATCH_SIZE`` per request; tickers the
+    batch could not cover go through the full provider chain on a pool of
+    ``max_workers`` threads. Either way the cache manifest is updated once
+    for the whole run.
     """
-    import time
+    from backend.timeseries.cache import batched_manifest_updates, load_meta_timeseries
 
-    from backend.timeseries.cache import load_meta_timeseries
+    if batch:
+        with batched_manifest_updates():
+            return _run_all_tickers_batched(tickers, exchange, days, max_workers)
 
     ok: list[str] = []
-    delay = 0.0
-    if getattr(config, "stooq_requests_per_minute", None):
-        try:
-            rpm = float(config.stooq_requests_per_minute)
-            if rpm > 0:
-                delay = 60.0 / rpm
-        except Exception:
-            pass
-
-    for idx, t in enumerate(tickers):
-        if delay and idx:
-            time.sleep(delay)
+    # Warm-ups can afford to wait for the shared Stooq budget, so each ticker
+    # starts once a Stooq call would be allowed instead of skipping Stooq.
+    stooq_limiter = get_rate_limiter("stooq")
+
+    with batched_manifest_updates():
+        for t in tickers:
+            stooq_limiter.wait()
+            sym, ex, meta_exchange = _resolve_symbol_exchange_details(t, exchange)
+            logger.debug(
+                "run_all_tickers resolved %s -> %s.%s",
+                sanitise_log_value(t),
+                sanitise_log_value(sym),
+                sanitise_log_value(ex),
+            )
+            cache_exchange = _resolve_cache_exchange(t, exchange, sym, ex, meta_exchange)
+            try:
+                if not load_meta_timeseries(sym, cache_exchange, days).empty:
+                    ok.append(t)
+            except Exception as exc:
+                logger.warning("[WARN] %s: %s", sanitise_log_value(t), sanitise_log_value(exc))
+    logger.info("Bulk warm-up complete: %d updated, %d skipped", len(ok), len(tickers) - len(ok))
+    return ok
+
+
+def _run_all_tickers_batched(tickers: List[str], exchange: str, days: int, max_workers: int) -> List[str]:
+    from backend.timeseries.cache import _weekday_range, load_meta_timeseries, warm_meta_timeseries
+
+    resolved: dict[str, tuple[str, str]] = {}
+    by_exchange: dict[str, list[str]] = {}
+    for t in tickers:
         sym, ex, meta_exchange = _resolve_symbol_exchange_details(t, exchange)
-        logger.debug(
-            "run_all_tickers resolved %s -> %s.%s",
-            sanitise_log_value(t),
-            sanitise_log_value(sym),
-            sanitise_log_value(ex),
-        )
         cache_exchange = _resolve_cache_exchange(t, exchange, sym, ex, meta_exchange)
+        resolved[t] = (sym, cache_exchange)
+        by_exchange.setdefault(cache_exchange, []).append(sym)
+
+    # Same window the rolling cache fills: weekdays up to yesterday.
+    start_date, end_date = _weekday_range(date.today() - timedelta(days=1), days)
+    prefetched: dict[tuple[str, str], pd.DataFrame] = {}
+    for ex, symbols in by_exchange.items():
+        unique = list(dict.fromkeys(symbols))
+        for i in range(0, len(unique), _YAHOO_BATCH_SIZE):
+            chunk = [(sym, ex) for sym in unique[i : i + _YAHOO_BATCH_SIZE]]
+            get_rate_limiter("yahoo").acquire()
+            try:
+                prefetched.update(fetch_yahoo_timeseries_batch(chunk, start_date, end_date))
+            except Exception as exc:
+                logger.warning(
+                    "Yahoo batch download failed for %s %s symbols: %s",
+                    sanitise_log_value(len(chunk)),
+                    sanitise_log_value(ex),
+                    sanitise_log_value(exc),
+                )
+
+    def warm(t: str) -> bool:
+        sym, ex = resolved[t]
         try:
-            if not load_meta_timeseries(sym, cache_exchange, days).empty:
-                ok.append(t)
+            frame = prefetched.get((sym, ex))
+            if frame is not None:
+                return not warm_meta_timeseries(sym, ex, days, frame).empty
+            return not load_meta_timeseries(sym, ex, days).empty
         except Exception as exc:
             logger.warning("[WARN] %s: %s", sanitise_log_value(t), sanitise_log_value(exc))
-    logger.info("Bulk warm-up complete: %d updated, %d skipped", len(ok), len(tickers) - len(ok))
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="warm-up") as pool:
+        warmed = list(pool.map(warm, tickers))
+    ok = [t for t, success in zip(tickers, warmed) if success]
+    logger.info(
+        "Bulk warm-up complete: %s updated (%s from Yahoo batches), %s skipped",
+        sanitise_log_value(len(ok)),
+        sanitise_log_value(len(prefetched)),
+        sanitise_log_value(len(tickers) - len(ok)),
+    )
     return ok
 
 
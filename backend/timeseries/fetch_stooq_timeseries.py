@@ -87,7 +87,7 @@ def fetch_stooq_timeseries_range(ticker: str, exchange: str, start_date: date, e
             timeout=config.stooq_timeout or 10,
         )
         if not response.ok:
-            raise Exception(f"HTTP error {response.status_code} for {full_ticker}")
+            raise requests.HTTPError(f"HTTP error {response.status_code} for {full_ticker}", response=response)
 
         if "Exceeded the daily hits limit" in response.text:
             logger.warning("Stooq: Exceeded the daily hits limit")
@@ -118,6 +118,64 @@ def fetch_yahoo_timeseries_range(ticker: str, exchange: str, start_date: date, e
         raise
 
 
+def fetch_yahoo_timeseries_batch(
+    symbols: list[tuple[str, str]], start_date: date, end_date: date
+) -> dict[tuple[str, str], pd.DataFrame]:
+    """Fetch daily history for many ``(ticker, exchange)`` pairs in one call.
+
+    Uses a single ``yfinance.download`` request for the whole list instead of
+    one ``Ticker.history`` round trip per symbol. Returns normalised frames
+    keyed by the input pair; symbols Yahoo returned nothing for (or that are
+    unrecognised) are left out so callers can fall back to other providers.
+    """
+    full_tickers: dict[str, tuple[str, str]] = {}
+    for ticker, exchange in symbols:
+        if not is_valid_ticker(ticker, exchange):
+            continue
+        try:
+            full_tickers[_build_full_ticker(ticker, exchange)] = (ticker, exchange)
+        except ValueError:
+            continue
+    if not full_tickers:
+        return {}
+
+    logger.debug(
+        "Fetching Yahoo batch of %s symbols from %s to %s",
+        sanitise_log_value(len(full_tickers)),
+        sanitise_log_value(start_date),
+        sanitise_log_value(end_date),
+    )
+    data = yf.download(
+        list(full_tickers),
+        start=start_date,
+        end=end_date + pd.Timedelta(days=1),  # include end_date
+        interval="1d",
+        group_by="ticker",
+        auto_adjust=True,
+        progress=False,
+        threads=True,
+    )
+    if data is None or data.empty:
+        return {}
+
+    out: dict[tuple[str, str], pd.DataFrame] = {}
+    available = set(data.columns.get_level_values(0)) if isinstance(data.columns, pd.MultiIndex) else set()
+    for full_ticker, pair in full_tickers.items():
+        if full_ticker not in available:
+            continue
+        df = data[full_ticker].dropna(how="all")
+        if df.empty:
+            continue
+        df.index.name = "Date"
+        out[pair] = normalize_history(df, full_ticker, "Yahoo")
+    logger.info(
+        "Fetched Yahoo batch: %s of %s symbols returned data",
+        sanitise_log_value(len(out)),
+        sanitise_log_value(len(full_tickers)),
+    )
+    return out
+
+
 def fetch_yahoo_timeseries_period(
     ticker: str,
     exchange: str = "US",
@@ -0,0 +1,215 @@
+"""
+Byte-budgeted in-process cache for timeseries DataFrames.
+
+Replaces the ``functools.lru_cache`` wrappers the meta loaders used to sit
+behind. Those were bounded by entry count only (512 frames of arbitrary
+length) and could only be invalidated wholesale, so one ticker's refresh
+evicted every other warm series in the process. Here every entry belongs to
+a ``(ticker, exchange)`` group that can be invalidated on its own, the total
+size of the cached frames is capped in bytes, and hit/miss/eviction counters
+are kept for the admin stats endpoint.
+
+Callers that only read a series can ask for a :func:`frame_view` of the
+cached frame instead of a deep copy.
+
+:class:`SingleFlight` and :class:`KeyedLocks` keep concurrent misses for the
+same series from each fetching from the providers and rewriting its parquet.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Set, Tuple
+
+import pandas as pd
+
+Group = Tuple[str, str]
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """Return the in-memory size of ``df`` including object payloads."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def frame_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a zero-copy view of a cached frame.
+
+    The view shares the cached column buffers. Under pandas Copy-on-Write
+    (always on since pandas 3.0) any write through it copies the touched
+    column first, and ``to_numpy()`` hands out non-writeable arrays, so the
+    cached frame cannot be mutated through the view.
+    """
+    return df.copy(deep=False)
+
+
+class FrameCache:
+    """Thread-safe LRU of DataFrames bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[pd.DataFrame, int, Group]]" = OrderedDict()
+        self._groups: Dict[Group, Set[Hashable]] = {}
+        self._bytes = 0
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _group(ticker: str, exchange: str) -> Group:
+        return ticker.upper(), exchange.upper()
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        """Return the cached frame for ``key`` (marking it recently used)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: Hashable) -> pd.DataFrame | None:
+        """Return the cached frame for ``key`` without touching the counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[0]
+
+    def put(self, key: Hashable, frame: pd.DataFrame, *, ticker: str, exchange: str) -> None:
+        """Cache ``frame`` under ``key`` as part of the ticker's group.
+
+        Frames larger than the whole budget are not cached at all; otherwise
+        least recently used entries are evicted until the new one fits.
+        """
+        size = frame_nbytes(frame)
+        group = self._group(ticker, exchange)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            while self._entries and self._bytes + size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+            self._entries[key] = (frame, size, group)
+            self._groups.setdefault(group, set()).add(key)
+            self._bytes += size
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        _frame, size, group = entry
+        self._bytes -= size
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+    def invalidate(self, ticker: str, exchange: str, *, namespace: str | None = None) -> int:
+        """Drop the entries cached for ``ticker``/``exchange``.
+
+        ``namespace`` limits this to tuple keys whose first element matches
+        it (callers key entries as ``(loader name, ...)``).
+        """
+        group = self._group(ticker, exchange)
+        with self._lock:
+            keys = [
+                key
+                for key in self._groups.get(group, ())
+                if namespace is None or (isinstance(key, tuple) and key[:1] == (namespace,))
+            ]
+            for key in keys:
+                self._discard(key)
+            if keys:
+                self.invalidations += 1
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the cache counters and current footprint."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "series": len(self._groups),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block until it finishes and receive the same result (or
+    exception) instead of repeating the work.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+class KeyedLocks:
+    """Lazily created per-key locks (e.g. one per cached series)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
@@ -0,0 +1,191 @@
+"""
+Local memory-mapped hot tier in front of the parquet timeseries cache.
+
+Every cold load of a cached series decompresses its parquet (from EFS or
+S3) and builds a fresh DataFrame, once per worker process. With a hot tier
+directory configured (``timeseries_hot_tier_dir`` or
+``TIMESERIES_HOT_TIER_DIR``, e.g. ``/tmp/allotmint-hot`` in Lambda or a
+local disk next to an EFS mount), the merged frame of each series read is
+also written there as an uncompressed Arrow IPC file. Later loads open that
+file with a memory map, so every worker on the host reads the same pages
+from the OS page cache and numeric columns come out without a decode.
+
+Each hot file records the signature (modification time and size) of the
+cache file it was built from; a changed signature makes it a miss, and it
+is rewritten after the next full load. Delta appends bump the base file's
+modification time, so they invalidate the hot copy too. Files are evicted
+oldest-use-first once the directory exceeds ``timeseries_hot_tier_mb``;
+each process keeps a running total of the bytes it has written and only
+scans the directory when that total passes the budget.
+The hot tier is an optimisation only: any error reading or writing it is
+logged at debug level and the caller falls back to parquet.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+
+from backend.config import config
+from backend.logging_setup import sanitise_log_value
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BUDGET_MB = 512
+_SIGNATURE_KEY = b"allotmint.source"
+_SUFFIX = ".arrow"
+
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+# Bytes in each hot tier directory as of its last scan, plus this process's
+# writes since. Other processes' writes show up at the next scan.
+_BYTES: Dict[Path, int] = {}
+
+
+def hot_tier_dir() -> Path | None:
+    """Return the configured hot tier directory, or ``None`` when disabled."""
+    configured = os.getenv("TIMESERIES_HOT_TIER_DIR") or getattr(config, "timeseries_hot_tier_dir", None)
+    return Path(configured).expanduser() if configured else None
+
+
+def _budget_bytes() -> int:
+    mb = getattr(config, "timeseries_hot_tier_mb", None)
+    if mb is None:
+        mb = _DEFAULT_BUDGET_MB
+    return int(float(mb) * 1024 * 1024)
+
+
+def _hot_path(root: Path, key: str) -> Path:
+    return root / f"{key}{_SUFFIX}"
+
+
+def _count(name: str) -> None:
+    with _LOCK:
+        _STATS[name] += 1
+
+
+def read(key: str, signature: str) -> pd.DataFrame | None:
+    """Return the hot copy of ``key`` if it was built from ``signature``."""
+    root = hot_tier_dir()
+    if root is None:
+        return None
+    path = _hot_path(root, key)
+    try:
+        import pyarrow as pa
+
+        reader = pa.ipc.open_file(pa.memory_map(str(path), "r"))
+        stored = (reader.schema.metadata or {}).get(_SIGNATURE_KEY, b"").decode("utf-8")
+        if stored != signature:
+            _count("misses")
+            return None
+        df = reader.read_all().to_pandas(split_blocks=True)
+        os.utime(path, None)  # mark as recently used for eviction
+    except FileNotFoundError:
+        _count("misses")
+        return None
+    except Exception as exc:
+        logger.debug("Hot tier read failed (%s): %s", sanitise_log_value(path), sanitise_log_value(exc))
+        _count("misses")
+        return None
+    _count("hits")
+    return df
+
+
+def write(key: str, signature: str, df: pd.DataFrame) -> None:
+    """Store ``df`` as the hot copy of ``key`` built from ``signature``."""
+    root = hot_tier_dir()
+    if root is None or df.empty:
+        return
+    path = _hot_path(root, key)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        previous = path.stat().st_size
+    except OSError:
+        previous = 0
+    try:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), _SIGNATURE_KEY: signature.encode("utf-8")}
+        table = table.replace_schema_metadata(metadata)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        size = tmp.stat().st_size
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.debug("Hot tier write failed (%s): %s", sanitise_log_value(path), sanitise_log_value(exc))
+        tmp.unlink(missing_ok=True)
+        return
+    _count("writes")
+    with _LOCK:
+        total = _BYTES.get(root)
+        if total is not None:
+            total = _BYTES[root] = total + size - previous
+    if total is None or total > _budget_bytes():
+        _evict(root)
+
+
+def _evict(root: Path) -> None:
+    """Delete the least recently used hot files until the budget is met.
+
+    Also resets the running byte total of ``root`` to what the scan found.
+    """
+    files = []
+    total = 0
+    for path in root.rglob(f"*{_SUFFIX}"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        files.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    budget = _budget_bytes()
+    for _mtime, size, path in sorted(files):
+        if total <= budget:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        _count("evictions")
+    with _LOCK:
+        _BYTES[root] = total
+
+
+def clear() -> int:
+    """Remove every hot file; returns how many were deleted."""
+    root = hot_tier_dir()
+    if root is None or not root.exists():
+        return 0
+    with _LOCK:
+        _BYTES.pop(root, None)
+    removed = 0
+    for path in root.rglob(f"*{_SUFFIX}"):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def stats() -> Dict[str, Any]:
+    """Return hit/miss/write/eviction counters for this process."""
+    root = hot_tier_dir()
+    with _LOCK:
+        out: Dict[str, Any] = dict(_STATS)
+    out["enabled"] = root is not None
+    out["dir"] = str(root) if root is not None else None
+    out["budget_bytes"] = _budget_bytes()
+    return out
+
+
+def reset_stats() -> None:
+    """Zero this process's hit/miss/write/eviction counters."""
+    with _LOCK:
+        for name in _STATS:
+            _STATS[name] = 0
+
+
+__all__ = ["clear", "hot_tier_dir", "read", "reset_stats", "stats", "write"]
@@ -0,0 +1,379 @@
+"""
+Columnar multi-ticker price panel built from the meta timeseries cache.
+
+The per-ticker ``meta/<TICKER>_<EXCH>.parquet`` files are ideal for the
+single-instrument pages but force every portfolio-wide consumer to open one
+file per holding. This module maintains a second, read-optimised copy of the
+same data as a hive-partitioned parquet dataset::
+
+    <cache base>/panel/Exchange=L/Year=2024/part-0.parquet
+    <cache base>/panel/Exchange=N/Year=2024/part-0.parquet
+
+so that :func:`load_meta_timeseries_panel` can answer "closes for these 300
+tickers between two dates" with a single filtered dataset scan that only
+touches the exchange/year partitions involved.
+
+The panel is derived data: :func:`build_meta_panel` rebuilds it from the
+per-ticker cache (the nightly price refresh does this) and records each
+series' write stamp (:func:`backend.timeseries.cache.meta_series_signature`)
+next to it. Any ticker the panel does not know about, or whose per-ticker
+file has been written since the rebuild, is served from the regular
+per-ticker loader.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+
+from backend.common.currency import CurrencyNormaliser, FxMatrix
+from backend.logging_setup import sanitise_log_value
+
+logger = logging.getLogger(__name__)
+
+PANEL_DIRNAME = "panel"
+PANEL_FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+_PANEL_COLUMNS = ["Date", "Symbol", "Exchange", "Year", *PANEL_FIELDS]
+_PARTITION_COLUMNS = ["Exchange", "Year"]
+# ``{symbol: series signature}`` as of the last rebuild. Dataset discovery
+# skips ``_``-prefixed files, so it lives in the dataset root.
+_SIGNATURES_NAME = "_signatures.json"
+
+# Dataset discovery lists every partition file, which on S3 is a LIST call.
+# The panel only changes when the refresh job rebuilds it, so reuse the
+# discovered dataset (and its signatures) for a short window instead of
+# re-listing per request.
+_DATASET_TTL_SECONDS = 60.0
+_DATASET_CACHE: dict[str, tuple[ds.Dataset | None, dict[str, str], float]] = {}
+_DATASET_CACHE_LOCK = threading.Lock()
+
+
+def panel_dataset_path() -> str:
+    """Return the panel dataset root under the configured cache base."""
+    from backend.timeseries import cache as ts_cache
+
+    return ts_cache._cache_path(PANEL_DIRNAME)
+
+
+def _filesystem_for(path: str) -> tuple[pafs.FileSystem, str]:
+    """Return a pyarrow filesystem and filesystem-relative root for ``path``."""
+    if path.startswith("s3://"):
+        return pafs.FileSystem.from_uri(path)
+    return pafs.LocalFileSystem(), str(Path(path).resolve())
+
+
+def _split_ticker(ticker: str) -> tuple[str, str]:
+    """Split ``"VOD.L"`` into ``("VOD", "L")``; bare symbols default to ``L``."""
+    sym, exch = (ticker.strip().upper().split(".", 1) + ["L"])[:2]
+    return sym, exch or "L"
+
+
+def clear_panel_cache() -> None:
+    """Forget any discovered panel dataset (e.g. after a rebuild)."""
+    with _DATASET_CACHE_LOCK:
+        _DATASET_CACHE.clear()
+
+
+def _read_signatures(fs: pafs.FileSystem, root: str) -> dict[str, str]:
+    try:
+        with fs.open_input_stream(f"{root}/{_SIGNATURES_NAME}") as fh:
+            signatures = json.loads(fh.read())
+    except (OSError, pa.ArrowException, ValueError):
+        return {}
+    return signatures if isinstance(signatures, dict) else {}
+
+
+def _write_signatures(fs: pafs.FileSystem, root: str, signatures: dict[str, str]) -> None:
+    with fs.open_output_stream(f"{root}/{_SIGNATURES_NAME}") as fh:
+        fh.write(json.dumps(signatures, sort_keys=True).encode("utf-8"))
+
+
+def _open_dataset() -> tuple[ds.Dataset | None, dict[str, str]]:
+    """Return the panel dataset (``None`` if absent) and its series signatures."""
+    path = panel_dataset_path()
+    now = time.monotonic()
+    with _DATASET_CACHE_LOCK:
+        entry = _DATASET_CACHE.get(path)
+    if entry is not None and now - entry[2] < _DATASET_TTL_SECONDS:
+        return entry[0], entry[1]
+
+    fs, root = _filesystem_for(path)
+    dataset: ds.Dataset | None
+    signatures: dict[str, str] = {}
+    try:
+        info = fs.get_file_info(root)
+        if info.type == pafs.FileType.NotFound:
+            dataset = None
+        else:
+            dataset = ds.dataset(root, format="parquet", partitioning="hive", filesystem=fs)
+            signatures = _read_signatures(fs, root)
+    except (OSError, pa.ArrowException) as exc:
+        logger.warning("Unable to open price panel at %s: %s", sanitise_log_value(path), sanitise_log_value(exc))
+        dataset = None
+
+    with _DATASET_CACHE_LOCK:
+        _DATASET_CACHE[path] = (dataset, signatures, now)
+    return dataset, signatures
+
+
+def _panel_rows(ticker: str, exchange: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Project one cached meta frame onto the long panel schema."""
+    dates = pd.to_datetime(df["Date"], errors="coerce").astype("datetime64[ms]")
+    rows = pd.DataFrame({"Date": dates})
+    rows["Symbol"] = f"{ticker}.{exchange}".upper()
+    rows["Exchange"] = exchange.upper()
+    for col in PANEL_FIELDS:
+        rows[col] = pd.to_numeric(df[col], errors="coerce").astype("float64") if col in df.columns else float("nan")
+    rows = rows.dropna(subset=["Date"])
+    rows = rows.drop_duplicates(subset="Date", keep="last").sort_values("Date")
+    rows["Year"] = rows["Date"].dt.year.astype("int32")
+    return rows[_PANEL_COLUMNS]
+
+
+def build_meta_panel(pairs: Iterable[tuple[str, str]] | None = None) -> int:
+    """Rebuild the partitioned panel from the per-ticker meta cache.
+
+    ``pairs`` defaults to every cached ``(ticker, exchange)``. Each
+    exchange/year partition that receives data is replaced wholesale, so
+    callers should pass the complete universe rather than a subset. Returns
+    the number of rows written.
+    """
+    from backend.timeseries import cache as ts_cache
+
+    if pairs is None:
+        pairs = ts_cache.list_cached_meta_tickers()
+
+    frames: list[pd.DataFrame] = []
+    signatures: dict[str, str] = {}
+    for ticker, exchange in pairs:
+        # Stamp before reading: a write in between only makes the row stale.
+        signature = ts_cache.meta_series_signature(ticker, exchange)
+        df = ts_cache.load_cached_meta_timeseries_full(ticker, exchange)
+        if df.empty:
+            continue
+        frames.append(_panel_rows(ticker, exchange, df))
+        if signature is not None:
+            signatures[f"{ticker}.{exchange}".upper()] = signature
+
+    if not frames:
+        logger.info("Price panel rebuild skipped: no cached meta timeseries")
+        return 0
+
+    long = pd.concat(frames, ignore_index=True)
+    table = pa.Table.from_pandas(long, preserve_index=False)
+    fs, root = _filesystem_for(panel_dataset_path())
+    if isinstance(fs, pafs.LocalFileSystem):
+        Path(root).mkdir(parents=True, exist_ok=True)
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        filesystem=fs,
+        partitioning=ds.partitioning(
+            pa.schema([("Exchange", pa.string()), ("Year", pa.int32())]),
+            flavor="hive",
+        ),
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+    )
+    _write_signatures(fs, root, signatures)
+    clear_panel_cache()
+    logger.info(
+        "Rebuilt price panel: %d rows across %d tickers", sanitise_log_value(len(long)), sanitise_log_value(len(frames))
+    )
+    return len(long)
+
+
+def _scan_panel(
+    dataset: ds.Dataset,
+    symbols: Sequence[str],
+    exchanges: Sequence[str],
+    start: date,
+    end: date,
+    field: str,
+) -> pd.DataFrame:
+    start_ts = datetime.combine(start, datetime.min.time())
+    end_ts = datetime.combine(end, datetime.min.time())
+    expr = (
+        ds.field("Exchange").isin(list(exchanges))
+        & (ds.field("Year") >= start.year)
+        & (ds.field("Year") <= end.year)
+        & ds.field("Symbol").isin(list(symbols))
+        & (ds.field("Date") >= pa.scalar(start_ts, type=pa.timestamp("ms")))
+        & (ds.field("Date") <= pa.scalar(end_ts, type=pa.timestamp("ms")))
+    )
+    table = dataset.to_table(columns=["Date", "Symbol", field], filter=expr)
+    return table.to_pandas()
+
+
+def _fallback_column(symbol: str, start: date, end: date, field: str) -> pd.Series:
+    """Load one ticker through the per-ticker cache when the panel lacks it."""
+    from backend.timeseries import cache as ts_cache
+
+    sym, exch = _split_ticker(symbol)
+    df = ts_cache._memoized_range(sym, exch, start.isoformat(), end.isoformat())
+    if df.empty or field not in df.columns:
+        return pd.Series(dtype="float64", name=symbol)
+    values = pd.to_numeric(df[field], errors="coerce")
+    values.index = pd.DatetimeIndex(pd.to_datetime(df["Date"]).astype("datetime64[ms]"), name="Date")
+    values = values[~values.index.duplicated(keep="last")]
+    return values.rename(symbol)
+
+
+def _is_current(symbol: str, signatures: dict[str, str]) -> bool:
+    """Return whether the panel rows for ``symbol`` match its per-ticker series."""
+    from backend.timeseries import cache as ts_cache
+
+    recorded = signatures.get(symbol)
+    return recorded is not None and recorded == ts_cache.meta_series_signature(*_split_ticker(symbol))
+
+
+def load_meta_timeseries_panel(
+    tickers: Iterable[str],
+    start: date,
+    end: date,
+    field: str = "Close",
+    *,
+    fallback: bool = True,
+) -> pd.DataFrame:
+    """Return an aligned ``Date`` × ticker matrix of ``field`` values.
+
+    ``tickers`` are full symbols such as ``"VOD.L"`` (bare symbols default to
+    the ``L`` exchange); the returned columns keep the caller's spelling and
+    order. Values are the raw cached prices in the instrument's native
+    currency, exactly as :func:`backend.timeseries.cache.load_meta_timeseries`
+    returns them. Dates a ticker has no row for are ``NaN``.
+
+    Tickers present in the panel dataset are read with one scan; anything
+    missing from it, or written since the panel was built, is loaded via the
+    per-ticker cache so a stale or absent panel never hides data. With
+    ``fallback=False`` those tickers are left out of the result instead, for
+    callers that load them through their own per-ticker path.
+    """
+    if field not in PANEL_FIELDS:
+        raise ValueError(f"Unsupported panel field: {field}")
+
+    requested = [t for t in dict.fromkeys(tickers) if t and t.strip()]
+    index = pd.DatetimeIndex([], dtype="datetime64[ms]", name="Date")
+    if not requested or start > end:
+        return pd.DataFrame(index=index, columns=requested, dtype="float64")
+
+    canonical = {t: "{}.{}".format(*_split_ticker(t)) for t in requested}
+    wanted = sorted(set(canonical.values()))
+
+    wide = pd.DataFrame(index=index, dtype="float64")
+    dataset, signatures = _open_dataset()
+    if dataset is not None:
+        exchanges = sorted({s.split(".", 1)[1] for s in wanted})
+        try:
+            long = _scan_panel(dataset, wanted, exchanges, start, end, field)
+        except (OSError, pa.ArrowException) as exc:
+            logger.warning("Price panel scan failed; using per-ticker cache: %s", sanitise_log_value(exc))
+            long = pd.DataFrame(columns=["Date", "Symbol", field])
+        if not long.empty:
+            long = long.drop_duplicates(subset=["Date", "Symbol"], keep="last")
+            wide = long.pivot(index="Date", columns="Symbol", values=field)
+            wide.index = pd.DatetimeIndex(wide.index.astype("datetime64[ms]"), name="Date")
+            wide.columns.name = None
+            stale = [s for s in wide.columns if not _is_current(s, signatures)]
+            wide = wide.drop(columns=stale).dropna(how="all")
+
+    missing = [s for s in wanted if s not in wide.columns]
+    if missing and fallback:
+        extra = [_fallback_column(s, start, end, field) for s in missing]
+        extra = [s for s in extra if not s.empty]
+        if extra:
+            wide = pd.concat([wide, *extra], axis=1)
+            wide.index.name = "Date"
+
+    wide = wide.sort_index()
+    if not fallback:
+        canonical = {t: c for t, c in canonical.items() if c in wide.columns}
+    out = pd.DataFrame(
+        {t: wide[c] if c in wide.columns else pd.Series(float("nan"), index=wide.index) for t, c in canonical.items()},
+        index=wide.index,
+    )
+    return out.astype("float64")
+
+
+def load_panel_ranges(
+    pairs: Iterable[tuple[str, str]],
+    start: date,
+    end: date,
+    base_currency: str | None = "GBP",
+) -> dict[tuple[str, str], pd.DataFrame]:
+    """Return ``Date``/``Close`` frames for the ``(ticker, exchange)`` pairs the panel serves.
+
+    Frames cover ``start``..``end`` like
+    :func:`backend.timeseries.cache.load_meta_timeseries_range`, including its
+    ``Close_<base>`` column when ``base_currency`` is given; the conversion
+    uses one :class:`~backend.common.currency.FxMatrix` for the whole window.
+    Pairs the panel lacks, holds stale rows for or has no rows in the window
+    for are left out, so callers load those through their usual per-ticker
+    path.
+    """
+    from backend.timeseries import cache as ts_cache
+
+    pairs = list(dict.fromkeys(pairs))
+    if not pairs or ts_cache._CACHE_BASE is None:
+        return {}
+    closes = load_meta_timeseries_panel([f"{t}.{e}" for t, e in pairs], start, end, fallback=False)
+    served = [(t, e) for t, e in pairs if f"{t}.{e}" in closes.columns]
+
+    converted = pd.DataFrame(index=closes.index)
+    skipped: set[str] = set()
+    if base_currency and served:
+        base = base_currency.upper()
+        currencies = {f"{t}.{e}": ts_cache._instrument_currency(t, e) for t, e in served}
+        currencies = {col: ccy for col, ccy in currencies.items() if ccy not in (base, "GBX")}
+        unavailable: set[str] = set()
+
+        def load_rates(code: str) -> pd.DataFrame:
+            try:
+                return ts_cache._load_fx_rates(code, start, end)
+            except ValueError as exc:
+                logger.debug("Panel FX rates missing for %s: %s", sanitise_log_value(code), sanitise_log_value(exc))
+                unavailable.add(code)
+                return pd.DataFrame(columns=["Date", "Rate"])
+
+        if currencies:
+            matrix = FxMatrix.build(start, end, set(currencies.values()), base, loader=load_rates)
+            # As with a per-ticker load, an FX lookup error drops the ticker
+            # while a currency without rates stays unconverted.
+            skipped = {
+                col for col, ccy in currencies.items() if CurrencyNormaliser.from_raw(ccy).canonical in unavailable
+            }
+            convertible = {col: ccy for col, ccy in currencies.items() if ccy in matrix and col not in skipped}
+            converted = matrix.convert(closes[list(convertible)], convertible)
+
+    frames: dict[tuple[str, str], pd.DataFrame] = {}
+    for ticker, exchange in served:
+        symbol = f"{ticker}.{exchange}"
+        column = closes[symbol].dropna()
+        if column.empty or symbol in skipped:
+            continue
+        df = pd.DataFrame({"Date": column.index, "Close": column.to_numpy()})
+        if symbol in converted.columns:
+            df[f"Close_{base_currency.lower()}"] = converted[symbol].reindex(column.index).to_numpy()
+        frames[(ticker, exchange)] = df
+    return frames
+
+
+def main() -> None:  # pragma: no cover - CLI wrapper
+    logging.basicConfig(level=logging.INFO)
+    rows = build_meta_panel()
+    print(f"Wrote {rows} rows to {panel_dataset_path()}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
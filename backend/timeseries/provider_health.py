@@ -0,0 +1,218 @@
+"""
+Rolling health stats and a circuit breaker for the meta fetcher's providers.
+
+Every Yahoo/Stooq/Alpha Vantage call made by
+:func:`backend.timeseries.fetch_meta_timeseries.fetch_meta_timeseries` is
+recorded here with its latency, whether it raised, and how much of the
+requested trading-day window it covered. Two things use those stats:
+
+* A breaker per provider. After ``failure_threshold`` consecutive failures
+  the provider is skipped for ``cool_off_seconds``; after that a single
+  trial call is let through (half-open) and either closes the breaker again
+  or re-opens it. A down Yahoo then costs one timeout per cool-off rather
+  than one per cache miss.
+* :meth:`ProviderHealth.order`, which reorders the providers that have
+  enough recent samples by latency per unit of coverage. Providers without
+  enough samples keep their configured position.
+
+An empty frame is a miss, not a failure: plenty of instruments are simply
+not listed by every provider. The fetchers also raise for those ("no data
+returned", unsupported exchange, unexpected format), so
+:func:`is_provider_failure` decides which exceptions count: only transport
+and HTTP errors, and Yahoo's rate-limit error, trip the breaker. yfinance
+logs and swallows its own transport errors and returns an empty frame, so
+misses on ``miss_threshold`` different instruments in a row, with no
+covering call in between, open the breaker too.
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any, Deque, Dict, List, Tuple
+
+import requests
+from yfinance.exceptions import YFRateLimitError
+
+_WINDOW = 50
+_MIN_SAMPLES = 5
+_FAILURE_THRESHOLD = 3
+_MISS_THRESHOLD = 10
+_COOL_OFF_SECONDS = 300.0
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """Return whether ``exc`` means the provider itself is unhealthy.
+
+    Connection errors, timeouts, HTTP error statuses and Yahoo throttling do;
+    anything else a fetcher raises describes the instrument (not listed, no
+    rows in range) and is recorded as a miss.
+    """
+    return isinstance(exc, (requests.RequestException, OSError, YFRateLimitError))
+
+
+class _Provider:
+    __slots__ = ("samples", "calls", "failures", "consecutive_failures", "missed", "open_until", "trial_in_flight")
+
+    def __init__(self, window: int) -> None:
+        # (ok, latency seconds, coverage ratio) for the most recent calls
+        self.samples: Deque[Tuple[bool, float, float]] = deque(maxlen=window)
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        # instruments missed since the last call that covered any day
+        self.missed: set[str] = set()
+        self.open_until = 0.0
+        self.trial_in_flight = False
+
+
+class ProviderHealth:
+    """Thread-safe per-provider stats with a consecutive-failure breaker."""
+
+    def __init__(
+        self,
+        *,
+        window: int = _WINDOW,
+        min_samples: int = _MIN_SAMPLES,
+        failure_threshold: int = _FAILURE_THRESHOLD,
+        miss_threshold: int = _MISS_THRESHOLD,
+        cool_off_seconds: float = _COOL_OFF_SECONDS,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._providers: Dict[str, _Provider] = {}
+        self.window = window
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.miss_threshold = miss_threshold
+        self.cool_off_seconds = cool_off_seconds
+
+    def _get(self, name: str) -> _Provider:
+        provider = self._providers.get(name)
+        if provider is None:
+            provider = self._providers[name] = _Provider(self.window)
+        return provider
+
+    def allow(self, name: str) -> bool:
+        """Return whether ``name`` may be called now.
+
+        Once an open breaker's cool-off has passed, exactly one caller is
+        allowed through as the half-open trial.
+        """
+        with self._lock:
+            provider = self._get(name)
+            if provider.consecutive_failures < self.failure_threshold:
+                return True
+            if time.monotonic() < provider.open_until or provider.trial_in_flight:
+                return False
+            provider.trial_in_flight = True
+            return True
+
+    def skip(self, name: str) -> None:
+        """Note that an allowed call produced no health signal (e.g. rate limited)."""
+        with self._lock:
+            self._get(name).trial_in_flight = False
+
+    def record(
+        self, name: str, *, ok: bool, latency: float, coverage: float = 0.0, instrument: str | None = None
+    ) -> None:
+        """Record one call's outcome, opening or closing the breaker as needed.
+
+        A call that is ``ok`` but covers nothing is a miss on ``instrument``;
+        the one that completes a run of ``miss_threshold`` distinct missed
+        instruments, and any miss after it, counts as a failure that opens
+        the breaker.
+        """
+        with self._lock:
+            provider = self._get(name)
+            provider.calls += 1
+            provider.trial_in_flight = False
+            if ok and coverage > 0:
+                provider.missed.clear()
+            elif ok and instrument is not None:
+                provider.missed.add(instrument)
+                if len(provider.missed) >= self.miss_threshold:
+                    ok = False
+                    provider.consecutive_failures = max(provider.consecutive_failures, self.failure_threshold - 1)
+            provider.samples.append((ok, latency, coverage if ok else 0.0))
+            if ok:
+                provider.consecutive_failures = 0
+                provider.open_until = 0.0
+                return
+            provider.failures += 1
+            provider.consecutive_failures += 1
+            if provider.consecutive_failures >= self.failure_threshold:
+                provider.open_until = time.monotonic() + self.cool_off_seconds
+
+    def _score(self, provider: _Provider) -> float | None:
+        """Median latency divided by mean coverage; lower is better."""
+        if len(provider.samples) < self.min_samples:
+            return None
+        latency = statistics.median(s[1] for s in provider.samples)
+        coverage = statistics.fmean(s[2] for s in provider.samples)
+        return latency / max(coverage, 0.01)
+
+    def order(self, names: List[str]) -> List[str]:
+        """Return ``names`` with the well-sampled providers sorted by score.
+
+        Only the slots held by providers with at least ``min_samples`` recent
+        calls are reshuffled, so a provider without history stays where the
+        caller put it.
+        """
+        with self._lock:
+            scores = {name: self._score(self._get(name)) for name in names}
+        slots = [i for i, name in enumerate(names) if scores[name] is not None]
+        ranked = sorted((names[i] for i in slots), key=lambda name: scores[name])
+        ordered = list(names)
+        for slot, name in zip(slots, ranked):
+            ordered[slot] = name
+        return ordered
+
+    def reset(self) -> None:
+        with self._lock:
+            self._providers.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of every provider's recent stats and breaker state."""
+        now_mono = time.monotonic()
+        now_wall = datetime.now(UTC)
+        out: Dict[str, Any] = {}
+        with self._lock:
+            for name, provider in self._providers.items():
+                samples = list(provider.samples)
+                latencies = [s[1] for s in samples]
+                if provider.consecutive_failures < self.failure_threshold:
+                    state, reopens = "closed", None
+                elif now_mono < provider.open_until:
+                    remaining = provider.open_until - now_mono
+                    state = "open"
+                    reopens = datetime.fromtimestamp(now_wall.timestamp() + remaining, UTC).isoformat()
+                else:
+                    state, reopens = "half_open", None
+                out[name] = {
+                    "state": state,
+                    "retry_at": reopens,
+                    "calls": provider.calls,
+                    "failures": provider.failures,
+                    "consecutive_failures": provider.consecutive_failures,
+                    "missed_instruments": len(provider.missed),
+                    "recent_calls": len(samples),
+                    "recent_success_rate": (
+                        round(sum(1 for s in samples if s[0]) / len(samples), 4) if samples else None
+                    ),
+                    "median_latency_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+                    "mean_coverage": round(statistics.fmean(s[2] for s in samples), 4) if samples else None,
+                    "score": self._score(provider),
+                }
+        return out
+
+
+PROVIDER_HEALTH = ProviderHealth()
+
+
+def provider_health_stats() -> Dict[str, Any]:
+    """Return the shared provider stats, listed in the order they'd be tried."""
+    stats = PROVIDER_HEALTH.stats()
+    return {"order": PROVIDER_HEALTH.order(list(stats)), "providers": stats}
@@ -10,10 +10,11 @@ from __future__ import annotations
 from datetime import date
 from typing import TypedDict
 
+import numpy as np
 import pandas as pd
 
 from backend.common.numeric_utils import is_nan
-from backend.utils.uk_holidays import uk_business_days_between
+from backend.utils.trading_calendar import get_trading_calendar
 
 DEFAULT_GAP_THRESHOLD_DAYS = 1
 DEFAULT_OUTLIER_SIGMA = 3.0
@@ -57,38 +58,34 @@ def find_duplicate_dates(df: pd.DataFrame) -> list[date]:
     return sorted(counts[counts > 1].index)
 
 
-def find_gaps(df: pd.DataFrame, gap_threshold_days: int = DEFAULT_GAP_THRESHOLD_DAYS) -> list[GapPeriod]:
-    """Return contiguous runs of missing UK business days longer than the threshold.
+def find_gaps(
+    df: pd.DataFrame,
+    gap_threshold_days: int = DEFAULT_GAP_THRESHOLD_DAYS,
+    exchange: str = "L",
+) -> list[GapPeriod]:
+    """Return contiguous runs of missing trading days longer than the threshold.
 
-    Weekends and UK bank holidays are excluded from "expected" days, so a gap
-    over a weekend or holiday is never reported.
+    Weekends and ``exchange`` holidays (UK bank holidays by default) are
+    excluded from "expected" days, so a gap over a weekend or holiday is
+    never reported.
     """
     if df.empty:
         return []
-    present = set(_to_date_series(df))
+    present = np.unique(pd.to_datetime(df["Date"]).to_numpy(dtype="datetime64[D]"))
     if len(present) < 2:
         return []
-    first_date, last_date = min(present), max(present)
-    expected = uk_business_days_between(first_date, last_date)
-    missing = [d for d in expected if d not in present]
-    if not missing:
+    first_date, last_date = present[0].astype(date), present[-1].astype(date)
+    expected = get_trading_calendar(exchange).trading_days_between(first_date, last_date)
+    missing_pos = np.flatnonzero(~np.isin(expected, present))
+    if not len(missing_pos):
         return []
 
-    expected_index = {d: i for i, d in enumerate(expected)}
-    runs: list[list[date]] = []
-    current: list[date] = [missing[0]]
-    for prev, curr in zip(missing, missing[1:]):
-        if expected_index[curr] == expected_index[prev] + 1:
-            current.append(curr)
-        else:
-            runs.append(current)
-            current = [curr]
-    runs.append(current)
-
+    # Split wherever the missing positions in the expected grid stop being consecutive.
+    runs = np.split(missing_pos, np.flatnonzero(np.diff(missing_pos) != 1) + 1)
     return [
         GapPeriod(
-            start=run[0].isoformat(),
-            end=run[-1].isoformat(),
+            start=expected[run[0]].astype(date).isoformat(),
+            end=expected[run[-1]].astype(date).isoformat(),
             missing_business_days=len(run),
         )
         for run in runs
@@ -153,7 +150,7 @@ def compute_quality(
         )
 
     dates = _to_date_series(df)
-    gaps = find_gaps(df, gap_threshold_days=gap_threshold_days)
+    gaps = find_gaps(df, gap_threshold_days=gap_threshold_days, exchange=exchange)
 
     return TimeseriesQuality(
         ticker=ticker,
@@ -1,11 +1,15 @@
 import logging
+import os
+import threading
 from datetime import date, timedelta
-from functools import lru_cache
+from pathlib import Path
 
 import pandas as pd
 import yfinance as yf
 
+from backend.config import config
 from backend.logging_setup import sanitise_log_value
+from backend.timeseries.frame_cache import KeyedLocks
 
 logger = logging.getLogger(__name__)
 
@@ -33,20 +37,107 @@ FALLBACK_RATES: dict[tuple[str, str], float] = {
 }
 
 
-@lru_cache(maxsize=32)
-def fetch_fx_rate_range(base: str, quote: str, start_date: date, end_date: date) -> pd.DataFrame:
-    """Return FX rates expressed as ``quote`` per unit of ``base``.
+# ──────────────────────────────────────────────────────────────
+# Persistent FX history
+# ──────────────────────────────────────────────────────────────
+# Rates are kept as one parquet file per pair under the timeseries cache base
+# (``fx/USD.parquet`` for USD->GBP, the layout the offline loader in
+# ``backend.timeseries.cache`` already reads; ``fx/USD_EUR.parquet`` for other
+# quotes). Requests are served by slicing that history, and only the leading
+# or trailing windows it does not cover yet are downloaded and merged in.
+# ``_FX_COVERED`` remembers the span already requested per pair so weekends,
+# holidays and dates before a pair's first quote are not re-fetched on every
+# call within a process. Coverage never extends past yesterday (as in the
+# rolling price cache), so today's provisional rate is fetched again until
+# the day has closed. Each pair has its own lock, held across its download,
+# so a slow Yahoo response for one pair does not stall the others.
+_FX_HISTORY: dict[tuple[str, str], pd.DataFrame] = {}
+_FX_COVERED: dict[tuple[str, str], tuple[date, date]] = {}
+_FX_LOCK = threading.Lock()
+_FX_PAIR_LOCKS = KeyedLocks()
 
-    Falls back to a constant for common pairs if the remote fetch fails.
-    """
 
-    base = base.upper()
-    quote = quote.upper()
+def _fx_cache_path(base: str, quote: str) -> str | None:
+    root = os.getenv("TIMESERIES_CACHE_BASE") or config.timeseries_cache_base
+    if not root:
+        return None
+    name = f"{base}.parquet" if quote == "GBP" else f"{base}_{quote}.parquet"
+    if root.startswith("s3://"):
+        return "/".join([root.rstrip("/"), "fx", name])
+    return str(Path(root, "fx", name))
+
+
+def _normalise_fx(df: pd.DataFrame) -> pd.DataFrame:
+    if df.empty or not {"Date", "Rate"}.issubset(df.columns):
+        return pd.DataFrame(columns=["Date", "Rate"])
+    out = df[["Date", "Rate"]].copy()
+    out["Date"] = pd.to_datetime(out["Date"]).dt.date
+    out["Rate"] = pd.to_numeric(out["Rate"], errors="coerce")
+    out = out.dropna(subset=["Rate"])
+    return out.drop_duplicates(subset="Date", keep="last").sort_values("Date").reset_index(drop=True)
+
+
+def _load_fx_history(base: str, quote: str) -> pd.DataFrame:
+    key = (base, quote)
+    if key in _FX_HISTORY:
+        return _FX_HISTORY[key]
+    path = _fx_cache_path(base, quote)
+    history = pd.DataFrame(columns=["Date", "Rate"])
+    if path is not None:
+        try:
+            history = _normalise_fx(pd.read_parquet(path))
+        except Exception as exc:
+            logger.debug("FX cache read miss (%s): %s", sanitise_log_value(path), sanitise_log_value(exc))
+        if history.empty:
+            from backend.timeseries.bundle import bundled_frame
+
+            bundled = bundled_frame(path)
+            if bundled is not None:
+                history = _normalise_fx(bundled)
+    _FX_HISTORY[key] = history
+    return history
+
+
+def _save_fx_history(base: str, quote: str, history: pd.DataFrame) -> None:
+    _FX_HISTORY[(base, quote)] = history
+    path = _fx_cache_path(base, quote)
+    if path is None:
+        return
+    try:
+        if not path.startswith("s3://"):
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        out = history.copy()
+        out["Date"] = pd.to_datetime(out["Date"])
+        out.to_parquet(path, index=False)
+    except Exception as exc:
+        # The in-process copy still serves this process; the next one re-fetches.
+        logger.debug("FX cache write failed (%s): %s", sanitise_log_value(path), sanitise_log_value(exc))
+
+
+def _missing_fx_windows(
+    history: pd.DataFrame, covered: tuple[date, date] | None, start: date, end: date
+) -> list[tuple[date, date]]:
+    if covered is None and not history.empty:
+        covered = (history["Date"].iloc[0], min(history["Date"].iloc[-1], _last_settled_day()))
+    if covered is None:
+        windows = [(start, end)]
+    else:
+        lo, hi = covered
+        windows = []
+        if start < lo:
+            windows.append((start, lo - timedelta(days=1)))
+        if end > hi:
+            windows.append((hi + timedelta(days=1), end))
+    return [(s, e) for s, e in windows if len(pd.bdate_range(s, e))]
 
-    if base == quote:
-        dates = pd.bdate_range(start_date, end_date).date
-        return pd.DataFrame({"Date": dates, "Rate": [1.0] * len(dates)})
 
+def _last_settled_day() -> date:
+    """Return the last date whose rate is final (yesterday)."""
+    return date.today() - timedelta(days=1)
+
+
+def _download_fx(base: str, quote: str, start_date: date, end_date: date) -> pd.DataFrame | None:
+    """Download ``base``/``quote`` closes, or ``None`` if the fetch failed."""
     pair = PAIR_MAP.get(base, {}).get(quote)
     if pair is None:
         pair = f"{base}{quote}=X"
@@ -55,9 +146,7 @@ def fetch_fx_rate_range(base: str, quote: str, start_date: date, end_date: date)
         ticker = yf.Ticker(pair)
         df = ticker.history(start=start_date, end=end_date + timedelta(days=1), interval="1d")
         if not df.empty:
-            df.reset_index(inplace=True)
-            df["Date"] = pd.to_datetime(df["Date"]).dt.date
-            return df[["Date", "Close"]].rename(columns={"Close": "Rate"}).copy()
+            return _normalise_fx(df.reset_index().rename(columns={"Close": "Rate"}))
     except Exception as exc:
         logger.info(
             "FX fetch failed for %s/%s: %s",
@@ -65,6 +154,49 @@ def fetch_fx_rate_range(base: str, quote: str, start_date: date, end_date: date)
             sanitise_log_value(quote),
             sanitise_log_value(exc),
         )
+        return None
+    return pd.DataFrame(columns=["Date", "Rate"])
+
+
+def clear_fx_cache() -> None:
+    """Drop the in-process FX history; persisted parquet files are kept."""
+    with _FX_LOCK:
+        _FX_HISTORY.clear()
+        _FX_COVERED.clear()
+
+
+def fetch_fx_rate_range(base: str, quote: str, start_date: date, end_date: date) -> pd.DataFrame:
+    """Return FX rates expressed as ``quote`` per unit of ``base``.
+
+    Rates are sliced from the persistent per-pair history, which is first
+    extended with whatever leading/trailing windows it does not cover yet.
+    Falls back to a constant for common pairs if no rates are available.
+    """
+
+    base = base.upper()
+    quote = quote.upper()
+
+    if base == quote:
+        dates = pd.bdate_range(start_date, end_date).date
+        return pd.DataFrame({"Date": dates, "Rate": [1.0] * len(dates)})
+
+    key = (base, quote)
+    with _FX_PAIR_LOCKS.get(key):
+        history = _load_fx_history(base, quote)
+        covered = _FX_COVERED.get(key)
+        windows = _missing_fx_windows(history, covered, start_date, end_date)
+        results = [_download_fx(base, quote, s, e) for s, e in windows]
+        fetched = [df for df in results if df is not None and not df.empty]
+        if fetched:
+            history = _normalise_fx(pd.concat([history, *fetched], ignore_index=True))
+            _save_fx_history(base, quote, history)
+        if all(df is not None for df in results):
+            lo, hi = covered or (start_date, end_date)
+            _FX_COVERED[key] = (min(lo, start_date), min(max(hi, end_date), _last_settled_day()))
+
+    sliced = history[(history["Date"] >= start_date) & (history["Date"] <= end_date)]
+    if not sliced.empty:
+        return sliced.reset_index(drop=True)
 
     dates = pd.bdate_range(start_date, end_date).date
     const = FALLBACK_RATES.get((base, quote))
@@ -7,6 +7,7 @@ from functools import cached_property
 from typing import Callable, Tuple
 
 from backend.utils.timeseries_helpers import _nearest_weekday
+from backend.utils.trading_calendar import get_trading_calendar
 
 
 class PricingDateCalculator:
@@ -15,7 +16,8 @@ class PricingDateCalculator:
     The calculator normalises weekend handling using
     :func:`backend.utils.timeseries_helpers._nearest_weekday` and exposes
     helpers for the most common anchors and lookback windows used across the
-    pricing utilities.
+    pricing utilities. Pass ``exchange`` to roll over that exchange's
+    holidays as well, using its :class:`~backend.utils.trading_calendar.TradingCalendar`.
     """
 
     def __init__(
@@ -24,7 +26,10 @@ class PricingDateCalculator:
         *,
         weekday_func: Callable[[dt.date, bool], dt.date] | None = None,
         reporting_date: dt.date | None = None,
+        exchange: str | None = None,
     ) -> None:
+        if weekday_func is None and exchange is not None:
+            weekday_func = get_trading_calendar(exchange).roll
         self._weekday_func = weekday_func or _nearest_weekday
         self._explicit_reporting_date = (
             self.resolve_weekday(reporting_date, forward=False) if reporting_date is not None else None
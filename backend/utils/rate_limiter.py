@@ -0,0 +1,207 @@
+"""Token-bucket rate limits for price providers, shared across processes.
+
+Each provider (``yahoo``, ``stooq``, ``alpha_vantage``) gets one bucket that
+every fetcher in every local process draws from: uvicorn workers, refresh
+jobs and warm-up scripts on the same host all see the same state because the
+buckets live in a small SQLite file (``config.rate_limit_db_path``, default
+in the system temp directory) and each update runs in a ``BEGIN IMMEDIATE``
+transaction.
+
+Request paths call :meth:`RateLimiter.try_acquire`, which never sleeps: when
+a call would exceed the limit it returns ``False`` and the caller falls back
+to the next provider or to cached data. Batch jobs that can afford to wait
+use :meth:`RateLimiter.acquire` or :meth:`RateLimiter.wait`. A provider that
+reports a rate limit itself (HTTP 429, Stooq's daily hit cap) is recorded
+with :meth:`RateLimiter.block_for` so the other processes stop calling it too.
+
+Limits come from ``config.<provider>_requests_per_minute``; a provider with
+no limit configured is only ever blocked by :meth:`block_for`. If the SQLite
+file cannot be used the limiter fails open rather than stopping fetches.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Optional
+
+from backend.config import config
+from backend.logging_setup import sanitise_log_value
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DB_NAME = "allotmint_rate_limits.sqlite3"
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS buckets ("
+    "provider TEXT PRIMARY KEY, "
+    "tokens REAL NOT NULL, "
+    "updated REAL NOT NULL, "
+    "blocked_until REAL NOT NULL DEFAULT 0)"
+)
+
+
+def rate_limit_db_path() -> Path:
+    """Return the SQLite file holding the shared buckets."""
+    configured = getattr(config, "rate_limit_db_path", None)
+    if configured:
+        return Path(configured).expanduser()
+    return Path(tempfile.gettempdir()) / _DEFAULT_DB_NAME
+
+
+class RateLimiter:
+    """Token bucket for one provider, refilled at ``per_minute`` tokens a minute.
+
+    ``burst`` is the bucket capacity (default 1, i.e. evenly spaced calls).
+    ``per_minute=None`` means no steady-state limit.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        per_minute: Optional[float],
+        *,
+        burst: float = 1.0,
+        path: str | Path | None = None,
+    ) -> None:
+        self.provider = provider
+        self.rate = float(per_minute) / 60.0 if per_minute else None
+        self.capacity = max(1.0, float(burst))
+        self.path = Path(path) if path is not None else rate_limit_db_path()
+        self._warned = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def _update(self, tokens: float, *, consume: bool, block: float = 0.0) -> float:
+        """Refill the bucket and return the seconds until ``tokens`` are available.
+
+        When they are available now and ``consume`` is set they are taken.
+        ``block`` extends the provider's blocked window by that many seconds.
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                if self.rate is None and block <= 0:
+                    # Unlimited provider: only a recorded block can hold it up.
+                    row = conn.execute(
+                        "SELECT blocked_until FROM buckets WHERE provider = ?", (self.provider,)
+                    ).fetchone()
+                    return max(0.0, row[0] - now) if row else 0.0
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT tokens, updated, blocked_until FROM buckets WHERE provider = ?",
+                        (self.provider,),
+                    ).fetchone()
+                    level, updated, blocked_until = row if row else (self.capacity, now, 0.0)
+                    if self.rate is not None:
+                        level = min(self.capacity, level + max(0.0, now - updated) * self.rate)
+                    if block > 0:
+                        blocked_until = max(blocked_until, now + block)
+                        level = 0.0
+                    if blocked_until > now:
+                        wait = blocked_until - now
+                    elif self.rate is None or level >= tokens:
+                        wait = 0.0
+                        if consume and self.rate is not None:
+                            level -= tokens
+                    else:
+                        wait = (tokens - level) / self.rate
+                    conn.execute(
+                        "INSERT INTO buckets (provider, tokens, updated, blocked_until) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(provider) DO UPDATE SET tokens = excluded.tokens, "
+                        "updated = excluded.updated, blocked_until = excluded.blocked_until",
+                        (self.provider, level, now, blocked_until),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (OSError, sqlite3.Error) as exc:
+            if not self._warned:
+                self._warned = True
+                logger.warning(
+                    "Rate limit store %s unavailable; not limiting %s: %s",
+                    sanitise_log_value(self.path),
+                    sanitise_log_value(self.provider),
+                    sanitise_log_value(exc),
+                )
+            return 0.0
+        return wait
+
+    def seconds_until_available(self, tokens: float = 1.0) -> float:
+        """Return how long until ``tokens`` could be taken (0 if now)."""
+        return self._update(tokens, consume=False)
+
+    def would_exceed(self, tokens: float = 1.0) -> bool:
+        """Return whether taking ``tokens`` now would exceed the limit."""
+        return self.seconds_until_available(tokens) > 0
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if available now; never sleeps."""
+        return self._update(tokens, consume=True) == 0
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Take ``tokens``, sleeping until they are available or ``timeout`` passes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._update(tokens, consume=True)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def wait(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Sleep until ``tokens`` are available without taking them."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.seconds_until_available(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def block_for(self, seconds: float) -> None:
+        """Stop every process from using the provider for ``seconds``."""
+        if seconds > 0:
+            self._update(0.0, consume=False, block=seconds)
+
+
+_LIMITERS: Dict[tuple[str, Optional[float], str], RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Return the shared limiter for ``provider`` using the configured rate."""
+    per_minute = getattr(config, f"{provider}_requests_per_minute", None)
+    try:
+        per_minute = float(per_minute) if per_minute else None
+    except (TypeError, ValueError):
+        per_minute = None
+    if per_minute is not None and per_minute <= 0:
+        per_minute = None
+    key = (provider, per_minute, str(rate_limit_db_path()))
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = RateLimiter(provider, per_minute)
+        return limiter
+
+
+__all__ = ["RateLimiter", "get_rate_limiter", "rate_limit_db_path"]
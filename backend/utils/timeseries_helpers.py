@@ -231,6 +231,32 @@ def resolve_date_range(
     return start_date, end_date
 
 
+def sorted_date_slice(
+    dates: pd.Series | pd.DatetimeIndex,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+) -> Optional[slice]:
+    """Return the positional slice of *dates* falling in ``[start_date, end_date]``.
+
+    *dates* must be tz-naive ``datetime64`` values. The bounds are found with
+    ``searchsorted`` on a :class:`pandas.DatetimeIndex` over the values, so no
+    per-row ``date`` objects are built. Returns ``None`` when the values are
+    unsorted or contain NaT; callers then fall back to a boolean mask.
+    ``end_date`` is inclusive of the whole day, matching a ``.dt.date``
+    comparison.
+    """
+    index = dates if isinstance(dates, pd.DatetimeIndex) else pd.DatetimeIndex(dates)
+    if index.hasnans or not index.is_monotonic_increasing:
+        return None
+    lo = 0 if start_date is None else int(index.searchsorted(pd.Timestamp(start_date).normalize(), side="left"))
+    hi = (
+        len(index)
+        if end_date is None
+        else int(index.searchsorted(pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1), side="left"))
+    )
+    return slice(lo, max(lo, hi))
+
+
 def apply_date_range(
     df: pd.DataFrame,
     start_date: Optional[datetime.date] = None,
@@ -241,6 +267,10 @@ def apply_date_range(
     Either bound may be ``None`` to leave that side open (true no-op for that bound).
     Handles both ``datetime64`` and plain ``date`` dtype in the ``Date`` column.
 
+    A sorted, NaT-free, tz-naive ``datetime64`` column (the shape every cached
+    frame has) is sliced by binary search via :func:`sorted_date_slice`; any
+    other column takes the boolean-mask path below.
+
     Null handling: NaT (datetime64 columns) is converted to ``None`` via ``.dt.date``
     before filtering; ``None`` values in object-dtype columns are caught by
     ``dates.notna()``.  In both cases null rows are always dropped regardless of
@@ -257,6 +287,10 @@ def apply_date_range(
     if df.empty or "Date" not in df.columns:
         return df.copy()
     dates = df["Date"]
+    if pd.api.types.is_datetime64_dtype(dates):
+        bounds = sorted_date_slice(dates, start_date, end_date)
+        if bounds is not None:
+            return df.iloc[bounds].reset_index(drop=True).copy()
     # Normalise to plain date objects for comparison so that NaT (datetime64) and
     # None (object dtype) are both caught by isna() before the >= / <= tests.
     # For datetime64 columns .dt.date converts NaT → None; for object-dtype columns
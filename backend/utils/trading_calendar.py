@@ -0,0 +1,194 @@
+"""Per-exchange trading calendars for expected-date grids and date rolls.
+
+Each calendar holds its trading days as a sorted ``datetime64[D]`` array so
+"previous trading day", "next trading day" and "trading days between" are
+``np.searchsorted`` lookups rather than day-by-day loops. Holidays are
+computed from fixed rules (no market-calendar library is a dependency of
+this project):
+
+* London (``L``/``LSE``/``UK``) uses :func:`backend.utils.uk_holidays.uk_bank_holidays`.
+* US exchanges (``N``/``US``/``NYSE``/``NASDAQ``) use the NYSE full-day closures.
+* Xetra/Frankfurt (``DE``/``F``/``XETRA``) use the Deutsche Börse closures.
+
+Any other exchange falls back to a plain Monday-Friday calendar, matching the
+``pd.bdate_range`` grids used before.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, Iterable
+
+import numpy as np
+
+from backend.utils.uk_holidays import (
+    _easter_sunday,
+    _last_weekday_of_month,
+    _nth_weekday_of_month,
+    uk_bank_holidays,
+)
+
+# Calendars are materialised for this span up front and extended on demand
+# when a lookup falls outside it.
+_FIRST_YEAR = 1990
+_YEARS_AHEAD = 2
+
+
+def _nyse_observed(d: date) -> date:
+    """NYSE weekend rule: Saturday holidays move to Friday, Sunday to Monday."""
+    if d.weekday() == 5:
+        return d - timedelta(days=1)
+    if d.weekday() == 6:
+        return d + timedelta(days=1)
+    return d
+
+
+@lru_cache(maxsize=None)
+def us_market_holidays(year: int) -> frozenset[date]:
+    """Return NYSE full-day closures for ``year``."""
+    easter = _easter_sunday(year)
+    days = {
+        _nth_weekday_of_month(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday_of_month(year, 2, 0, 3),  # Washington's Birthday
+        easter - timedelta(days=2),  # Good Friday
+        _last_weekday_of_month(year, 5, 0),  # Memorial Day
+        _nyse_observed(date(year, 7, 4)),
+        _nth_weekday_of_month(year, 9, 0, 1),  # Labor Day
+        _nth_weekday_of_month(year, 11, 3, 4),  # Thanksgiving
+        _nyse_observed(date(year, 12, 25)),
+    }
+    # A Saturday New Year's Day is not observed on the preceding Friday.
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        days.add(_nyse_observed(new_year))
+    if year >= 2022:
+        days.add(_nyse_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(days)
+
+
+@lru_cache(maxsize=None)
+def xetra_holidays(year: int) -> frozenset[date]:
+    """Return Xetra/Frankfurt trading holidays for ``year``."""
+    easter = _easter_sunday(year)
+    return frozenset(
+        {
+            date(year, 1, 1),
+            easter - timedelta(days=2),  # Good Friday
+            easter + timedelta(days=1),  # Easter Monday
+            date(year, 5, 1),
+            date(year, 12, 24),
+            date(year, 12, 25),
+            date(year, 12, 26),
+            date(year, 12, 31),
+        }
+    )
+
+
+_HOLIDAY_RULES: dict[str, Callable[[int], Iterable[date]]] = {
+    "L": uk_bank_holidays,
+    "US": us_market_holidays,
+    "DE": xetra_holidays,
+}
+
+_EXCHANGE_ALIASES: dict[str, str] = {
+    "L": "L",
+    "LSE": "L",
+    "UK": "L",
+    "N": "US",
+    "US": "US",
+    "NYSE": "US",
+    "NASDAQ": "US",
+    "DE": "DE",
+    "F": "DE",
+    "XETRA": "DE",
+}
+
+
+def _day(d: date) -> np.datetime64:
+    return np.datetime64(d, "D")
+
+
+class TradingCalendar:
+    """Sorted trading days for one exchange with ``O(log n)`` lookups."""
+
+    def __init__(self, name: str, holidays: Callable[[int], Iterable[date]] | None = None) -> None:
+        self.name = name
+        self._holidays = holidays
+        self._lock = threading.Lock()
+        self._first_year = _FIRST_YEAR
+        self._last_year = date.today().year + _YEARS_AHEAD
+        self._days = self._build(self._first_year, self._last_year)
+
+    def _build(self, first_year: int, last_year: int) -> np.ndarray:
+        days = np.arange(
+            np.datetime64(f"{first_year:04d}-01-01"),
+            np.datetime64(f"{last_year + 1:04d}-01-01"),
+            dtype="datetime64[D]",
+        )
+        days = days[np.is_busday(days)]
+        if self._holidays is not None:
+            closed = [d for year in range(first_year, last_year + 1) for d in self._holidays(year)]
+            days = days[~np.isin(days, np.array(closed, dtype="datetime64[D]"))]
+        return days
+
+    def _covering(self, *dates: date) -> np.ndarray:
+        """Return the day array, first extending it to include ``dates``."""
+        first = min(d.year for d in dates)
+        last = max(d.year for d in dates)
+        if first > self._first_year and last < self._last_year:
+            return self._days
+        with self._lock:
+            if first <= self._first_year or last >= self._last_year:
+                self._first_year = min(self._first_year, first - 1)
+                self._last_year = max(self._last_year, last + 1)
+                self._days = self._build(self._first_year, self._last_year)
+            return self._days
+
+    def is_trading_day(self, d: date) -> bool:
+        days = self._covering(d)
+        i = np.searchsorted(days, _day(d))
+        return bool(i < len(days) and days[i] == _day(d))
+
+    def previous_trading_day(self, d: date, *, inclusive: bool = True) -> date:
+        """Return the last trading day on or before ``d`` (strictly before if not ``inclusive``)."""
+        days = self._covering(d)
+        i = np.searchsorted(days, _day(d), side="right" if inclusive else "left")
+        return days[i - 1].astype(date)
+
+    def next_trading_day(self, d: date, *, inclusive: bool = True) -> date:
+        """Return the first trading day on or after ``d`` (strictly after if not ``inclusive``)."""
+        days = self._covering(d)
+        i = np.searchsorted(days, _day(d), side="left" if inclusive else "right")
+        return days[i].astype(date)
+
+    def roll(self, d: date, forward: bool) -> date:
+        """Drop-in for :func:`backend.utils.timeseries_helpers._nearest_weekday`."""
+        return self.next_trading_day(d) if forward else self.previous_trading_day(d)
+
+    def trading_days_between(self, start: date, end: date) -> np.ndarray:
+        """Return the trading days in ``[start, end]`` as a ``datetime64[D]`` array."""
+        if start > end:
+            return np.array([], dtype="datetime64[D]")
+        days = self._covering(start, end)
+        lo = np.searchsorted(days, _day(start), side="left")
+        hi = np.searchsorted(days, _day(end), side="right")
+        return days[lo:hi]
+
+    def count_trading_days(self, start: date, end: date) -> int:
+        return len(self.trading_days_between(start, end))
+
+
+@lru_cache(maxsize=None)
+def _calendar(key: str) -> TradingCalendar:
+    return TradingCalendar(key, _HOLIDAY_RULES.get(key))
+
+
+def get_trading_calendar(exchange: str | None) -> TradingCalendar:
+    """Return the shared calendar for ``exchange`` (weekdays-only if unknown)."""
+    code = (exchange or "").strip().upper()
+    return _calendar(_EXCHANGE_ALIASES.get(code, "WEEKDAYS"))
+
+
+__all__ = ["TradingCalendar", "get_trading_calendar", "us_market_holidays", "xetra_holidays"]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""benchmark_valuation
+======================
+
+Time portfolio valuation for synthetic 50/500/2000-holding portfolios.
+
+Each holding gets ten years of business-day closes with a few percent of
+days missing (exchange holidays, gaps). The script times the array engine
+in :mod:`backend.common.valuation` (matrix build, forward-fill, value,
+returns, drawdown and serialisation) against the per-series reindex/ffill
+loop it replaced, and checks that both produce the same values.
+
+Usage::
+
+    python scripts/benchmark_valuation.py
+    python scripts/benchmark_valuation.py --holdings 50 500 --years 5 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from backend.common.valuation import PriceMatrix, history_records, performance_arrays
+
+
+def _synthetic_columns(
+    holdings: int, years: int, seed: int = 0
+) -> tuple[list[tuple[np.ndarray, np.ndarray]], np.ndarray]:
+    rng = np.random.default_rng(seed)
+    calendar = pd.bdate_range(end=pd.Timestamp("2024-12-31"), periods=years * 252)
+    calendar = calendar.to_numpy(dtype="datetime64[D]")
+    columns = []
+    for _ in range(holdings):
+        present = rng.random(len(calendar)) > 0.03
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(calendar))))
+        columns.append((calendar[present], closes[present]))
+    units = rng.integers(1, 500, holdings).astype(float)
+    return columns, units
+
+
+def _legacy(columns, units) -> np.ndarray:
+    series = [
+        pd.Series(c * u, index=pd.Index(d.astype(object)))
+        for (d, c), u in zip(columns, units, strict=True)
+    ]
+    all_dates = pd.Index(sorted(set().union(*(s.index for s in series))), name="Date")
+    total = pd.Series(0.0, index=all_dates)
+    for values in series:
+        total = total.add(values.sort_index().reindex(all_dates).ffill().fillna(0.0), fill_value=0)
+    perf = total.to_frame(name="value")
+    perf = perf.loc[[idx.weekday() < 5 for idx in perf.index]]
+    perf["daily_return"] = perf["value"].pct_change()
+    perf["weekly_return"] = perf["value"].pct_change(5)
+    perf["cumulative_return"] = perf["value"] / perf["value"].iloc[0] - 1
+    perf["running_max"] = perf["value"].cummax()
+    perf["drawdown"] = perf["value"] / perf["running_max"] - 1
+    list(perf.itertuples(index=False))  # serialisation cost
+    return perf["value"].to_numpy()
+
+
+def _engine(columns, units) -> np.ndarray:
+    matrix = PriceMatrix.from_columns(columns)
+    dates, total = matrix.dates, matrix.values(units)
+    weekdays = np.is_busday(dates)
+    perf = performance_arrays(total[weekdays])
+    history_records(dates[weekdays], perf)
+    return perf["value"]
+
+
+def _best_of(fn: Callable[[], np.ndarray], repeat: int) -> tuple[float, np.ndarray]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark portfolio valuation")
+    parser.add_argument(
+        "--holdings", type=int, nargs="+", default=[50, 500, 2000], help="Portfolio sizes"
+    )
+    parser.add_argument("--years", type=int, default=10, help="Years of daily closes per holding")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is reported)"
+    )
+    args = parser.parse_args()
+
+    print(f"{'holdings':>8} {'legacy ms':>10} {'engine ms':>10} {'speed-up':>9}")
+    for holdings in args.holdings:
+        columns, units = _synthetic_columns(holdings, args.years)
+        legacy_s, legacy = _best_of(lambda c=columns, u=units: _legacy(c, u), args.repeat)
+        engine_s, engine = _best_of(lambda c=columns, u=units: _engine(c, u), args.repeat)
+        np.testing.assert_allclose(engine, legacy, rtol=1e-9)
+        speed_up = legacy_s / engine_s
+        print(f"{holdings:>8} {legacy_s * 1000:>10.1f} {engine_s * 1000:>10.1f} {speed_up:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""build_cache_bundle
+=====================
+
+Pack the offline price store into a single memory-mappable bundle.
+
+The bundle holds every cached meta series, the FX histories, the instrument
+metadata JSON and ``latest_prices.json`` (see
+:mod:`backend.timeseries.bundle`), read from a local or S3 cache base. Ship
+it with a Lambda image or copy it onto a laptop and point
+``cache_bundle_path`` / ``CACHE_BUNDLE_PATH`` at it to run in offline mode
+without the cache directory.
+
+Usage::
+
+    python scripts/build_cache_bundle.py --output data/cache_bundle.arrow
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from backend.timeseries.bundle import build_cache_bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build an offline cache bundle")
+    parser.add_argument(
+        "--output",
+        default="data/cache_bundle.arrow",
+        help="Bundle file to write (replaced atomically)",
+    )
+    args = parser.parse_args()
+    print(json.dumps(build_cache_bundle(args.output), indent=2))
+
+
+if __name__ == "__main__":
+    main()
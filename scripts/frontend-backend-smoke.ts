@@ -440,10 +440,18 @@ export const smokeEndpoints: SmokeEndpoint[] = [
     "method": "GET",
     "path": "/performance-group/{slug}/max-drawdown"
   },
+  {
+    "method": "GET",
+    "path": "/performance-group/{slug}/rolling-risk"
+  },
   {
     "method": "GET",
     "path": "/performance-group/{slug}/tracking-error"
   },
+  {
+    "method": "GET",
+    "path": "/performance-group/{slug}/xirr"
+  },
   {
     "method": "GET",
     "path": "/performance/{owner}"
@@ -463,6 +471,14 @@ export const smokeEndpoints: SmokeEndpoint[] = [
     "method": "GET",
     "path": "/performance/{owner}/max-drawdown"
   },
+  {
+    "method": "GET",
+    "path": "/performance/{owner}/rolling-risk"
+  },
+  {
+    "method": "GET",
+    "path": "/performance/{owner}/summary"
+  },
   {
     "method": "GET",
     "path": "/performance/{owner}/tracking-error"
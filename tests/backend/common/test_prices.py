@@ -34,7 +34,8 @@ def test_close_on_falls_back_to_close_column(monkeypatch: pytest.MonkeyPatch) ->
     sample_date = date(2024, 5, 6)
     frame = pd.DataFrame({"Close": [99.25]})
 
-    monkeypatch.setattr(prices, "_nearest_weekday", lambda d, forward=False: sample_date)
+    calendar = types.SimpleNamespace(previous_trading_day=lambda d: sample_date)
+    monkeypatch.setattr(prices, "get_trading_calendar", lambda exchange: calendar)
 
     captured: list[tuple[str, str, date, date]] = []
 
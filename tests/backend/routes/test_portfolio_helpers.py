@@ -3,6 +3,7 @@ import types
 from pathlib import Path
 
 import pytest
+from fastapi import BackgroundTasks
 
 from backend.common.account_models import OwnerSummaryRecord
 from backend.routes import portfolio
@@ -158,3 +159,17 @@ async def test_do_refresh_prices_uses_to_thread(monkeypatch: pytest.MonkeyPatch)
         "args": (),
         "kwargs": {},
     }
+
+
+@pytest.mark.asyncio
+async def test_do_refresh_prices_refreshes_performance_histories_after_the_response(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(portfolio.prices, "refresh_prices", lambda: {"updated": 1})
+    background_tasks = BackgroundTasks()
+
+    result = await portfolio._do_refresh_prices(background_tasks)
+
+    assert result == {"status": "ok", "updated": 1}
+    refresh = portfolio.portfolio_utils.refresh_performance_histories
+    assert [task.func for task in background_tasks.tasks] == [refresh]
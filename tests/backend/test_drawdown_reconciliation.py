@@ -40,7 +40,7 @@ def mock_env(monkeypatch, price_data):
 
     calls = []
 
-    def fake_load_meta_timeseries(ticker, exchange, days):
+    def fake_load_meta_timeseries(ticker, exchange, days, readonly=False):
         calls.append((ticker, exchange))
         return price_data.get(ticker, pd.DataFrame())
 
@@ -95,7 +95,7 @@ def test_compute_max_drawdown_forward_fills_short_price_gaps(monkeypatch):
     monkeypatch.setattr(
         portfolio_utils,
         "load_meta_timeseries",
-        lambda ticker, exchange, days: series_by_ticker.get(ticker, pd.DataFrame()),
+        lambda ticker, exchange, days, readonly=False: series_by_ticker.get(ticker, pd.DataFrame()),
     )
     monkeypatch.setattr(portfolio_utils, "_PRICE_SNAPSHOT", {})
 
@@ -138,7 +138,7 @@ def test_portfolio_value_series_does_not_forward_fill_long_gaps(monkeypatch):
     monkeypatch.setattr(
         portfolio_utils,
         "load_meta_timeseries",
-        lambda ticker, exchange, days: series_by_ticker.get(ticker, pd.DataFrame()),
+        lambda ticker, exchange, days, readonly=False: series_by_ticker.get(ticker, pd.DataFrame()),
     )
     monkeypatch.setattr(portfolio_utils, "_PRICE_SNAPSHOT", {})
 
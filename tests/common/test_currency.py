@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import datetime as dt
+
 import pandas as pd
 import pytest
 
-from backend.common.currency import CurrencyNormaliser, extract_currency
+from backend.common.currency import CurrencyNormaliser, FxMatrix, extract_currency
 
 
 @pytest.mark.parametrize(
@@ -133,3 +135,56 @@ def test_scale_dataframe_scales_case_insensitive_ohlc():
     assert scaled["HIGH"].iloc[0] == pytest.approx(2.0)
     assert scaled["low"].iloc[0] == pytest.approx(1.5)
     assert scaled["Close"].iloc[0] == pytest.approx(3.0)
+
+
+def _rates_loader(values):
+    def loader(code):
+        rows = values.get(code, [])
+        return pd.DataFrame({"Date": [d for d, _ in rows], "Rate": [r for _, r in rows]})
+
+    return loader
+
+
+def test_fx_matrix_converts_panel_with_one_multiply():
+    loader = _rates_loader(
+        {
+            "USD": [(dt.date(2024, 1, 1), 0.8), (dt.date(2024, 1, 3), 0.75)],
+            "EUR": [
+                (dt.date(2024, 1, 1), 0.9),
+                (dt.date(2024, 1, 2), 0.85),
+                (dt.date(2024, 1, 3), 0.86),
+            ],
+        }
+    )
+    matrix = FxMatrix.build(dt.date(2024, 1, 1), dt.date(2024, 1, 3), loader=loader)
+    panel = pd.DataFrame(
+        {"AAA.N": [10.0, 10.0, 10.0], "BBB.DE": [1.0, 2.0, 3.0], "CCC.L": [100.0, 200.0, 300.0]},
+        index=pd.bdate_range("2024-01-01", "2024-01-03"),
+    )
+
+    out = matrix.convert(panel, {"AAA.N": "USD", "BBB.DE": "EUR", "CCC.L": "GBp"})
+
+    assert list(out["AAA.N"]) == pytest.approx([8.0, 8.0, 7.5])
+    assert list(out["BBB.DE"]) == pytest.approx([0.9, 1.7, 2.58])
+    assert list(out["CCC.L"]) == pytest.approx([1.0, 2.0, 3.0])
+
+
+def test_fx_matrix_cross_rates_and_missing_currency():
+    jan1 = dt.date(2024, 1, 1)
+    loader = _rates_loader({"USD": [(jan1, 0.8)], "EUR": [(jan1, 0.9)]})
+    matrix = FxMatrix.build(
+        dt.date(2024, 1, 1), dt.date(2024, 1, 2), ("USD", "CHF"), base_currency="EUR", loader=loader
+    )
+
+    assert "USD" in matrix
+    assert "CHF" not in matrix
+    factors = matrix.factors([dt.date(2024, 1, 2), dt.date(2024, 1, 6)], ["USD", "CHF", "EUR"])
+    assert factors[:, 0] == pytest.approx([0.8 / 0.9, 0.8 / 0.9])
+    assert pd.isna(factors[:, 1]).all()
+    assert factors[:, 2] == pytest.approx([1.0, 1.0])
+
+
+def test_fx_matrix_spot_latest():
+    matrix = FxMatrix.spot({"USD": 0.8})
+    assert list(matrix.latest(["USD", "GBX", "GBP"])) == pytest.approx([0.8, 0.01, 1.0])
+    assert pd.isna(matrix.latest(["JPY"])[0])
@@ -0,0 +1,140 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from backend.common import performance_history
+from backend.common import portfolio_utils as pu
+from backend.common.performance_history import StoredHistory
+
+CALENDAR = np.array(
+    [d for d in np.arange("2023-11-01", "2024-01-11", dtype="datetime64[D]") if np.is_busday(d)],
+    dtype="datetime64[D]",
+)
+VALUES = 1000.0 + np.arange(len(CALENDAR), dtype="float64")
+
+
+class FakeCalc:
+    reporting_date = date(2024, 1, 9)
+
+    def __init__(self, reporting_date=None):
+        self.reporting_date = reporting_date or FakeCalc.reporting_date
+        self.previous_pricing_date = self.reporting_date
+
+
+@pytest.fixture
+def materialised(monkeypatch, tmp_path):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path / "ts"))
+    monkeypatch.setattr(pu.config, "performance_history_days", 30, raising=False)
+    monkeypatch.setattr(pu.config, "accounts_root", tmp_path / "accounts")
+    owner_dir = tmp_path / "accounts" / "alice"
+    owner_dir.mkdir(parents=True)
+    (owner_dir / "isa.json").write_text("{}")
+    monkeypatch.setattr(pu, "PricingDateCalculator", FakeCalc)
+    monkeypatch.setattr(FakeCalc, "reporting_date", date(2024, 1, 9))
+
+    calls = []
+
+    def fake_history(owner, days, *, calc, **_):
+        calls.append(days)
+        end = np.datetime64(calc.reporting_date, "D")
+        keep = (CALENDAR <= end) & (CALENDAR >= end - days)
+        return CALENDAR[keep], VALUES[keep], np.zeros(int(keep.sum())), []
+
+    monkeypatch.setattr(pu, "_owner_value_history", fake_history)
+    return owner_dir, calls
+
+
+def test_store_round_trips_and_checks_the_signature(materialised):
+    history = StoredHistory(
+        CALENDAR[-3:],
+        VALUES[-3:],
+        date(2024, 1, 10),
+        [{"date": "2024-01-09"}],
+        flows=np.array([0.0, 5.0, 0.0]),
+    )
+    performance_history.save("alice", "sig", history)
+
+    loaded = performance_history.load("alice", "sig")
+
+    assert loaded.dates.tolist() == CALENDAR[-3:].tolist()
+    assert loaded.values.tolist() == VALUES[-3:].tolist()
+    assert loaded.flows.tolist() == [0.0, 5.0, 0.0]
+    assert loaded.reporting_date == date(2024, 1, 10)
+    assert loaded.data_quality_issues == [{"date": "2024-01-09"}]
+    assert performance_history.load("alice", "other") is None
+
+
+def test_store_keeps_only_the_columns_it_reads(materialised):
+    import pyarrow.parquet as pq
+
+    history = StoredHistory(CALENDAR[-3:], VALUES[-3:], date(2024, 1, 10))
+    performance_history.save("alice", "sig", history)
+
+    path = performance_history.history_dir() / "alice.parquet"
+    assert pq.read_schema(path).names == ["date", "value", "flows"]
+
+
+def test_owner_performance_is_served_from_the_materialised_history(materialised):
+    owner_dir, calls = materialised
+
+    first = pu.compute_owner_performance("alice", days=10)
+    second = pu.compute_owner_performance("alice", days=5)
+
+    assert calls == [30]
+    assert [row["date"] for row in second["history"]] == ["2024-01-04", "2024-01-05", "2024-01-08", "2024-01-09"]
+    assert [row["date"] for row in first["history"]][-4:] == [row["date"] for row in second["history"]]
+    assert second["history"][0]["cumulative_return"] == 0.0
+    assert second["reporting_date"] == "2024-01-09"
+
+    (owner_dir / "isa_transactions.json").write_text("{}")
+    pu.compute_owner_performance("alice", days=5)
+    assert calls == [30, 30]
+
+
+def test_other_variants_and_long_windows_bypass_the_history(materialised):
+    _owner_dir, calls = materialised
+
+    pu.compute_owner_performance("alice", days=10, include_cash=False)
+    pu.compute_owner_performance("alice", days=60)
+
+    assert calls == [10, 60]
+    assert performance_history.load("alice", performance_history.owner_signature("alice")) is None
+
+
+def test_append_values_only_the_new_days(materialised, monkeypatch):
+    _owner_dir, calls = materialised
+    assert pu.append_owner_performance("alice")
+
+    monkeypatch.setattr(FakeCalc, "reporting_date", date(2024, 1, 10))
+    assert pu.append_owner_performance("alice")
+
+    assert calls == [30, 1 + pu._PERFORMANCE_APPEND_LOOKBACK_DAYS]
+    stored = performance_history.load("alice", performance_history.owner_signature("alice"))
+    kept = CALENDAR >= np.datetime64("2023-12-11")
+    assert stored.dates.tolist() == CALENDAR[kept].tolist()
+    assert stored.values.tolist() == VALUES[kept].tolist()
+    assert stored.reporting_date == date(2024, 1, 10)
+
+
+def test_append_rebuilds_when_the_overlap_disagrees(materialised, monkeypatch):
+    _owner_dir, calls = materialised
+    pu.append_owner_performance("alice")
+    signature = performance_history.owner_signature("alice")
+    stored = performance_history.load("alice", signature)
+    performance_history.save("alice", signature, StoredHistory(stored.dates, stored.values * 2, stored.reporting_date))
+
+    monkeypatch.setattr(FakeCalc, "reporting_date", date(2024, 1, 10))
+    pu.append_owner_performance("alice")
+
+    assert calls == [30, 1 + pu._PERFORMANCE_APPEND_LOOKBACK_DAYS, 30]
+    kept = CALENDAR >= np.datetime64("2023-12-11")
+    assert performance_history.load("alice", signature).values.tolist() == VALUES[kept].tolist()
+
+
+def test_refresh_is_a_no_op_when_disabled(monkeypatch):
+    monkeypatch.setattr(pu.config, "performance_history_days", None, raising=False)
+
+    assert pu.refresh_performance_histories() == 0
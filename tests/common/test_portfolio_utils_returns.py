@@ -18,7 +18,7 @@ def test_compute_alpha_and_tracking_error(monkeypatch: pytest.MonkeyPatch) -> No
 
     benchmark_df = pd.DataFrame({"Date": dates, "Close": [100.0, 108.0, 112.0]})
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
         assert (ticker, exchange, days) == ("SPY", "L", 365)
         return benchmark_df.copy()
 
@@ -44,7 +44,7 @@ def test_compute_metrics_none_when_series_misaligned(monkeypatch: pytest.MonkeyP
     benchmark_dates = pd.date_range("2024-02-01", periods=3, freq="D")
     benchmark_df = pd.DataFrame({"Date": benchmark_dates, "Close": [100.0, 108.0, 112.0]})
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
         return benchmark_df.copy()
 
     monkeypatch.setattr(portfolio_utils, "load_meta_timeseries", fake_load_meta_timeseries)
@@ -73,7 +73,7 @@ def test_compute_metrics_none_when_benchmark_data_entirely_missing(
 
     monkeypatch.setattr(portfolio_utils, "_portfolio_value_series", fake_portfolio_value_series)
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
         return pd.DataFrame()
 
     monkeypatch.setattr(portfolio_utils, "load_meta_timeseries", fake_load_meta_timeseries)
@@ -104,7 +104,7 @@ def test_group_metrics_and_max_drawdown(monkeypatch: pytest.MonkeyPatch) -> None
 
     monkeypatch.setattr(portfolio_utils, "_portfolio_value_series", fake_portfolio_value_series)
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
         return benchmark_df.copy()
 
     monkeypatch.setattr(portfolio_utils, "load_meta_timeseries", fake_load_meta_timeseries)
@@ -169,7 +169,7 @@ def test_portfolio_value_series_uses_requested_days(monkeypatch: pytest.MonkeyPa
         lambda ticker, snapshot: (ticker.split(".")[0], "L"),
     )
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
         observed_days.append(days)
         dates = pd.date_range("2024-01-01", periods=5, freq="D")
         return pd.DataFrame({"Date": dates, "Close": [100, 101, 102, 103, 104]})
@@ -179,3 +179,125 @@ def test_portfolio_value_series_uses_requested_days(monkeypatch: pytest.MonkeyPa
     series = portfolio_utils._portfolio_value_series("alice", 30)
     assert not series.empty
     assert observed_days == [30]
+
+
+def test_performance_summary_values_the_portfolio_once(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setattr(portfolio_utils.config, "accounts_root", tmp_path)
+    dates = pd.date_range("2024-01-01", periods=3, freq="D")
+    portfolio_series = pd.Series([100.0, 110.0, 115.0], index=dates.date)
+    benchmark_df = pd.DataFrame({"Date": dates, "Close": [100.0, 108.0, 112.0]})
+    calls: dict[str, int] = {"series": 0, "benchmark": 0, "transactions": 0}
+
+    def fake_portfolio_value_series(name: str, days: int, *, group: bool = False, pricing_date=None, **_) -> pd.Series:
+        calls["series"] += 1
+        return portfolio_series
+
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
+        calls["benchmark"] += 1
+        return benchmark_df.copy()
+
+    def fake_load_transactions(owner: str, **_) -> list[dict]:
+        calls["transactions"] += 1
+        return []
+
+    monkeypatch.setattr(portfolio_utils, "_portfolio_value_series", fake_portfolio_value_series)
+    monkeypatch.setattr(portfolio_utils, "load_meta_timeseries", fake_load_meta_timeseries)
+    monkeypatch.setattr(portfolio_utils, "load_transactions", fake_load_transactions)
+
+    summary = portfolio_utils.compute_performance_summary("alice", "SPY.L", days=365)
+
+    assert summary["alpha_vs_benchmark"] == pytest.approx(0.03, rel=1e-4)
+    assert summary["tracking_error"] == pytest.approx(0.13001314, rel=1e-4)
+    assert summary["max_drawdown"] == pytest.approx(0.0)
+    assert summary["time_weighted_return"] == pytest.approx(0.15)
+    assert summary["xirr"] is None
+    assert summary["cagr"] == pytest.approx(1.15 ** (365 / 2) - 1)
+    assert calls == {"series": 1, "benchmark": 1, "transactions": 1}
+
+    portfolio_utils.compute_performance_summary("alice", "SPY.L", days=365)
+    assert calls["series"] == 1
+
+
+def test_analytics_context_is_keyed_on_data_version(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setattr(portfolio_utils.config, "accounts_root", tmp_path)
+    owner_dir = tmp_path / "alice"
+    owner_dir.mkdir()
+    holdings = owner_dir / "isa.json"
+    holdings.write_text("{}")
+
+    first = portfolio_utils.analytics_context("alice", 365)
+    assert portfolio_utils.analytics_context("alice", 365) is first
+    assert portfolio_utils.analytics_context("alice", 30) is not first
+
+    holdings.write_text('{"holdings": []}')
+    second = portfolio_utils.analytics_context("alice", 365)
+    assert second is not first
+
+    monkeypatch.setattr(portfolio_utils, "_PRICE_SNAPSHOT_TS", pd.Timestamp("2024-01-01").to_pydatetime())
+    assert portfolio_utils.analytics_context("alice", 365) is not second
+
+
+def test_benchmark_returns_are_loaded_once_across_owners(monkeypatch: pytest.MonkeyPatch) -> None:
+    dates = pd.date_range("2024-01-01", periods=4, freq="D")
+    series = {
+        "alice": pd.Series([100.0, 110.0, 115.0, 120.0], index=dates.date),
+        # Bob has no value on the third day, so his alignment skips a benchmark day.
+        "bob": pd.Series([50.0, 52.0, 51.0], index=dates.date[[0, 1, 3]]),
+    }
+    benchmark_df = pd.DataFrame({"Date": dates, "Close": [100.0, 108.0, 112.0, 110.0]})
+    loads: list[str] = []
+
+    def fake_portfolio_value_series(name: str, days: int, *, group: bool = False, pricing_date=None, **_) -> pd.Series:
+        return series[name]
+
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
+        loads.append(ticker)
+        return benchmark_df.copy()
+
+    monkeypatch.setattr(portfolio_utils, "_portfolio_value_series", fake_portfolio_value_series)
+    monkeypatch.setattr(portfolio_utils, "load_meta_timeseries", fake_load_meta_timeseries)
+
+    alpha, breakdown = portfolio_utils.compute_alpha_vs_benchmark("alice", "SPY.L", include_breakdown=True)
+    assert alpha == pytest.approx(0.2 - 0.1)
+    assert [row["benchmark_cumulative_return"] for row in breakdown["series"]] == pytest.approx([0.08, 0.12, 0.1])
+
+    bob_alpha, bob_breakdown = portfolio_utils.compute_alpha_vs_benchmark("bob", "SPY.L", include_breakdown=True)
+    # Only the benchmark's returns on Bob's dates are compounded.
+    assert [row["date"] for row in bob_breakdown["series"]] == ["2024-01-02", "2024-01-04"]
+    assert bob_breakdown["benchmark_cumulative_return"] == pytest.approx(1.08 * (110 / 112) - 1)
+    assert bob_alpha == pytest.approx(51 / 50 - 1 - (1.08 * (110 / 112) - 1))
+
+    portfolio_utils.compute_tracking_error("alice", "SPY.L")
+    portfolio_utils.compute_tracking_error("bob", "spy.l")
+    assert loads == ["SPY"]
+
+    portfolio_utils.refresh_snapshot_in_memory({}, pd.Timestamp("2024-01-05").to_pydatetime())
+    portfolio_utils.compute_tracking_error("alice", "SPY.L")
+    assert loads == ["SPY", "SPY"]
+
+
+def test_compute_rolling_risk_aligns_with_the_benchmark(monkeypatch: pytest.MonkeyPatch) -> None:
+    dates = pd.date_range("2024-01-01", periods=6, freq="D")
+    portfolio_series = pd.Series([100.0, 102.0, 101.0, 104.0, 103.0, 107.0], index=dates.date)
+    # The benchmark has no close on the fourth day.
+    benchmark_df = pd.DataFrame({"Date": dates[[0, 1, 2, 4, 5]], "Close": [50.0, 50.5, 50.2, 51.0, 52.0]})
+
+    monkeypatch.setattr(portfolio_utils, "_portfolio_value_series", lambda *_a, **_k: portfolio_series)
+    monkeypatch.setattr(portfolio_utils, "load_meta_timeseries", lambda *_a, **_k: benchmark_df.copy())
+    monkeypatch.setattr(portfolio_utils.config, "risk_free_rate", None)
+
+    result = portfolio_utils.compute_rolling_risk("alice", "SPY.L", window=3)
+
+    assert result["window"] == 3
+    assert [row["date"] for row in result["series"]] == ["2024-01-05", "2024-01-06"]
+    port = portfolio_series.pct_change().loc[[dates[i].date() for i in (1, 2, 4, 5)]].to_numpy()
+    assert result["series"][-1]["volatility"] == pytest.approx(port[1:].std(ddof=1) * 252**0.5)
+    assert result["series"][-1]["correlation"] is not None
+
+    monkeypatch.setattr(portfolio_utils, "load_meta_timeseries", lambda *_a, **_k: pd.DataFrame())
+    portfolio_utils.clear_benchmark_returns()
+    no_benchmark = portfolio_utils.compute_rolling_risk("alice", "MISSING.L", window=3)
+    assert len(no_benchmark["series"]) == 3
+    assert {row["beta"] for row in no_benchmark["series"]} == {None}
+
+    assert portfolio_utils.compute_rolling_risk("alice", "MISSING.L", window=10)["series"] == []
@@ -6,6 +6,7 @@ from datetime import date
 
 import pandas as pd
 import pandas.testing as pdt
+import pytest
 
 from backend.common import portfolio_utils as pu
 
@@ -56,7 +57,7 @@ def test_portfolio_value_series_aggregates_and_skips_flagged(monkeypatch):
 
     calls: list[tuple[str, str]] = []
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
         calls.append((ticker, exchange))
         data_map = {
             ("AAA", "L"): _make_df([("2024-01-01", 100.0), ("2024-01-02", 110.0)]),
@@ -80,52 +81,93 @@ def test_portfolio_value_series_aggregates_and_skips_flagged(monkeypatch):
     assert ("FLAGGED", "L") not in calls
 
 
-def test_portfolio_value_series_uses_group_builder(monkeypatch):
+def test_portfolio_value_series_uses_units_held_on_each_date(monkeypatch):
     import backend.common.instrument_api as instrument_api
-
-    def boom(*_args, **_kwargs):  # pragma: no cover - defensive
-        raise AssertionError("owner builder should not be used")
-
-    monkeypatch.setattr(pu.portfolio_mod, "build_owner_portfolio", boom)
+    from backend.common.position_timeline import PositionTimeline
 
     monkeypatch.setattr(
-        pu.group_portfolio,
-        "build_group_portfolio",
+        pu.portfolio_mod,
+        "build_owner_portfolio",
         lambda name, *, pricing_date=None, **_: {
-            "accounts": [
-                {
-                    "holdings": [
-                        {"ticker": "XYZ.L", "units": 2},
-                    ]
-                }
-            ]
+            "accounts": [{"account_type": "ISA", "holdings": [{"ticker": "ABC.L", "units": 15}]}]
         },
     )
+    monkeypatch.setattr(instrument_api, "_resolve_full_ticker", lambda ticker, snapshot: ("ABC", "L"))
+    monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
+    timeline = PositionTimeline.from_transactions(
+        {
+            "transactions": [
+                {"type": "BUY", "ticker": "ABC.L", "units": 10, "date": "2023-12-01"},
+                {"type": "BUY", "ticker": "ABC.L", "units": 5, "date": "2024-01-02"},
+            ]
+        }
+    )
+    monkeypatch.setattr(pu, "owner_timelines", lambda owner: {"isa": timeline})
+    frame = _make_df([("2024-01-01", 10.0), ("2024-01-02", 10.0), ("2024-01-03", 11.0)])
+    monkeypatch.setattr(pu, "load_meta_timeseries", lambda ticker, exchange, days, readonly=False: frame.copy())
+
+    result = pu._portfolio_value_series("owner-1", days=30, pricing_date=date(2024, 1, 3))
 
+    assert result.tolist() == [100.0, 150.0, 165.0]
+
+
+def test_group_value_series_sums_member_series(monkeypatch):
+    def boom(*_args, **_kwargs):  # pragma: no cover - defensive
+        raise AssertionError("group portfolio should not be rebuilt")
+
+    monkeypatch.setattr(pu.group_portfolio, "build_group_portfolio", boom)
     monkeypatch.setattr(
-        instrument_api,
-        "_resolve_full_ticker",
-        lambda ticker, snapshot: {"XYZ.L": ("XYZ", "L")}.get(ticker),
+        pu.group_portfolio,
+        "list_groups",
+        lambda: [{"slug": "group-1", "members": ["alice", "bob", "carol"]}],
     )
 
-    monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
+    member_series = {
+        "alice": pd.Series([100.0, 110.0, 120.0], index=[date(2024, 2, 1), date(2024, 2, 2), date(2024, 2, 5)]),
+        "bob": pd.Series([50.0, 55.0], index=[date(2024, 2, 2), date(2024, 2, 5)]),
+    }
+    calls: list[str] = []
+
+    def fake_owner_series(name, days=365, *, group=False, pricing_date=None):
+        assert not group
+        calls.append(name)
+        if name not in member_series:
+            raise FileNotFoundError(name)
+        return member_series[name]
 
+    monkeypatch.setattr(pu.portfolio_mod, "build_owner_portfolio", boom)
+    real = pu._portfolio_value_series
     monkeypatch.setattr(
         pu,
-        "load_meta_timeseries",
-        lambda ticker, exchange, days: _make_df([("2024-02-01", 50.0), ("2024-02-02", 55.0)]),
+        "_portfolio_value_series",
+        lambda name, days=365, *, group=False, pricing_date=None: (
+            real(name, days, group=True, pricing_date=pricing_date)
+            if group
+            else fake_owner_series(name, days, pricing_date=pricing_date)
+        ),
     )
 
     result = pu._portfolio_value_series("group-1", days=10, group=True)
-
     expected = pd.Series(
-        [100.0, 110.0],
-        index=[date(2024, 2, 1), date(2024, 2, 2)],
+        [100.0, 160.0, 175.0],
+        index=[date(2024, 2, 1), date(2024, 2, 2), date(2024, 2, 5)],
         dtype=float,
     )
-
     pdt.assert_series_equal(result, expected, check_names=False)
 
+    # Member series are shared through their analytics contexts.
+    pu._portfolio_value_series("group-1", days=10, group=True)
+    assert calls == ["alice", "bob", "carol", "carol"]
+
+    assert pu._portfolio_value_series("group-1", days=2, group=True).tolist() == [160.0, 175.0]
+
+
+def test_group_value_series_rejects_unknown_slug(monkeypatch):
+    monkeypatch.setattr(pu.group_portfolio, "list_groups", lambda: [])
+
+    with pytest.raises(ValueError):
+        pu._portfolio_value_series("missing", days=10, group=True)
+
 
 def test_cash_value_series_sums_cash_holdings(monkeypatch):
     import backend.common.instrument_api as instrument_api
@@ -157,7 +199,7 @@ def test_cash_value_series_sums_cash_holdings(monkeypatch):
 
     monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
+    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int, readonly: bool = False) -> pd.DataFrame:
         data_map = {
             ("CASH_GBP", "GBP"): _make_df([("2024-03-01", 1.0), ("2024-03-02", 1.01)]),
             ("CASH_USD", "USD"): _make_df([("2024-03-01", 1.2), ("2024-03-02", 1.25)]),
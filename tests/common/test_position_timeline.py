@@ -0,0 +1,67 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from backend.common import position_timeline
+from backend.common.portfolio_loader import get_units_as_of
+from backend.common.position_timeline import PositionTimeline, owner_timelines
+
+TX_DATA = {
+    "transactions": [
+        {"type": "BUY", "ticker": "abc", "units": 100, "date": "2024-01-05"},
+        {"type": "SELL", "ticker": "ABC", "units": 30, "date": "2024-02-01"},
+        {"type": "BUY", "ticker": "ABC", "units": 5, "date": "2024-02-01"},
+        {"type": "TRANSFER_IN", "ticker": "DEF", "shares": 2_000_000_000, "date": "2024-03-01"},
+        {"type": "DIVIDEND", "ticker": "ABC", "amount_minor": 123, "date": "2024-03-01"},
+        {"type": "BUY", "ticker": "ABC", "units": 1, "date": "not-a-date"},
+    ]
+}
+
+
+@pytest.mark.parametrize("as_of", ["2024-01-01", "2024-01-05", "2024-01-31", "2024-02-01", "2024-12-31"])
+def test_timeline_matches_get_units_as_of(as_of):
+    timeline = PositionTimeline.from_transactions(TX_DATA)
+
+    for ticker in ("ABC", "DEF", "XYZ"):
+        assert timeline.units_on(ticker, as_of) == pytest.approx(get_units_as_of(TX_DATA, ticker, as_of))
+
+
+def test_units_over_is_a_step_function():
+    timeline = PositionTimeline.from_transactions(TX_DATA)
+    dates = np.array(["2024-01-04", "2024-01-05", "2024-01-31", "2024-02-01", "2024-03-01"], dtype="datetime64[D]")
+
+    assert timeline.units_over("abc", dates).tolist() == [0.0, 100.0, 100.0, 75.0, 75.0]
+    assert timeline.units_over("DEF", dates).tolist() == [0.0, 0.0, 0.0, 0.0, 20.0]
+    assert timeline.reconciles("ABC", 75.0, "2024-06-30")
+    assert not timeline.reconciles("ABC", 80.0, "2024-06-30")
+
+
+def test_owner_timelines_are_cached_until_a_file_changes(tmp_path, monkeypatch):
+    position_timeline.clear_cache()
+    owner_dir = tmp_path / "alice"
+    owner_dir.mkdir()
+    tx_path = owner_dir / "isa_transactions.json"
+    tx_path.write_text(json.dumps({"account_type": "ISA", **TX_DATA}))
+
+    built = []
+    real = PositionTimeline.from_transactions.__func__
+    monkeypatch.setattr(
+        PositionTimeline,
+        "from_transactions",
+        classmethod(lambda cls, data: built.append(1) or real(cls, data)),
+    )
+
+    first = owner_timelines("alice", tmp_path)
+    assert owner_timelines("alice", tmp_path) is first
+    assert len(built) == 1
+    assert first["isa"].units_on("ABC", "2024-12-31") == pytest.approx(75.0)
+
+    tx_path.write_text(json.dumps({"account_type": "ISA", "transactions": TX_DATA["transactions"][:1]}))
+    bumped = tx_path.stat().st_mtime + 10
+    os.utime(tx_path, (bumped, bumped))
+
+    assert owner_timelines("alice", tmp_path)["isa"].units_on("ABC", "2024-12-31") == pytest.approx(100.0)
+    assert len(built) == 2
+    assert owner_timelines("missing", tmp_path) == {}
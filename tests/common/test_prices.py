@@ -13,6 +13,7 @@ import pandas as pd
 import pytest
 
 from backend.common import prices
+from backend.utils.trading_calendar import get_trading_calendar
 
 
 def test_close_on_returns_value_from_timeseries(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -63,7 +64,7 @@ def test_close_on_handles_close_column_and_conversion_errors(
 def test_get_price_snapshot_uses_latest_and_live(monkeypatch: pytest.MonkeyPatch) -> None:
     ticker = "ABC.L"
     now = datetime.now(UTC)
-    last_trading_day = prices._nearest_weekday(date.today() - timedelta(days=1), forward=False)
+    last_trading_day = get_trading_calendar("L").roll(date.today() - timedelta(days=1), False)
     seven_day = last_trading_day - timedelta(days=7)
     thirty_day = last_trading_day - timedelta(days=30)
 
@@ -115,7 +116,7 @@ def test_get_price_snapshot_uses_latest_and_live(monkeypatch: pytest.MonkeyPatch
 def test_get_price_snapshot_handles_missing_live_fields(monkeypatch: pytest.MonkeyPatch) -> None:
     ticker_missing_price = "MNO.L"
     ticker_missing_ts = "PQR.L"
-    last_trading_day = prices._nearest_weekday(date.today() - timedelta(days=1), forward=False)
+    last_trading_day = get_trading_calendar("L").roll(date.today() - timedelta(days=1), False)
 
     monkeypatch.setattr(
         prices,
@@ -192,7 +193,7 @@ def test_get_price_snapshot_defaults_to_cached_close(monkeypatch: pytest.MonkeyP
 def test_get_price_snapshot_uses_prior_weekday_on_weekend(monkeypatch: pytest.MonkeyPatch) -> None:
     ticker = "WEEK.L"
     frozen_today = date(2024, 3, 24)  # Sunday
-    expected_last_trading_day = prices._nearest_weekday(frozen_today - timedelta(days=1), forward=False)
+    expected_last_trading_day = date(2024, 3, 22)
     expected_7d_anchor = expected_last_trading_day - timedelta(days=7)
     expected_30d_anchor = expected_last_trading_day - timedelta(days=30)
 
@@ -221,6 +222,29 @@ def test_get_price_snapshot_uses_prior_weekday_on_weekend(monkeypatch: pytest.Mo
     assert requested_dates == [expected_7d_anchor, expected_30d_anchor]
 
 
+def test_get_price_snapshot_rolls_over_the_holding_exchange_holidays(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frozen_today = date(2024, 5, 7)  # the day after the UK early May bank holiday
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls) -> date:
+            return frozen_today
+
+    exchanges = {"VOD.L": ("VOD", "L"), "AAPL.N": ("AAPL", "N")}
+    monkeypatch.setattr(prices, "date", FakeDate)
+    monkeypatch.setattr(prices, "_load_latest_prices", lambda tickers: dict.fromkeys(tickers, 10.0))
+    monkeypatch.setattr(prices, "load_live_prices", lambda tickers: {})
+    monkeypatch.setattr(prices.instrument_api, "_resolve_full_ticker", lambda t, _: exchanges[t])
+    monkeypatch.setattr(prices, "_close_on", lambda *args: 10.0)
+
+    snapshot = prices.get_price_snapshot(list(exchanges))
+
+    assert snapshot["VOD.L"]["last_price_date"] == "2024-05-03"
+    assert snapshot["AAPL.N"]["last_price_date"] == "2024-05-06"
+
+
 def test_load_latest_prices_defaults_to_l(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
     ticker = "AAA.L"
     frozen_today = date(2024, 3, 6)
@@ -369,6 +393,24 @@ def test_refresh_prices_writes_json_and_updates_cache(tmp_path, monkeypatch: pyt
     alerts_mock.assert_called_once_with()
 
 
+def test_refresh_prices_warms_cache_in_batches(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Online refreshes warm the meta cache with batched downloads before the snapshot."""
+    calls: List = []
+    monkeypatch.setattr(prices, "list_all_unique_tickers", lambda: ["VWRL.L", "AAA.L"])
+    monkeypatch.setattr(prices, "run_all_tickers", lambda t, **kw: calls.append(("warm", t, kw)))
+    monkeypatch.setattr(prices, "get_price_snapshot", lambda t: calls.append(("snapshot", t)) or {})
+    monkeypatch.setattr(prices, "refresh_snapshot_in_memory", Mock())
+    monkeypatch.setattr(prices, "check_price_alerts", Mock())
+    monkeypatch.setattr(prices.config, "prices_json", tmp_path / "prices.json")
+    monkeypatch.setattr(prices.config, "offline_mode", False)
+    monkeypatch.setattr(prices, "_price_cache", {})
+
+    prices.refresh_prices()
+
+    tickers = ["VWRL.L", "AAA.L"]
+    assert calls == [("warm", tickers, {"batch": True}), ("snapshot", tickers)]
+
+
 def test_refresh_prices_skips_write_when_all_prices_null(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Offline/no-data refresh must not overwrite a valid seed file with all-null prices."""
     seed = {"VWRL.L": {"last_price": 97.5, "price_currency": "GBP"}}
@@ -0,0 +1,62 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.common.rolling_risk import rolling_risk, window_sums
+
+
+def _returns(seed: int, n: int = 300) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(0.0004, 0.012, n)
+
+
+def test_window_sums_match_a_direct_sum():
+    values = np.arange(10, dtype=float)
+
+    assert window_sums(values, 3).tolist() == [3.0, 6.0, 9.0, 12.0, 15.0, 18.0, 21.0, 24.0]
+    assert window_sums(values, 11).size == 0
+
+
+def test_rolling_risk_matches_pandas_rolling_windows():
+    window, rf = 21, 0.03
+    port = _returns(1)
+    bench = 0.6 * port + _returns(2) * 0.5
+
+    metrics = rolling_risk(port, window, benchmark=bench, risk_free_rate=rf)
+
+    p, b = pd.Series(port), pd.Series(bench)
+    excess = p - rf / 252
+    std = p.rolling(window).std()
+    downside = np.sqrt((np.minimum(excess, 0.0) ** 2).rolling(window).mean())
+    expected = {
+        "volatility": std * math.sqrt(252),
+        "sharpe_ratio": excess.rolling(window).mean() / std * math.sqrt(252),
+        "sortino_ratio": excess.rolling(window).mean() / downside * math.sqrt(252),
+        "beta": p.rolling(window).cov(b) / b.rolling(window).var(),
+        "correlation": p.rolling(window).corr(b),
+    }
+    for key, series in expected.items():
+        assert len(metrics[key]) == len(port) - window + 1
+        np.testing.assert_allclose(metrics[key], series.to_numpy()[window - 1 :], rtol=1e-8, err_msg=key)
+
+
+def test_flat_windows_have_no_ratios():
+    port = np.concatenate([np.full(10, 0.001), _returns(3, 20)])
+
+    metrics = rolling_risk(port, 5)
+
+    assert metrics["volatility"][0] == 0.0
+    assert math.isnan(metrics["sharpe_ratio"][0])
+    # No return falls below the risk-free rate, so there is no downside deviation.
+    assert math.isnan(metrics["sortino_ratio"][0])
+    assert "beta" not in metrics
+
+
+def test_rolling_risk_validates_inputs():
+    with pytest.raises(ValueError):
+        rolling_risk(np.zeros(5), 1)
+    with pytest.raises(ValueError):
+        rolling_risk(np.zeros(5), 2, benchmark=np.zeros(4))
+    assert rolling_risk(np.zeros(3), 5, benchmark=np.zeros(3))["correlation"].size == 0
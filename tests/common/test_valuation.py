@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.common.valuation import PriceMatrix, close_column, history_records, performance_arrays
+
+
+def _d(*days):
+    return np.array(days, dtype="datetime64[D]")
+
+
+def test_close_column_drops_nans_and_keeps_last_duplicate():
+    df = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-03"]),
+            "Close": [3.0, 1.0, None, 4.0],
+        }
+    )
+
+    dates, closes = close_column(df)
+
+    assert dates.tolist() == _d("2024-01-01", "2024-01-03").tolist()
+    assert closes.tolist() == [1.0, 4.0]
+
+
+def test_price_matrix_forward_fills_gaps_and_zero_fills_leading_dates():
+    matrix = PriceMatrix.from_columns(
+        [
+            (_d("2024-01-01", "2024-01-04"), np.array([100.0, 104.0])),
+            (_d("2024-01-02", "2024-01-03", "2024-01-04"), np.array([50.0, 51.0, 52.0])),
+        ]
+    )
+
+    assert len(matrix.dates) == 4
+    assert matrix.values([10, 5]).tolist() == [1000.0, 1250.0, 1255.0, 1300.0]
+
+
+def test_price_matrix_limit_and_min_count():
+    matrix = PriceMatrix.from_columns(
+        [
+            (_d("2024-01-01", "2024-01-04"), np.array([1.0, 2.0])),
+            (_d("2024-01-02", "2024-01-03"), np.array([5.0, 6.0])),
+        ]
+    )
+
+    filled = matrix.forward_filled(limit=1)[:, 0]
+    assert filled[1] == 1.0
+    assert np.isnan(filled[2])
+    assert matrix.values([1.0, 0.0], limit=1).tolist() == [1.0, 1.0, 0.0, 2.0]
+    values = matrix.values([1.0, 1.0], limit=1, min_count=1)
+    assert values.tolist() == [1.0, 6.0, 6.0, 8.0]
+
+
+def test_performance_arrays_match_pandas():
+    values = np.array([100.0, 110.0, 99.0, 120.0, 90.0, 95.0, 130.0])
+    s = pd.Series(values)
+
+    perf = performance_arrays(values)
+
+    np.testing.assert_allclose(perf["daily_return"], s.pct_change())
+    np.testing.assert_allclose(perf["weekly_return"], s.pct_change(5))
+    np.testing.assert_allclose(perf["running_max"], s.cummax())
+    np.testing.assert_allclose(perf["drawdown"], s / s.cummax() - 1)
+
+
+def test_history_records_serialise_missing_returns_as_none():
+    perf = performance_arrays(np.array([100.0, 101.234]))
+
+    rows = history_records(_d("2024-01-01", "2024-01-02"), perf)
+
+    assert rows[0]["date"] == "2024-01-01"
+    assert rows[0]["daily_return"] is None
+    assert rows[1]["value"] == 101.23
+    assert rows[1]["daily_return"] == pytest.approx(0.01234)
+
+
+def test_flows_value_the_unit_changes_and_returns_are_net_of_them():
+    dates = _d("2024-01-01", "2024-01-02", "2024-01-03")
+    matrix = PriceMatrix.from_columns([(dates, np.array([10.0, 10.0, 11.0]))])
+    units = np.array([[10.0], [15.0], [15.0]])
+
+    values = matrix.values(units)
+    flows = matrix.flows(units)
+    perf = performance_arrays(values, flows)
+
+    assert values.tolist() == [100.0, 150.0, 165.0]
+    assert flows.tolist() == [0.0, 50.0, 0.0]
+    np.testing.assert_allclose(perf["daily_return"], [np.nan, 0.0, 0.1])
+    np.testing.assert_allclose(perf["cumulative_return"], [0.0, 0.0, 0.1])
+    np.testing.assert_allclose(perf["drawdown"], [0.0, 0.0, 0.0])
+    assert matrix.flows([15.0]).tolist() == [0.0, 0.0, 0.0]
@@ -0,0 +1,43 @@
+from datetime import date
+
+import pytest
+
+from backend.common.xirr import xirr, xirr_many, year_fractions
+
+EXCEL_DATES = [date(2008, 1, 1), date(2008, 3, 1), date(2008, 10, 30), date(2009, 2, 15), date(2009, 4, 1)]
+EXCEL_AMOUNTS = [-10000.0, 2750.0, 4250.0, 3250.0, 2750.0]
+
+
+def test_year_fractions_are_actual_over_365():
+    assert year_fractions([date(2024, 1, 1), date(2025, 1, 1)]).tolist() == pytest.approx([0.0, 366 / 365])
+
+
+def test_xirr_matches_spreadsheet_reference():
+    assert xirr(EXCEL_DATES, EXCEL_AMOUNTS) == pytest.approx(0.373362535, abs=1e-6)
+
+
+def test_xirr_converges_where_newton_from_the_guess_diverges():
+    # A near-total loss: the root sits close to -100%, far from the 10% guess.
+    assert xirr([date(2024, 1, 1), date(2025, 1, 1)], [-1000.0, 10.0]) == pytest.approx(
+        0.01 ** (365 / 366) - 1, abs=1e-6
+    )
+    # A huge gain: the root is far above any Newton step from 10%.
+    rate = xirr([date(2024, 1, 1), date(2024, 6, 1)], [-1000.0, 1e6])
+    assert rate == pytest.approx(1000 ** (365 / 152) - 1, rel=1e-6)
+
+
+def test_xirr_many_solves_each_set_and_flags_unsolvable_ones():
+    sets = [
+        (EXCEL_DATES, EXCEL_AMOUNTS),
+        ([date(2024, 1, 1)], [5.0]),
+        ([date(2024, 1, 1), date(2025, 1, 1)], [100.0, 50.0]),
+        ([], []),
+        ([date(2024, 1, 1), date(2024, 7, 1), date(2025, 1, 1)], [-100.0, 0.0, 100.0]),
+    ]
+
+    rates = xirr_many(sets)
+
+    assert rates[0] == pytest.approx(0.373362535, abs=1e-6)
+    assert rates[1:4] == [None, None, None]
+    assert rates[4] == pytest.approx(0.0, abs=1e-9)
+    assert xirr_many([]) == []
@@ -1,7 +1,10 @@
 import asyncio
+import atexit
 import inspect
 import os
 import shutil
+import sys
+import tempfile
 from pathlib import Path
 
 try:
@@ -17,6 +20,11 @@ import pytest
 
 os.environ.setdefault("TESTING", "1")
 os.environ.setdefault("DATA_ROOT", str(Path(__file__).resolve().parent.parent / "data"))
+# Series the app caches while tests run (e.g. the startup price priming) go
+# to a throwaway directory instead of the working tree.
+if "TIMESERIES_CACHE_BASE" not in os.environ:
+    os.environ["TIMESERIES_CACHE_BASE"] = tempfile.mkdtemp(prefix="allotmint-timeseries-")
+    atexit.register(shutil.rmtree, os.environ["TIMESERIES_CACHE_BASE"], True)
 
 from backend import app as app_module
 from backend import auth as auth_module
@@ -98,6 +106,58 @@ def isolate_prices_json(tmp_path_factory):
     yield tmp_prices_json
 
 
+@pytest.fixture(autouse=True)
+def isolate_rate_limits(monkeypatch, tmp_path):
+    """Give each test its own provider rate-limit store, with no limits set.
+
+    The buckets in :mod:`backend.utils.rate_limiter` are shared through a
+    SQLite file, so without this one test's fetches (or a developer's local
+    server) could exhaust the Stooq budget for the next test. Tests that
+    exercise a limit configure ``<provider>_requests_per_minute`` themselves.
+    """
+    monkeypatch.setattr(config, "rate_limit_db_path", str(tmp_path / "rate_limits.sqlite3"), raising=False)
+    for provider in ("stooq", "yahoo", "alpha_vantage"):
+        monkeypatch.setattr(config, f"{provider}_requests_per_minute", None, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_provider_health():
+    """Start each test with closed breakers and the default provider order."""
+    from backend.timeseries.provider_health import PROVIDER_HEALTH
+
+    PROVIDER_HEALTH.reset()
+    yield
+    PROVIDER_HEALTH.reset()
+
+
+@pytest.fixture(autouse=True)
+def restore_timeseries_cache_module():
+    """Put the shared ``backend.timeseries.cache`` back after tests that re-import it.
+
+    Several tests pop the module and import a fresh copy under their own cache
+    base; modules that import it lazily (the price panel) would otherwise keep
+    using that copy in later tests.
+    """
+    import backend.timeseries as timeseries_pkg
+    from backend.timeseries import cache
+
+    yield
+    sys.modules["backend.timeseries.cache"] = cache
+    timeseries_pkg.cache = cache
+
+
+@pytest.fixture(autouse=True)
+def reset_analytics_contexts():
+    """Drop shared performance contexts and benchmark returns so one test's data never leaks into the next."""
+    from backend.common.portfolio_utils import clear_analytics_contexts, clear_benchmark_returns
+
+    clear_analytics_contexts()
+    clear_benchmark_returns()
+    yield
+    clear_analytics_contexts()
+    clear_benchmark_returns()
+
+
 @pytest.fixture(autouse=True)
 def mock_google_verify(monkeypatch, request):
     """Stub Google ID token verification for tests.
@@ -309,6 +309,33 @@ def test_dedupe_series_direct_endpoint(monkeypatch, client, tmp_path):
     assert audit[0]["after"] == {"rows": 2}
 
 
+def test_dedupe_clears_materialised_performance_histories(monkeypatch, client, tmp_path):
+    pytest.importorskip("pyarrow")
+    import numpy as np
+
+    from backend.common import performance_history
+    from backend.common.performance_history import StoredHistory
+
+    df = pd.DataFrame({"Date": ["2026-01-01", "2026-01-01", "2026-01-02"], "Close": [1.0, 2.0, 3.0]})
+    cache_path = tmp_path / "ABC_L.parquet"
+    df.to_parquet(cache_path, index=False)
+
+    import backend.routes.data_quality_admin as admin_module
+
+    monkeypatch.setattr(admin_module, "meta_timeseries_cache_path", lambda t, e: str(cache_path))
+    monkeypatch.setattr(admin_module, "load_cached_meta_timeseries_full", lambda t, e: df.copy())
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path / "ts"))
+    monkeypatch.setattr(config, "performance_history_days", 30, raising=False)
+    dates = pd.to_datetime(["2026-01-02"]).to_numpy(dtype="datetime64[D]")
+    performance_history.save("demo", "sig", StoredHistory(dates, np.array([3.0]), dates[0].astype(object)))
+    assert performance_history.load("demo", "sig") is not None
+
+    resp = client.post("/data-quality/series/ABC/L/dedupe")
+
+    assert resp.status_code == 200
+    assert performance_history.load("demo", "sig") is None
+
+
 def test_audit_undo_wrong_exchange(client, tmp_path):
     issues = client.get("/data-quality/issues").json()["issues"]
     wrong = next(i for i in issues if i["type"] == "WRONG_EXCHANGE")
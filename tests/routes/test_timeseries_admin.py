@@ -332,3 +332,24 @@ def test_refetch_and_rebuild(monkeypatch, tmp_path):
         assert not cache_path.exists()
 
     asyncio.run(run())
+
+
+def test_cache_stats_and_compact_endpoints(monkeypatch):
+    monkeypatch.setattr(timeseries_admin, "meta_cache_stats", lambda: {"hits": 3, "misses": 1})
+    monkeypatch.setattr(
+        timeseries_admin,
+        "compact_cached_meta_timeseries",
+        lambda: {"tickers": 2, "segments": 5},
+    )
+    monkeypatch.setattr(timeseries_admin, "rebuild_meta_cache_manifest", lambda: 7)
+
+    async def run():
+        assert await timeseries_admin.timeseries_cache_stats() == {"hits": 3, "misses": 1}
+        assert await timeseries_admin.compact_timeseries_cache() == {
+            "status": "ok",
+            "tickers": 2,
+            "segments": 5,
+        }
+        assert await timeseries_admin.rebuild_timeseries_manifest() == {"status": "ok", "series": 7}
+
+    asyncio.run(run())
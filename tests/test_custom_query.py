@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 
 import pytest
@@ -9,12 +10,14 @@ from backend.routes.query import Metric
 
 
 @pytest.fixture
-def client():
+def client(tmp_path):
     orig_root = config.data_root
     orig_cache_base = ts_cache._CACHE_BASE
     test_data_root = Path(__file__).resolve().parent / "data"
     config.data_root = test_data_root
-    ts_cache._CACHE_BASE = str(test_data_root / "timeseries")
+    # Work on a copy: loads extend cached series (e.g. CASH.GBP) in place.
+    shutil.copytree(test_data_root / "timeseries", tmp_path / "timeseries")
+    ts_cache._CACHE_BASE = str(tmp_path / "timeseries")
     from backend.app import create_app
 
     client = TestClient(create_app())
@@ -177,7 +177,7 @@ def test_memoized_range_returns_copy(monkeypatch):
 
     monkeypatch.setattr(cache, "load_meta_timeseries", fake_load_meta_timeseries)
     monkeypatch.setattr(cache, "OFFLINE_MODE", False)
-    cache._memoized_range_cached.cache_clear()
+    cache.clear_meta_caches()
 
     first = cache._memoized_range("T", "L", start.isoformat(), end.isoformat())
     first.loc[0, "Close"] = 999
@@ -200,7 +200,7 @@ def test_memoized_range_offline_no_cache_returns_empty(monkeypatch):
     monkeypatch.setattr(cache, "load_meta_timeseries", fake_load_meta_timeseries)
     monkeypatch.setattr(cache, "_load_parquet", lambda path: cache._empty_ts())
     monkeypatch.setattr(cache, "OFFLINE_MODE", True)
-    cache._memoized_range_cached.cache_clear()
+    cache.clear_meta_caches()
 
     df = cache._memoized_range("T", "L", start.isoformat(), end.isoformat())
     assert df.empty
@@ -251,8 +251,7 @@ def test_offline_falls_back_to_live_loader(tmp_path, monkeypatch):
     monkeypatch.setattr(cache, "_CACHE_BASE", str(tmp_path))
     monkeypatch.setattr(cache, "fetch_meta_timeseries", fake_fetch_meta_timeseries)
     monkeypatch.setattr(cache, "get_instrument_meta", lambda t: {"currency": "GBP"})
-    cache._memoized_range_cached.cache_clear()
-    cache._load_meta_timeseries_cached.cache_clear()
+    cache.clear_meta_caches()
 
     df = cache.load_meta_timeseries_range("T", "L", start, end)
     assert list(df["Close"].astype(float)) == [1.0, 2.0]
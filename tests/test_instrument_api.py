@@ -129,6 +129,36 @@ def test_top_movers_includes_instrument_type(monkeypatch):
     assert [r["instrument_type"] for r in res["losers"]] == ["etf"]
 
 
+def test_top_movers_reads_panel_closes_and_loads_the_rest_per_ticker(monkeypatch):
+    _fixed_today(monkeypatch)
+    monkeypatch.setattr(ia, "_resolve_full_ticker", lambda t, latest: (t, "L"))
+    panel = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(["2022-12-30", "2023-01-06"]),
+            "Close": [200.0, 220.0],
+            "Close_gbp": [100.0, 110.0],
+        }
+    )
+    requested = []
+
+    def fake_panel(pairs, start, end):
+        requested.append((pairs, start, end))
+        return {("AAA", "L"): panel}
+
+    monkeypatch.setattr(ia, "load_panel_ranges", fake_panel)
+    monkeypatch.setattr(ia, "price_change_pct", lambda t, d: {"BBB": -2.0}[t])
+    monkeypatch.setattr(ia, "_close_on", lambda sym, ex, d: 50.0)
+    monkeypatch.setattr(ia, "get_security_meta", lambda t: {})
+
+    res = ia.top_movers(["AAA", "BBB"], 7)
+
+    assert requested == [([("AAA", "L"), ("BBB", "L")], dt.date(2022, 12, 26), dt.date(2023, 1, 8))]
+    assert [(r["ticker"], r["change_pct"], r["last_price_gbp"]) for r in res["gainers"]] == [
+        ("AAA.L", pytest.approx(10.0), 110.0)
+    ]
+    assert [(r["ticker"], r["last_price_gbp"]) for r in res["losers"]] == [("BBB.L", 50.0)]
+
+
 def test_intraday_timeseries_success(monkeypatch):
     fixed_now = dt.datetime(2024, 1, 2, 12, 0)
 
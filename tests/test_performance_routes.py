@@ -173,6 +173,80 @@ def test_performance_summary_not_found(client, monkeypatch):
     assert resp.json()["detail"] == "Owner not found"
 
 
+def test_owner_metric_summary_returns_every_metric(client, monkeypatch):
+    summary = {
+        "alpha_vs_benchmark": 0.03,
+        "tracking_error": 0.13,
+        "max_drawdown": -0.25,
+        "time_weighted_return": 0.15,
+        "xirr": None,
+        "cagr": 0.12,
+    }
+
+    def fake(owner, benchmark, days, **kwargs):
+        assert (owner, benchmark, days) == ("alice", "VWRL.L", 365)
+        assert kwargs == {"pricing_date": None}
+        return summary
+
+    monkeypatch.setattr(portfolio_utils, "compute_performance_summary", fake)
+    resp = client.get("/performance/alice/summary")
+    assert resp.status_code == 200
+    assert resp.json() == {"owner": "alice", "benchmark": "VWRL.L", **summary}
+
+
+def test_owner_metric_summary_not_found(client, monkeypatch):
+    def fake(*args, **kwargs):
+        raise FileNotFoundError
+
+    monkeypatch.setattr(portfolio_utils, "compute_performance_summary", fake)
+    resp = client.get("/performance/missing/summary")
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "Owner not found"
+
+
+def test_group_xirr_returns_every_member(client, monkeypatch):
+    def fake(slug, days):
+        assert (slug, days) == ("test-group", 365)
+        return {"alice": 0.1, "bob": None}
+
+    monkeypatch.setattr(portfolio_utils, "compute_group_xirr", fake)
+    resp = client.get("/performance-group/test-group/xirr")
+    assert resp.status_code == 200
+    assert resp.json() == {"group": "test-group", "xirr": {"alice": 0.1, "bob": None}}
+
+    def unknown(slug, days):
+        raise ValueError(slug)
+
+    monkeypatch.setattr(portfolio_utils, "compute_group_xirr", unknown)
+    assert client.get("/performance-group/missing/xirr").status_code == 404
+
+
+def test_rolling_risk_routes(client, monkeypatch):
+    result = {"window": 21, "series": [{"date": "2024-02-01", "volatility": 0.1, "beta": None}]}
+
+    def fake_owner(owner, benchmark, window, days, **kwargs):
+        assert (owner, benchmark, window, days) == ("alice", "VWRL.L", 21, 365)
+        assert kwargs == {"pricing_date": None}
+        return result
+
+    def fake_group(slug, benchmark, window, days):
+        if slug == "missing":
+            raise ValueError(slug)
+        return result
+
+    monkeypatch.setattr(portfolio_utils, "compute_rolling_risk", fake_owner)
+    monkeypatch.setattr(portfolio_utils, "compute_group_rolling_risk", fake_group)
+
+    resp = client.get("/performance/alice/rolling-risk?window=21")
+    assert resp.status_code == 200
+    assert resp.json() == {"owner": "alice", "benchmark": "VWRL.L", **result}
+
+    resp = client.get("/performance-group/test-group/rolling-risk?window=21")
+    assert resp.json() == {"group": "test-group", "benchmark": "VWRL.L", **result}
+    assert client.get("/performance-group/missing/rolling-risk").status_code == 404
+    assert client.get("/performance/alice/rolling-risk?window=1").status_code == 400
+
+
 def test_returns_compare_success(client, monkeypatch):
     def fake_cagr(owner, days):
         assert owner == "alice"
@@ -212,7 +286,7 @@ def test_group_alpha_handles_near_zero_benchmark(client, monkeypatch):
         assert days == 365
         return port_series
 
-    def fake_load_meta_timeseries(ticker, exchange, days):
+    def fake_load_meta_timeseries(ticker, exchange, days, readonly=False):
         return pd.DataFrame(
             {
                 "Date": pd.to_datetime(["2024-01-01", "2024-01-02"]),
@@ -1,11 +1,13 @@
 import datetime as dt
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from backend.common import instrument_api
 from backend.common import portfolio_utils as pu
+from backend.utils.pricing_dates import PricingDateCalculator
 
 
 @pytest.fixture
@@ -226,7 +228,42 @@ def test_portfolio_value_breakdown_invalid_date(monkeypatch):
     assert called is False
 
 
-def test_compute_owner_performance_respects_flagged_and_cash(monkeypatch):
+@pytest.fixture
+def owner_prices(monkeypatch):
+    """Serve ``compute_owner_performance`` a fixed portfolio and price history.
+
+    Returns ``install(portfolio, frames, snapshot=None)``; ``frames`` maps
+    ``(ticker, exchange)`` to the frame ``load_meta_timeseries`` returns. The
+    reporting date is pinned to 2024-01-09.
+    """
+
+    def install(portfolio, frames, snapshot=None):
+        monkeypatch.setattr(
+            pu,
+            "PricingDateCalculator",
+            lambda **kwargs: PricingDateCalculator(today=dt.date(2024, 1, 10), **kwargs),
+        )
+        monkeypatch.setattr(
+            pu.portfolio_mod,
+            "build_owner_portfolio",
+            lambda owner, *, pricing_date=None, **_: portfolio,
+        )
+        monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", snapshot or {}, raising=False)
+        monkeypatch.setattr(
+            instrument_api,
+            "_resolve_full_ticker",
+            lambda ticker, _snapshot: tuple(ticker.split(".", 1)) if "." in ticker else (ticker, None),
+        )
+        monkeypatch.setattr(
+            pu,
+            "load_meta_timeseries",
+            lambda ticker, exchange, days, readonly=False: frames.get((ticker, exchange), pd.DataFrame()).copy(),
+        )
+
+    return install
+
+
+def test_compute_owner_performance_respects_flagged_and_cash(owner_prices):
     portfolio = {
         "accounts": [
             {
@@ -239,39 +276,19 @@ def test_compute_owner_performance_respects_flagged_and_cash(monkeypatch):
         ]
     }
 
-    monkeypatch.setattr(
-        pu.portfolio_mod,
-        "build_owner_portfolio",
-        lambda owner, *, pricing_date=None, **_: portfolio,
-    )
-    monkeypatch.setattr(
-        pu,
-        "_PRICE_SNAPSHOT",
-        {
-            "FLAG.L": {"flagged": True},
-            "NORM.L": {"flagged": False},
-            "CASH.GBP": {"flagged": False},
-        },
-        raising=False,
-    )
-
-    monkeypatch.setattr(
-        instrument_api,
-        "_resolve_full_ticker",
-        lambda ticker, snapshot: tuple(ticker.split(".", 1)) if "." in ticker else (ticker, None),
-    )
-
     dates = pd.date_range("2024-01-01", periods=2, freq="D")
     frames = {
         ("FLAG", "L"): pd.DataFrame({"Date": dates, "Close": [5.0, 6.0]}),
         ("NORM", "L"): pd.DataFrame({"Date": dates, "Close": [10.0, 11.0]}),
         ("CASH", "GBP"): pd.DataFrame({"Date": dates, "Close": [0.01, 0.01]}),
     }
+    snapshot = {
+        "FLAG.L": {"flagged": True},
+        "NORM.L": {"flagged": False},
+        "CASH.GBP": {"flagged": False},
+    }
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
-        return frames.get((ticker, exchange), pd.DataFrame()).copy()
-
-    monkeypatch.setattr(pu, "load_meta_timeseries", fake_load_meta_timeseries)
+    owner_prices(portfolio, frames, snapshot)
 
     excluded = pu.compute_owner_performance("owner", days=10, include_flagged=False, include_cash=False)
     included_flagged = pu.compute_owner_performance("owner", days=10, include_flagged=True, include_cash=False)
@@ -288,7 +305,7 @@ def test_compute_owner_performance_respects_flagged_and_cash(monkeypatch):
         date.fromisoformat(payload["previous_date"])
 
 
-def test_compute_owner_performance_forward_fills_exchange_holiday(monkeypatch):
+def test_compute_owner_performance_forward_fills_exchange_holiday(owner_prices):
     """Regression test for #6857: a single-exchange holiday (e.g. a UK bank
     holiday closing an LSE-listed holding while a NYSE-listed holding in the
     same portfolio keeps trading) must not be treated as the closed holding
@@ -306,18 +323,6 @@ def test_compute_owner_performance_forward_fills_exchange_holiday(monkeypatch):
         ]
     }
 
-    monkeypatch.setattr(
-        pu.portfolio_mod,
-        "build_owner_portfolio",
-        lambda owner, *, pricing_date=None, **_: portfolio,
-    )
-    monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
-    monkeypatch.setattr(
-        instrument_api,
-        "_resolve_full_ticker",
-        lambda ticker, snapshot: tuple(ticker.split(".", 1)) if "." in ticker else (ticker, None),
-    )
-
     all_dates = pd.date_range("2024-01-01", periods=3, freq="D")  # Mon, Tue, Wed
     # LSE.L has no row for the middle date (bank holiday); NYSE.N trades every day.
     lse_dates = pd.DatetimeIndex([all_dates[0], all_dates[2]])
@@ -326,11 +331,7 @@ def test_compute_owner_performance_forward_fills_exchange_holiday(monkeypatch):
         ("NYSE", "N"): pd.DataFrame({"Date": all_dates, "Close": [50.0, 51.0, 52.0]}),
     }
 
-    monkeypatch.setattr(
-        pu,
-        "load_meta_timeseries",
-        lambda ticker, exchange, days: frames.get((ticker, exchange), pd.DataFrame()).copy(),
-    )
+    owner_prices(portfolio, frames)
 
     result = pu.compute_owner_performance("owner", days=10)
 
@@ -348,7 +349,7 @@ def test_compute_owner_performance_forward_fills_exchange_holiday(monkeypatch):
     assert values[0] < values[1] < values[2]
 
 
-def test_compute_owner_performance_forward_fills_multi_day_gap(monkeypatch):
+def test_compute_owner_performance_forward_fills_multi_day_gap(owner_prices):
     """Regression test for #6857: multi-day gaps (e.g. a Christmas/New Year
     week where one exchange is shut for several consecutive days) must also
     forward-fill correctly, not just single-day gaps.
@@ -364,18 +365,6 @@ def test_compute_owner_performance_forward_fills_multi_day_gap(monkeypatch):
         ]
     }
 
-    monkeypatch.setattr(
-        pu.portfolio_mod,
-        "build_owner_portfolio",
-        lambda owner, *, pricing_date=None, **_: portfolio,
-    )
-    monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
-    monkeypatch.setattr(
-        instrument_api,
-        "_resolve_full_ticker",
-        lambda ticker, snapshot: tuple(ticker.split(".", 1)) if "." in ticker else (ticker, None),
-    )
-
     all_dates = pd.date_range("2024-01-01", periods=4, freq="D")  # Mon-Thu
     # LSE.L is shut for the middle two days (e.g. a holiday week); NYSE.N trades every day.
     lse_dates = pd.DatetimeIndex([all_dates[0], all_dates[3]])
@@ -384,11 +373,7 @@ def test_compute_owner_performance_forward_fills_multi_day_gap(monkeypatch):
         ("NYSE", "N"): pd.DataFrame({"Date": all_dates, "Close": [50.0, 51.0, 52.0, 53.0]}),
     }
 
-    monkeypatch.setattr(
-        pu,
-        "load_meta_timeseries",
-        lambda ticker, exchange, days: frames.get((ticker, exchange), pd.DataFrame()).copy(),
-    )
+    owner_prices(portfolio, frames)
 
     result = pu.compute_owner_performance("owner", days=10)
 
@@ -409,7 +394,41 @@ def test_compute_owner_performance_forward_fills_multi_day_gap(monkeypatch):
     )
 
 
-def test_compute_owner_performance_leading_gap_contributes_zero(monkeypatch):
+def test_compute_owner_performance_days_is_the_same_calendar_window_when_materialised(
+    monkeypatch, tmp_path, owner_prices
+):
+    """``days`` covers the same calendar days whether or not the history is materialised."""
+    portfolio = {"accounts": [{"holdings": [{"ticker": "NYSE.N", "units": 5}]}]}
+    dates = pd.date_range("2023-10-02", "2024-01-09", freq="B")
+    frame = pd.DataFrame({"Date": dates, "Close": 50.0 + np.arange(len(dates))})
+    owner_prices(portfolio, {})
+    loads = []
+
+    def load(ticker, exchange, days, readonly=False):
+        loads.append(days)
+        return frame[frame["Date"] >= pd.Timestamp(dt.date(2024, 1, 9) - timedelta(days=days))].copy()
+
+    monkeypatch.setattr(pu, "load_meta_timeseries", load)
+    monkeypatch.setattr(pu, "load_panel_ranges", lambda *args, **kwargs: {})
+
+    direct = pu.compute_owner_performance("owner", days=30)
+
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path / "ts"))
+    monkeypatch.setattr(pu.config, "performance_history_days", 60, raising=False)
+    monkeypatch.setattr(pu.config, "accounts_root", tmp_path / "accounts")
+    (tmp_path / "accounts" / "owner").mkdir(parents=True)
+    miss = pu.compute_owner_performance("owner", days=30)
+    hit = pu.compute_owner_performance("owner", days=30)
+
+    assert loads == [30, 60]
+    expected = [d.date().isoformat() for d in dates if d.date() >= dt.date(2023, 12, 10)]
+    assert len(expected) == 22
+    for result in (direct, miss, hit):
+        assert [row["date"] for row in result["history"]] == expected
+        assert [row["value"] for row in result["history"]] == [row["value"] for row in direct["history"]]
+
+
+def test_compute_owner_performance_leading_gap_contributes_zero(owner_prices):
     """Regression test for #6857: a ticker with no price history yet at the
     start of the requested window should contribute 0 for those dates, not
     NaN (and not be forward-filled from nothing).
@@ -425,18 +444,6 @@ def test_compute_owner_performance_leading_gap_contributes_zero(monkeypatch):
         ]
     }
 
-    monkeypatch.setattr(
-        pu.portfolio_mod,
-        "build_owner_portfolio",
-        lambda owner, *, pricing_date=None, **_: portfolio,
-    )
-    monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
-    monkeypatch.setattr(
-        instrument_api,
-        "_resolve_full_ticker",
-        lambda ticker, snapshot: tuple(ticker.split(".", 1)) if "." in ticker else (ticker, None),
-    )
-
     all_dates = pd.date_range("2024-01-01", periods=3, freq="D")  # Mon, Tue, Wed
     new_dates = pd.DatetimeIndex([all_dates[2]])  # NEW.L only starts trading on day 3
     frames = {
@@ -444,11 +451,7 @@ def test_compute_owner_performance_leading_gap_contributes_zero(monkeypatch):
         ("NEW", "L"): pd.DataFrame({"Date": new_dates, "Close": [20.0]}),
     }
 
-    monkeypatch.setattr(
-        pu,
-        "load_meta_timeseries",
-        lambda ticker, exchange, days: frames.get((ticker, exchange), pd.DataFrame()).copy(),
-    )
+    owner_prices(portfolio, frames)
 
     result = pu.compute_owner_performance("owner", days=10)
 
@@ -464,7 +467,70 @@ def test_compute_owner_performance_leading_gap_contributes_zero(monkeypatch):
     assert all(v == v for v in values)  # no NaNs leaked through
 
 
-def test_compute_owner_performance_filters_single_day_zero(monkeypatch):
+def test_compute_owner_performance_uses_units_held_on_each_date(monkeypatch, owner_prices):
+    from backend.common.position_timeline import PositionTimeline
+
+    portfolio = {
+        "accounts": [
+            {
+                "account_type": "ISA",
+                "holdings": [{"ticker": "ABC.L", "units": 15}, {"ticker": "OLD.L", "units": 4}],
+            }
+        ]
+    }
+    # ABC.L: 10 units bought before the window, 5 more on day 2 -- reconciles
+    # with the 15 held now. OLD.L's log says 1 unit, the holdings file says 4,
+    # so it falls back to the current units on every date.
+    timeline = PositionTimeline.from_transactions(
+        {
+            "transactions": [
+                {"type": "BUY", "ticker": "ABC.L", "units": 10, "date": "2023-12-01"},
+                {"type": "BUY", "ticker": "ABC.L", "units": 5, "date": "2024-01-02"},
+                {"type": "BUY", "ticker": "OLD.L", "units": 1, "date": "2023-12-01"},
+            ]
+        }
+    )
+    monkeypatch.setattr(pu, "owner_timelines", lambda owner: {"isa": timeline})
+
+    dates = pd.date_range("2024-01-01", periods=3, freq="D")
+    frames = {
+        ("ABC", "L"): pd.DataFrame({"Date": dates, "Close": [10.0, 10.0, 10.0]}),
+        ("OLD", "L"): pd.DataFrame({"Date": dates, "Close": [1.0, 1.0, 1.0]}),
+    }
+    owner_prices(portfolio, frames)
+
+    result = pu.compute_owner_performance("owner", days=10)
+
+    history = result["history"]
+    assert [row["value"] for row in history] == [104.0, 154.0, 154.0]
+    # Prices are flat: buying 5 more ABC.L is not a return.
+    assert [row["daily_return"] for row in history] == [None, 0.0, 0.0]
+    assert [row["cumulative_return"] for row in history] == [0.0, 0.0, 0.0]
+    assert result["max_drawdown"] == 0.0
+
+
+def test_units_on_dates_ignores_rows_that_net_to_zero(monkeypatch):
+    from backend.common.position_timeline import PositionTimeline
+
+    timeline = PositionTimeline.from_transactions(
+        {
+            "transactions": [
+                {"type": "BUY", "ticker": "ABC.L", "units": 5, "date": "2023-12-01"},
+                {"type": "SELL", "ticker": "ABC.L", "units": 5, "date": "2023-12-02"},
+            ]
+        }
+    )
+    monkeypatch.setattr(pu, "owner_timelines", lambda owner: {"isa": timeline})
+    dates = np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]")
+
+    positions = [(5.0, "isa", "ABC.L"), (-5.0, "isa", "ABC.L")]
+
+    units = pu._units_on_dates("owner", dates, positions, dt.date(2024, 1, 2))
+
+    assert units.tolist() == [[5.0, -5.0], [5.0, -5.0]]
+
+
+def test_compute_owner_performance_filters_single_day_zero(monkeypatch, owner_prices):
     pytest.importorskip("allotmint_pro")
     portfolio = {"accounts": [{"holdings": [{"ticker": "ERR.L", "units": 10}]}]}
 
@@ -475,29 +541,12 @@ def test_compute_owner_performance_filters_single_day_zero(monkeypatch):
 
     monkeypatch.setattr(pu, "PricingDateCalculator", fake_calc)
 
-    monkeypatch.setattr(
-        pu.portfolio_mod,
-        "build_owner_portfolio",
-        lambda owner, *, pricing_date=None, **_: portfolio,
-    )
-
-    monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
-
-    monkeypatch.setattr(
-        instrument_api,
-        "_resolve_full_ticker",
-        lambda ticker, snapshot: tuple(ticker.split(".", 1)) if "." in ticker else (ticker, None),
-    )
-
     dates = pd.date_range("2024-01-01", periods=3, freq="D")
     frames = {
         ("ERR", "L"): pd.DataFrame({"Date": dates, "Close": [100.0, 0.0, 102.0]}),
     }
 
-    def fake_load_meta_timeseries(ticker: str, exchange: str, days: int) -> pd.DataFrame:
-        return frames.get((ticker, exchange), pd.DataFrame()).copy()
-
-    monkeypatch.setattr(pu, "load_meta_timeseries", fake_load_meta_timeseries)
+    owner_prices(portfolio, frames)
 
     result = pu.compute_owner_performance("owner", days=10)
 
@@ -518,32 +567,16 @@ def test_compute_owner_performance_filters_single_day_zero(monkeypatch):
     ]
 
 
-def test_compute_owner_performance_drops_partial_close_nans(monkeypatch):
+def test_compute_owner_performance_drops_partial_close_nans(owner_prices):
     pytest.importorskip("allotmint_pro")
     portfolio = {"accounts": [{"holdings": [{"ticker": "NAN.L", "units": 2}, {"ticker": "CASH.GBP", "units": 1}]}]}
-    monkeypatch.setattr(
-        pu.portfolio_mod,
-        "build_owner_portfolio",
-        lambda owner, *, pricing_date=None, **_: portfolio,
-    )
-    monkeypatch.setattr(pu, "_PRICE_SNAPSHOT", {}, raising=False)
-    monkeypatch.setattr(
-        instrument_api,
-        "_resolve_full_ticker",
-        lambda ticker, snapshot: tuple(ticker.split(".", 1)) if "." in ticker else (ticker, None),
-    )
-
     dates = pd.date_range("2024-01-01", periods=3, freq="D")
     frames = {
         ("NAN", "L"): pd.DataFrame({"Date": dates, "Close": [10.0, float("nan"), 11.0]}),
         ("CASH", "GBP"): pd.DataFrame({"Date": dates, "Close": [0.01, 99.0, 1.0]}),
     }
 
-    monkeypatch.setattr(
-        pu,
-        "load_meta_timeseries",
-        lambda ticker, exchange, days: frames[(ticker, exchange)].copy(),
-    )
+    owner_prices(portfolio, frames)
 
     result = pu.compute_owner_performance("owner", days=10, include_cash=True)
 
@@ -560,3 +593,29 @@ def test_cash_flow_signs_treat_dividend_singular_same_as_plural():
 
     assert "DIVIDEND" in pu._CASH_FLOW_SIGNS
     assert pu._CASH_FLOW_SIGNS["DIVIDEND"] == pu._CASH_FLOW_SIGNS["DIVIDENDS"]
+
+
+def test_compute_xirr_many_matches_single_owner_results(monkeypatch, one_year_series):
+    monkeypatch.setattr(pu.config, "accounts_root", None)
+    series = {"alice": one_year_series, "bob": one_year_series * 2, "carol": pd.Series(dtype=float)}
+    transactions = {
+        "alice": [{"date": "2024-01-01", "type": "DEPOSIT", "amount_minor": 100000}],
+        "bob": [{"date": "2024-01-01", "type": "DEPOSIT", "amount_minor": 150000}],
+        "carol": [],
+    }
+
+    def fake_series(owner, days=365, *, pricing_date=None, **_):
+        if owner not in series:
+            raise FileNotFoundError(owner)
+        return series[owner]
+
+    monkeypatch.setattr(pu, "_portfolio_value_series", fake_series)
+    monkeypatch.setattr(pu, "load_transactions", lambda owner, *, scaffold_missing=False: transactions[owner])
+
+    rates = pu.compute_xirr_many(["alice", "bob", "carol", "missing"])
+
+    assert list(rates) == ["alice", "bob", "carol", "missing"]
+    assert rates["alice"] == pytest.approx(pu.compute_xirr("alice"))
+    assert rates["bob"] == pytest.approx((2200 / 1500) ** (365 / 366) - 1, abs=1e-6)
+    assert rates["carol"] is None
+    assert rates["missing"] is None
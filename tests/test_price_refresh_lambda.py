@@ -19,6 +19,7 @@ def _import_lambda(monkeypatch, env_value):
         agent_state.called = True
 
     monkeypatch.setattr(mod, "trading_agent", SimpleNamespace(run=fake_run))
+    monkeypatch.setattr(mod, "_rebuild_price_panel", lambda: None)
 
     return mod, agent_state, sentinel
 
@@ -37,6 +38,16 @@ def test_run_not_called_when_disabled(monkeypatch):
     assert result is sentinel
 
 
+def test_performance_histories_refresh_after_the_snapshot(monkeypatch):
+    mod, _agent, _sentinel = _import_lambda(monkeypatch, "false")
+    refreshed = []
+    monkeypatch.setattr(mod, "refresh_performance_histories", lambda: refreshed.append(True))
+
+    mod.lambda_handler({}, {})
+
+    assert refreshed == [True]
+
+
 # ---------------------------------------------------------------------------
 # lambda_handler exception path
 # ---------------------------------------------------------------------------
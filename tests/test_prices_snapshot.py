@@ -4,6 +4,7 @@ import pandas as pd
 import pytest
 
 from backend.common import prices
+from backend.utils import pricing_dates
 
 
 def test_get_price_snapshot(monkeypatch):
@@ -25,6 +26,18 @@ def test_get_price_snapshot(monkeypatch):
 
     monkeypatch.setattr(prices, "_nearest_weekday", fake_weekday)
 
+    class FakeCalendar:
+        def previous_trading_day(self, day: date) -> date:
+            weekday_calls.append((day, False))
+            return day
+
+        def roll(self, day: date, forward: bool) -> date:
+            weekday_calls.append((day, forward))
+            return day
+
+    monkeypatch.setattr(prices, "get_trading_calendar", lambda exchange: FakeCalendar())
+    monkeypatch.setattr(pricing_dates, "get_trading_calendar", lambda exchange: FakeCalendar())
+
     last_trading_day = frozen_today - timedelta(days=1)
     d7 = last_trading_day - timedelta(days=7)
     d30 = last_trading_day - timedelta(days=30)
@@ -47,3 +47,36 @@ def test_run_all_tickers_resolves_exchange_from_metadata():
     assert out == ["GSK"]
     assert calls == [("GSK", "L", 3)]
     mock_load.assert_called_once()
+
+
+def test_run_all_tickers_batch_fans_out_yahoo_download_and_falls_back(monkeypatch):
+    import backend.timeseries.fetch_meta_timeseries as meta
+
+    batches = []
+
+    def fake_batch(symbols, start_date, end_date):
+        batches.append(symbols)
+        return {("AAA", "L"): pd.DataFrame({"Date": [1], "Close": [2]})}
+
+    warmed = []
+    loaded = []
+
+    def fake_warm(sym, ex, days, frame):
+        warmed.append((sym, ex, days, len(frame)))
+        return frame
+
+    def fake_load(sym, ex, days):
+        loaded.append((sym, ex, days))
+        return pd.DataFrame() if sym == "CCC" else pd.DataFrame({"Date": [1], "Close": [2]})
+
+    monkeypatch.setattr(meta, "fetch_yahoo_timeseries_batch", fake_batch)
+    with (
+        patch("backend.timeseries.cache.warm_meta_timeseries", side_effect=fake_warm),
+        patch("backend.timeseries.cache.load_meta_timeseries", side_effect=fake_load),
+    ):
+        out = run_all_tickers(["AAA.L", "BBB.L", "CCC.N"], days=10, batch=True, max_workers=2)
+
+    assert out == ["AAA.L", "BBB.L"]
+    assert sorted(batches) == [[("AAA", "L"), ("BBB", "L")], [("CCC", "N")]]
+    assert warmed == [("AAA", "L", 10, 1)]
+    assert sorted(loaded) == [("BBB", "L", 10), ("CCC", "N", 10)]
@@ -1,4 +1,6 @@
 import importlib
+import io
+import json
 import logging
 import os
 import sys
@@ -7,6 +9,7 @@ from datetime import datetime, timezone
 
 import pandas as pd
 import pytest
+from botocore.exceptions import ClientError
 
 from backend.config import reload_config
 
@@ -214,7 +217,8 @@ def test_has_cached_meta_timeseries_returns_false_when_s3_client_creation_fails(
     monkeypatch.setattr(cache.boto3, "client", fake_client)
 
     assert cache.has_cached_meta_timeseries("any", "us") is False
-    assert created_clients == ["s3"]
+    # One attempt for the manifest GET, one for the HeadObject fallback.
+    assert created_clients == ["s3", "s3"]
 
 
 def test_s3_cache_object_exists_returns_false_for_invalid_path(monkeypatch):
@@ -612,7 +616,7 @@ def test_s3_object_mtime_returns_none_for_confirmed_missing(monkeypatch):
 
 def test_invalidate_meta_caches_skips_update_for_confirmed_missing(monkeypatch):
     """Once a ticker is confirmed missing, repeat invalidation checks must
-    not touch ``_CACHE_FILE_MTIMES`` or re-clear the LRUs -- the negative
+    not touch ``_CACHE_FILE_MTIMES`` or re-invalidate the series -- the negative
     cache should be a true no-op fast path, not just a HeadObject skip.
     """
     monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
@@ -628,8 +632,7 @@ def test_invalidate_meta_caches_skips_update_for_confirmed_missing(monkeypatch):
     patch_s3_client(monkeypatch, cache, FakeS3())
 
     clears = []
-    monkeypatch.setattr(cache._load_meta_timeseries_cached, "cache_clear", lambda: clears.append(1))
-    monkeypatch.setattr(cache._memoized_range_cached, "cache_clear", lambda: clears.append(1))
+    monkeypatch.setattr(cache._FRAME_CACHE, "invalidate", lambda *_args: clears.append(1))
 
     cache._invalidate_meta_caches_if_stale("MISSING", "L")
     cache_uri = cache.meta_timeseries_cache_path("MISSING", "L")
@@ -685,6 +688,8 @@ def test_s3_object_mtime_skips_repeat_head_object_within_ttl(monkeypatch):
 def test_s3_range_cache_invalidates_when_last_modified_changes(monkeypatch):
     monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
     cache = import_cache()
+    monkeypatch.setattr(cache.config, "offline_mode", False)
+    monkeypatch.setattr(cache, "OFFLINE_MODE", False)
 
     last_modified = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
 
@@ -719,3 +724,164 @@ def test_s3_range_cache_invalidates_when_last_modified_changes(monkeypatch):
     assert second["Close"].iloc[0] == 1.0
     assert third["Close"].iloc[0] == 2.0
     assert len(loads) == 2
+
+
+class ManifestS3:
+    """In-memory S3 double supporting the manifest's conditional puts."""
+
+    def __init__(self):
+        self.objects = {}
+        self.etags = 0
+        self.heads = []
+        self.conflicts = 0
+        self.puts = 0
+
+    def get_object(self, *, Bucket, Key):  # noqa: N803 - boto3 API parameter names
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject")
+        body, etag = self.objects[(Bucket, Key)]
+        return {"Body": io.BytesIO(body), "ETag": etag}
+
+    def put_object(self, *, Bucket, Key, Body, IfMatch=None, IfNoneMatch=None, **_kwargs):  # noqa: N803
+        current = self.objects.get((Bucket, Key))
+        stale = IfMatch is not None and (current is None or current[1] != IfMatch)
+        if self.conflicts or stale or (IfNoneMatch == "*" and current is not None):
+            self.conflicts = max(0, self.conflicts - 1)
+            raise ClientError({"Error": {"Code": "PreconditionFailed", "Message": "conflict"}}, "PutObject")
+        self.etags += 1
+        self.puts += 1
+        self.objects[(Bucket, Key)] = (Body, f'"{self.etags}"')
+        return {"ETag": f'"{self.etags}"'}
+
+    def delete_object(self, *, Bucket, Key):  # noqa: N803 - boto3 API parameter names
+        self.objects.pop((Bucket, Key), None)
+
+    def head_object(self, *, Bucket, Key):  # noqa: N803 - boto3 API parameter names
+        self.heads.append(Key)
+        return {"LastModified": datetime(2026, 5, 8, tzinfo=timezone.utc)}
+
+
+def _manifest(client):
+    return json.loads(client.objects[("bucket", "timeseries/meta/_manifest.json")][0])
+
+
+def test_manifest_answers_existence_and_staleness_without_head_object(monkeypatch):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
+    cache = import_cache()
+    client = ManifestS3()
+    patch_s3_client(monkeypatch, cache, client)
+
+    cache.record_meta_cache_write("s3://bucket/timeseries/meta/AAA_L.parquet", _frame(3.0))
+    cache.record_meta_cache_write("s3://bucket/timeseries/meta/BBB_L.parquet", _frame(4.0))
+
+    entry = _manifest(client)["series"]["AAA_L"]
+    assert (entry["rows"], entry["min_date"], entry["max_date"]) == (1, "2026-05-08", "2026-05-08")
+
+    loads = []
+    monkeypatch.setattr(cache, "_rolling_cache", lambda *_a, **_k: loads.append(1) or _frame(1.0))
+    assert cache.has_cached_meta_timeseries("aaa", "l") is True
+    cache.load_meta_timeseries("AAA", "L", 5)
+    cache.load_meta_timeseries("AAA", "L", 5)
+    assert client.heads == []
+    assert loads == [1]
+
+    # A rewrite of AAA changes its recorded mtime, invalidating the frame cache.
+    cache.record_meta_cache_write("s3://bucket/timeseries/meta/AAA_L.parquet", _frame(5.0))
+    cache.load_meta_timeseries("AAA", "L", 5)
+    assert loads == [1, 1]
+
+    # Not in an incomplete manifest: fall back to HeadObject.
+    assert cache.has_cached_meta_timeseries("ccc", "l") is True
+    assert client.heads == ["timeseries/meta/CCC_L.parquet"]
+
+
+def test_manifest_write_retries_on_conflict_and_skips_non_meta_paths(monkeypatch):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
+    cache = import_cache()
+    client = ManifestS3()
+    patch_s3_client(monkeypatch, cache, client)
+
+    client.conflicts = 1
+    cache.record_meta_cache_write("s3://bucket/timeseries/meta/AAA_L.parquet", _frame(3.0))
+    cache.record_meta_cache_write("s3://bucket/timeseries/yahoo/AAA_L.parquet", _frame(3.0))
+    cache.record_meta_cache_delete("s3://bucket/timeseries/meta/MISSING_L.parquet")
+
+    assert list(_manifest(client)["series"]) == ["AAA_L"]
+
+
+def test_complete_manifest_replaces_listing_and_head_checks(monkeypatch):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
+    cache = import_cache()
+    client = ManifestS3()
+    patch_s3_client(monkeypatch, cache, client)
+    monkeypatch.setattr(
+        cache,
+        "_s3_cached_meta_objects",
+        lambda _base: {"AAA_L.parquet": (100.0, 2048), "BBB_N.parquet": (200.0, 4096)},
+    )
+    monkeypatch.setattr(cache, "_load_parquet", lambda _path: _frame(1.0))
+
+    assert cache.rebuild_meta_cache_manifest() == 2
+    manifest = _manifest(client)
+    assert manifest["complete"] is True
+    assert manifest["series"]["BBB_N"]["size"] == 4096
+
+    monkeypatch.setattr(cache, "_s3_cached_meta_objects", lambda _base: pytest.fail("listed the bucket"))
+    assert cache.list_cached_meta_tickers() == [("AAA", "L"), ("BBB", "N")]
+    assert cache.has_cached_meta_timeseries("zzz", "l") is False
+    assert client.heads == []
+
+    cache.record_meta_cache_delete("s3://bucket/timeseries/meta/AAA_L.parquet")
+    assert cache.list_cached_meta_tickers() == [("BBB", "N")]
+
+
+def test_failed_manifest_update_discards_the_shared_manifest(monkeypatch):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
+    cache = import_cache()
+    client = ManifestS3()
+    patch_s3_client(monkeypatch, cache, client)
+    monkeypatch.setattr(cache, "_s3_cached_meta_objects", lambda _base: {"AAA_L.parquet": (100.0, 2048)})
+    monkeypatch.setattr(cache, "_load_parquet", lambda _path: _frame(1.0))
+    cache.rebuild_meta_cache_manifest()
+
+    client.conflicts = cache._MANIFEST_WRITE_ATTEMPTS
+    cache.record_meta_cache_write("s3://bucket/timeseries/meta/BBB_L.parquet", _frame(3.0))
+
+    # The complete manifest no longer answers for BBB (which it never recorded).
+    assert ("bucket", "timeseries/meta/_manifest.json") not in client.objects
+    assert cache.has_cached_meta_timeseries("bbb", "l") is True
+    assert client.heads == ["timeseries/meta/BBB_L.parquet"]
+
+
+def test_batched_manifest_updates_write_once(monkeypatch):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
+    cache = import_cache()
+    client = ManifestS3()
+    patch_s3_client(monkeypatch, cache, client)
+    cache.record_meta_cache_write("s3://bucket/timeseries/meta/AAA_L.parquet", _frame(1.0))
+
+    with cache.batched_manifest_updates():
+        with cache.batched_manifest_updates():
+            cache.record_meta_cache_write("s3://bucket/timeseries/meta/BBB_L.parquet", _frame(2.0))
+        cache.record_meta_cache_write("s3://bucket/timeseries/meta/CCC_L.parquet", _frame(3.0))
+        cache.record_meta_cache_delete("s3://bucket/timeseries/meta/AAA_L.parquet")
+        assert client.puts == 1
+        assert sorted(cache.meta_cache_manifest()["series"]) == ["BBB_L", "CCC_L"]
+
+    assert client.puts == 2
+    assert sorted(_manifest(client)["series"]) == ["BBB_L", "CCC_L"]
+
+
+def test_compacting_delta_segments_records_the_series(monkeypatch):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", "s3://bucket/timeseries")
+    cache = import_cache()
+    client = ManifestS3()
+    patch_s3_client(monkeypatch, cache, client)
+    path = "s3://bucket/timeseries/meta/AAA_L.parquet"
+    monkeypatch.setattr(cache, "_list_delta_segments", lambda _path: [f"{path[:-8]}.delta/1.parquet"])
+    monkeypatch.setattr(cache, "_load_parquet", lambda _path: _frame(1.0))
+    monkeypatch.setattr(cache, "_write_parquet_file", lambda _df, _path: None)
+    monkeypatch.setattr(cache, "_delete_cache_objects", lambda _paths: None)
+
+    assert cache.compact_delta_segments(path) == 1
+    assert list(_manifest(client)["series"]) == ["AAA_L"]
@@ -141,6 +141,39 @@ def test_ensure_schema_normalises_date_to_ms(date_input, input_id):
     ), f"input_id={input_id}: expected datetime64[ms], got {result['Date'].dtype}"
 
 
+def test_compact_dtypes_round_trip_through_parquet(monkeypatch, tmp_path):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path))
+    cache = import_cache()
+    monkeypatch.setattr(cache.config, "timeseries_compact_dtypes", True, raising=False)
+    df = pd.DataFrame(
+        {
+            "Date": pd.date_range("2024-01-01", periods=3),
+            "Open": [1.5, 2.25, 3.0],
+            "High": [1.5, 2.25, 3.0],
+            "Low": [1.5, 2.25, 3.0],
+            "Close": [1.5, 2.25, 1234567.891],  # not representable in float32
+            "Volume": [100.0, 200.0, 300.0],
+            "Ticker": ["ABC"] * 3,
+            "Source": ["SRC"] * 3,
+        }
+    )
+    path = cache._cache_path("compact.parquet")
+    cache._save_parquet(df, path)
+    result = cache._load_parquet(path)
+
+    assert result["Open"].dtype == "float32"
+    assert result["Close"].dtype == "float64"
+    assert result["Close"].iloc[-1] == 1234567.891
+    assert result["Volume"].dtype == "int64"
+    assert isinstance(result["Ticker"].dtype, pd.CategoricalDtype)
+
+    # With the flag off, compact files read back in the standard dtypes.
+    monkeypatch.setattr(cache.config, "timeseries_compact_dtypes", False)
+    standard = cache._load_parquet(path)
+    assert standard["Open"].dtype == "float64"
+    assert standard["Ticker"].dtype == object
+
+
 def test_rolling_cache_serves_cached_slice_on_fetch_failure(monkeypatch, tmp_path):
     monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path))
     cache = import_cache()
@@ -1,6 +1,12 @@
+from datetime import date
+
+import numpy as np
+import pytest
 from fastapi.testclient import TestClient
 
 from backend.app import create_app
+from backend.common import performance_history
+from backend.common.performance_history import StoredHistory
 from backend.config import config
 
 
@@ -64,3 +70,22 @@ def test_timeseries_edit_invalid_json_logs_validation_failure(tmp_path, monkeypa
     assert record.ticker == "ABC"
     assert record.exchange == "L"
     assert record.path == "/timeseries/edit"
+
+
+def test_timeseries_edit_clears_materialised_performance_histories(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(config, "skip_snapshot_warm", True)
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path))
+    app = create_app()
+    monkeypatch.setattr(config, "performance_history_days", 30, raising=False)
+    client = TestClient(app)
+    token = client.post("/token", json={"id_token": "good"}).json()["access_token"]
+    client.headers.update({"Authorization": f"Bearer {token}"})
+    history = StoredHistory(np.array(["2024-01-02"], dtype="datetime64[D]"), np.array([100.0]), date(2024, 1, 2))
+    performance_history.save("alice", "sig", history)
+    assert performance_history.load("alice", "sig") is not None
+
+    resp = client.post("/timeseries/edit?ticker=ABC&exchange=L", json=[{"Date": "2024-01-02", "Close": 1.5}])
+
+    assert resp.status_code == 200
+    assert performance_history.load("alice", "sig") is None
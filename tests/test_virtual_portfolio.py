@@ -112,7 +112,7 @@ def test_performance_with_synthetic_holdings(monkeypatch):
         lambda owner, *, pricing_date=None, **_: portfolio,
     )
 
-    def fake_load_meta_timeseries(ticker, exchange, days):
+    def fake_load_meta_timeseries(ticker, exchange, days, readonly=False):
         dates = pd.date_range("2024-01-01", periods=3, freq="D")
         prices = {
             "AAA": [10, 11, 12],
@@ -128,7 +128,7 @@ def test_performance_with_synthetic_holdings(monkeypatch):
     monkeypatch.setattr(portfolio_utils, "get_scaling_override", lambda *_args, **_kwargs: 1.0)
     monkeypatch.setattr(portfolio_utils, "_PRICE_SNAPSHOT", {}, raising=False)
 
-    perf = portfolio_utils.compute_owner_performance("virtual", days=3)
+    perf = portfolio_utils.compute_owner_performance("virtual", days=3, pricing_date=dt.date(2024, 1, 3))
     history = perf["history"] if isinstance(perf, dict) else perf
 
     assert len(history) == 3
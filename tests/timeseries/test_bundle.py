@@ -0,0 +1,152 @@
+import importlib
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from backend.timeseries import bundle as bundle_mod  # noqa: E402
+
+
+def _meta_frame():
+    return pd.DataFrame(
+        {
+            "Date": pd.date_range("2024-01-01", periods=3),
+            "Open": [1.0, 2.0, 3.0],
+            "High": [1.5, 2.5, 3.5],
+            "Low": [0.5, 1.5, 2.5],
+            "Close": [1.2, 2.2, 3.2],
+            "Volume": [100, 200, 300],
+            "Ticker": ["VOD"] * 3,
+            "Source": ["Stooq"] * 3,
+        }
+    )
+
+
+def _write(path, **overrides):
+    kwargs = {
+        "meta": {"meta/VOD_L.parquet": _meta_frame()},
+        "fx": {"fx/USD.parquet": pd.DataFrame({"Date": pd.date_range("2024-01-01", periods=2), "Rate": [0.8, 0.81]})},
+        "instruments": {"L/VOD.json": {"ticker": "VOD.L", "currency": "GBP"}},
+        "latest_prices": {"VOD.L": {"last_price": 3.2}},
+    }
+    kwargs.update(overrides)
+    return bundle_mod.write_cache_bundle(path, **kwargs)
+
+
+def test_bundle_round_trip(tmp_path):
+    path = tmp_path / "bundle.arrow"
+    summary = _write(path)
+
+    assert summary["meta_series"] == 1
+    assert summary["fx_series"] == 1
+    assert summary["rows"] == 5
+
+    bundle = bundle_mod.CacheBundle(path)
+    meta = bundle.frame("meta/VOD_L.parquet")
+    assert meta["Close"].tolist() == [1.2, 2.2, 3.2]
+    assert meta["Ticker"].tolist() == ["VOD"] * 3
+    fx = bundle.frame("fx/USD.parquet")
+    assert list(fx.columns) == ["Date", "Rate"]
+    assert fx["Rate"].tolist() == [0.8, 0.81]
+    assert bundle.frame("meta/MISSING_L.parquet") is None
+    assert bundle.instrument("L/VOD.json") == {"ticker": "VOD.L", "currency": "GBP"}
+    prices, _ts = bundle.latest_prices()
+    assert prices == {"VOD.L": {"last_price": 3.2}}
+
+
+def test_bundle_key_accepts_local_and_s3_paths():
+    assert bundle_mod.bundle_key("/mnt/efs/ts/meta/VOD_L.parquet") == "meta/VOD_L.parquet"
+    assert bundle_mod.bundle_key("s3://bucket/ts/fx/USD.parquet") == "fx/USD.parquet"
+
+
+def test_unsupported_format_is_ignored(tmp_path, monkeypatch):
+    path = tmp_path / "bundle.arrow"
+    _write(path)
+    monkeypatch.setattr(bundle_mod, "BUNDLE_FORMAT", 99)
+    with pytest.raises(ValueError):
+        bundle_mod.CacheBundle(path)
+    monkeypatch.setenv("CACHE_BUNDLE_PATH", str(path))
+    assert bundle_mod.active_bundle() is None
+
+
+def test_offline_range_load_served_from_bundle(tmp_path, monkeypatch):
+    path = tmp_path / "bundle.arrow"
+    _write(path)
+    monkeypatch.setenv("CACHE_BUNDLE_PATH", str(path))
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path / "empty-cache"))
+    sys.modules.pop("backend.timeseries.cache", None)
+    cache = importlib.import_module("backend.timeseries.cache")
+    monkeypatch.setattr(cache, "OFFLINE_MODE", True)
+    monkeypatch.setattr(cache, "get_instrument_meta", lambda _t: {"currency": "GBP"})
+
+    df = cache.load_meta_timeseries_range("VOD", "L", date(2024, 1, 2), date(2024, 1, 3))
+
+    assert df["Close"].tolist() == [2.2, 3.2]
+
+
+def _offline_cache(tmp_path, monkeypatch, bundle_path):
+    monkeypatch.setenv("CACHE_BUNDLE_PATH", str(bundle_path))
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path / "cache"))
+    sys.modules.pop("backend.timeseries.cache", None)
+    cache = importlib.import_module("backend.timeseries.cache")
+    monkeypatch.setattr(cache, "OFFLINE_MODE", True)
+    return cache
+
+
+def test_offline_load_prefers_a_local_base_newer_than_the_bundle(tmp_path, monkeypatch):
+    bundle_path = tmp_path / "bundle.arrow"
+    _write(bundle_path)
+    cache = _offline_cache(tmp_path, monkeypatch, bundle_path)
+    path = cache.meta_timeseries_cache_path("VOD", "L")
+
+    cache._write_parquet_file(_meta_frame().assign(Close=[9.0, 9.0, 9.0]), path)
+    created = bundle_mod.active_bundle().created.timestamp()
+    os.utime(path, (created + 60, created + 60))
+    assert cache._load_parquet(path)["Close"].tolist() == [9.0, 9.0, 9.0]
+
+    os.utime(path, (created - 60, created - 60))
+    assert cache._load_parquet(path)["Close"].tolist() == [1.2, 2.2, 3.2]
+
+
+def test_offline_load_merges_local_delta_segments_over_the_bundle(tmp_path, monkeypatch):
+    bundle_path = tmp_path / "bundle.arrow"
+    _write(bundle_path)
+    cache = _offline_cache(tmp_path, monkeypatch, bundle_path)
+    path = cache.meta_timeseries_cache_path("VOD", "L")
+    extra = _meta_frame().iloc[[-1]].assign(Date=pd.Timestamp("2024-01-04"), Close=4.2)
+
+    cache._append_delta(extra, path)
+
+    assert cache._load_parquet(path)["Close"].tolist() == [1.2, 2.2, 3.2, 4.2]
+
+
+def test_build_cache_bundle_packs_fx_from_an_s3_cache(tmp_path, monkeypatch):
+    from backend.timeseries import cache
+
+    class FakePaginator:
+        def paginate(self, Bucket, Prefix):  # noqa: N803 - boto3 API parameter names
+            assert (Bucket, Prefix) == ("bucket", "ts/fx/")
+            yield {"Contents": [{"Key": "ts/fx/USD.parquet"}, {"Key": "ts/fx/old/EUR.parquet"}]}
+
+    class FakeS3:
+        def get_paginator(self, name):
+            return FakePaginator()
+
+    rates = pd.DataFrame({"Date": pd.date_range("2024-01-01", periods=2), "Rate": [0.8, 0.81]})
+    read = []
+    monkeypatch.setattr(cache, "_CACHE_BASE", "s3://bucket/ts")
+    monkeypatch.setattr(cache, "_s3_client", lambda: FakeS3())
+    monkeypatch.setattr(cache, "list_cached_meta_tickers", lambda: [])
+    monkeypatch.setattr(bundle_mod.pd, "read_parquet", lambda path: read.append(path) or rates)
+    monkeypatch.setattr(bundle_mod.config, "prices_json", None)
+
+    summary = bundle_mod.build_cache_bundle(tmp_path / "bundle.arrow")
+
+    assert read == ["s3://bucket/ts/fx/USD.parquet"]
+    assert summary["fx_series"] == 1
+    fx = bundle_mod.CacheBundle(tmp_path / "bundle.arrow").frame("fx/USD.parquet")
+    assert fx["Rate"].tolist() == [0.8, 0.81]
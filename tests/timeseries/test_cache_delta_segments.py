@@ -0,0 +1,227 @@
+import importlib
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path))
+    sys.modules.pop("backend.timeseries.cache", None)
+    module = importlib.import_module("backend.timeseries.cache")
+    monkeypatch.setattr(module, "OFFLINE_MODE", False)
+    return module
+
+
+def _frame(dates, close=1.0) -> pd.DataFrame:
+    dates = pd.DatetimeIndex(dates)
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": [close + i for i in range(len(dates))],
+            "Volume": 100,
+            "Ticker": "VOD",
+            "Source": "test",
+        }
+    )
+
+
+def _fetch_range(start_date, end_date, **_kwargs):
+    return _frame(pd.bdate_range(start_date, end_date), close=50.0)
+
+
+def _seed_stale_base(cache) -> str:
+    """Write a base file whose last row is a few days before the window end."""
+    _cutoff, today = cache._weekday_range(date.today() - timedelta(days=1), 10)
+    path = cache.meta_timeseries_cache_path("VOD", "L")
+    cache._save_parquet(_frame(pd.bdate_range(end=today - timedelta(days=3), periods=30)), path)
+    return path
+
+
+def test_forward_extension_appends_delta_without_rewriting_base(cache):
+    path = _seed_stale_base(cache)
+    base_bytes = Path(path).read_bytes()
+
+    out = cache._rolling_cache(_fetch_range, path, {}, 10, ticker="VOD", exchange="L")
+
+    assert Path(path).read_bytes() == base_bytes
+    segments = cache._list_delta_segments(path)
+    assert len(segments) == 1
+    assert Path(segments[0]).parent.name == "VOD_L.delta"
+    merged = cache._load_parquet(path)
+    assert merged["Date"].is_monotonic_increasing
+    assert not merged["Date"].duplicated().any()
+    assert merged["Date"].max() == out["Date"].max()
+    assert len(merged) > 30
+
+
+def test_compaction_folds_segments_into_base(cache):
+    path = _seed_stale_base(cache)
+    cache._rolling_cache(_fetch_range, path, {}, 10, ticker="VOD", exchange="L")
+    before = cache._load_parquet(path)
+
+    assert cache.compact_meta_timeseries("VOD", "L") == 1
+
+    assert cache._list_delta_segments(path) == []
+    assert not Path(cache._delta_dir(path)).exists()
+    pd.testing.assert_frame_equal(cache._read_parquet_file(path), before)
+    assert cache.compact_meta_timeseries("VOD", "L") == 0
+
+
+def test_later_segments_win_and_threshold_compacts_inline(cache, monkeypatch):
+    monkeypatch.setattr(cache, "_DELTA_COMPACT_THRESHOLD", 2)
+    path = cache.meta_timeseries_cache_path("VOD", "L")
+    cache._save_parquet(_frame(["2024-01-01", "2024-01-02"]), path)
+
+    cache._append_delta(_frame(["2024-01-03"], close=5.0), path)
+    assert len(cache._list_delta_segments(path)) == 1
+    cache._append_delta(_frame(["2024-01-03", "2024-01-04"], close=9.0), path)
+
+    assert cache._list_delta_segments(path) == []
+    base = cache._read_parquet_file(path)
+    assert base["Close"].tolist() == [1.0, 2.0, 9.0, 10.0]
+
+
+def test_full_rewrite_discards_segments(cache):
+    path = cache.meta_timeseries_cache_path("VOD", "L")
+    cache._save_parquet(_frame(["2024-01-01"]), path)
+    cache._append_delta(_frame(["2024-01-02"]), path)
+
+    cache._save_parquet(_frame(["2024-02-01"]), path)
+
+    assert cache._list_delta_segments(path) == []
+    assert cache._load_parquet(path)["Date"].dt.date.tolist() == [date(2024, 2, 1)]
+
+
+def test_delta_directories_are_not_listed_as_tickers(cache):
+    path = cache.meta_timeseries_cache_path("VOD", "L")
+    cache._save_parquet(_frame(["2024-01-01"]), path)
+    cache._append_delta(_frame(["2024-01-02"]), path)
+
+    assert cache.list_cached_meta_tickers() == [("VOD", "L")]
+    assert cache.compact_cached_meta_timeseries() == {"tickers": 1, "segments": 1}
+
+
+def test_s3_meta_listing_skips_delta_keys(cache, monkeypatch):
+    class FakePaginator:
+        def paginate(self, Bucket, Prefix):  # noqa: N803 - boto3 API parameter names
+            yield {
+                "Contents": [
+                    {"Key": "ts/meta/VOD_L.parquet"},
+                    {"Key": "ts/meta/VOD_L.delta/20240102T000000000000.parquet"},
+                ]
+            }
+
+    class FakeS3:
+        def get_paginator(self, name):
+            return FakePaginator()
+
+    monkeypatch.setattr(cache, "_s3_client", lambda: FakeS3())
+
+    assert cache._s3_cached_meta_filenames("s3://bucket/ts") == ["VOD_L.parquet"]
+
+
+def _patch_providers(monkeypatch, **fetches):
+    """Stand ``fetches`` in for the provider chain behind ``fetch_meta_timeseries``."""
+    from backend.timeseries import fetch_meta_timeseries as fmt
+
+    monkeypatch.setattr(fmt, "is_valid_ticker", lambda *_a: True)
+    monkeypatch.setattr(fmt, "_provider_steps", lambda *_a: list(fetches.items()))
+    monkeypatch.setattr(fmt, "fetch_ft_df", lambda *_a: pd.DataFrame())
+
+
+def test_warm_meta_timeseries_writes_prefetched_rows_without_fetching(cache, monkeypatch):
+    cutoff, today = cache._weekday_range(date.today() - timedelta(days=1), 10)
+    prefetched = _frame(pd.bdate_range(end=today, periods=15), close=70.0)
+
+    def fetched():
+        pytest.fail("fetched")
+
+    _patch_providers(monkeypatch, yahoo=fetched, stooq=fetched)
+
+    out = cache.warm_meta_timeseries("VOD", "L", 10, prefetched)
+
+    assert not out.empty
+    assert out["Date"].max().date() == today
+    # Only the rolling window is requested from the prefetched rows.
+    window = prefetched[prefetched["Date"].dt.date >= cutoff]
+    stored = cache._load_parquet(cache.meta_timeseries_cache_path("VOD", "L"))
+    assert stored["Close"].tolist() == window["Close"].tolist()
+
+
+def test_warm_meta_timeseries_gap_fills_short_prefetched_rows(cache, monkeypatch):
+    cutoff, today = cache._weekday_range(date.today() - timedelta(days=1), 10)
+    # The batch stopped three weekdays short of the window end.
+    prefetched = _frame(pd.bdate_range(end=today - timedelta(days=5), periods=15), close=70.0)
+    stooq_calls = []
+
+    def stooq():
+        stooq_calls.append(True)
+        return _frame(pd.bdate_range(cutoff, today), close=50.0)
+
+    _patch_providers(monkeypatch, yahoo=lambda: pytest.fail("fetched"), stooq=stooq)
+
+    out = cache.warm_meta_timeseries("VOD", "L", 10, prefetched)
+
+    assert stooq_calls == [True]
+    assert out["Date"].max().date() == today
+
+
+def test_s3_touch_keeps_the_object_metadata(cache, monkeypatch):
+    calls = []
+
+    class FakeS3:
+        def head_object(self, *, Bucket, Key):  # noqa: N803 - boto3 API parameter names
+            return {
+                "Metadata": {"source": "refresh"},
+                "ContentType": "application/x-parquet",
+                "ContentLength": 9,
+            }
+
+        def copy_object(self, **kwargs):
+            calls.append(kwargs)
+
+    monkeypatch.setattr(cache, "_s3_client", lambda: FakeS3())
+
+    cache._touch_cache_file("s3://bucket/ts/meta/VOD_L.parquet")
+
+    assert calls == [
+        {
+            "Bucket": "bucket",
+            "Key": "ts/meta/VOD_L.parquet",
+            "CopySource": {"Bucket": "bucket", "Key": "ts/meta/VOD_L.parquet"},
+            "MetadataDirective": "REPLACE",
+            "Metadata": {"source": "refresh"},
+            "ContentType": "application/x-parquet",
+        }
+    ]
+
+
+def test_s3_segment_listing_is_skipped_when_the_manifest_counts_segments(cache, monkeypatch):
+    path = "s3://bucket/ts/meta/VOD_L.parquet"
+    entry = {"deltas": 0}
+    compacted = []
+    monkeypatch.setattr(cache, "_manifest_entry", lambda _path: (entry, True))
+
+    def no_listing(_path):
+        pytest.fail("listed the segments")
+
+    monkeypatch.setattr(cache, "_list_delta_segments", no_listing)
+    monkeypatch.setattr(cache, "_read_parquet_file", lambda _path: _frame(["2024-01-01"]))
+    monkeypatch.setattr(cache, "_write_parquet_file", lambda _df, _path: None)
+    monkeypatch.setattr(cache, "_touch_cache_file", lambda _path: None)
+    monkeypatch.setattr(cache, "compact_delta_segments", lambda p: compacted.append(p) or 0)
+    monkeypatch.setattr(cache, "_DELTA_COMPACT_THRESHOLD", 3)
+
+    assert cache._load_parquet(path)["Date"].dt.date.tolist() == [date(2024, 1, 1)]
+    assert cache._append_delta(_frame(["2024-01-02"]), path) == 1
+
+    entry["deltas"] = 2
+    assert cache._append_delta(_frame(["2024-01-03"]), path) == 0
+    assert compacted == [path]
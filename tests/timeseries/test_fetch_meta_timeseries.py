@@ -1,4 +1,5 @@
 import re
+import threading
 from datetime import date
 from pathlib import Path
 from types import SimpleNamespace
@@ -310,6 +311,145 @@ def test_coverage_ratio_partial_and_empty():
     assert _coverage_ratio(empty_df, expected_dates) == 0.0
 
 
+def test_fetch_meta_timeseries_bank_holiday_not_expected():
+    # 2024-01-01 is a UK bank holiday, so Yahoo covering 2nd-5th is complete.
+    yahoo_df = _make_df(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"], "Yahoo")
+
+    import backend.timeseries.fetch_meta_timeseries as meta
+
+    with (
+        patch.object(meta, "fetch_yahoo_timeseries_range", return_value=yahoo_df),
+        patch.object(meta, "fetch_stooq_timeseries_range") as stooq_mock,
+        patch.object(meta, "fetch_ft_df") as ft_mock,
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", SimpleNamespace(alpha_vantage_enabled=False)),
+    ):
+        df = meta.fetch_meta_timeseries("ABC", "L", start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+
+    assert df["Source"].tolist() == ["Yahoo"] * 4
+    stooq_mock.assert_not_called()
+    ft_mock.assert_not_called()
+
+
+def test_fetch_meta_timeseries_skips_provider_with_open_breaker():
+    from backend.timeseries.provider_health import PROVIDER_HEALTH
+
+    stooq_df = _make_df(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"], "Stooq")
+
+    import backend.timeseries.fetch_meta_timeseries as meta
+
+    with (
+        patch.object(meta, "fetch_yahoo_timeseries_range", side_effect=TimeoutError("slow")) as yahoo_mock,
+        patch.object(meta, "fetch_stooq_timeseries_range", return_value=stooq_df),
+        patch.object(meta, "fetch_ft_df") as ft_mock,
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", SimpleNamespace(alpha_vantage_enabled=False)),
+    ):
+        for _ in range(PROVIDER_HEALTH.failure_threshold + 2):
+            df = meta.fetch_meta_timeseries("ABC", "L", start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+            assert df["Source"].tolist() == ["Stooq"] * 4
+
+    assert yahoo_mock.call_count == PROVIDER_HEALTH.failure_threshold
+    assert PROVIDER_HEALTH.stats()["yahoo"]["state"] == "open"
+    ft_mock.assert_not_called()
+
+
+def test_fetch_meta_timeseries_no_data_errors_do_not_open_breaker():
+    import backend.timeseries.fetch_meta_timeseries as meta
+    from backend.timeseries.provider_health import PROVIDER_HEALTH
+
+    no_data = [ValueError("No data returned for XYZ.L"), RuntimeError("No data returned from Stooq")]
+    with (
+        patch.object(meta, "fetch_yahoo_timeseries_range", side_effect=no_data[0]) as yahoo_mock,
+        patch.object(meta, "fetch_stooq_timeseries_range", side_effect=no_data[1]) as stooq_mock,
+        patch.object(meta, "fetch_ft_df", return_value=pd.DataFrame()),
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", SimpleNamespace(alpha_vantage_enabled=False)),
+    ):
+        for i in range(PROVIDER_HEALTH.failure_threshold + 2):
+            meta.fetch_meta_timeseries(f"XY{i}", "L", start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+
+    calls = PROVIDER_HEALTH.failure_threshold + 2
+    assert yahoo_mock.call_count == calls
+    assert stooq_mock.call_count == calls
+    stats = PROVIDER_HEALTH.stats()
+    for name in ("yahoo", "stooq"):
+        assert stats[name]["state"] == "closed"
+        assert stats[name]["failures"] == 0
+    assert PROVIDER_HEALTH.allow("yahoo")
+
+
+def test_fetch_meta_timeseries_http_errors_open_breaker():
+    import requests
+
+    import backend.timeseries.fetch_meta_timeseries as meta
+    from backend.timeseries.provider_health import PROVIDER_HEALTH
+
+    with (
+        patch.object(meta, "fetch_yahoo_timeseries_range", return_value=pd.DataFrame()),
+        patch.object(meta, "fetch_stooq_timeseries_range", side_effect=requests.HTTPError("HTTP error 503")),
+        patch.object(meta, "fetch_ft_df", return_value=pd.DataFrame()),
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", SimpleNamespace(alpha_vantage_enabled=False)),
+    ):
+        for _ in range(PROVIDER_HEALTH.failure_threshold):
+            meta.fetch_meta_timeseries("ABC", "L", start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+
+    assert PROVIDER_HEALTH.stats()["stooq"]["state"] == "open"
+    assert PROVIDER_HEALTH.stats()["yahoo"]["state"] == "closed"
+
+
+def test_fetch_meta_timeseries_yahoo_rate_limit_opens_breaker():
+    from yfinance.exceptions import YFRateLimitError
+
+    import backend.timeseries.fetch_meta_timeseries as meta
+    import backend.timeseries.fetch_yahoo_timeseries as yahoo
+    from backend.timeseries.provider_health import PROVIDER_HEALTH
+
+    def history(**_):
+        raise YFRateLimitError()
+
+    with (
+        patch.object(yahoo.yf, "Ticker", return_value=SimpleNamespace(history=history)),
+        patch.object(yahoo, "is_valid_ticker", return_value=True),
+        patch.object(meta, "fetch_stooq_timeseries_range", return_value=pd.DataFrame()),
+        patch.object(meta, "fetch_ft_df", return_value=pd.DataFrame()),
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", SimpleNamespace(alpha_vantage_enabled=False)),
+    ):
+        for i in range(PROVIDER_HEALTH.failure_threshold):
+            meta.fetch_meta_timeseries(f"XY{i}", "L", start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+
+    assert PROVIDER_HEALTH.stats()["yahoo"]["state"] == "open"
+
+
+def test_fetch_meta_timeseries_yahoo_empty_for_many_tickers_opens_breaker():
+    """yfinance hides transport errors behind an empty frame."""
+    import backend.timeseries.fetch_meta_timeseries as meta
+    import backend.timeseries.fetch_yahoo_timeseries as yahoo
+    from backend.timeseries.provider_health import PROVIDER_HEALTH
+
+    history_calls = []
+
+    def history(**_):
+        history_calls.append(1)
+        return pd.DataFrame()
+
+    with (
+        patch.object(yahoo.yf, "Ticker", return_value=SimpleNamespace(history=history)),
+        patch.object(yahoo, "is_valid_ticker", return_value=True),
+        patch.object(meta, "fetch_stooq_timeseries_range", return_value=pd.DataFrame()),
+        patch.object(meta, "fetch_ft_df", return_value=pd.DataFrame()),
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", SimpleNamespace(alpha_vantage_enabled=False)),
+    ):
+        for i in range(PROVIDER_HEALTH.miss_threshold + 2):
+            meta.fetch_meta_timeseries(f"XY{i}", "L", start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+
+    assert len(history_calls) == PROVIDER_HEALTH.miss_threshold
+    assert PROVIDER_HEALTH.stats()["yahoo"]["state"] == "open"
+
+
 def test_fetch_meta_timeseries_invalid_ticker():
     import backend.timeseries.fetch_meta_timeseries as meta
 
@@ -402,6 +542,57 @@ def test_fetch_meta_timeseries_yahoo_stooq_merge():
     ft_mock.assert_not_called()
 
 
+def test_fetch_meta_timeseries_hedges_slow_primary():
+    start = date(2024, 1, 1)
+    end = date(2024, 1, 3)
+    stooq_df = _make_df(["2024-01-01", "2024-01-02", "2024-01-03"], "Stooq")
+    release = threading.Event()
+
+    def slow_yahoo(*_args):
+        release.wait(5)
+        return _make_df(["2024-01-01"], "Yahoo")
+
+    import backend.timeseries.fetch_meta_timeseries as meta
+
+    cfg = SimpleNamespace(alpha_vantage_enabled=False, timeseries_hedge_delay_seconds=0.01)
+    with (
+        patch.object(meta, "fetch_yahoo_timeseries_range", side_effect=slow_yahoo),
+        patch.object(meta, "fetch_stooq_timeseries_range", return_value=stooq_df) as stooq_mock,
+        patch.object(meta, "fetch_ft_df") as ft_mock,
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", cfg),
+    ):
+        df = meta.fetch_meta_timeseries("ABC", "L", start_date=start, end_date=end)
+        release.set()
+
+    assert df["Source"].tolist() == ["Stooq"] * 3
+    stooq_mock.assert_called_once()
+    ft_mock.assert_not_called()
+
+
+def test_fetch_meta_timeseries_hedged_merges_in_provider_order_then_falls_back_to_ft():
+    start = date(2024, 1, 1)
+    end = date(2024, 1, 4)
+    yahoo_df = _make_df(["2024-01-01"], "Yahoo")
+    stooq_df = _make_df(["2024-01-02"], "Stooq")
+    ft_df = _make_df(["2024-01-03", "2024-01-04"], "FT")
+
+    import backend.timeseries.fetch_meta_timeseries as meta
+
+    cfg = SimpleNamespace(alpha_vantage_enabled=False, timeseries_hedge_delay_seconds=0.0)
+    with (
+        patch.object(meta, "fetch_yahoo_timeseries_range", return_value=yahoo_df),
+        patch.object(meta, "fetch_stooq_timeseries_range", return_value=stooq_df),
+        patch.object(meta, "fetch_ft_df", return_value=ft_df) as ft_mock,
+        patch.object(meta, "is_valid_ticker", return_value=True),
+        patch.object(meta, "config", cfg),
+    ):
+        df = meta.fetch_meta_timeseries("ABC", "L", start_date=start, end_date=end)
+
+    assert df["Source"].tolist() == ["Yahoo", "Stooq", "FT", "FT"]
+    ft_mock.assert_called_once()
+
+
 def test_fetch_meta_timeseries_coverage_shortfall():
     start = date(2024, 1, 1)
     end = date(2024, 1, 4)
@@ -497,13 +688,7 @@ def test_fetch_meta_timeseries_alpha_vantage_rate_limit(monkeypatch):
     )
 
     import backend.timeseries.fetch_meta_timeseries as meta
-
-    sleep_calls = []
-
-    def fake_sleep(delay):
-        sleep_calls.append(delay)
-
-    monkeypatch.setattr(meta.time, "sleep", fake_sleep)
+    from backend.utils.rate_limiter import get_rate_limiter
 
     with (
         patch.object(meta, "is_valid_ticker", return_value=True),
@@ -528,7 +713,8 @@ def test_fetch_meta_timeseries_alpha_vantage_rate_limit(monkeypatch):
         df = meta.fetch_meta_timeseries("ABC", "L", start_date=start, end_date=end)
 
     assert df.equals(fallback_df)
-    assert sleep_calls == [5]
+    # The retry-after is recorded on the shared limiter instead of slept on.
+    assert 0 < get_rate_limiter("alpha_vantage").seconds_until_available() <= 5
     yahoo_mock.assert_called_once()
     stooq_mock.assert_called_once()
     av_mock.assert_called_once()
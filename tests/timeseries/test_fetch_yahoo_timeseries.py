@@ -6,6 +6,7 @@ import pytest
 
 from backend.timeseries.fetch_yahoo_timeseries import (
     _build_full_ticker,
+    fetch_yahoo_timeseries_batch,
     fetch_yahoo_timeseries_period,
     fetch_yahoo_timeseries_range,
     get_yahoo_suffix,
@@ -159,3 +160,29 @@ def test_fetch_yahoo_timeseries_period_exception(mock_ticker_cls):
     mock_ticker_cls.return_value = mock_stock
     with pytest.raises(Exception):
         fetch_yahoo_timeseries_period("abc", "l", period="1mo", interval="1d")
+
+
+@patch("backend.timeseries.fetch_yahoo_timeseries.is_valid_ticker", return_value=True)
+@patch("backend.timeseries.fetch_yahoo_timeseries.yf.download")
+def test_fetch_yahoo_timeseries_batch_splits_multi_symbol_download(mock_download, _valid):
+    index = pd.to_datetime(["2024-01-01", "2024-01-02"])
+    fields = ["Open", "High", "Low", "Close", "Volume"]
+    columns = pd.MultiIndex.from_product([["VOD.L", "AZN.L"], fields])
+    raw = pd.DataFrame(
+        [[1.0, 1.0, 1.0, 1.111, 10, None, None, None, None, None], [2.0, 2.0, 2.0, 2.0, 20, 5, 5, 5, 5.0, 50]],
+        index=index,
+        columns=columns,
+    )
+    mock_download.return_value = raw
+
+    out = fetch_yahoo_timeseries_batch(
+        [("VOD", "L"), ("AZN", "L"), ("GSK", "L"), ("BAD", "MOON")], date(2024, 1, 1), date(2024, 1, 2)
+    )
+
+    mock_download.assert_called_once()
+    assert mock_download.call_args.args[0] == ["VOD.L", "AZN.L", "GSK.L"]
+    assert set(out) == {("VOD", "L"), ("AZN", "L")}
+    vod = out[("VOD", "L")]
+    assert list(vod.columns) == STANDARD_COLUMNS
+    assert vod["Close"].tolist() == [1.11, 2.0]
+    assert out[("AZN", "L")]["Date"].tolist() == [date(2024, 1, 2)]
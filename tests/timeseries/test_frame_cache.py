@@ -0,0 +1,180 @@
+import importlib
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.timeseries.frame_cache import FrameCache, SingleFlight, frame_nbytes
+
+
+def _frame(rows: int, close: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame({"Date": pd.date_range("2024-01-01", periods=rows), "Close": [close] * rows})
+
+
+def test_hits_misses_and_lru_eviction_by_bytes():
+    size = frame_nbytes(_frame(10))
+    fc = FrameCache(max_bytes=size * 2)
+
+    fc.put("a", _frame(10), ticker="AAA", exchange="L")
+    fc.put("b", _frame(10), ticker="BBB", exchange="L")
+    assert fc.get("a") is not None  # "a" becomes most recently used
+    fc.put("c", _frame(10), ticker="CCC", exchange="L")
+
+    assert fc.get("b") is None
+    assert fc.get("a") is not None
+    assert fc.get("c") is not None
+    stats = fc.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == size * 2
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+
+
+def test_oversized_frames_are_not_cached():
+    fc = FrameCache(max_bytes=frame_nbytes(_frame(5)))
+    fc.put("big", _frame(500), ticker="AAA", exchange="L")
+    assert fc.get("big") is None
+    assert fc.stats()["bytes"] == 0
+
+
+def test_invalidate_only_drops_one_series():
+    fc = FrameCache(max_bytes=10_000_000)
+    fc.put(("load", "AAA", "L", 5), _frame(3), ticker="AAA", exchange="L")
+    fc.put(("range", "aaa", "l", "x", "y"), _frame(3), ticker="aaa", exchange="l")
+    fc.put(("load", "BBB", "L", 5), _frame(3), ticker="BBB", exchange="L")
+
+    assert fc.invalidate("AAA", "L") == 2
+
+    assert fc.get(("load", "AAA", "L", 5)) is None
+    assert fc.get(("load", "BBB", "L", 5)) is not None
+    assert fc.stats()["invalidations"] == 1
+    assert fc.stats()["series"] == 1
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path))
+    sys.modules.pop("backend.timeseries.cache", None)
+    return importlib.import_module("backend.timeseries.cache")
+
+
+def test_stale_file_only_invalidates_its_own_series(cache, tmp_path, monkeypatch):
+    for name in ("AAA_L", "BBB_L"):
+        path = tmp_path / "meta" / f"{name}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+
+    loads = []
+
+    def fake_rolling_cache(_fetch, path, _args, _days, *, ticker, exchange):
+        loads.append(ticker)
+        return _frame(3, close=float(len(loads)))
+
+    monkeypatch.setattr(cache, "_rolling_cache", fake_rolling_cache)
+
+    cache.load_meta_timeseries("AAA", "L", 5)
+    cache.load_meta_timeseries("BBB", "L", 5)
+    aaa = tmp_path / "meta" / "AAA_L.parquet"
+    bumped = aaa.stat().st_mtime + 10
+    os.utime(aaa, (bumped, bumped))
+    cache.load_meta_timeseries("AAA", "L", 5)
+    cache.load_meta_timeseries("BBB", "L", 5)
+
+    assert loads == ["AAA", "BBB", "AAA"]
+    stats = cache.meta_cache_stats()
+    assert stats["invalidations"] == 1
+    assert stats["hits"] == 1
+
+
+def test_invalidate_can_be_limited_to_one_namespace():
+    fc = FrameCache(max_bytes=10_000_000)
+    fc.put(("load", "AAA", "L", 5), _frame(3), ticker="AAA", exchange="L")
+    fc.put(("range", "AAA", "L", "x", "y"), _frame(3), ticker="AAA", exchange="L")
+
+    assert fc.invalidate("AAA", "L", namespace="range") == 1
+
+    assert fc.get(("range", "AAA", "L", "x", "y")) is None
+    assert fc.get(("load", "AAA", "L", 5)) is not None
+
+
+def test_single_flight_shares_result_and_errors_with_waiters():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(3)]
+    for t in followers:
+        t.start()
+    while flight.shared < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(5)
+
+    assert calls == [1]
+    assert results == ["value"] * 4
+
+    def boom():
+        raise RuntimeError("fetch failed")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", boom)
+
+
+def test_concurrent_meta_misses_fetch_once(cache, tmp_path, monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def fake_rolling_cache(_fetch, path, _args, _days, *, ticker, exchange):
+        calls.append(ticker)
+        release.wait(5)
+        return _frame(3)
+
+    monkeypatch.setattr(cache, "_rolling_cache", fake_rolling_cache)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.load_meta_timeseries("AAA", "L", 5))) for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    while not calls or cache.meta_cache_stats()["coalesced"] + 1 < 5:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert calls == ["AAA"]
+    assert len(results) == 5
+    assert all(len(df) == 3 for df in results)
+    # Callers still get private copies.
+    assert len({id(df) for df in results}) == 5
+
+
+def test_readonly_loads_share_the_cached_buffers(cache, monkeypatch):
+    monkeypatch.setattr(cache, "_rolling_cache", lambda *_a, **_k: _frame(3, close=2.0))
+
+    view = cache.load_meta_timeseries("AAA", "L", 5, readonly=True)
+    again = cache.load_meta_timeseries("AAA", "L", 5, readonly=True)
+    assert np.shares_memory(view["Close"].to_numpy(), again["Close"].to_numpy())
+    with pytest.raises(ValueError):
+        view["Close"].to_numpy()[0] = 99.0
+
+    view.loc[0, "Close"] = 99.0
+    view["Close"] *= 2
+    assert cache.load_meta_timeseries("AAA", "L", 5)["Close"].tolist() == [2.0, 2.0, 2.0]
@@ -0,0 +1,91 @@
+import importlib
+import os
+import sys
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+pytest.importorskip("pyarrow")
+
+from backend.timeseries import hot_tier  # noqa: E402
+
+
+def _frame(closes):
+    n = len(closes)
+    return pd.DataFrame(
+        {
+            "Date": pd.date_range("2024-01-01", periods=n),
+            "Open": closes,
+            "High": closes,
+            "Low": closes,
+            "Close": closes,
+            "Volume": [100] * n,
+            "Ticker": ["ABC"] * n,
+            "Source": ["SRC"] * n,
+        }
+    )
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path / "cache"))
+    monkeypatch.setenv("TIMESERIES_HOT_TIER_DIR", str(tmp_path / "hot"))
+    sys.modules.pop("backend.timeseries.cache", None)
+    module = importlib.import_module("backend.timeseries.cache")
+    monkeypatch.setattr(module, "OFFLINE_MODE", False)
+    hot_tier.reset_stats()
+    return module
+
+
+def test_second_load_is_served_from_hot_tier(cache, tmp_path):
+    path = cache.meta_timeseries_cache_path("ABC", "L")
+    cache._save_parquet(_frame([1.0, 2.0, 3.0]), path)
+
+    first = cache._load_parquet(path)
+    second = cache._load_parquet(path)
+
+    assert_frame_equal(first, second)
+    assert (tmp_path / "hot" / "meta" / "ABC_L.arrow").exists()
+    stats = hot_tier.stats()
+    assert stats["writes"] == 1
+    assert stats["hits"] == 1
+
+
+def test_rewritten_base_file_invalidates_hot_copy(cache):
+    path = cache.meta_timeseries_cache_path("ABC", "L")
+    cache._save_parquet(_frame([1.0, 2.0]), path)
+    cache._load_parquet(path)
+
+    cache._save_parquet(_frame([5.0, 6.0, 7.0]), path)
+    bumped = os.stat(path).st_mtime + 10
+    os.utime(path, (bumped, bumped))
+    reloaded = cache._load_parquet(path)
+
+    assert reloaded["Close"].tolist() == [5.0, 6.0, 7.0]
+    assert hot_tier.stats()["hits"] == 0
+
+
+def test_hot_tier_evicts_least_recently_used(cache, monkeypatch):
+    monkeypatch.setattr(cache.config, "timeseries_hot_tier_mb", 0, raising=False)
+    path = cache.meta_timeseries_cache_path("ABC", "L")
+    cache._save_parquet(_frame([1.0]), path)
+
+    assert cache._load_parquet(path)["Close"].tolist() == [1.0]
+    assert hot_tier.stats()["evictions"] == 1
+
+
+def test_hot_tier_scans_only_when_the_running_total_passes_the_budget(cache, monkeypatch):
+    scans = []
+    evict = hot_tier._evict
+    monkeypatch.setattr(hot_tier, "_evict", lambda root: scans.append(root) or evict(root))
+
+    for i in range(3):
+        hot_tier.write(f"meta/T{i}_L", "sig", _frame([1.0, 2.0]))
+    assert len(scans) == 1  # the first write seeds the total
+
+    monkeypatch.setattr(cache.config, "timeseries_hot_tier_mb", 0, raising=False)
+    hot_tier.write("meta/T3_L", "sig", _frame([1.0]))
+
+    assert len(scans) == 2
+    assert hot_tier.stats()["evictions"] == 4
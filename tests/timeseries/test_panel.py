@@ -0,0 +1,175 @@
+import importlib
+import sys
+from datetime import date
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def modules(monkeypatch, tmp_path):
+    """Import cache + panel against an isolated cache base."""
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path))
+    sys.modules.pop("backend.timeseries.cache", None)
+    cache = importlib.import_module("backend.timeseries.cache")
+    panel = importlib.import_module("backend.timeseries.panel")
+    panel.clear_panel_cache()
+    yield cache, panel
+    panel.clear_panel_cache()
+
+
+def _frame(ticker: str, start: str, closes: list[float]) -> pd.DataFrame:
+    dates = pd.bdate_range(start, periods=len(closes))
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": closes,
+            "High": closes,
+            "Low": closes,
+            "Close": closes,
+            "Volume": [100] * len(closes),
+            "Ticker": [ticker] * len(closes),
+            "Source": ["test"] * len(closes),
+        }
+    )
+
+
+def test_build_meta_panel_writes_exchange_year_partitions(modules, tmp_path):
+    cache, panel = modules
+    cache._save_parquet(_frame("VOD", "2023-12-28", [1.0, 2.0, 3.0, 4.0]), cache.meta_timeseries_cache_path("VOD", "L"))
+    cache._save_parquet(_frame("AAPL", "2024-01-02", [10.0, 11.0]), cache.meta_timeseries_cache_path("AAPL", "N"))
+
+    rows = panel.build_meta_panel()
+
+    assert rows == 6
+    parts = sorted(p.relative_to(tmp_path / "panel").parent.as_posix() for p in (tmp_path / "panel").rglob("*.parquet"))
+    assert parts == ["Exchange=L/Year=2023", "Exchange=L/Year=2024", "Exchange=N/Year=2024"]
+
+
+def test_load_panel_returns_aligned_matrix_in_requested_order(modules, monkeypatch):
+    cache, panel = modules
+    cache._save_parquet(_frame("VOD", "2024-01-01", [1.0, 2.0, 3.0]), cache.meta_timeseries_cache_path("VOD", "L"))
+    cache._save_parquet(_frame("AAPL", "2024-01-02", [10.0, 11.0]), cache.meta_timeseries_cache_path("AAPL", "N"))
+    panel.build_meta_panel()
+
+    def fail_fallback(*_args, **_kwargs):
+        raise AssertionError("panel hits must not use the per-ticker loader")
+
+    monkeypatch.setattr(cache, "_memoized_range", fail_fallback)
+
+    wide = panel.load_meta_timeseries_panel(["AAPL.N", "VOD.L"], date(2024, 1, 1), date(2024, 1, 3))
+
+    assert list(wide.columns) == ["AAPL.N", "VOD.L"]
+    assert wide.index.name == "Date"
+    assert [d.date() for d in wide.index] == [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+    assert wide["VOD.L"].tolist() == [1.0, 2.0, 3.0]
+    assert pd.isna(wide.loc["2024-01-01", "AAPL.N"])
+    assert wide["AAPL.N"].iloc[1:].tolist() == [10.0, 11.0]
+
+
+def test_load_panel_falls_back_for_tickers_missing_from_panel(modules, monkeypatch):
+    cache, panel = modules
+    cache._save_parquet(_frame("VOD", "2024-01-01", [1.0, 2.0]), cache.meta_timeseries_cache_path("VOD", "L"))
+    panel.build_meta_panel()
+
+    calls = []
+
+    def fake_range(ticker, exchange, start_iso, end_iso):
+        calls.append((ticker, exchange, start_iso, end_iso))
+        return _frame(ticker, "2024-01-01", [5.0, 6.0])
+
+    monkeypatch.setattr(cache, "_memoized_range", fake_range)
+
+    wide = panel.load_meta_timeseries_panel(["VOD.L", "NEW.L"], date(2024, 1, 1), date(2024, 1, 2))
+
+    assert calls == [("NEW", "L", "2024-01-01", "2024-01-02")]
+    assert wide["NEW.L"].tolist() == [5.0, 6.0]
+    assert wide["VOD.L"].tolist() == [1.0, 2.0]
+
+
+def test_load_panel_without_dataset_uses_per_ticker_cache(modules, monkeypatch):
+    cache, panel = modules
+    monkeypatch.setattr(
+        cache,
+        "_memoized_range",
+        lambda ticker, exchange, start_iso, end_iso: _frame(ticker, "2024-01-01", [7.0]),
+    )
+
+    wide = panel.load_meta_timeseries_panel(["VOD"], date(2024, 1, 1), date(2024, 1, 1))
+
+    assert list(wide.columns) == ["VOD"]
+    assert wide["VOD"].tolist() == [7.0]
+
+
+def test_load_panel_rejects_unknown_field(modules):
+    _cache, panel = modules
+    with pytest.raises(ValueError):
+        panel.load_meta_timeseries_panel(["VOD.L"], date(2024, 1, 1), date(2024, 1, 2), field="Ticker")
+
+
+def test_load_panel_skips_series_written_since_the_build(modules, monkeypatch):
+    cache, panel = modules
+    path = cache.meta_timeseries_cache_path("VOD", "L")
+    cache._save_parquet(_frame("VOD", "2024-01-01", [1.0, 2.0]), path)
+    aapl = cache.meta_timeseries_cache_path("AAPL", "N")
+    cache._save_parquet(_frame("AAPL", "2024-01-01", [10.0, 11.0]), aapl)
+    panel.build_meta_panel()
+    cache._save_parquet(_frame("VOD", "2024-01-01", [3.0, 4.0, 5.0]), path)
+
+    calls = []
+
+    def fake_range(ticker, exchange, start_iso, end_iso):
+        calls.append(ticker)
+        return _frame(ticker, "2024-01-01", [3.0, 4.0])
+
+    monkeypatch.setattr(cache, "_memoized_range", fake_range)
+
+    wide = panel.load_meta_timeseries_panel(["VOD.L", "AAPL.N"], date(2024, 1, 1), date(2024, 1, 2))
+
+    assert calls == ["VOD"]
+    assert wide["VOD.L"].tolist() == [3.0, 4.0]
+    assert wide["AAPL.N"].tolist() == [10.0, 11.0]
+
+
+def test_load_panel_ranges_leaves_unserved_pairs_to_the_caller(modules, monkeypatch):
+    cache, panel = modules
+    vod = cache.meta_timeseries_cache_path("VOD", "L")
+    cache._save_parquet(_frame("VOD", "2024-01-01", [1.0, 2.0]), vod)
+    panel.build_meta_panel()
+
+    def no_per_ticker_load(*_args):
+        pytest.fail("used the per-ticker cache")
+
+    monkeypatch.setattr(cache, "_memoized_range", no_per_ticker_load)
+
+    frames = panel.load_panel_ranges(
+        [("VOD", "L"), ("NEW", "L")], date(2024, 1, 1), date(2024, 1, 2), base_currency=None
+    )
+
+    assert list(frames) == [("VOD", "L")]
+    assert frames[("VOD", "L")]["Close"].tolist() == [1.0, 2.0]
+    assert [d.date() for d in frames[("VOD", "L")]["Date"]] == [date(2024, 1, 1), date(2024, 1, 2)]
+
+
+def test_load_panel_ranges_converts_with_one_fx_load_per_currency(modules, monkeypatch):
+    cache, panel = modules
+    for ticker in ("AAPL", "MSFT"):
+        path = cache.meta_timeseries_cache_path(ticker, "N")
+        cache._save_parquet(_frame(ticker, "2024-01-01", [10.0, 20.0]), path)
+    panel.build_meta_panel()
+
+    loads = []
+
+    def fake_rates(code, start, end):
+        loads.append(code)
+        return pd.DataFrame({"Date": pd.bdate_range(start, end), "Rate": 0.5})
+
+    monkeypatch.setattr(cache, "get_instrument_meta", lambda _full: {"currency": "USD"})
+    monkeypatch.setattr(cache, "_load_fx_rates", fake_rates)
+
+    pairs = [("AAPL", "N"), ("MSFT", "N")]
+    frames = panel.load_panel_ranges(pairs, date(2024, 1, 1), date(2024, 1, 2))
+
+    assert loads == ["USD"]
+    assert frames[("AAPL", "N")]["Close_gbp"].tolist() == [5.0, 10.0]
+    assert frames[("MSFT", "N")]["Close_gbp"].tolist() == [5.0, 10.0]
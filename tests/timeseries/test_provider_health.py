@@ -0,0 +1,80 @@
+import pytest
+
+from backend.timeseries import provider_health
+from backend.timeseries.provider_health import ProviderHealth
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(provider_health.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_breaker_opens_after_consecutive_failures_and_half_opens(clock):
+    health = ProviderHealth(failure_threshold=2, cool_off_seconds=60)
+    health.record("yahoo", ok=False, latency=5.0)
+    assert health.allow("yahoo") is True
+    health.record("yahoo", ok=False, latency=5.0)
+    assert health.allow("yahoo") is False
+    assert health.stats()["yahoo"]["state"] == "open"
+
+    clock[0] += 61
+    assert health.allow("yahoo") is True  # the half-open trial
+    assert health.allow("yahoo") is False  # only one trial at a time
+    health.record("yahoo", ok=True, latency=0.2, coverage=1.0)
+    assert health.allow("yahoo") is True
+    assert health.stats()["yahoo"]["state"] == "closed"
+
+
+def test_failed_trial_reopens_and_skip_releases_trial(clock):
+    health = ProviderHealth(failure_threshold=1, cool_off_seconds=10)
+    health.record("stooq", ok=False, latency=1.0)
+    clock[0] += 11
+    assert health.allow("stooq") is True
+    health.skip("stooq")
+    assert health.allow("stooq") is True
+    health.record("stooq", ok=False, latency=1.0)
+    assert health.allow("stooq") is False
+
+
+def test_order_ranks_only_well_sampled_providers():
+    health = ProviderHealth(min_samples=2)
+    for _ in range(2):
+        health.record("yahoo", ok=True, latency=4.0, coverage=1.0)
+        health.record("alphavantage", ok=True, latency=0.5, coverage=1.0)
+    # stooq has no history, so it keeps the middle slot.
+    assert health.order(["yahoo", "stooq", "alphavantage"]) == ["alphavantage", "stooq", "yahoo"]
+
+
+def test_low_coverage_is_penalised():
+    health = ProviderHealth(min_samples=1)
+    health.record("yahoo", ok=True, latency=0.5, coverage=0.1)
+    health.record("stooq", ok=True, latency=1.0, coverage=1.0)
+    assert health.order(["yahoo", "stooq"]) == ["stooq", "yahoo"]
+    stats = health.stats()
+    assert stats["yahoo"]["median_latency_ms"] == 500.0
+    assert stats["stooq"]["recent_success_rate"] == 1.0
+
+
+def test_misses_across_distinct_instruments_open_the_breaker(clock):
+    health = ProviderHealth(failure_threshold=3, miss_threshold=3, cool_off_seconds=60)
+    for _ in range(5):
+        health.record("yahoo", ok=True, latency=0.1, instrument="AAA.L")
+    health.record("yahoo", ok=True, latency=0.1, instrument="BBB.L")
+    assert health.stats()["yahoo"]["state"] == "closed"
+
+    health.record("yahoo", ok=True, latency=0.1, instrument="CCC.L")
+    assert health.allow("yahoo") is False
+    assert health.stats()["yahoo"]["failures"] == 1
+
+    clock[0] += 61
+    assert health.allow("yahoo") is True
+    health.record("yahoo", ok=True, latency=0.1, instrument="AAA.L")
+    assert health.allow("yahoo") is False  # the trial missed too
+
+    clock[0] += 61
+    assert health.allow("yahoo") is True
+    health.record("yahoo", ok=True, latency=0.1, coverage=0.5, instrument="AAA.L")
+    assert health.stats()["yahoo"]["state"] == "closed"
+    assert health.stats()["yahoo"]["missed_instruments"] == 0
@@ -75,6 +75,13 @@ def test_find_gaps_ignores_uk_bank_holiday():
     assert find_gaps(df) == []
 
 
+def test_find_gaps_uses_exchange_calendar():
+    # 2026-11-26 is Thanksgiving: a closure for N but a missing day for L.
+    df = _df([{"Date": "2026-11-25", "Close": 1.0}, {"Date": "2026-11-27", "Close": 1.0}])
+    assert find_gaps(df, gap_threshold_days=0, exchange="N") == []
+    assert len(find_gaps(df, gap_threshold_days=0, exchange="L")) == 1
+
+
 def test_find_gaps_multiple_disjoint_gaps():
     # Two separate 2-business-day gaps in one series, with a valid stretch
     # between them: present Mon 5th-Fri 9th, gap Mon 12th-Tue 13th, present
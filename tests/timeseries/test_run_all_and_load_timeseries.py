@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pandas as pd
@@ -26,9 +27,8 @@ def test_run_all_tickers_filters_and_delays(monkeypatch, caplog):
         lambda *_args, **_kwargs: "",
     )
     fmt._resolve_exchange_from_metadata_cached.cache_clear()
-    monkeypatch.setattr(fmt.config, "stooq_requests_per_minute", 30, raising=False)
-    sleep_calls = []
-    monkeypatch.setattr(fmt.time, "sleep", lambda s: sleep_calls.append(s))
+    waits = []
+    monkeypatch.setattr(fmt, "get_rate_limiter", lambda provider: SimpleNamespace(wait=lambda: waits.append(provider)))
 
     with patch("backend.timeseries.cache.load_meta_timeseries", side_effect=fake_load):
         with caplog.at_level("WARNING", logger="meta_timeseries"):
@@ -36,7 +36,7 @@ def test_run_all_tickers_filters_and_delays(monkeypatch, caplog):
 
     assert out == ["AAA"]
     assert calls == [("AAA", "", 5), ("BBB", "", 5), ("CCC", "", 5)]
-    assert sleep_calls == [2.0, 2.0]
+    assert waits == ["stooq", "stooq", "stooq"]
     assert "CCC" in caplog.text
 
 
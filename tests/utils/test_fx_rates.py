@@ -4,7 +4,15 @@ import pandas as pd
 import pytest
 import yfinance as yf
 
-from backend.utils.fx_rates import fetch_fx_rate_range
+from backend.utils.fx_rates import clear_fx_cache, fetch_fx_rate_range
+
+
+@pytest.fixture(autouse=True)
+def fx_cache_base(tmp_path, monkeypatch):
+    monkeypatch.setenv("TIMESERIES_CACHE_BASE", str(tmp_path))
+    clear_fx_cache()
+    yield tmp_path
+    clear_fx_cache()
 
 
 def _fake_df(start, end):
@@ -22,7 +30,6 @@ def test_fetch_fx_rate_range_success(monkeypatch, base, quote):
             return _fake_df(start, end - dt.timedelta(days=1))
 
     monkeypatch.setattr(yf, "Ticker", lambda pair: FakeTicker())
-    fetch_fx_rate_range.cache_clear()
 
     df = fetch_fx_rate_range(base, quote, start, end)
     assert list(df["Date"]) == [dt.date(2024, 1, 1), dt.date(2024, 1, 2), dt.date(2024, 1, 3)]
@@ -38,7 +45,6 @@ def test_fetch_fx_rate_range_empty(monkeypatch):
             return pd.DataFrame()
 
     monkeypatch.setattr(yf, "Ticker", lambda pair: FakeTicker())
-    fetch_fx_rate_range.cache_clear()
 
     df = fetch_fx_rate_range("USD", "GBP", start, end)
     assert list(df["Rate"]) == [0.8, 0.8]
@@ -53,7 +59,6 @@ def test_fetch_fx_rate_range_exception(monkeypatch):
             raise RuntimeError("boom")
 
     monkeypatch.setattr(yf, "Ticker", lambda pair: FakeTicker())
-    fetch_fx_rate_range.cache_clear()
 
     df = fetch_fx_rate_range("EUR", "GBP", start, end)
     assert list(df["Rate"]) == [0.9]
@@ -68,7 +73,6 @@ def test_fetch_fx_rate_range_unsupported(monkeypatch):
             return pd.DataFrame()
 
     monkeypatch.setattr(yf, "Ticker", lambda pair: FakeTicker())
-    fetch_fx_rate_range.cache_clear()
 
     df = fetch_fx_rate_range("AUD", "GBP", start, end)
     assert list(df["Rate"]) == [1.0]
@@ -77,6 +81,78 @@ def test_fetch_fx_rate_range_unsupported(monkeypatch):
 def test_fetch_fx_rate_same_currency():
     start = dt.date(2024, 1, 1)
     end = dt.date(2024, 1, 3)
-    fetch_fx_rate_range.cache_clear()
     df = fetch_fx_rate_range("USD", "USD", start, end)
     assert list(df["Rate"]) == [1.0, 1.0, 1.0]
+
+
+class _RecordingTicker:
+    def __init__(self):
+        self.calls = []
+
+    def history(self, start, end, interval):
+        self.calls.append((start, end - dt.timedelta(days=1)))
+        return _fake_df(start, end - dt.timedelta(days=1))
+
+
+def test_fetch_fx_rate_range_persists_and_slices(monkeypatch, fx_cache_base):
+    ticker = _RecordingTicker()
+    monkeypatch.setattr(yf, "Ticker", lambda pair: ticker)
+
+    fetch_fx_rate_range("USD", "GBP", dt.date(2024, 1, 1), dt.date(2024, 1, 5))
+    assert (fx_cache_base / "fx" / "USD.parquet").exists()
+
+    clear_fx_cache()
+    df = fetch_fx_rate_range("USD", "GBP", dt.date(2024, 1, 2), dt.date(2024, 1, 3))
+
+    assert ticker.calls == [(dt.date(2024, 1, 1), dt.date(2024, 1, 5))]
+    assert list(df["Date"]) == [dt.date(2024, 1, 2), dt.date(2024, 1, 3)]
+    assert list(df["Rate"]) == [1.1, pytest.approx(1.2)]
+
+
+def test_fetch_fx_rate_range_fetches_only_missing_windows(monkeypatch, fx_cache_base):
+    ticker = _RecordingTicker()
+    monkeypatch.setattr(yf, "Ticker", lambda pair: ticker)
+
+    fetch_fx_rate_range("EUR", "USD", dt.date(2024, 1, 8), dt.date(2024, 1, 12))
+    df = fetch_fx_rate_range("EUR", "USD", dt.date(2024, 1, 3), dt.date(2024, 1, 16))
+
+    assert ticker.calls == [
+        (dt.date(2024, 1, 8), dt.date(2024, 1, 12)),
+        (dt.date(2024, 1, 3), dt.date(2024, 1, 7)),
+        (dt.date(2024, 1, 13), dt.date(2024, 1, 16)),
+    ]
+    assert df["Date"].iloc[0] == dt.date(2024, 1, 3)
+    assert df["Date"].iloc[-1] == dt.date(2024, 1, 16)
+    assert (fx_cache_base / "fx" / "EUR_USD.parquet").exists()
+
+
+def test_fetch_fx_rate_range_does_not_persist_fallback(monkeypatch, fx_cache_base):
+    class FailingTicker:
+        def history(self, start, end, interval):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(yf, "Ticker", lambda pair: FailingTicker())
+    df = fetch_fx_rate_range("USD", "GBP", dt.date(2024, 1, 1), dt.date(2024, 1, 2))
+
+    assert list(df["Rate"]) == [0.8, 0.8]
+    assert not (fx_cache_base / "fx" / "USD.parquet").exists()
+
+
+def test_fetch_fx_rate_range_refetches_the_unsettled_day(monkeypatch, fx_cache_base):
+    from backend.utils import fx_rates
+
+    ticker = _RecordingTicker()
+    monkeypatch.setattr(yf, "Ticker", lambda pair: ticker)
+    # "Today" is Friday 5 January: its rate is provisional until the day closes.
+    monkeypatch.setattr(fx_rates, "_last_settled_day", lambda: dt.date(2024, 1, 4))
+
+    fetch_fx_rate_range("USD", "GBP", dt.date(2024, 1, 1), dt.date(2024, 1, 5))
+    fetch_fx_rate_range("USD", "GBP", dt.date(2024, 1, 1), dt.date(2024, 1, 5))
+    clear_fx_cache()
+    fetch_fx_rate_range("USD", "GBP", dt.date(2024, 1, 1), dt.date(2024, 1, 5))
+
+    assert ticker.calls == [
+        (dt.date(2024, 1, 1), dt.date(2024, 1, 5)),
+        (dt.date(2024, 1, 5), dt.date(2024, 1, 5)),
+        (dt.date(2024, 1, 5), dt.date(2024, 1, 5)),
+    ]
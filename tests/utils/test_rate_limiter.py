@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from backend.utils import rate_limiter
+from backend.utils.rate_limiter import RateLimiter, get_rate_limiter
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(rate_limiter.time, "time", fake.time)
+    return fake
+
+
+def test_try_acquire_never_waits_and_refills(clock, tmp_path):
+    limiter = RateLimiter("stooq", 30, path=tmp_path / "rl.sqlite3")
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+    assert limiter.seconds_until_available() == pytest.approx(2.0)
+    clock.now += 2.0
+    assert limiter.would_exceed() is False
+    assert limiter.try_acquire() is True
+
+
+def test_buckets_are_shared_through_the_store(clock, tmp_path):
+    path = tmp_path / "rl.sqlite3"
+    first = RateLimiter("stooq", 60, burst=2, path=path)
+    second = RateLimiter("stooq", 60, burst=2, path=path)
+    other = RateLimiter("yahoo", 60, path=path)
+    assert first.try_acquire() and second.try_acquire()
+    assert first.try_acquire() is False
+    assert other.try_acquire() is True
+
+
+def test_block_for_applies_to_unlimited_providers(clock, tmp_path):
+    limiter = RateLimiter("alpha_vantage", None, path=tmp_path / "rl.sqlite3")
+    assert limiter.try_acquire() and limiter.try_acquire()
+    limiter.block_for(30)
+    assert limiter.try_acquire() is False
+    assert limiter.seconds_until_available() == pytest.approx(30.0)
+    clock.now += 30
+    assert limiter.try_acquire() is True
+
+
+def test_acquire_sleeps_until_a_token_is_free(clock, monkeypatch, tmp_path):
+    monkeypatch.setattr(rate_limiter.time, "sleep", clock.sleep)
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.time)
+    limiter = RateLimiter("stooq", 60, path=tmp_path / "rl.sqlite3")
+    start = clock.now
+    assert limiter.acquire() and limiter.acquire()
+    assert clock.now - start == pytest.approx(1.0)
+    assert limiter.acquire(timeout=0.5) is False
+
+
+def test_get_rate_limiter_reads_config(monkeypatch):
+    monkeypatch.setattr(rate_limiter.config, "stooq_requests_per_minute", 6, raising=False)
+    monkeypatch.setattr(rate_limiter.config, "yahoo_requests_per_minute", None, raising=False)
+    assert get_rate_limiter("stooq").rate == pytest.approx(0.1)
+    assert get_rate_limiter("stooq") is get_rate_limiter("stooq")
+    assert get_rate_limiter("yahoo").rate is None
+
+
+def test_concurrent_limiters_share_one_token(tmp_path):
+    path = tmp_path / "rl.sqlite3"
+    results: list[bool] = []
+    lock = threading.Lock()
+
+    def take() -> None:
+        # Separate instances use separate connections, as separate processes would.
+        ok = RateLimiter("stooq", 1, path=path).try_acquire()
+        with lock:
+            results.append(ok)
+
+    threads = [threading.Thread(target=take) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results) == [False] * 7 + [True]
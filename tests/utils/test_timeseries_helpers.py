@@ -288,6 +288,20 @@ class TestApplyDateRange:
         assert list(df.index) == original_index
         assert len(df) == 3
 
+    def test_sorted_slice_includes_intraday_end_timestamp(self):
+        col = pd.to_datetime(["2024-01-01 00:00", "2024-06-15 16:30", "2024-12-31 00:00"])
+        df = pd.DataFrame({"Date": col, "Close": [1, 2, 3]})
+        assert th.sorted_date_slice(df["Date"], self.MID, self.MID) == slice(1, 2)
+        result = th.apply_date_range(df, end_date=self.MID)
+        assert list(result["Close"]) == [1, 2]
+
+    def test_unsorted_column_falls_back_to_mask(self):
+        col = pd.to_datetime([self.END, self.BASE, self.MID])
+        df = pd.DataFrame({"Date": col, "Close": [1, 2, 3]})
+        assert th.sorted_date_slice(df["Date"], self.BASE, self.MID) is None
+        result = th.apply_date_range(df, start_date=self.BASE, end_date=self.MID)
+        assert list(result["Close"]) == [2, 3]
+
 
 def _make_frozen_date(frozen_today: dt.date):
     """Return a drop-in replacement for ``datetime.date`` that freezes ``today()``."""
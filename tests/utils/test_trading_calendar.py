@@ -0,0 +1,48 @@
+from datetime import date
+
+import numpy as np
+
+from backend.utils.trading_calendar import get_trading_calendar, us_market_holidays, xetra_holidays
+
+
+def test_london_calendar_skips_bank_holidays():
+    cal = get_trading_calendar("L")
+    assert cal is get_trading_calendar("LSE")
+    # Good Friday 2026-04-03 and Easter Monday 2026-04-06.
+    assert cal.is_trading_day(date(2026, 4, 3)) is False
+    assert cal.previous_trading_day(date(2026, 4, 6)) == date(2026, 4, 2)
+    assert cal.next_trading_day(date(2026, 4, 3)) == date(2026, 4, 7)
+    assert cal.previous_trading_day(date(2026, 4, 7), inclusive=False) == date(2026, 4, 2)
+    assert cal.count_trading_days(date(2026, 3, 30), date(2026, 4, 10)) == 8
+
+
+def test_trading_days_between_returns_sorted_array():
+    days = get_trading_calendar("L").trading_days_between(date(2026, 12, 23), date(2026, 12, 31))
+    assert days.dtype == np.dtype("datetime64[D]")
+    assert [d.astype(date) for d in days] == [
+        date(2026, 12, 23),
+        date(2026, 12, 24),
+        date(2026, 12, 29),
+        date(2026, 12, 30),
+        date(2026, 12, 31),
+    ]
+    assert len(get_trading_calendar("L").trading_days_between(date(2026, 1, 2), date(2026, 1, 1))) == 0
+
+
+def test_us_and_xetra_holidays():
+    us = us_market_holidays(2026)
+    assert date(2026, 11, 26) in us  # Thanksgiving
+    assert date(2026, 7, 3) in us  # Independence Day observed (4th is a Saturday)
+    assert date(2026, 6, 19) in us  # Juneteenth
+    assert date(2021, 12, 31) not in us_market_holidays(2021)  # Saturday New Year not observed
+    assert date(2026, 12, 24) in xetra_holidays(2026)
+    assert get_trading_calendar("N").is_trading_day(date(2026, 11, 26)) is False
+    assert get_trading_calendar("XETRA").is_trading_day(date(2026, 5, 1)) is False
+
+
+def test_unknown_exchange_is_weekdays_only_and_extends_range():
+    cal = get_trading_calendar("ZZ")
+    assert cal.is_trading_day(date(2026, 12, 25)) is True
+    assert cal.roll(date(2026, 1, 3), False) == date(2026, 1, 2)
+    assert cal.roll(date(2026, 1, 3), True) == date(2026, 1, 5)
+    assert cal.previous_trading_day(date(1985, 1, 1), inclusive=False) == date(1984, 12, 31)